@@ -0,0 +1,68 @@
+""" Setup phase with many wrapper calls: one call at a time versus SentioProber.batch().
+
+    Starts a local SENTIO simulator with a simulated network latency, adds subsites with
+    map:subsite:add and reports the time and the number of socket writes of both variants.
+
+    Usage:
+
+        python benchmarks/bench_batch.py --latency-ms 1 --subsites 500
+"""
+import argparse
+import time
+
+from sentio_prober_control.Communication.CommunicatorTcpIp import CommunicatorTcpIp
+from sentio_prober_control.Sentio.ProberSentio import SentioProber
+from sentio_prober_control.Simulator.SentioSimulator import SentioSimulator
+
+
+class CountingCommunicator(CommunicatorTcpIp):
+    """Counts the socket writes of send and send_many."""
+
+    writes = 0
+
+    def send(self, msg: str):
+        self.writes += 1
+        super().send(msg)
+
+    def send_many(self, msgs):
+        self.writes += 1
+        super().send_many(msgs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--latency-ms", type=float, default=1.0, help="Simulated round trip time in milliseconds")
+    parser.add_argument("--subsites", type=int, default=500, help="Number of subsites to add")
+    parser.add_argument("--depth", type=int, default=64, help="Maximum number of outstanding responses of the batch")
+    args = parser.parse_args()
+
+    sim = SentioSimulator(port=0, latency=args.latency_ms / 1000.0)
+    sim.start()
+    comm = CountingCommunicator()
+    comm.connect(sim.address)
+    prober = SentioProber(comm)
+    prober.map.create_rect(10, 10)
+
+    print(f"latency: {args.latency_ms} ms, subsites: {args.subsites}")
+    print(f"{'variant':>8} {'time [ms]':>10} {'writes':>8}")
+
+    comm.writes = 0
+    start = time.perf_counter()
+    for i in range(args.subsites):
+        prober.map.subsites.add(f"S{i}", i, i)
+    print(f"{'single':>8} {(time.perf_counter() - start) * 1e3:>10.1f} {comm.writes:>8}")
+
+    prober.map.subsites.reset()
+    comm.writes = 0
+    start = time.perf_counter()
+    with prober.batch(args.depth) as batch:
+        for i in range(args.subsites):
+            batch.map.subsites.add(f"S{i}", i, i)
+    print(f"{'batch':>8} {(time.perf_counter() - start) * 1e3:>10.1f} {comm.writes:>8}")
+
+    comm.disconnect()
+    sim.stop()
+
+
+if __name__ == "__main__":
+    main()
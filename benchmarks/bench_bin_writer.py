@@ -0,0 +1,68 @@
+""" Time to bin a wafer die by die versus with a BinWriter.
+
+    Starts a local SENTIO simulator with a simulated network latency, creates a
+    rectangular wafermap with about --dies dies and steps through the whole route. Each
+    die gets a bin and a value, either with set_bin/set_value right away or buffered in a
+    BinWriter that is flushed in pipelined bursts.
+
+    Usage:
+
+        python benchmarks/bench_bin_writer.py --latency-ms 0.5 --dies 10000
+"""
+import argparse
+import math
+import time
+
+from sentio_prober_control.Communication.CommunicatorTcpIp import CommunicatorTcpIp
+from sentio_prober_control.Sentio.BinWriter import BinWriter
+from sentio_prober_control.Sentio.ProberSentio import SentioProber
+from sentio_prober_control.Simulator.SentioSimulator import SentioSimulator
+
+
+def run(prober: SentioProber, writer: BinWriter | None) -> float:
+    start = time.perf_counter()
+    col, row, site = prober.map.step_first_die()
+    while True:
+        if writer is None:
+            prober.map.bins.set_bin(1, col, row)
+            prober.map.bins.set_value(0.5, col, row)
+        else:
+            writer.write(col, row, 1, value=0.5)
+
+        if prober.map.end_of_route():
+            break
+        col, row, site = prober.map.step_next_die()
+
+    if writer is not None:
+        writer.close()
+
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--latency-ms", type=float, default=0.5, help="Simulated round trip time in milliseconds")
+    parser.add_argument("--dies", type=int, default=10000, help="Number of dies of the wafermap")
+    parser.add_argument("--capacity", type=int, default=1024, help="Buffer size of the bin writer")
+    parser.add_argument("--depth", type=int, default=64, help="Pipeline depth of the bin writer")
+    args = parser.parse_args()
+
+    with SentioSimulator(port=0, latency=args.latency_ms / 1000.0) as sim:
+        comm = CommunicatorTcpIp.create(sim.address)
+        prober = SentioProber(comm)
+        side = math.ceil(math.sqrt(args.dies))
+        prober.map.create_rect(side, side)
+        print(f"latency: {args.latency_ms} ms, dies: {side * side}")
+
+        direct = run(prober, None)
+        print(f"{'set_bin/set_value':>18}: {direct:8.2f} s")
+
+        prober.map.bins.clear_all()
+        buffered = run(prober, BinWriter(prober, args.capacity, args.depth))
+        print(f"{'BinWriter':>18}: {buffered:8.2f} s ({direct / buffered:.1f}x)")
+
+        comm.disconnect()
+
+
+if __name__ == "__main__":
+    main()
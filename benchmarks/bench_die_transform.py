@@ -0,0 +1,57 @@
+""" Time to get the chuck position of every die from SENTIO versus with a DieTransform.
+
+    Starts a local SENTIO simulator with a simulated network latency, creates a round
+    wafermap with subsites and gets the chuck position of every die of the route, either
+    by stepping to the die and reading the chuck position or by converting the whole route
+    with a DieTransform. Requires numpy.
+
+    Usage:
+
+        python benchmarks/bench_die_transform.py --latency-ms 0.5 --diameter 100
+"""
+import argparse
+import time
+
+from sentio_prober_control.Communication.CommunicatorTcpIp import CommunicatorTcpIp
+from sentio_prober_control.Sentio.DieTransform import DieTransform
+from sentio_prober_control.Sentio.Enumerations import XyReference
+from sentio_prober_control.Sentio.ProberSentio import SentioProber
+from sentio_prober_control.Simulator.SentioSimulator import SentioSimulator
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--latency-ms", type=float, default=0.5, help="Simulated round trip time in milliseconds")
+    parser.add_argument("--diameter", type=int, default=100, help="Wafer diameter in millimeter")
+    parser.add_argument("--die-size", type=float, default=2500, help="Die size in micrometer")
+    args = parser.parse_args()
+
+    with SentioSimulator(port=0, latency=args.latency_ms / 1000.0) as sim:
+        comm = CommunicatorTcpIp.create(sim.address)
+        prober = SentioProber(comm)
+        prober.map.set_index_size(args.die_size, args.die_size)
+        prober.map.create(args.diameter)
+        prober.map.subsites.add("A", args.die_size / 4, args.die_size / 4)
+        route = prober.map.path.get_all()
+        print(f"latency: {args.latency_ms} ms, dies: {len(route)}")
+
+        start = time.perf_counter()
+        stepped = []
+        for col, row in route.tolist():
+            prober.map.step_die(col, row)
+            stepped.append(prober.chuck.get_xy(XyReference.Home)[:2])
+        t_step = time.perf_counter() - start
+        print(f"{'step_die/get_xy':>16}: {t_step:8.3f} s")
+
+        start = time.perf_counter()
+        transform = DieTransform.from_prober(prober)
+        xy = transform.to_chuck(route)
+        t_transform = time.perf_counter() - start
+        print(f"{'DieTransform':>16}: {t_transform:8.3f} s ({t_step / t_transform:.0f}x)")
+
+        assert [tuple(p) for p in xy.tolist()] == stepped
+        comm.disconnect()
+
+
+if __name__ == "__main__":
+    main()
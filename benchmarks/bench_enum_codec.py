@@ -0,0 +1,49 @@
+""" Cost of converting enumerations from and to SENTIO's remote command strings.
+
+    Measures to_string and from_string of a few enumerations that are used on the hot
+    command formatting and response parsing paths.
+
+    Usage:
+
+        python benchmarks/bench_enum_codec.py --calls 200000
+"""
+import argparse
+import time
+
+from sentio_prober_control.Sentio.Compatibility import Compatibility, CompatibilityLevel
+from sentio_prober_control.Sentio.Enumerations import ChuckSite, LoaderStation, RoutingPriority, Stage, XyReference, ZReference
+
+
+TO_STRING = (ChuckSite.AuxLeft2, Stage.BottomProbe, XyReference.Current, ZReference.Separation, LoaderStation.WaferWallet)
+FROM_STRING = ((ChuckSite, "ChuckCamera"), (XyReference, "relative"), (ZReference, "hover"), (RoutingPriority, "wc"))
+
+
+def best_time(fn, calls: int, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(calls):
+            fn()
+        best = min(best, time.perf_counter() - start)
+
+    return best / calls
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=200000, help="Number of calls per measurement")
+    args = parser.parse_args()
+
+    Compatibility.level = CompatibilityLevel.Sentio_25_2
+
+    for member in TO_STRING:
+        name = f"{type(member).__name__}.to_string"
+        print(f"{name:>28}: {best_time(member.to_string, args.calls) * 1e9:8.0f} ns/call")
+
+    for enum, text in FROM_STRING:
+        name = f"{enum.__name__}.from_string"
+        print(f"{name:>28}: {best_time(lambda: enum.from_string(text), args.calls) * 1e9:8.0f} ns/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+""" Time to read a set of module properties one by one versus with get_props.
+
+    Starts a local SENTIO simulator with a simulated network latency and reads the same
+    dozen module properties with serial get_prop calls and with a single get_props call.
+
+    Usage:
+
+        python benchmarks/bench_get_props.py --latency-ms 1 --repeat 20
+"""
+import argparse
+import time
+
+from sentio_prober_control.Communication.CommunicatorTcpIp import CommunicatorTcpIp
+from sentio_prober_control.Sentio.ProberSentio import SentioProber
+from sentio_prober_control.Simulator.SentioSimulator import SentioSimulator
+
+
+PROPS = [("map", "grid_chuck_mode"), ("map", "chuck_to_wafer_offset"), ("map", "die_reference"), ("map", "die_reference_is_set"),
+         ("vis", "light", "scope"), ("vis", "exposure", "scope"), ("status", "active_stage", "chuck")] + \
+        [("aux", f"prop{i}") for i in range(5)]
+
+
+def serial(prober: SentioProber) -> None:
+    groups = {"map": prober.map, "vis": prober.vision, "status": prober.status, "aux": prober.aux}
+    for prop in PROPS:
+        groups[prop[0]].get_prop(*prop[1:])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--latency-ms", type=float, default=1.0, help="Simulated round trip time in milliseconds")
+    parser.add_argument("--repeat", type=int, default=20, help="Number of measurements")
+    args = parser.parse_args()
+
+    with SentioSimulator(port=0, latency=args.latency_ms / 1000.0) as sim:
+        comm = CommunicatorTcpIp.create(sim.address)
+        prober = SentioProber(comm)
+        for i in range(5):
+            prober.aux.set_prop(f"prop{i}", i)
+
+        print(f"latency: {args.latency_ms} ms, properties: {len(PROPS)}")
+        for name, fn in (("get_prop", lambda: serial(prober)), ("get_props", lambda: prober.get_props(PROPS))):
+            best = float("inf")
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                fn()
+                best = min(best, time.perf_counter() - start)
+
+            print(f"{name:>10}: {best * 1000:8.2f} ms")
+
+        comm.disconnect()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+""" Startup cost of importing the package in a fresh interpreter.
+
+    Worker processes that are started per wafer pay the import time of the package every
+    time. This measures the time for importing SentioProber in a new interpreter, with the
+    time of starting an empty interpreter subtracted, and lists the optional transport
+    dependencies that were loaded by the import.
+
+    Usage:
+
+        python benchmarks/bench_import.py --runs 10
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+
+IMPORT = "from sentio_prober_control.Sentio.ProberSentio import SentioProber"
+CHECK = IMPORT + "; import sys; print(','.join(m for m in ('pyvisa', 'numpy', 'ctypes') if m in sys.modules))"
+
+
+def run(code: str, runs: int) -> float:
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], check=True, stdout=subprocess.DEVNULL)
+        times.append(time.perf_counter() - start)
+
+    return statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10, help="Number of interpreter starts per measurement")
+    args = parser.parse_args()
+
+    empty = run("pass", args.runs)
+    full = run(IMPORT, args.runs)
+    loaded = subprocess.run([sys.executable, "-c", CHECK], check=True, capture_output=True, text=True).stdout.strip()
+
+    print(f"interpreter start: {empty * 1e3:8.1f} ms")
+    print(f"import SentioProber: {(full - empty) * 1e3:6.1f} ms (median of {args.runs})")
+    print(f"optional modules loaded: {loaded or 'none'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+""" Time to read the whole test path with get_die versus get_all.
+
+    Starts a local SENTIO simulator with a simulated network latency, creates a round
+    wafermap and reads the die of every sequence number one by one with
+    map.path.get_die and in one call with map.path.get_all. Requires numpy.
+
+    Usage:
+
+        python benchmarks/bench_path_get_all.py --latency-ms 0.5 --diameter 200
+"""
+import argparse
+import time
+
+from sentio_prober_control.Communication.CommunicatorTcpIp import CommunicatorTcpIp
+from sentio_prober_control.Sentio.Enumerations import DieNumber
+from sentio_prober_control.Sentio.ProberSentio import SentioProber
+from sentio_prober_control.Simulator.SentioSimulator import SentioSimulator
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--latency-ms", type=float, default=0.5, help="Simulated round trip time in milliseconds")
+    parser.add_argument("--diameter", type=int, default=200, help="Wafer diameter in millimeter")
+    parser.add_argument("--die-size", type=float, default=2500, help="Die size in micrometer")
+    parser.add_argument("--chunk-size", type=int, default=512, help="Number of responses decoded at once")
+    parser.add_argument("--depth", type=int, default=64, help="Pipeline depth")
+    args = parser.parse_args()
+
+    with SentioSimulator(port=0, latency=args.latency_ms / 1000.0) as sim:
+        comm = CommunicatorTcpIp.create(sim.address)
+        prober = SentioProber(comm)
+        prober.map.set_index_size(args.die_size, args.die_size)
+        prober.map.create(args.diameter)
+        num = prober.map.get_num_dies(DieNumber.Selected)
+        print(f"latency: {args.latency_ms} ms, dies: {num}")
+
+        start = time.perf_counter()
+        serial = [prober.map.path.get_die(seq) for seq in range(num)]
+        t_serial = time.perf_counter() - start
+        print(f"{'get_die':>8}: {t_serial:8.3f} s")
+
+        start = time.perf_counter()
+        route = prober.map.path.get_all(args.chunk_size, args.depth)
+        t_all = time.perf_counter() - start
+        print(f"{'get_all':>8}: {t_all:8.3f} s ({t_serial / t_all:.0f}x)")
+
+        assert [tuple(d) for d in route.tolist()] == serial
+        comm.disconnect()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+""" Throughput of pipelined remote commands versus pipeline depth.
+
+    Starts a local SENTIO simulator with a simulated network latency and measures how many
+    commands per second a single CommunicatorTcpIp achieves for different pipeline depths.
+
+    Usage:
+
+        python benchmarks/bench_pipeline.py --latency-ms 1 --commands 2000
+"""
+import argparse
+import time
+
+from sentio_prober_control.Communication.CommunicatorTcpIp import CommunicatorTcpIp
+from sentio_prober_control.Simulator.SentioSimulator import SentioSimulator
+
+
+def run(comm: CommunicatorTcpIp, depth: int, commands: int) -> float:
+    start = time.perf_counter()
+
+    if depth == 1:
+        for _ in range(commands):
+            comm.send("status:get_chuck_temp")
+            comm.read_line()
+    else:
+        with comm.pipeline(depth) as pipe:
+            for _ in range(commands):
+                pipe.submit("status:get_chuck_temp")
+
+    return commands / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--latency-ms", type=float, default=1.0, help="Simulated round trip time in milliseconds")
+    parser.add_argument("--commands", type=int, default=2000, help="Number of commands per measurement")
+    parser.add_argument("--depths", type=str, default="1,2,4,8,16,32,64", help="Comma separated list of pipeline depths")
+    args = parser.parse_args()
+
+    sim = SentioSimulator(port=0, latency=args.latency_ms / 1000.0)
+    sim.start()
+    comm = CommunicatorTcpIp.create(sim.address)
+
+    print(f"latency: {args.latency_ms} ms, commands per run: {args.commands}")
+    print(f"{'depth':>6} {'cmd/s':>12} {'speedup':>8}")
+
+    baseline = None
+    for depth in [int(d) for d in args.depths.split(",")]:
+        rate = run(comm, depth, args.commands)
+        baseline = baseline or rate
+        print(f"{depth:>6} {rate:>12.0f} {rate / baseline:>8.1f}")
+
+    comm.disconnect()
+    sim.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+""" Cost of parsing a remote command response and converting its fields.
+
+    Compares the __slots__ based Response and its typed accessors with the previous
+    implementation (an object with an instance dictionary whose message is split and
+    converted by hand in every wrapper). Reports the time per response and the memory
+    held by each response object.
+
+    Usage:
+
+        python benchmarks/bench_response.py --responses 200000
+"""
+import argparse
+import time
+import tracemalloc
+
+from sentio_prober_control.Sentio.Response import Response
+
+
+class LegacyResponse:
+    """The response class before it used __slots__ and typed accessors."""
+
+    def __init__(self, errc: int, stat: int, cmd_id: int, msg: str):
+        self.__errc = errc
+        self.__stat = stat
+        self.__cmd_id = cmd_id
+        self.__msg = msg
+
+    @staticmethod
+    def parse_resp(resp: str) -> "LegacyResponse":
+        tok = resp.split(",", 2)
+        errc = int(tok[0]) & 1023
+        stat = (int(tok[0]) & ~1023) >> 10
+        cmd_id = int(tok[1])
+        msg = tok[2].rstrip()
+        return LegacyResponse(errc, stat, cmd_id, msg)
+
+    def message(self) -> str:
+        return self.__msg
+
+
+def legacy(line: str):
+    resp = LegacyResponse.parse_resp(line)
+    tok = resp.message().split(",")
+    return int(tok[0]), int(tok[1]), int(tok[2])
+
+
+def current(line: str):
+    return Response.parse_resp(line).ints(3)
+
+
+def time_per_call(fn, lines, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for line in lines:
+            fn(line)
+        best = min(best, time.perf_counter() - start)
+
+    return best / len(lines) * 1e9
+
+
+def bytes_per_object(parse, lines) -> float:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = [parse(line) for line in lines]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return (after - before) / len(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--responses", type=int, default=200000, help="Number of responses per measurement")
+    args = parser.parse_args()
+
+    # typical response of map:step_next_die
+    lines = [f"{2048 if i % 100 == 99 else 0},0,{i % 50},{i // 50 % 50},0" for i in range(args.responses)]
+
+    for name, fn in (("legacy", legacy), ("slots", current)):
+        fn(lines[0])
+        print(f"{name:>8}: {time_per_call(fn, lines):8.0f} ns/response")
+
+    print(f"{'legacy':>8}: {bytes_per_object(LegacyResponse.parse_resp, lines):8.0f} bytes/response object")
+    print(f"{'slots':>8}: {bytes_per_object(Response.parse_resp, lines):8.0f} bytes/response object")
+
+
+if __name__ == "__main__":
+    main()
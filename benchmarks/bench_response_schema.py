@@ -0,0 +1,71 @@
+""" Cost of converting response messages with a compiled ResponseSchema.
+
+    Compares the schema parser of map:bins:get_bin_info with the hand written conversion it
+    replaced, and the decoding of a long repeated-record response (i.e. a list of die
+    positions) with a list comprehension, the repeated schema and parse_array (numpy).
+
+    Usage:
+
+        python benchmarks/bench_response_schema.py --responses 200000
+"""
+import argparse
+import time
+
+from sentio_prober_control.Sentio.Enumerations import BinQuality
+from sentio_prober_control.Sentio.Response import Response
+from sentio_prober_control.Sentio.ResponseSchema import ResponseSchema
+
+
+BIN_INFO = ResponseSchema(int, str, BinQuality, str)
+POSITIONS = ResponseSchema(int, int, repeat=True)
+
+
+def hand_written(resp: Response):
+    values = resp.fields()
+    return int(values[0]), values[1], BinQuality[values[2]], values[3]
+
+
+def positions_hand_written(msg: str):
+    tok = msg.split(",")
+    return [(int(tok[i]), int(tok[i + 1])) for i in range(0, len(tok), 2)]
+
+
+def best_time(fn, args, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for arg in args:
+            fn(arg)
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--responses", type=int, default=200000, help="Number of bin info responses")
+    parser.add_argument("--dies", type=int, default=10000, help="Number of records of the repeated response")
+    args = parser.parse_args()
+
+    # The split is cached by the response, so each measurement gets fresh response objects.
+    lines = [f"0,0,{i % 10},Bin{i % 10},{'Pass' if i % 3 else 'Fail'},#FF00FFFF" for i in range(args.responses)]
+    for name, fn in (("hand written", hand_written), ("schema", BIN_INFO.parse)):
+        responses = [Response.parse_resp(line) for line in lines]
+        t = best_time(fn, responses, repeat=1)
+        print(f"{name:>14}: {t / len(lines) * 1e9:8.0f} ns/response")
+
+    msg = ",".join(f"{i % 100},{i // 100}" for i in range(args.dies))
+    print(f"\n{args.dies} die positions in one response:")
+    print(f"{'hand written':>14}: {best_time(positions_hand_written, [msg]) * 1e3:8.2f} ms")
+    print(f"{'schema':>14}: {best_time(POSITIONS.parse_message, [msg]) * 1e3:8.2f} ms")
+
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        print(f"{'parse_array':>14}: numpy is not installed")
+    else:
+        print(f"{'parse_array':>14}: {best_time(POSITIONS.parse_array, [msg]) * 1e3:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
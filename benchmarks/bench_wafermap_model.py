@@ -0,0 +1,65 @@
+""" Time to read the status and bin of every die of a wafermap.
+
+    Starts a local SENTIO simulator with a simulated network latency, creates a round
+    wafermap and compares reading it die by die through the command groups with a full
+    and an incremental WaferMapModel.sync(). The die by die time is extrapolated from
+    --sample dies spread evenly over the grid. Requires numpy.
+
+    Usage:
+
+        python benchmarks/bench_wafermap_model.py --latency-ms 0.5 --die-size 1500
+"""
+import argparse
+import time
+
+from sentio_prober_control.Communication.CommunicatorTcpIp import CommunicatorTcpIp
+from sentio_prober_control.Sentio.Enumerations import DieNumber
+from sentio_prober_control.Sentio.ProberSentio import SentioProber
+from sentio_prober_control.Sentio.WaferMapModel import WaferMapModel
+from sentio_prober_control.Simulator.SentioSimulator import SentioSimulator
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--latency-ms", type=float, default=0.5, help="Simulated round trip time in milliseconds")
+    parser.add_argument("--diameter", type=int, default=300, help="Wafer diameter in millimeter")
+    parser.add_argument("--die-size", type=float, default=1500, help="Die size in micrometer")
+    parser.add_argument("--sample", type=int, default=500, help="Number of dies read die by die")
+    parser.add_argument("--depth", type=int, default=64, help="Pipeline depth of the model")
+    args = parser.parse_args()
+
+    with SentioSimulator(port=0, latency=args.latency_ms / 1000.0) as sim:
+        comm = CommunicatorTcpIp.create(sim.address)
+        prober = SentioProber(comm)
+        prober.map.set_index_size(args.die_size, args.die_size)
+        prober.map.create(args.diameter)
+        cols, rows = prober.map.get_num_cols(), prober.map.get_num_rows()
+        print(f"latency: {args.latency_ms} ms, grid: {cols} x {rows}, present dies: {prober.map.get_num_dies(DieNumber.Present)}")
+
+        grid = [(c, r) for r in range(rows) for c in range(cols)]
+        dies = grid[::max(1, len(grid) // args.sample)]
+        start = time.perf_counter()
+        for col, row in dies:
+            if prober.map.die.get_status(col, row) != 3:
+                prober.map.bins.get_bin(col, row)
+        serial = (time.perf_counter() - start) / len(dies) * cols * rows
+        print(f"{'die by die':>18}: {serial:8.2f} s (extrapolated)")
+
+        with WaferMapModel(prober, args.depth) as model:
+            start = time.perf_counter()
+            model.sync()
+            full = time.perf_counter() - start
+            print(f"{'model full sync':>18}: {full:8.2f} s ({serial / full:.0f}x)")
+
+            for i in range(10):
+                prober.map.bins.set_bin(1, *dies[i])
+
+            start = time.perf_counter()
+            num = model.sync()
+            print(f"{'model incremental':>18}: {(time.perf_counter() - start) * 1000:8.2f} ms ({num} dies)")
+
+        comm.disconnect()
+
+
+if __name__ == "__main__":
+    main()
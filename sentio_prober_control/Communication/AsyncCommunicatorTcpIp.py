@@ -0,0 +1,93 @@
+import asyncio
+import locale
+
+from sentio_prober_control.Communication.CommunicatorBase import CommunicatorBase
+
+
+class AsyncCommunicatorTcpIp:
+    """Communicator for TCP/IP communication based on asyncio.
+
+    This is the asyncio counterpart of CommunicatorTcpIp. All methods that perform
+    I/O are coroutines, so a single event loop can talk to several probe stations
+    without using one thread per station.
+    """
+
+    def __init__(self, limit: int = 2**24):
+        """Constructs an asyncio TCP/IP communicator.
+
+            Args:
+                limit (int): The maximum length of a single response line in bytes. Large
+                             responses like base64 encoded images require a large limit.
+        """
+        self.__limit = limit
+        self.__reader: asyncio.StreamReader | None = None
+        self.__writer: asyncio.StreamWriter | None = None
+        self.__encoding = "utf-8"
+        self.__address = ""
+
+    @staticmethod
+    async def create(addr: str, encoding : str | None = None) -> "AsyncCommunicatorTcpIp":
+        """Create an instance of an asyncio TCP/IP communicator and connect it.
+
+            Args:
+                addr (str): A string that specifies the address of the TCP/IP device to connect to. The address must have the format "IP_ADDRESS&colon;PORT"
+                encoding (str|None): The encoding to use for the communication. Default is None.
+        """
+        c = AsyncCommunicatorTcpIp()
+        await c.connect(addr, encoding)
+        return c
+
+    async def connect(self, address: str, encoding : str | None = None) -> None:
+        """Connect to a TCP/IP device at the specified address.
+
+            Args:
+                address (str): A string that specifies the address of the TCP/IP device to connect to. The address must have the format "IP_ADDRESS&colon;PORT"
+                encoding (str|None): The encoding to use for the communication. Default is None.
+        """
+        tok = address.split(":")
+        if len(tok) != 2:
+            raise Exception("Invalid address format. Must be IP_ADDRESS:PORT")
+
+        self.__address = address
+
+        if CommunicatorBase._verbose:
+            print(f"Connecting comunicator to {address}")
+
+        self.__reader, self.__writer = await asyncio.open_connection(tok[0], int(tok[1]), limit=self.__limit)
+
+        if encoding is None:
+            encoding = locale.getpreferredencoding(False)
+
+        self.__encoding = encoding
+
+    async def disconnect(self) -> None:
+        """Disconnect from the TCP/IP device."""
+        if CommunicatorBase._verbose:
+            print(f"Diconnecting comunicator to {self.__address}")
+
+        self.__writer.close()
+        await self.__writer.wait_closed()
+
+    async def send(self, msg: str) -> None:
+        """Send a command to the TCP/IP device.
+
+            Args:
+                msg (str): The command to send.
+        """
+        if CommunicatorBase._verbose:
+            print(f'Sending "{msg}"')
+
+        self.__writer.write((msg + "\n").encode())
+        await self.__writer.drain()
+
+    async def read_line(self) -> str:
+        """Read a line from the TCP/IP device.
+
+            Returns:
+                The read line.
+        """
+        line = await self.__reader.readline()
+        if not line:
+            raise ConnectionError(f"Connection to {self.__address} was closed by the remote side.")
+
+        return line.decode(self.__encoding).rstrip()
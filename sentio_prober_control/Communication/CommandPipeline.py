@@ -0,0 +1,214 @@
+from collections import deque
+from typing import Any, Callable, Deque, Iterable, List, Optional
+
+from sentio_prober_control.Communication.CommunicatorBase import CommunicatorBase
+
+
+class PendingLine:
+    """A handle to the response of a command that was submitted to a pipeline.
+
+    The response line is read from the communicator when the pipeline needs room for
+    new commands, when the pipeline is flushed or when result() is called. You are not
+    meant to create objects of this class directly. They are returned by
+    CommandPipeline.submit.
+    """
+
+    __slots__ = ("command", "_pipeline", "_parser", "_line", "_error", "_done", "_value", "_parsed")
+
+    def __init__(self, pipeline: Optional["CommandPipeline"], command: str, parser: Optional[Callable[[str], Any]]) -> None:
+        self.command: str = command
+        self._pipeline = pipeline
+        self._parser = parser
+        self._line: Optional[str] = None
+        self._error: Optional[BaseException] = None
+        self._done: bool = False
+        self._value: Any = None
+        self._parsed: bool = False
+
+
+    def _resolve(self, line: Optional[str]) -> None:
+        self._line = line
+        self._done = True
+        self._pipeline = None
+
+
+    def _fail(self, error: BaseException) -> None:
+        self._error = error
+        self._resolve(None)
+
+
+    def done(self) -> bool:
+        """Returns True if the response line was already read from the communicator."""
+        return self._done
+
+
+    def line(self) -> Optional[str]:
+        """Returns the raw response line.
+
+        Blocks until the response was read. Commands that do not produce a response
+        (i.e. "*RCS 1") return None.
+
+        Raises:
+            TimeoutError: If reading the response timed out. The response is discarded by the communicator when it arrives.
+        """
+        if not self._done:
+            self._pipeline._wait_for(self)
+
+        if self._error is not None:
+            raise self._error
+
+        return self._line
+
+
+    def result(self) -> Any:
+        """Returns the parsed response.
+
+        Blocks until the response was read. If the pipeline was created with a parser
+        the parser is applied to the response line and its result is returned. Any exception
+        raised by the parser (i.e. a ProberException for an error response) is raised here.
+
+        Returns:
+            The parsed response, the raw response line if no parser is set or None if the
+            command does not produce a response.
+        """
+        line = self.line()
+
+        if not self._parsed:
+            if line is not None and self._parser is not None:
+                self._value = self._parser(line)
+            else:
+                self._value = line
+            self._parsed = True
+
+        return self._value
+
+
+class CommandPipeline:
+    """Keeps several commands in flight on a single communicator.
+
+    Normally every remote command is sent and then the caller blocks until the response
+    was read. On a network connection this costs one full round trip per command. A pipeline
+    sends up to depth commands before reading the first response. Responses are matched
+    to the commands in the order they were sent and handed back via PendingLine objects.
+
+    While a pipeline has commands in flight no other code must read from the same
+    communicator. Use the pipeline as a context manager to make sure all responses are
+    consumed when leaving the block.
+
+    Example:
+
+    ```py
+    with CommandPipeline(comm, depth=32) as pipe:
+        handles = [pipe.submit(f"map:die:get_status {c}, {r}") for c, r in dies]
+
+    status = [h.result() for h in handles]
+    ```
+    """
+
+    def __init__(self, comm: CommunicatorBase, depth: int = 16, parser: Optional[Callable[[str], Any]] = None) -> None:
+        """Create a new command pipeline.
+
+        Args:
+            comm (CommunicatorBase): The communicator used for sending commands and reading responses.
+            depth (int): The maximum number of commands in flight.
+            parser (Callable): An optional function that is applied to each response line by PendingLine.result.
+        """
+        if depth < 1:
+            raise ValueError(f"Pipeline depth must be at least 1! (depth={depth})")
+
+        self.__comm = comm
+        self.__depth = depth
+        self.__parser = parser
+        self.__in_flight: Deque[PendingLine] = deque()
+
+
+    def __enter__(self) -> "CommandPipeline":
+        return self
+
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.flush()
+            return
+
+        # Try to keep the communicator in sync but do not hide the original error.
+        try:
+            self.flush()
+        except Exception:
+            pass
+
+
+    @property
+    def depth(self) -> int:
+        """The maximum number of commands in flight."""
+        return self.__depth
+
+
+    @property
+    def in_flight(self) -> int:
+        """The number of commands whose response was not yet read."""
+        return len(self.__in_flight)
+
+
+    def submit(self, msg: str, parser: Optional[Callable[[str], Any]] = None) -> PendingLine:
+        """Send a command without waiting for its response.
+
+        If the pipeline is full the oldest response is read before the command is sent.
+
+        Args:
+            msg (str): The command to send.
+            parser (Callable): A parser for this command. Overrides the parser of the pipeline.
+
+        Returns:
+            A handle for retrieving the response.
+        """
+        handle = PendingLine(self, msg, parser if parser is not None else self.__parser)
+
+        if not CommunicatorBase.expects_response(msg):
+            self.__comm.send(msg)
+            handle._resolve(None)
+            return handle
+
+        while len(self.__in_flight) >= self.__depth:
+            self._read_next()
+
+        self.__comm.send(msg)
+        self.__in_flight.append(handle)
+        return handle
+
+
+    def submit_all(self, msgs: Iterable[str], parser: Optional[Callable[[str], Any]] = None) -> List[PendingLine]:
+        """Submit a sequence of commands.
+
+        Args:
+            msgs (Iterable[str]): The commands to send.
+            parser (Callable): A parser for these commands. Overrides the parser of the pipeline.
+
+        Returns:
+            A list of handles in the order of the commands.
+        """
+        return [self.submit(msg, parser) for msg in msgs]
+
+
+    def flush(self) -> None:
+        """Read all outstanding responses."""
+        while self.__in_flight:
+            self._read_next()
+
+
+    def _read_next(self) -> None:
+        handle = self.__in_flight.popleft()
+        try:
+            line = self.__comm.read_line()
+        except TimeoutError as e:
+            # The communicator discards the late response, so the handles behind this
+            # one still receive their own responses.
+            handle._fail(e)
+            raise
+
+        handle._resolve(line)
+
+
+    def _wait_for(self, handle: PendingLine) -> None:
+        while not handle.done():
+            self._read_next()
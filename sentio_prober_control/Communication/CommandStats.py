@@ -0,0 +1,224 @@
+import csv
+import json
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, List, TextIO, Tuple
+
+from sentio_prober_control.Communication.CommunicatorBase import CommunicationHook, CommunicatorBase
+from sentio_prober_control.Communication.Histogram import Histogram
+
+
+class CommandStatsEntry:
+    """The statistics of a single remote command.
+
+    Latencies are recorded in microseconds, sizes in bytes.
+
+    Attributes:
+        name (str): The name of the remote command (i.e. "map:step_next_die").
+        first_byte (Histogram): Time from sending the command until the first byte of the response was received.
+        total (Histogram): Time from sending the command until the response was received completely.
+        request_size (Histogram): The size of the commands.
+        response_size (Histogram): The size of the responses.
+        errors (Dict[int, int]): The number of responses per error code. Successful responses are counted with error code 0.
+        timeouts (int): The number of responses that were not received before the deadline.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name: str = name
+        self.first_byte: Histogram = Histogram()
+        self.total: Histogram = Histogram()
+        self.request_size: Histogram = Histogram()
+        self.response_size: Histogram = Histogram()
+        self.errors: Dict[int, int] = {}
+        self.timeouts: int = 0
+
+
+    def summary(self) -> Dict[str, Any]:
+        """A flat summary of the statistics.
+
+        Returns:
+            A dictionary with the number of calls, the accumulated time and percentiles of the latencies.
+        """
+        return {
+            "command": self.name,
+            "count": self.total.count,
+            "total_time_us": self.total.total,
+            "mean_us": round(self.total.mean(), 1),
+            "p50_us": self.total.percentile(50),
+            "p99_us": self.total.percentile(99),
+            "max_us": self.total.max,
+            "first_byte_p50_us": self.first_byte.percentile(50),
+            "first_byte_p99_us": self.first_byte.percentile(99),
+            "request_bytes": self.request_size.total,
+            "response_bytes": self.response_size.total,
+            "errors": sum(n for errc, n in self.errors.items() if errc != 0),
+            "timeouts": self.timeouts,
+        }
+
+
+class CommandStats(CommunicationHook):
+    """Collects latency, size and error statistics per remote command.
+
+    The statistics are recorded by hooking into a communicator. Commands are grouped by their
+    name, arguments are ignored. Responses are matched to commands in the order they were sent,
+    so pipelined commands are measured correctly.
+
+    Example:
+
+    ```py
+    stats = CommandStats()
+    stats.attach(prober.comm)
+
+    # ... test a wafer ...
+
+    for row in stats.summary()[:10]:
+        print(row["command"], row["count"], row["total_time_us"])
+
+    stats.to_csv("wafer_stats.csv")
+    ```
+    """
+
+    def __init__(self) -> None:
+        self.__lock = threading.Lock()
+        self.__entries: Dict[str, CommandStatsEntry] = {}
+        self.__in_flight: Deque[Tuple[CommandStatsEntry, float]] = deque()
+
+
+    def attach(self, comm: CommunicatorBase) -> None:
+        """Start collecting statistics of a communicator.
+
+        Args:
+            comm (CommunicatorBase): The communicator to observe.
+        """
+        comm.add_hook(self)
+
+
+    def detach(self, comm: CommunicatorBase) -> None:
+        """Stop collecting statistics of a communicator.
+
+        Args:
+            comm (CommunicatorBase): The communicator to stop observing.
+        """
+        comm.remove_hook(self)
+        with self.__lock:
+            self.__in_flight.clear()
+
+
+    def reset(self) -> None:
+        """Remove all recorded statistics."""
+        with self.__lock:
+            self.__entries.clear()
+
+
+    def __getitem__(self, name: str) -> CommandStatsEntry:
+        return self.__entries[name]
+
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.__entries
+
+
+    def names(self) -> List[str]:
+        """The names of all recorded commands."""
+        return list(self.__entries)
+
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """Summaries of all recorded commands.
+
+        Returns:
+            A list of CommandStatsEntry.summary results sorted by the accumulated time, longest first.
+        """
+        with self.__lock:
+            rows = [entry.summary() for entry in self.__entries.values()]
+
+        return sorted(rows, key=lambda row: row["total_time_us"], reverse=True)
+
+
+    def to_csv(self, file: str | TextIO) -> None:
+        """Write the summary as CSV with one row per command.
+
+        Args:
+            file (str|TextIO): The path of the file or a text stream.
+        """
+        rows = self.summary()
+        fields = list(rows[0]) if rows else list(CommandStatsEntry("").summary())
+
+        if isinstance(file, str):
+            with open(file, "w", newline="") as f:
+                self.__write_csv(f, fields, rows)
+        else:
+            self.__write_csv(file, fields, rows)
+
+
+    def to_json(self, file: str | TextIO) -> None:
+        """Write the statistics as JSON including the non-empty histogram buckets.
+
+        Args:
+            file (str|TextIO): The path of the file or a text stream.
+        """
+        with self.__lock:
+            data = []
+            for entry in self.__entries.values():
+                row = entry.summary()
+                row["error_codes"] = {str(errc): n for errc, n in entry.errors.items()}
+                row["histograms"] = {
+                    "first_byte_us": entry.first_byte.buckets(),
+                    "total_us": entry.total.buckets(),
+                    "request_bytes": entry.request_size.buckets(),
+                    "response_bytes": entry.response_size.buckets(),
+                }
+                data.append(row)
+
+        if isinstance(file, str):
+            with open(file, "w") as f:
+                json.dump(data, f, indent=1)
+        else:
+            json.dump(data, file, indent=1)
+
+
+    @staticmethod
+    def __write_csv(f: TextIO, fields: List[str], rows: List[Dict[str, Any]]) -> None:
+        writer = csv.DictWriter(f, fieldnames=fields)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+    #
+    # CommunicationHook
+    #
+
+    def command_sent(self, msg: str, size: int, t: float) -> None:
+        name = msg.split(" ", 1)[0]
+        with self.__lock:
+            entry = self.__entries.get(name)
+            if entry is None:
+                entry = self.__entries[name] = CommandStatsEntry(name)
+
+            entry.request_size.record(size)
+            if CommunicatorBase.expects_response(msg):
+                self.__in_flight.append((entry, t))
+
+
+    def response_received(self, errc: int, size: int, t_first_byte: float, t: float) -> None:
+        with self.__lock:
+            if not self.__in_flight:
+                return
+
+            entry, t_sent = self.__in_flight.popleft()
+            entry.first_byte.record(int((t_first_byte - t_sent) * 1e6))
+            entry.total.record(int((t - t_sent) * 1e6))
+            entry.response_size.record(size)
+            entry.errors[errc] = entry.errors.get(errc, 0) + 1
+
+
+    def response_timed_out(self, t: float) -> None:
+        with self.__lock:
+            if self.__in_flight:
+                entry, _ = self.__in_flight.popleft()
+                entry.timeouts += 1
+
+
+    def connection_reset(self) -> None:
+        with self.__lock:
+            self.__in_flight.clear()
@@ -1,4 +1,56 @@
+import time
 from abc import ABC
+from contextlib import contextmanager
+from typing import Callable, Iterable, Iterator, Tuple, TypeVar
+
+
+T = TypeVar("T")
+
+
+class CommunicationHook:
+    """Base class for objects that observe the traffic of a communicator.
+
+    Hooks are registered with CommunicatorBase.add_hook. The communicator calls them for
+    every command and response in the order they appear on the wire. Hooks must be fast,
+    they are called while the communicator is busy. All times are given as values of
+    time.perf_counter(). The default implementation of every method does nothing.
+    """
+
+    def command_sent(self, msg: str, size: int, t: float) -> None:
+        """Called after a command was sent.
+
+        Args:
+            msg (str): The command. For chunked commands only the beginning of the command is given.
+            size (int): The size of the command in bytes.
+            t (float): The time the command was sent.
+        """
+        pass
+
+
+    def response_received(self, errc: int, size: int, t_first_byte: float, t: float) -> None:
+        """Called after a response line was received.
+
+        Args:
+            errc (int): The error code of the response.
+            size (int): The size of the response line.
+            t_first_byte (float): The time the first byte of the response was received (if the communicator knows it, otherwise t).
+            t (float): The time the response was received completely.
+        """
+        pass
+
+
+    def response_timed_out(self, t: float) -> None:
+        """Called when reading a response timed out. The response will not be reported later.
+
+        Args:
+            t (float): The time the read timed out.
+        """
+        pass
+
+
+    def connection_reset(self) -> None:
+        """Called when the connection was reestablished. Responses to all commands sent so far are lost."""
+        pass
 
 
 class CommunicatorBase(ABC):
@@ -6,10 +58,240 @@ class CommunicatorBase(ABC):
 
     Communicators ore objects that implement different communication protocols
     for talking to the probe station.
+
+    Reading a response blocks until the response arrives, the default_timeout elapses or
+    the deadline set with deadline() is reached. In the latter two cases a TimeoutError
+    is raised. The response of the timed out command is discarded when it arrives later,
+    so that subsequent commands receive their own responses.
     """
 
     _verbose = False
 
+    default_timeout: float | None = None
+    """ The maximum time in seconds to wait for a single response when no deadline is active. None waits forever. """
+
+    __deadline: float | None = None
+    __stale_lines: int = 0
+    __hooks: Tuple[CommunicationHook, ...] = ()
+
+
+    def add_hook(self, hook: CommunicationHook) -> None:
+        """Register an object that is notified about all commands and responses.
+
+        Args:
+            hook (CommunicationHook): The hook to register.
+        """
+        self.__hooks = self.__hooks + (hook,)
+
+
+    def remove_hook(self, hook: CommunicationHook) -> None:
+        """Unregister a hook that was registered with add_hook.
+
+        Args:
+            hook (CommunicationHook): The hook to remove.
+        """
+        self.__hooks = tuple(h for h in self.__hooks if h is not hook)
+
+
+    @contextmanager
+    def deadline(self, timeout: float | None) -> Iterator[None]:
+        """Set a deadline for all communication inside of a with block.
+
+        Every read inside of the block raises a TimeoutError once the deadline has passed.
+        While a deadline is active it replaces default_timeout. Deadlines can be nested,
+        the earliest deadline applies.
+
+        Example:
+
+        ```py
+        with prober.comm.deadline(5):
+            prober.map.step_first_die()
+            prober.map.bins.set_bin(1)
+        ```
+
+        Args:
+            timeout (float): The time in seconds from now until the deadline. None does not set a deadline.
+        """
+        if timeout is None:
+            yield
+            return
+
+        previous = self.__deadline
+        deadline = time.monotonic() + timeout
+        self.__deadline = deadline if previous is None else min(previous, deadline)
+        try:
+            yield
+        finally:
+            self.__deadline = previous
+
+
+    def remaining_time(self) -> float | None:
+        """The time in seconds a read may block until it must time out.
+
+        Derived classes apply this to their transport before every blocking operation.
+
+        Returns:
+            The remaining time or None if reads may block forever. The value may be negative if the deadline has already passed.
+        """
+        if self.__deadline is not None:
+            return self.__deadline - time.monotonic()
+
+        return self.default_timeout
+
+
+    def discard_response(self) -> None:
+        """Discard the next response instead of returning it from read_line.
+
+        Use this when a command was sent but its response will not be read, so that the
+        following reads receive the responses of their own commands.
+        """
+        self._response_timed_out()
+
+
+    def reclaim_response(self) -> bool:
+        """Take back a response that was marked for discarding after a read timed out.
+
+        The next read_line returns the oldest response that was marked for discarding instead
+        of dropping it. This is meant for callers that send a command whose response arrives
+        together with the late one (i.e. abort_command after wait_complete timed out) and
+        want to read both of them.
+
+        Returns:
+            True if a response was taken back. False if no response is marked for discarding or the communicator does not support this.
+        """
+        if self.__stale_lines <= 0:
+            return False
+
+        self.__stale_lines -= 1
+        return True
+
+
+    def _read_response(self, read: Callable[[], T]) -> T:
+        """Read the response of the last command with the given transport function.
+
+        Responses of commands that timed out earlier are read and discarded first.
+        When the read times out the response is marked for discarding.
+
+        Args:
+            read (Callable): A function that reads a single line and raises TimeoutError on timeouts.
+
+        @private
+        """
+        try:
+            self._discard_stale_lines(read)
+            line = read()
+        except TimeoutError:
+            self._response_timed_out()
+            raise
+
+        if self.__hooks:
+            self._notify_received(line, len(line))
+
+        return line
+
+
+    def _discard_stale_lines(self, read: Callable[[], object]) -> None:
+        """Read and discard the responses of commands that timed out earlier.
+
+        @private
+        """
+        while self.__stale_lines > 0:
+            read()
+            self.__stale_lines -= 1
+
+
+    def _response_timed_out(self) -> None:
+        """Mark the response of the current command for discarding when it arrives later.
+
+        @private
+        """
+        self.__stale_lines += 1
+
+        if self.__hooks:
+            t = time.perf_counter()
+            for hook in self.__hooks:
+                hook.response_timed_out(t)
+
+
+    def _notify_sent(self, msg: str, size: int) -> None:
+        """Report a sent command to the hooks.
+
+        @private
+        """
+        if self.__hooks:
+            t = time.perf_counter()
+            for hook in self.__hooks:
+                hook.command_sent(msg, size, t)
+
+
+    def _notify_received(self, header: str | bytes | memoryview, size: int) -> None:
+        """Report a received response to the hooks.
+
+        Args:
+            header (str|bytes|memoryview): The response line or at least its part up to the first comma.
+            size (int): The size of the response line.
+
+        @private
+        """
+        if not self.__hooks:
+            return
+
+        t = time.perf_counter()
+        t_first_byte = self._first_byte_time()
+        if isinstance(header, memoryview):
+            header = bytes(header[:32])
+
+        try:
+            errc = int(header.split(b"," if isinstance(header, bytes) else ",", 1)[0]) & 1023
+        except ValueError:
+            errc = -1
+
+        for hook in self.__hooks:
+            hook.response_received(errc, size, t if t_first_byte is None else t_first_byte, t)
+
+
+    def _notify_reset(self) -> None:
+        """Report a reestablished connection to the hooks.
+
+        @private
+        """
+        for hook in self.__hooks:
+            hook.connection_reset()
+
+
+    def _first_byte_time(self) -> float | None:
+        """The time the first byte of the last response was received.
+
+        Derived classes that can measure this should override it.
+
+        @private
+        """
+        return None
+
+
+    def _clear_stale_lines(self) -> int:
+        """Forget about responses of timed out commands. Used after the connection was reestablished.
+
+        Returns:
+            The number of responses that would have been discarded.
+
+        @private
+        """
+        stale = self.__stale_lines
+        self.__stale_lines = 0
+        return stale
+
+
+    @property
+    def station_id(self) -> str | None:
+        """A string identifying the probe station the communicator is connected to.
+
+        It is derived from the address of the station (i.e. "tcpip://192.168.1.10:35555") and
+        used as key for information cached about the station. None if the communicator is
+        not connected or cannot identify the station.
+        """
+        return None
+
 
     def connect(self, address: str, encoding : str = 'utf-8') -> None:
         """Connect to the probe station.
@@ -35,9 +317,100 @@ class CommunicatorBase(ABC):
         raise NotImplementedError("CommunicatorBase.send is not implemented!")
 
 
+    def send_many(self, msgs: Iterable[str]) -> None:
+        """Send several commands at once without reading their responses.
+
+        Derived classes should override this to transmit all commands with a single write.
+        The default implementation passes each command to send. The responses must be read
+        afterwards with read_line in the order of the commands.
+
+        Args:
+            msgs (Iterable[str]): The commands to send.
+        """
+        for msg in msgs:
+            self.send(msg)
+
+
+    def send_chunks(self, chunks: Iterable[bytes]) -> None:
+        """Send a single command whose text is given in several pieces.
+
+        This is meant for commands with very large arguments (i.e. file_transfer) that are
+        generated incrementally. Derived classes should override this to transmit each chunk
+        as soon as it is available. The default implementation assembles the command and
+        passes it to send.
+
+        Args:
+            chunks (Iterable[bytes]): The pieces of the command without the line terminator.
+        """
+        self.send(b"".join(chunks).decode())
+
+
     def read_line(self):
         """Read a line from the probe station.
 
         Must be implemented by the derived class.
         """
         raise NotImplementedError("CommunicatorBase.read_line is not implemented!")
+
+
+    def read_line_bytes(self) -> bytes:
+        """Read a line from the probe station without decoding it.
+
+        Derived classes with access to the raw byte stream should override this to avoid
+        decoding the line. The default implementation encodes the result of read_line.
+
+        Returns:
+            The line without its terminator.
+        """
+        return self.read_line().encode()
+
+
+    def iter_line_chunks(self) -> Iterator[bytes | memoryview]:
+        """Read a single line from the probe station in chunks.
+
+        This is meant for very large responses that can be processed incrementally. Chunks
+        are only valid until the next chunk is requested. The default implementation returns
+        the whole line as a single chunk.
+
+        Returns:
+            An iterator over the chunks of the line.
+        """
+        yield self.read_line_bytes()
+
+
+    @staticmethod
+    def expects_response(msg: str) -> bool:
+        """Check wether the probe station will answer a given command.
+
+        SENTIO answers every remote command with exactly one line of text. The only exception
+        are the IEEE 488.2 style commands (i.e. "*RCS 1" or "*LOCAL") which do not send a
+        response unless they are queries (i.e. "*IDN?").
+
+        Args:
+            msg (str): The command to check.
+
+        Returns:
+            True if a response line must be read after sending the command.
+        """
+        return not msg.startswith("*") or "?" in msg
+
+
+    @staticmethod
+    def is_idempotent(msg: str) -> bool:
+        """Check wether a command can safely be executed a second time.
+
+        This is the case for IEEE 488.2 style queries and for remote commands that only read
+        state (i.e. "status:get_chuck_temp" or "loader:query_wafer_status"). Communicators use
+        this to decide wether a command whose response was lost may be sent again.
+
+        Args:
+            msg (str): The command to check.
+
+        Returns:
+            True if the command does not change the state of the probe station.
+        """
+        name = msg.split(" ", 1)[0].lower()
+        if name.startswith("*"):
+            return "?" in name
+
+        return name.rsplit(":", 1)[-1].startswith(("get_", "query_", "has_", "is_"))
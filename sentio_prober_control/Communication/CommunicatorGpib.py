@@ -1,8 +1,7 @@
+import bisect
 from enum import Enum
 
 from sentio_prober_control.Communication.CommunicatorBase import CommunicatorBase
-from sentio_prober_control.Devices.GpibAdlinkDriver import GpibAdlinkDriver
-from sentio_prober_control.Devices.GpibNiDriver import GpibNiDriver
 
 
 class GpibCardVendor(Enum):
@@ -22,16 +21,35 @@ class CommunicatorGpib(CommunicatorBase):
     use it either with ADLINK or National Instruments GPIB cards.
     The native drivers must be installed on the system or this class
     will not work.
+
+    Deadlines and default_timeout are enforced with the timeout of the GPIB board.
+    GPIB timeouts come in fixed steps (10 us, 30 us, 100 us ... 1000 s). The communicator
+    uses the longest step that ends before the deadline and waits again until the
+    deadline has passed, so reads time out no later than the deadline but may time
+    out up to 10 us after it.
+
+    A send that times out may leave part of the command in the input buffer of the
+    probe station. The communicator sends a device clear in this case, which also
+    discards responses to earlier commands that were not read yet.
     """
 
+    # Durations of the NI-488.2 timeout codes 1 to 17. Code 0 disables the timeout.
+    __timeout_steps = (10e-6, 30e-6, 100e-6, 300e-6, 1e-3, 3e-3, 10e-3, 30e-3, 100e-3, 300e-3, 1, 3, 10, 30, 100, 300, 1000)
+
     def __init__(self, vendor: GpibCardVendor):
         """Construcst a GPIB communicator.
 
         :param vendor: Specifies the native driver to use (either Adlink or NI).
         """
+        self.__station_id: str | None = None
+        self.__timeout_code: int | None = None
+
+        # The drivers are only imported for the selected card.
         if vendor == GpibCardVendor.Adlink:
+            from sentio_prober_control.Devices.GpibAdlinkDriver import GpibAdlinkDriver
             self._driver = GpibAdlinkDriver()
         elif vendor == GpibCardVendor.NationalInstruments:
+            from sentio_prober_control.Devices.GpibNiDriver import GpibNiDriver
             self._driver = GpibNiDriver()
         else:
             raise NotImplementedError(
@@ -69,6 +87,12 @@ class CommunicatorGpib(CommunicatorBase):
         board: str = tok[0]
         addr: int = int(tok[1])
         self._driver.connect(board, addr)
+        self.__station_id = f"gpib://{board}:{addr}"
+
+    @property
+    def station_id(self) -> str | None:
+        """The address of the station in the form "gpib://BOARD_NAME:ADDRESS". None if not connected."""
+        return self.__station_id
 
     def disconnect(self):
         """Disconnects from the GPIB device."""
@@ -79,8 +103,41 @@ class CommunicatorGpib(CommunicatorBase):
 
         :param msg: The text string to send.
         """
-        self._driver.send(msg)
+        self.__apply_timeout()
+        try:
+            self._driver.send(msg)
+        except TimeoutError:
+            # the responses to unread commands are cleared along with the partial command
+            self._driver.clear()
+            self._clear_stale_lines()
+            raise
+
+        self._notify_sent(msg, len(msg))
 
     def read_line(self):
-        """Read a line from the communication interface."""
-        return self._driver.receive().rstrip()
+        """Read a line from the communication interface.
+
+        :raises TimeoutError: If the line was not received before the deadline.
+        """
+        return self._read_response(self.__receive)
+
+    def __receive(self) -> str:
+        while True:
+            self.__apply_timeout()
+            try:
+                return self._driver.receive().rstrip()
+            except TimeoutError:
+                remaining = self.remaining_time()
+                if remaining is None or remaining <= 0:
+                    raise
+
+    def __apply_timeout(self) -> None:
+        remaining = self.remaining_time()
+        if remaining is None:
+            code = 0
+        else:
+            code = max(bisect.bisect_right(CommunicatorGpib.__timeout_steps, remaining), 1)
+
+        if code != self.__timeout_code:
+            self._driver.set_timeout(code)
+            self.__timeout_code = code
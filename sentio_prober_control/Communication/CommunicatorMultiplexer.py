@@ -0,0 +1,334 @@
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Deque, Iterable, Iterator, TypeVar
+
+from sentio_prober_control.Communication.CommunicatorBase import CommunicationHook, CommunicatorBase
+from sentio_prober_control.Communication.CommandPipeline import CommandPipeline
+
+
+T = TypeVar("T")
+
+
+class _Ticket:
+    """Marks the position of a single expected response in the response stream.
+
+    @private
+    """
+
+    __slots__ = ("abandoned",)
+
+    def __init__(self) -> None:
+        self.abandoned: bool = False
+
+
+class CommunicatorMultiplexer(CommunicatorBase):
+    """Lets several threads share a single communicator.
+
+    SENTIO answers commands strictly in the order they were received. When two threads use
+    the same communicator without synchronization one thread may read the response to a command
+    of the other thread. This class wraps another communicator and hands every response to the
+    thread that sent the command.
+
+    Each command that expects a response gets a ticket when it is sent. Tickets are kept in a
+    single queue in the order of the commands on the wire and in a queue per thread. A thread
+    reading a line waits until its oldest ticket is at the head of the global queue and then
+    reads its response from the wrapped communicator. Sending does not wait for reads, so a
+    thread can queue its command while another thread is still waiting for a response. The
+    command is pipelined behind the pending ones instead of waiting for a global lock.
+
+    Deadlines are kept per thread. A thread whose deadline passes while it waits for its turn
+    gets a TimeoutError and its response is discarded when it arrives.
+
+    Example:
+
+    ```py
+    comm = CommunicatorMultiplexer(CommunicatorTcpIp.create("127.0.0.1:35555"))
+    prober = SentioProber(comm)
+
+    def monitor():
+        while running:
+            log(prober.status.get_chuck_temp())
+
+    threading.Thread(target=monitor).start()
+    prober.map.step_first_die()
+    ```
+    """
+
+    def __init__(self, comm: CommunicatorBase) -> None:
+        """Wrap a communicator.
+
+        The wrapped communicator must not be used directly while it is wrapped.
+
+        Args:
+            comm (CommunicatorBase): The communicator to share between threads.
+        """
+        self.__comm = comm
+        self.__send_lock = threading.Lock()
+        self.__cond = threading.Condition()
+        self.__queue: Deque[_Ticket] = deque()
+        self.__reading = False
+        self.__local = threading.local()
+
+
+    @property
+    def comm(self) -> CommunicatorBase:
+        """The wrapped communicator."""
+        return self.__comm
+
+
+    @property
+    def default_timeout(self) -> float | None:
+        """The default timeout of the wrapped communicator."""
+        return self.__comm.default_timeout
+
+
+    @default_timeout.setter
+    def default_timeout(self, value: float | None) -> None:
+        self.__comm.default_timeout = value
+
+
+    def add_hook(self, hook: CommunicationHook) -> None:
+        """Register a hook with the wrapped communicator. See CommunicatorBase.add_hook."""
+        self.__comm.add_hook(hook)
+
+
+    def remove_hook(self, hook: CommunicationHook) -> None:
+        """Remove a hook from the wrapped communicator. See CommunicatorBase.remove_hook."""
+        self.__comm.remove_hook(hook)
+
+
+    @contextmanager
+    def deadline(self, timeout: float | None) -> Iterator[None]:
+        """Set a deadline for all communication of the calling thread inside of a with block.
+
+        Works like CommunicatorBase.deadline but does not affect other threads.
+
+        Args:
+            timeout (float): The time in seconds from now until the deadline. None does not set a deadline.
+        """
+        if timeout is None:
+            yield
+            return
+
+        previous = getattr(self.__local, "deadline", None)
+        deadline = time.monotonic() + timeout
+        self.__local.deadline = deadline if previous is None else min(previous, deadline)
+        try:
+            yield
+        finally:
+            self.__local.deadline = previous
+
+
+    def remaining_time(self) -> float | None:
+        """The time in seconds a read of the calling thread may block until it must time out.
+
+        Returns:
+            The remaining time or None if reads may block forever.
+        """
+        deadline = getattr(self.__local, "deadline", None)
+        if deadline is not None:
+            return deadline - time.monotonic()
+
+        return self.default_timeout
+
+
+    @property
+    def pending(self) -> int:
+        """The number of responses of all threads that were not yet read."""
+        with self.__cond:
+            return len(self.__queue)
+
+
+    def connect(self, address: str, encoding: str = 'utf-8') -> None:
+        """Connect the wrapped communicator."""
+        self.__comm.connect(address, encoding)
+
+
+    def disconnect(self):
+        """Disconnect the wrapped communicator."""
+        self.__comm.disconnect()
+
+
+    def send(self, msg: str):
+        """Send a command to the probe station.
+
+        The command is sent immediately, even when other threads are waiting for responses.
+
+        Args:
+            msg (str): The command to send.
+        """
+        self.__send(msg, lambda: self.__comm.send(msg))
+
+
+    def send_chunks(self, chunks: Iterable[bytes]) -> None:
+        """Send a single command whose text is given in several pieces.
+
+        Other threads cannot send until the last chunk was sent.
+
+        Args:
+            chunks (Iterable[bytes]): The pieces of the command without the line terminator.
+        """
+        self.__send("", lambda: self.__comm.send_chunks(chunks))
+
+
+    def pipeline(self, depth: int = 16) -> CommandPipeline:
+        """Create a pipeline that keeps up to depth commands of the calling thread in flight.
+
+        Args:
+            depth (int): The maximum number of commands sent before the first response is read.
+
+        Returns:
+            A CommandPipeline bound to this communicator. Responses are returned as raw lines.
+        """
+        return CommandPipeline(self, depth)
+
+
+    def read_line(self):
+        """Read the response to the oldest unanswered command of the calling thread.
+
+        Returns:
+            The read line.
+
+        Raises:
+            TimeoutError: If the line was not received before the deadline.
+        """
+        return self.__receive(self.__comm.read_line)
+
+
+    def read_line_bytes(self) -> bytes:
+        """Read the response to the oldest unanswered command of the calling thread without decoding it.
+
+        Returns:
+            The line without its terminator.
+
+        Raises:
+            TimeoutError: If the line was not received before the deadline.
+        """
+        return self.__receive(self.__comm.read_line_bytes)
+
+
+    def iter_line_chunks(self) -> Iterator[bytes | memoryview]:
+        """Read the response to the oldest unanswered command of the calling thread in chunks.
+
+        Other threads cannot read until the iterator is exhausted.
+
+        Returns:
+            An iterator over the chunks of the line.
+
+        Raises:
+            TimeoutError: If the line was not received before the deadline.
+        """
+        self.__wait_for_turn()
+        try:
+            with self.__comm.deadline(self.remaining_time()):
+                yield from self.__comm.iter_line_chunks()
+        finally:
+            self.__finish_read()
+
+
+    def discard_response(self) -> None:
+        """Discard the response to the oldest unanswered command of the calling thread."""
+        pending = self.__pending_tickets()
+        if not pending:
+            raise RuntimeError("The calling thread has not sent a command that expects a response!")
+
+        with self.__cond:
+            pending.popleft().abandoned = True
+            self.__cond.notify_all()
+
+
+    def reclaim_response(self) -> bool:
+        """Not supported. Responses of timed out reads are always discarded.
+
+        Returns:
+            False
+        """
+        return False
+
+
+    def __pending_tickets(self) -> Deque[_Ticket]:
+        pending = getattr(self.__local, "pending", None)
+        if pending is None:
+            pending = self.__local.pending = deque()
+
+        return pending
+
+
+    def __send(self, msg: str, send: Callable[[], None]) -> None:
+        if not CommunicatorBase.expects_response(msg):
+            with self.__send_lock:
+                send()
+            return
+
+        ticket = _Ticket()
+        with self.__send_lock:
+            with self.__cond:
+                self.__queue.append(ticket)
+
+            try:
+                send()
+            except BaseException:
+                with self.__cond:
+                    self.__queue.remove(ticket)
+                    self.__cond.notify_all()
+                raise
+
+        self.__pending_tickets().append(ticket)
+
+
+    def __receive(self, read: Callable[[], T]) -> T:
+        self.__wait_for_turn()
+        try:
+            with self.__comm.deadline(self.remaining_time()):
+                return read()
+        finally:
+            self.__finish_read()
+
+
+    def __wait_for_turn(self) -> None:
+        """Block until the response of the oldest ticket of the calling thread is next in line.
+
+        Responses of commands that were abandoned by timed out threads are discarded on the
+        way. On return the calling thread has the exclusive right to read from the wrapped
+        communicator and must call __finish_read afterwards.
+        """
+        pending = self.__pending_tickets()
+        if not pending:
+            raise RuntimeError("The calling thread has not sent a command that expects a response!")
+
+        ticket = pending[0]
+        while True:
+            with self.__cond:
+                while self.__reading or (self.__queue[0] is not ticket and not self.__queue[0].abandoned):
+                    remaining = self.remaining_time()
+                    if remaining is not None and remaining <= 0:
+                        pending.popleft()
+                        ticket.abandoned = True
+                        self.__cond.notify_all()
+                        raise TimeoutError("Timed out while waiting for the responses of other threads.")
+
+                    self.__cond.wait(remaining)
+
+                self.__reading = True
+                if self.__queue[0] is ticket:
+                    pending.popleft()
+                    return
+
+            # The head belongs to a thread that gave up waiting. A timeout here is not an error
+            # because the wrapped communicator discards the response when it arrives.
+            try:
+                with self.__comm.deadline(self.remaining_time()):
+                    self.__comm.read_line_bytes()
+            except TimeoutError:
+                pass
+            finally:
+                self.__finish_read()
+
+
+    def __finish_read(self) -> None:
+        with self.__cond:
+            self.__queue.popleft()
+            self.__reading = False
+            self.__cond.notify_all()
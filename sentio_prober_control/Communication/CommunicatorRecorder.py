@@ -0,0 +1,220 @@
+import json
+import time
+from typing import Any, Dict, Iterable, Iterator, TextIO
+
+from sentio_prober_control.Communication.CommunicatorBase import CommunicationHook, CommunicatorBase
+from sentio_prober_control.Communication.CommandPipeline import CommandPipeline
+
+
+TRACE_VERSION = 2
+""" The version of the trace format written by CommunicatorRecorder. """
+
+
+class CommunicatorRecorder(CommunicatorBase):
+    """Records the traffic of another communicator to a trace file.
+
+    Every sent command and every received response is written as a JSON object on a line
+    of its own (JSONL). The first line is a header. Each following line has a "t" field with
+    the time in seconds since recording started, measured with a monotonic clock, and one of:
+
+    - "send": the command sent to the probe station,
+    - "read": the response line received from the probe station,
+    - "error": the name of the exception raised while reading a response (TimeoutError or ConnectionError).
+    - "send_part", "read_part": a piece of a chunked command or response.
+
+    Chunked commands and responses (see send_chunks and iter_line_chunks) are written piece by
+    piece as they pass through, so they are never held in memory. Each piece is a "send_part" or
+    "read_part" event. A "send" or "read" event with an empty string ends the line. A line is
+    the concatenation of its parts.
+
+    ```
+    {"trace": "sentio", "version": 2}
+    {"t": 0.000012, "send": "map:get_num_cols"}
+    {"t": 0.000410, "read": "0,0,10"}
+    {"t": 0.000415, "send": "vis:snap_image **download**, 0"}
+    {"t": 0.001201, "read_part": "0,0,/9j/4AAQSkZJRgABAQ"}
+    {"t": 0.001310, "read_part": "AAAQABAAD"}
+    {"t": 0.001312, "read": ""}
+    ```
+
+    A trace can be played back with CommunicatorReplay.
+
+    Example:
+
+    ```py
+    comm = CommunicatorRecorder(CommunicatorTcpIp.create("127.0.0.1:35555"), "lot.jsonl")
+    prober = SentioProber(comm)
+    # ... run the test program ...
+    comm.disconnect()
+    ```
+    """
+
+    def __init__(self, comm: CommunicatorBase, trace: str | TextIO) -> None:
+        """Start recording.
+
+        Args:
+            comm (CommunicatorBase): The communicator whose traffic is recorded.
+            trace (str|TextIO): The path of the trace file or a text stream the trace is written to.
+        """
+        self.__comm = comm
+        self.__owns_file = isinstance(trace, str)
+        self.__file: TextIO = open(trace, "w", encoding="utf-8", newline="\n") if isinstance(trace, str) else trace
+        self.__start = time.perf_counter()
+        self.__file.write(json.dumps({"trace": "sentio", "version": TRACE_VERSION}) + "\n")
+
+
+    @property
+    def comm(self) -> CommunicatorBase:
+        """The wrapped communicator."""
+        return self.__comm
+
+
+    @property
+    def default_timeout(self) -> float | None:
+        """The default timeout of the wrapped communicator."""
+        return self.__comm.default_timeout
+
+
+    @default_timeout.setter
+    def default_timeout(self, value: float | None) -> None:
+        self.__comm.default_timeout = value
+
+
+    def add_hook(self, hook: CommunicationHook) -> None:
+        """Register a hook with the wrapped communicator. See CommunicatorBase.add_hook."""
+        self.__comm.add_hook(hook)
+
+
+    def remove_hook(self, hook: CommunicationHook) -> None:
+        """Remove a hook from the wrapped communicator. See CommunicatorBase.remove_hook."""
+        self.__comm.remove_hook(hook)
+
+
+    def deadline(self, timeout: float | None):
+        """Set a deadline on the wrapped communicator. See CommunicatorBase.deadline."""
+        return self.__comm.deadline(timeout)
+
+
+    def remaining_time(self) -> float | None:
+        """The remaining time of the wrapped communicator. See CommunicatorBase.remaining_time."""
+        return self.__comm.remaining_time()
+
+
+    def close(self) -> None:
+        """Stop recording and close the trace. The wrapped communicator stays connected."""
+        if self.__file.closed:
+            return
+
+        if self.__owns_file:
+            self.__file.close()
+        else:
+            self.__file.flush()
+
+
+    def connect(self, address: str, encoding: str = 'utf-8') -> None:
+        """Connect the wrapped communicator."""
+        self.__comm.connect(address, encoding)
+
+
+    def disconnect(self):
+        """Disconnect the wrapped communicator and close the trace."""
+        try:
+            self.__comm.disconnect()
+        finally:
+            self.close()
+
+
+    def send(self, msg: str):
+        """Send a command and record it.
+
+        Args:
+            msg (str): The command to send.
+        """
+        self.__record("send", msg)
+        self.__comm.send(msg)
+
+
+    def send_chunks(self, chunks: Iterable[bytes]) -> None:
+        """Send a chunked command and record each chunk as it is sent.
+
+        Args:
+            chunks (Iterable[bytes]): The pieces of the command without the line terminator.
+        """
+        def tee():
+            for chunk in chunks:
+                self.__record("send_part", bytes(chunk).decode("utf-8", errors="surrogateescape"))
+                yield chunk
+
+        try:
+            self.__comm.send_chunks(tee())
+        finally:
+            self.__record("send", "")
+
+
+    def pipeline(self, depth: int = 16) -> CommandPipeline:
+        """Create a pipeline whose traffic is recorded.
+
+        Args:
+            depth (int): The maximum number of commands sent before the first response is read.
+
+        Returns:
+            A CommandPipeline bound to this communicator. Responses are returned as raw lines.
+        """
+        return CommandPipeline(self, depth)
+
+
+    def read_line(self):
+        """Read a line from the wrapped communicator and record it.
+
+        Returns:
+            The read line.
+        """
+        line = self.__read(self.__comm.read_line)
+        self.__record("read", line)
+        return line
+
+
+    def read_line_bytes(self) -> bytes:
+        """Read a line without decoding it from the wrapped communicator and record it.
+
+        Returns:
+            The line without its terminator.
+        """
+        line = self.__read(self.__comm.read_line_bytes)
+        self.__record("read", line.decode("utf-8", errors="surrogateescape"))
+        return line
+
+
+    def iter_line_chunks(self) -> Iterator[bytes | memoryview]:
+        """Read a line in chunks from the wrapped communicator and record each chunk as it is read.
+
+        Returns:
+            An iterator over the chunks of the line.
+        """
+        chunks = self.__comm.iter_line_chunks()
+        while True:
+            chunk = self.__read(lambda: next(chunks, None))
+            if chunk is None:
+                break
+
+            self.__record("read_part", bytes(chunk).decode("utf-8", errors="surrogateescape"))
+            yield chunk
+
+        self.__record("read", "")
+
+
+    def __read(self, read):
+        try:
+            return read()
+        except (TimeoutError, ConnectionError) as e:
+            self.__record("error", "TimeoutError" if isinstance(e, TimeoutError) else "ConnectionError")
+            raise
+
+
+    def __now(self) -> float:
+        return time.perf_counter() - self.__start
+
+
+    def __record(self, kind: str, data: str) -> None:
+        event: Dict[str, Any] = {"t": round(self.__now(), 6), kind: data}
+        self.__file.write(json.dumps(event) + "\n")
@@ -0,0 +1,222 @@
+import json
+import time
+from typing import Any, Dict, Iterable, Iterator, List, TextIO
+
+from sentio_prober_control.Communication.CommunicatorBase import CommunicatorBase
+from sentio_prober_control.Communication.CommandPipeline import CommandPipeline
+
+
+class ReplayError(Exception):
+    """Raised by CommunicatorReplay when the replayed program deviates from the recorded trace."""
+    pass
+
+
+class CommunicatorReplay(CommunicatorBase):
+    """Plays back a trace recorded with CommunicatorRecorder.
+
+    The replay communicator answers every read with the next recorded response. Commands
+    that are sent must match the recorded commands in the same order, unless checking is
+    disabled. This allows running and profiling a test program offline against a recorded
+    production session.
+
+    By default responses are returned immediately. In realtime mode every response is delayed
+    by the time that passed between the previous event and the response in the recording. This
+    reproduces the time the probe station needed, while time spent by the test program itself
+    is measured as it is now.
+
+    Recorded TimeoutError and ConnectionError events are raised again when their response is read.
+
+    Example:
+
+    ```py
+    prober = SentioProber(CommunicatorReplay("lot.jsonl", realtime=True))
+    # ... run the test program ...
+    ```
+    """
+
+    def __init__(self, trace: str | TextIO, realtime: bool = False, check: bool = True) -> None:
+        """Load a trace.
+
+        Args:
+            trace (str|TextIO): The path of the trace file or a text stream to read the trace from.
+            realtime (bool): Delay responses like in the recording.
+            check (bool): Raise a ReplayError if a sent command does not match the recording.
+        """
+        if isinstance(trace, str):
+            with open(trace, "r", encoding="utf-8") as f:
+                lines = f.readlines()
+        else:
+            lines = trace.readlines()
+
+        header = json.loads(lines[0]) if lines else {}
+        if header.get("trace") != "sentio":
+            raise ReplayError("Not a SENTIO communication trace!")
+
+        self.__events: List[Dict[str, Any]] = [json.loads(line) for line in lines[1:] if line.strip()]
+        self.__pos = 0
+        self.realtime = realtime
+        self.check = check
+
+        # time of the last event in the recording and in the replay
+        self.__last_recorded = 0.0
+        self.__last_replayed = time.perf_counter()
+
+
+    @property
+    def remaining(self) -> int:
+        """The number of events in the trace that were not yet replayed."""
+        return len(self.__events) - self.__pos
+
+
+    def connect(self, address: str, encoding: str = 'utf-8') -> None:
+        pass
+
+
+    def disconnect(self):
+        pass
+
+
+    def send(self, msg: str):
+        """Consume the next recorded command.
+
+        Args:
+            msg (str): The command to send.
+
+        Raises:
+            ReplayError: If the trace does not contain this command at the current position.
+        """
+        pos = self.__pos
+        recorded = "".join(self.__take_parts("send_part")) + self.__take("send")["send"]
+        if self.check and recorded != msg:
+            raise ReplayError(f"Replay diverged from trace at event {pos + 1}: sent \"{msg}\" but recorded \"{recorded}\".")
+
+        self._notify_sent(msg, len(msg) + 1)
+
+
+    def send_chunks(self, chunks: Iterable[bytes]) -> None:
+        """Consume the next recorded command. See send.
+
+        The chunks are compared with the recording one by one, the command is never assembled.
+        """
+        pos = self.__pos
+        recorded = iter(self.__take_parts("send_part") + [self.__take("send")["send"]])
+        expected = b""
+        head = b""
+        size = 1
+        for chunk in chunks:
+            chunk = bytes(chunk)
+            while len(expected) < len(chunk):
+                part = next(recorded, None)
+                if part is None:
+                    break
+                expected += part.encode("utf-8", errors="surrogateescape")
+
+            if self.check and not expected.startswith(chunk):
+                raise ReplayError(f"Replay diverged from trace at event {pos + 1}: the chunked command differs from the recording after {size - 1} bytes.")
+
+            expected = expected[len(chunk):]
+            size += len(chunk)
+            if len(head) < 64:
+                head += chunk[:64]
+
+        if self.check and (expected or any(recorded)):
+            raise ReplayError(f"Replay diverged from trace at event {pos + 1}: the chunked command is shorter than the recording.")
+
+        self._notify_sent(head[:64].decode("utf-8", errors="replace"), size)
+
+
+    def pipeline(self, depth: int = 16) -> CommandPipeline:
+        """Create a pipeline on the replayed session.
+
+        Args:
+            depth (int): The maximum number of commands sent before the first response is read.
+
+        Returns:
+            A CommandPipeline bound to this communicator. Responses are returned as raw lines.
+        """
+        return CommandPipeline(self, depth)
+
+
+    def read_line(self):
+        """Return the next recorded response.
+
+        Returns:
+            The recorded line.
+
+        Raises:
+            ReplayError: If the trace does not contain a response at the current position.
+        """
+        return b"".join(self.iter_line_chunks()).decode("utf-8", errors="surrogateescape")
+
+
+    def read_line_bytes(self) -> bytes:
+        """Return the next recorded response without decoding it. See read_line."""
+        return self.read_line().encode("utf-8", errors="surrogateescape")
+
+
+    def iter_line_chunks(self) -> Iterator[bytes]:
+        """Return the next recorded response in the chunks it was recorded in. See read_line."""
+        header = None
+        size = 0
+        while True:
+            event = self.__take("read_part", "read", "error")
+            if "error" in event:
+                if event["error"] == "TimeoutError":
+                    self._response_timed_out()
+                    raise TimeoutError("Recorded timeout.")
+
+                raise ConnectionError("Recorded connection loss.")
+
+            chunk = event.get("read_part", event.get("read")).encode("utf-8", errors="surrogateescape")
+            if header is None:
+                header = chunk
+            size += len(chunk)
+
+            # the empty "read" event only ends a line recorded in parts
+            if chunk or "read" not in event or size == 0:
+                yield chunk
+
+            if "read" in event:
+                break
+
+        self._notify_received(header, size)
+
+
+    def __take_parts(self, kind: str) -> List[str]:
+        """Consume the consecutive events of the given kind."""
+        parts = []
+        while self.__pos < len(self.__events) and kind in self.__events[self.__pos]:
+            parts.append(self.__take(kind)[kind])
+
+        return parts
+
+
+    def __take(self, *kinds: str) -> Dict[str, Any]:
+        """Consume the next event, which must be of one of the given kinds. Responses are delayed in realtime mode."""
+        event = self.__next(*kinds)
+
+        if self.realtime and "send" not in event and "send_part" not in event:
+            delay = self.__last_replayed + (event["t"] - self.__last_recorded) - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+
+        self.__advance(event)
+        return event
+
+
+    def __next(self, *kinds: str) -> Dict[str, Any]:
+        if self.__pos >= len(self.__events):
+            raise ReplayError(f"Replay diverged from trace: the trace ended but a \"{kinds[0]}\" was requested.")
+
+        event = self.__events[self.__pos]
+        if not any(kind in event for kind in kinds):
+            recorded = "send" if "send" in event else "read"
+            raise ReplayError(f"Replay diverged from trace at event {self.__pos + 1}: expected a \"{kinds[0]}\" but recorded a \"{recorded}\".")
+
+        return event
+
+
+    def __advance(self, event: Dict[str, Any]) -> None:
+        self.__pos += 1
+        self.__last_recorded = event["t"]
+        self.__last_replayed = time.perf_counter()
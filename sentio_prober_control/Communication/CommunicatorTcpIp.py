@@ -1,16 +1,57 @@
 import socket
 import locale
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, Iterable, Iterator, List, Optional, TypeVar
 
 from sentio_prober_control.Communication.CommunicatorBase import CommunicatorBase
+from sentio_prober_control.Communication.CommandPipeline import CommandPipeline
+from sentio_prober_control.Communication.SocketLineReader import SocketLineReader
+
+
+T = TypeVar("T")
 
 
 class CommunicatorTcpIp(CommunicatorBase):
-    """Communicator for TCP/IP communication."""
+    """Communicator for TCP/IP communication.
+
+    The communicator can reconnect automatically when the connection is lost. This is disabled
+    by default and enabled by setting reconnect_attempts. After reconnecting, the session commands
+    sent over the lost connection (i.e. "*RCS 1") are sent again. Commands whose response was
+    lost are sent again when they are idempotent (see CommunicatorBase.is_idempotent). Otherwise
+    it is unknown wether SENTIO executed them and a ConnectionError is raised, but the communicator
+    stays usable.
+
+    A send that times out may leave part of the command on the wire. SENTIO would read the
+    next command as the continuation of the truncated one, so the connection is considered
+    broken. The next operation reconnects like after a lost connection or raises a
+    ConnectionError if reconnecting is disabled.
+
+    Example:
+
+    ```py
+    comm = CommunicatorTcpIp.create("127.0.0.1:35555")
+    comm.reconnect_attempts = 8
+    prober = SentioProber(comm)
+    ```
+    """
+
+    reconnect_attempts: int = 0
+    """ The number of attempts to reconnect after the connection was lost. 0 disables reconnecting. """
+
+    reconnect_delay: float = 0.25
+    """ The time in seconds to wait before the second reconnect attempt. The delay doubles with every further attempt. """
+
+    reconnect_max_delay: float = 8.0
+    """ The maximum time in seconds to wait between two reconnect attempts. """
 
     def __init__(self):
         """Construcst a TCP/IP communicator."""
-        self.__socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self.__socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.__socket = CommunicatorTcpIp.__create_socket()
+        self.__unanswered: Deque[Optional[str]] = deque()
+        self.__session: Dict[str, str] = {}
+        self.__station_id: str | None = None
+        self.__broken = False
 
     @staticmethod
     def create(addr: str, encoding : str | None = None) -> CommunicatorBase:
@@ -24,7 +65,7 @@ class CommunicatorTcpIp(CommunicatorBase):
         if encoding is None:
             encoding = locale.getpreferredencoding(False)
 
-        c.connect(addr)
+        c.connect(addr, encoding)
         return c
 
     def connect(self, address: str, encoding : str | None = None) -> None:
@@ -48,11 +89,18 @@ class CommunicatorTcpIp(CommunicatorBase):
             print(f"Connecting comunicator to {self.__address}:{self.__port}")
 
         self.__socket.connect((self.__address, self.__port))
+        self.__station_id = f"tcpip://{self.__address}:{self.__port}"
 
         if encoding is None:
             encoding = locale.getpreferredencoding(False)
 
-        self.__reader = self.__socket.makefile(mode='r', encoding=encoding)
+        self.__encoding = encoding
+        self.__reader = SocketLineReader(self.__socket)
+
+    @property
+    def station_id(self) -> str | None:
+        """The address of the station in the form "tcpip://IP_ADDRESS:PORT". None if not connected."""
+        return self.__station_id
 
     def disconnect(self):
         """Disconnect from the TCP/IP device."""
@@ -72,12 +120,282 @@ class CommunicatorTcpIp(CommunicatorBase):
         if CommunicatorBase._verbose:
             print(f'Sending "{msg}"')
 
-        self.__socket.send((msg + "\n").encode())
+        data = (msg + "\n").encode()
+        self.__with_recovery(lambda: self.__sendall(data))
+        if CommunicatorBase.expects_response(msg):
+            self.__unanswered.append(msg)
+
+        self._notify_sent(msg, len(data))
+
+        if CommunicatorTcpIp.__is_session_command(msg):
+            self.__session[msg.split(" ", 1)[0].upper()] = msg
+
+    def send_many(self, msgs: Iterable[str]) -> None:
+        """Send several commands with a single write to the socket.
+
+            The responses must be read afterwards with read_line in the order of the commands.
+
+            Args:
+                msgs (Iterable[str]): The commands to send.
+
+            Raises:
+                ConnectionError: If the connection was lost. When reconnecting is enabled the
+                    commands are sent again if all of them are idempotent.
+        """
+        msgs = list(msgs)
+        if not msgs:
+            return
+
+        if CommunicatorBase._verbose:
+            print(f"Sending {len(msgs)} commands")
+
+        data = "".join(msg + "\n" for msg in msgs).encode()
+        self.__check_broken()
+        self.__apply_timeout()
+        try:
+            self.__sendall(data)
+        except ConnectionError as e:
+            # Some of the commands may have been received. Recovery sends them again if
+            # they are idempotent and raises otherwise.
+            self.__unanswered.extend(msg for msg in msgs if CommunicatorBase.expects_response(msg))
+            self.__recover(e)
+            return
+
+        for msg in msgs:
+            if CommunicatorBase.expects_response(msg):
+                self.__unanswered.append(msg)
+
+            self._notify_sent(msg, len(msg) + 1)
+
+            if CommunicatorTcpIp.__is_session_command(msg):
+                self.__session[msg.split(" ", 1)[0].upper()] = msg
+
+    def send_chunks(self, chunks: Iterable[bytes]) -> None:
+        """Send a single command whose text is given in several pieces.
+
+            Every chunk is written to the socket as soon as it is produced, so the command
+            is never assembled in memory.
+
+            Args:
+                chunks (Iterable[bytes]): The pieces of the command without the line terminator.
+        """
+        if CommunicatorBase._verbose:
+            print("Sending chunked command")
+
+        self.__check_broken()
+        self.__apply_timeout()
+        head = b""
+        size = 1
+        try:
+            for chunk in chunks:
+                self.__sendall(chunk)
+                size += len(chunk)
+                if len(head) < 64:
+                    head += bytes(chunk[:64])
+
+            self.__sendall(b"\n")
+        except ConnectionError as e:
+            # the chunks are consumed, the command cannot be sent again
+            self.__recover(e)
+            raise
+
+        self.__unanswered.append(None)
+        self._notify_sent(head[:64].decode(self.__encoding, errors="replace"), size)
+
+    def pipeline(self, depth: int = 16) -> CommandPipeline:
+        """Create a pipeline that keeps up to depth commands in flight on this connection.
+
+            Args:
+                depth (int): The maximum number of commands sent before the first response is read.
+
+            Returns:
+                A CommandPipeline bound to this communicator. Responses are returned as raw lines.
+        """
+        return CommandPipeline(self, depth)
 
     def read_line(self):
         """Read a line from the TCP/IP device.
 
             Returns:
                 The read line.
+
+            Raises:
+                TimeoutError: If the line was not received before the deadline.
         """
-        return self.__reader.readline().rstrip()
+        return self.read_line_bytes().decode(self.__encoding)
+
+    def read_line_bytes(self) -> bytes:
+        """Read a line from the TCP/IP device without decoding it.
+
+            Returns:
+                The read line without its terminator and trailing whitespace.
+
+            Raises:
+                TimeoutError: If the line was not received before the deadline.
+        """
+        return self.__with_recovery(lambda: self._read_response(self.__read_tracked))
+
+    def iter_line_chunks(self) -> Iterator[memoryview]:
+        """Read a single line from the TCP/IP device in chunks.
+
+            The chunks are views into the receive buffer and are only valid until the next
+            chunk is requested. The iterator must be exhausted before the next line is read.
+
+            Returns:
+                An iterator over the chunks of the line.
+
+            Raises:
+                TimeoutError: If the line was not received before the deadline.
+        """
+        while True:
+            self.__check_broken()
+            self.__apply_timeout()
+            started = False
+            header = b""
+            size = 0
+            try:
+                self._discard_stale_lines(self.__read_tracked)
+                for chunk in self.__reader.iter_line_chunks():
+                    if not started:
+                        header = bytes(chunk[:32])
+                        started = True
+                    size += len(chunk)
+                    yield chunk
+            except TimeoutError:
+                self._response_timed_out()
+                raise
+            except ConnectionError as e:
+                if not started:
+                    self.__recover(e)
+                    continue
+
+                # part of the response was already consumed, it cannot be read again
+                if self.__unanswered:
+                    self.__unanswered.popleft()
+                self.__recover(e)
+                raise
+
+            if self.__unanswered:
+                self.__unanswered.popleft()
+
+            self._notify_received(header, size)
+            return
+
+    def reconnect(self) -> List[Optional[str]]:
+        """Close the connection and connect to the same address again.
+
+            Connecting is retried up to reconnect_attempts times. The delay between attempts
+            starts at reconnect_delay and doubles with every attempt up to reconnect_max_delay.
+            No attempt is started that would end after the current deadline. Once connected,
+            the session commands (i.e. "*RCS 1") are sent again.
+
+            Returns:
+                The commands whose responses were not received over the old connection.
+                Chunked commands are returned as None.
+
+            Raises:
+                OSError: If the connection could not be reestablished.
+        """
+        for _ in range(self._clear_stale_lines()):
+            if self.__unanswered:
+                self.__unanswered.popleft()
+
+        lost = list(self.__unanswered)
+        self.__unanswered.clear()
+
+        delay = self.reconnect_delay
+        attempt = 1
+        while True:
+            if CommunicatorBase._verbose:
+                print(f"Reconnecting comunicator to {self.__address}:{self.__port} (attempt {attempt})")
+
+            self.__socket.close()
+            self.__socket = CommunicatorTcpIp.__create_socket()
+            try:
+                self.__apply_timeout()
+                self.__socket.connect((self.__address, self.__port))
+                break
+            except OSError:
+                remaining = self.remaining_time()
+                if attempt >= max(self.reconnect_attempts, 1) or (remaining is not None and remaining < delay):
+                    raise
+
+            time.sleep(delay)
+            delay = min(2 * delay, self.reconnect_max_delay)
+            attempt += 1
+
+        self.__reader = SocketLineReader(self.__socket)
+        self.__broken = False
+        for msg in self.__session.values():
+            self.__socket.sendall((msg + "\n").encode())
+
+        return lost
+
+    def __with_recovery(self, op: Callable[[], T]) -> T:
+        while True:
+            self.__check_broken()
+            self.__apply_timeout()
+            try:
+                return op()
+            except ConnectionError as e:
+                self.__recover(e)
+
+    def __sendall(self, data: bytes) -> None:
+        try:
+            self.__socket.sendall(data)
+        except TimeoutError:
+            # An unknown part of the data was sent, the stream cannot be continued.
+            self.__broken = True
+            raise
+
+    def __check_broken(self) -> None:
+        if self.__broken:
+            self.__recover(ConnectionError("The connection is broken because sending a command timed out."))
+
+    def __recover(self, error: ConnectionError) -> None:
+        """Reconnect after the connection was lost and send the unanswered commands again.
+
+            Raises the original error if reconnecting is disabled and a ConnectionError
+            if a command whose response was lost cannot be sent again.
+        """
+        if self.reconnect_attempts <= 0:
+            raise error
+
+        lost = self.reconnect()
+        self._notify_reset()
+        unsafe = [msg for msg in lost if msg is None or not CommunicatorBase.is_idempotent(msg)]
+        if unsafe:
+            raise ConnectionError(f"The connection was lost and reestablished. It is unknown wether SENTIO executed \"{unsafe[0] or 'chunked command'}\".") from error
+
+        for msg in lost:
+            data = (msg + "\n").encode()
+            self.__socket.sendall(data)
+            self.__unanswered.append(msg)
+            self._notify_sent(msg, len(data))
+
+    def __read_tracked(self) -> bytes:
+        line = self.__reader.read_line_bytes()
+        if self.__unanswered:
+            self.__unanswered.popleft()
+
+        return line
+
+    def _first_byte_time(self) -> float | None:
+        return self.__reader.first_byte_time
+
+    @staticmethod
+    def __is_session_command(msg: str) -> bool:
+        return msg.upper().startswith("*RCS")
+
+    @staticmethod
+    def __create_socket() -> socket.socket:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return sock
+
+    def __apply_timeout(self) -> None:
+        remaining = self.remaining_time()
+
+        # A timeout of 0 would switch the socket to non-blocking mode. An expired
+        # deadline must still time out when no data is available.
+        self.__socket.settimeout(None if remaining is None else max(remaining, 1e-6))
@@ -1,5 +1,3 @@
-import pyvisa
-
 from sentio_prober_control.Communication.CommunicatorBase import CommunicatorBase
 
 
@@ -8,11 +6,24 @@ class CommunicatorVisa(CommunicatorBase):
 
     This communicator is meant for communication over National Instruments VISA interface.
     In order to use it you must have the [NI-VISA driver](https://www.ni.com/de/support/downloads/drivers/download.ni-visa.html) installed on your system.
+
+    pyvisa is imported when the first VISA communicator is created, so that importing this
+    module does not slow down programs using other transports.
     """
 
     def __init__(self):
-        """Constructs a VISA communicator."""
+        """Constructs a VISA communicator.
+
+        The default timeout for a single response is one hour. Use the default_timeout attribute
+        or deadline() to change it.
+        """
+        import pyvisa
+
+        self.__errors = pyvisa.errors
+        self.__status = pyvisa.constants.StatusCode
         self.__rm = pyvisa.ResourceManager()
+        self.__address: str | None = None
+        self.default_timeout = 3600
 
     @staticmethod
     def create(addr: str):
@@ -27,14 +38,18 @@ class CommunicatorVisa(CommunicatorBase):
     def connect(self, address: str, encoding : str | None = None) -> None:
         """Connect to a VISA device at the specified address.
 
-        The VISA timeout for the interface is set to 3600000 (1 hour).
+        The VISA timeout is set before every operation from default_timeout and the active deadline.
 
         :param addr: A string that specifies the address of the VISA device to connect to. The address must be a valid VISA resource identifier.
         """
         self.__visa = self.__rm.open_resource(address)
-        self.__visa.timeout = 3600000
         self.__address = address
 
+    @property
+    def station_id(self) -> str | None:
+        """The VISA resource name of the station prefixed with "visa://". None if not connected."""
+        return None if self.__address is None else f"visa://{self.__address}"
+
     def disconnect(self):
         """Disconnect from the VISA device."""
         if CommunicatorBase._verbose:
@@ -50,11 +65,28 @@ class CommunicatorVisa(CommunicatorBase):
         if CommunicatorBase._verbose:
             print('Sending "{0}"'.format(msg))
 
+        self.__apply_timeout()
         self.__visa.write((msg + "\n"))
+        self._notify_sent(msg, len(msg) + 1)
 
     def read_line(self):
         """Read a line from the VISA device.
 
         :return: The read line.
+        :raises TimeoutError: If the line was not received before the deadline.
         """
-        return self.__visa.read()
+        self.__apply_timeout()
+        return self._read_response(self.__read)
+
+    def __read(self) -> str:
+        try:
+            return self.__visa.read()
+        except self.__errors.VisaIOError as e:
+            if e.error_code == self.__status.error_timeout:
+                raise TimeoutError(f"Timeout while reading from {self.__address}") from e
+            raise
+
+    def __apply_timeout(self) -> None:
+        # pyvisa expects milliseconds, None means infinite
+        remaining = self.remaining_time()
+        self.__visa.timeout = None if remaining is None else max(1, int(remaining * 1000))
@@ -0,0 +1,170 @@
+from typing import Dict, List
+
+
+class Histogram:
+    """A histogram of non-negative integer values with a bounded relative error.
+
+    The histogram uses log-linear buckets like HdrHistogram. Values below 2**precision_bits
+    are counted exactly, larger values are counted in buckets whose width grows with the
+    value so that the relative error stays below 2**-(precision_bits - 1). Recording a value
+    is a few integer operations and memory usage does not depend on the number of values.
+
+    Example:
+
+    ```py
+    h = Histogram()
+    for latency_us in samples:
+        h.record(latency_us)
+
+    print(h.percentile(99))
+    ```
+    """
+
+    def __init__(self, precision_bits: int = 8) -> None:
+        """Create an empty histogram.
+
+        Args:
+            precision_bits (int): The number of bits of each value that are stored exactly. 8 bits give an error below 1%.
+        """
+        if precision_bits < 2:
+            raise ValueError(f"precision_bits must be at least 2! (precision_bits={precision_bits})")
+
+        self.__bits = precision_bits
+        self.__half = 1 << (precision_bits - 1)
+        self.__counts: List[int] = []
+        self.__count = 0
+        self.__total = 0
+        self.__min = 0
+        self.__max = 0
+
+
+    def __bucket(self, value: int) -> int:
+        shift = value.bit_length() - self.__bits
+        if shift <= 0:
+            return value
+
+        return shift * self.__half + (value >> shift)
+
+
+    def __lowest(self, bucket: int) -> int:
+        """The lowest value that is counted in a bucket."""
+        if bucket < 2 * self.__half:
+            return bucket
+
+        shift = bucket // self.__half - 1
+        return (bucket - shift * self.__half) << shift
+
+
+    def __highest(self, bucket: int) -> int:
+        """The highest value that is counted in a bucket."""
+        return self.__lowest(bucket + 1) - 1
+
+
+    def record(self, value: int, count: int = 1) -> None:
+        """Add a value.
+
+        Args:
+            value (int): The value to add. Negative values are recorded as 0.
+            count (int): The number of times the value is added.
+        """
+        value = max(int(value), 0)
+        bucket = self.__bucket(value)
+        if bucket >= len(self.__counts):
+            self.__counts.extend([0] * (bucket + 1 - len(self.__counts)))
+
+        self.__counts[bucket] += count
+
+        if self.__count == 0 or value < self.__min:
+            self.__min = value
+        if value > self.__max:
+            self.__max = value
+
+        self.__count += count
+        self.__total += value * count
+
+
+    def merge(self, other: "Histogram") -> None:
+        """Add all values of another histogram with the same precision.
+
+        Args:
+            other (Histogram): The histogram to add.
+        """
+        if other.__bits != self.__bits:
+            raise ValueError("Histograms with different precision cannot be merged!")
+
+        if other.__count == 0:
+            return
+
+        if len(other.__counts) > len(self.__counts):
+            self.__counts.extend([0] * (len(other.__counts) - len(self.__counts)))
+
+        for bucket, n in enumerate(other.__counts):
+            self.__counts[bucket] += n
+
+        self.__min = other.__min if self.__count == 0 else min(self.__min, other.__min)
+        self.__max = max(self.__max, other.__max)
+        self.__count += other.__count
+        self.__total += other.__total
+
+
+    @property
+    def count(self) -> int:
+        """The number of recorded values."""
+        return self.__count
+
+
+    @property
+    def total(self) -> int:
+        """The exact sum of all recorded values."""
+        return self.__total
+
+
+    @property
+    def min(self) -> int:
+        """The exact smallest recorded value or 0 if the histogram is empty."""
+        return self.__min
+
+
+    @property
+    def max(self) -> int:
+        """The exact largest recorded value or 0 if the histogram is empty."""
+        return self.__max
+
+
+    def mean(self) -> float:
+        """The exact mean of all recorded values or 0 if the histogram is empty."""
+        return self.__total / self.__count if self.__count else 0.0
+
+
+    def percentile(self, p: float) -> int:
+        """The value below or at which p percent of the recorded values are.
+
+        The result is the upper bound of the bucket containing the percentile, limited to the
+        largest recorded value.
+
+        Args:
+            p (float): The percentile between 0 and 100.
+
+        Returns:
+            The value or 0 if the histogram is empty.
+        """
+        if self.__count == 0:
+            return 0
+
+        rank = max(1, min(self.__count, int(p / 100.0 * self.__count + 0.5)))
+        seen = 0
+        for bucket, n in enumerate(self.__counts):
+            seen += n
+            if seen >= rank:
+                return min(self.__highest(bucket), self.__max)
+
+        return self.__max
+
+
+    def buckets(self) -> Dict[int, int]:
+        """The non-empty buckets.
+
+        Returns:
+            A dictionary that maps the lowest value of each non-empty bucket to its count.
+        """
+        return {self.__lowest(bucket): n for bucket, n in enumerate(self.__counts) if n}
@@ -0,0 +1,136 @@
+import socket
+import time
+from typing import Iterator
+
+
+class SocketLineReader:
+    """Reads newline terminated lines from a socket without a text layer.
+
+    Received data is written directly into a reusable bytearray with recv_into. Lines are
+    split on the raw bytes and returned as bytes, decoding is left to the caller. The buffer
+    is compacted when its end is reached and only grows when a single line does not fit.
+    Compared to a text mode file object this avoids copying large responses (i.e. base64
+    encoded images) several times.
+
+    You are not meant to use this class directly. It is used by CommunicatorTcpIp.
+    """
+
+    def __init__(self, sock: socket.socket, buffer_size: int = 65536) -> None:
+        """Create a line reader.
+
+        Args:
+            sock (socket.socket): A connected socket.
+            buffer_size (int): The initial size of the receive buffer in bytes.
+        """
+        self.__socket = sock
+        self.__buf = bytearray(buffer_size)
+        self.__view = memoryview(self.__buf)
+        self.__start = 0  # first unread byte
+        self.__end = 0    # end of received data
+        self.__fill_time = 0.0
+
+        self.first_byte_time: float = 0.0
+        """ The time.perf_counter() value when the first byte of the last line was received. """
+
+
+    @property
+    def buffer_size(self) -> int:
+        """The current size of the receive buffer in bytes."""
+        return len(self.__buf)
+
+
+    def __fill(self) -> None:
+        """Receive more data into the buffer. Makes room first if the buffer is full."""
+        if self.__end == len(self.__buf):
+            pending = self.__end - self.__start
+            if self.__start > 0:
+                # compact: move the unread part to the front of the buffer
+                self.__buf[:pending] = self.__view[self.__start:self.__end]
+            else:
+                # a single line is larger than the buffer
+                self.__view.release()
+                self.__buf.extend(bytes(len(self.__buf)))
+                self.__view = memoryview(self.__buf)
+
+            self.__start = 0
+            self.__end = pending
+
+        n = self.__socket.recv_into(self.__view[self.__end:])
+        if n == 0:
+            raise ConnectionError("Connection was closed by the remote side.")
+
+        self.__end += n
+        self.__fill_time = time.perf_counter()
+
+
+    def read_line_bytes(self) -> bytes:
+        """Read a single line.
+
+        Returns:
+            The line without its terminator and without trailing whitespace.
+        """
+        scan = self.__start
+        first = self.__fill_time if self.__start < self.__end else None
+        while True:
+            pos = self.__buf.find(b"\n", scan, self.__end)
+            if pos >= 0:
+                break
+
+            scan = self.__end - self.__start
+            self.__fill()
+            scan += self.__start
+            if first is None:
+                first = self.__fill_time
+
+        self.first_byte_time = first
+
+        line = bytes(self.__view[self.__start:pos]).rstrip()
+        self.__start = pos + 1
+        if self.__start == self.__end:
+            self.__start = self.__end = 0
+
+        return line
+
+
+    def iter_line_chunks(self) -> Iterator[memoryview]:
+        """Read a single line in chunks without assembling it in memory.
+
+        This is meant for very large responses that are processed incrementally. Each chunk
+        is a view into the receive buffer and is only valid until the next chunk is requested.
+        The line terminator and a preceding carriage return are not part of the chunks. The
+        generator must be exhausted before the next line is read.
+
+        Returns:
+            An iterator over the chunks of the line.
+        """
+        self.first_byte_time = self.__fill_time if self.__start < self.__end else None
+        while True:
+            if self.__start == self.__end:
+                self.__start = self.__end = 0
+                self.__fill()
+                if self.first_byte_time is None:
+                    self.first_byte_time = self.__fill_time
+
+            pos = self.__buf.find(b"\n", self.__start, self.__end)
+            stop = self.__end if pos < 0 else pos
+
+            # Drop the carriage return of a "\r\n" terminator. Without a terminator in the buffer
+            # a trailing carriage return is held back until the next byte is known.
+            if stop > self.__start and self.__buf[stop - 1] == 0x0D:
+                stop -= 1
+
+            if stop > self.__start:
+                yield self.__view[self.__start:stop]
+
+            if pos >= 0:
+                self.__start = pos + 1
+                return
+
+            self.__start = stop
+            if self.__start == self.__end:
+                self.__start = self.__end = 0
+            else:
+                # only the held back carriage return is left, move it to the front
+                self.__buf[0] = 0x0D
+                self.__start, self.__end = 0, 1
+                self.__fill()
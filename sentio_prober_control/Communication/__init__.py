@@ -9,6 +9,9 @@
     * `sentio_prober_control.Communication.CommunicatorTcpIp`<br/>for plain TCP/IP communication
     * `sentio_prober_control.Communication.CommunicatorGpib`<br/>for GPIB communication via native drivers (ADLINK and NI)
     * `sentio_prober_control.Communication.CommunicatorVisa`<br/>for using the NI-VISA interface which warps (TCP/IP, GPIB and RS232) 
+    * `sentio_prober_control.Communication.CommunicatorMultiplexer`<br/>for sharing any of the above between several threads
+    * `sentio_prober_control.Communication.CommunicatorRecorder`<br/>for recording the traffic of any of the above to a trace file
+    * `sentio_prober_control.Communication.CommunicatorReplay`<br/>for playing back a recorded trace without a probe station
 
     ## Communicator Example
 
@@ -22,4 +25,3 @@
     'MPI Corporation,Sentio - Probe System Software Suite,0,23.2.99.0'
     
 """
-print(f"Initializing package {__name__}")
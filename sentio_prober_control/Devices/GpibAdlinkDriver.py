@@ -3,6 +3,9 @@
 import ctypes
 from ctypes import byref, c_byte, c_char_p, c_int, c_ushort, c_void_p, c_wchar_p
 
+# ibsta bit set when an operation timed out
+TIMO = 0x4000
+
 
 class GpibAdlinkDriver:
     """A python wrapper for the ADLINK gpib-32.dll.
@@ -29,6 +32,14 @@ class GpibAdlinkDriver:
         self._gpibIbsic.restype = c_int
         self._gpibIbsic.argtypes = [c_int]
 
+        self._gpibIbtmo = gpibDll.ibtmo
+        self._gpibIbtmo.restype = c_int
+        self._gpibIbtmo.argtypes = [c_int, c_int]
+
+        # gpib device clear
+        self._gpibDevClear = gpibDll.DevClear
+        self._gpibDevClear.argtypes = [c_int, c_ushort]
+
         # gpib send
         self._gpibSendImpl = gpibDll.Send
         self._gpibSendImpl.argtypes = [c_int, c_ushort, c_char_p, c_int, c_int]
@@ -53,6 +64,7 @@ class GpibAdlinkDriver:
 
         self._addr = address
         self._max_len = 1000
+        self._partial = bytearray()
 
     def get_globals(self):
         ibsta = c_int()
@@ -64,11 +76,31 @@ class GpibAdlinkDriver:
         )
         return ibsta.value, iberr.value, ibcnt.value, ibcntl.value
 
+    def set_timeout(self, code: int):
+        """Set the board timeout. code is one of the NI-488.2 timeout codes (0 = none, 1 = 10 us ... 17 = 1000 s)."""
+        self._gpibIbtmo(self._board, code)
+
+    def clear(self):
+        self._gpibDevClear(self._board, self._addr)
+        self._partial = bytearray()
+
     def send(self, str):
         self._gpibSendImpl(self._board, self._addr, str.encode("utf-8"), len(str), 1)
 
+        ibsta, iberr, ibcnt, ibcntl = self.get_globals()
+        if ibsta & TIMO:
+            raise TimeoutError(f'Sending "{str}" timed out.')
+
     def receive(self):
         byteArr = (c_byte * self._max_len)()
         self._gpibReceiveImpl(self._board, self._addr, byteArr, self._max_len, 0)
         ibsta, iberr, ibcnt, ibcntl = self.get_globals()
-        return bytearray(byteArr[:ibcntl]).decode("utf-8")
+
+        # keep data received before a timeout, the next receive continues the message
+        data = self._partial + bytearray(byteArr[:ibcntl])
+        if ibsta & TIMO:
+            self._partial = data
+            raise TimeoutError("Receive timed out.")
+
+        self._partial = bytearray()
+        return data.decode("utf-8")
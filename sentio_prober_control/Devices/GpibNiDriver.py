@@ -3,6 +3,9 @@ import ctypes
 import re
 from ctypes import c_byte, c_char_p, c_int, c_ushort, c_void_p, c_wchar_p
 
+# ibsta bit set when an operation timed out
+TIMO = 0x4000
+
 
 class GpibNiDriver:
     """A python wrapper for the NI gpib-32.dll.
@@ -37,6 +40,14 @@ class GpibNiDriver:
         self._gpibIbsic.restype = c_int
         self._gpibIbsic.argtypes = [c_int]
 
+        self._gpibIbtmo = gpibDll.ibtmo
+        self._gpibIbtmo.restype = c_int
+        self._gpibIbtmo.argtypes = [c_int, c_int]
+
+        # gpib device clear
+        self._gpibDevClear = gpibDll.DevClear
+        self._gpibDevClear.argtypes = [c_int, c_ushort]
+
         # gpib send
         self._gpibSendImpl = gpibDll.Send
         self._gpibSendImpl.argtypes = [c_int, c_ushort, c_char_p, c_int, c_int]
@@ -51,6 +62,8 @@ class GpibNiDriver:
         if board_handle < 0:
             raise Exception(f'Board "{board_name}" does not exist!')
 
+        self._board_handle = board_handle
+
         # init
         numbers = re.findall("[0-9]+", board_name)
         self._board = int(numbers[0])
@@ -63,6 +76,7 @@ class GpibNiDriver:
 
         self._addr = address
         self._max_len = 1000
+        self._partial = bytearray()
 
     def get_globals(self):
         ibsta = self._gpibThreadIbsta()
@@ -72,9 +86,20 @@ class GpibNiDriver:
 
         return ibsta, iberr, ibcnt, ibcntl
 
+    def set_timeout(self, code: int):
+        """Set the board timeout. code is one of the NI-488.2 timeout codes (0 = none, 1 = 10 us ... 17 = 1000 s)."""
+        self._gpibIbtmo(self._board_handle, code)
+
+    def clear(self):
+        self._gpibDevClear(self._board, self._addr)
+        self._partial = bytearray()
+
     def send(self, str):
         self._gpibSendImpl(self._board, self._addr, str.encode("utf-8"), len(str), 1)
 
+        if self._gpibThreadIbsta() & TIMO:
+            raise TimeoutError(f'Sending "{str}" timed out.')
+
         iberr = self._gpibThreadIberr()
         if iberr != 0:
             raise Exception(f'Sending "{str}" failed. (GPIB error code {iberr})')
@@ -84,7 +109,14 @@ class GpibNiDriver:
         self._gpibReceiveImpl(self._board, self._addr, byteArr, self._max_len, 0)
         ibsta, iberr, ibcnt, ibcntl = self.get_globals()
 
+        # keep data received before a timeout, the next receive continues the message
+        data = self._partial + bytearray(byteArr[:ibcntl])
+        if ibsta & TIMO:
+            self._partial = data
+            raise TimeoutError("Receive timed out.")
+
+        self._partial = bytearray()
         if iberr != 0:
             raise Exception(f"Receive failed: Gpib error code {iberr}")
 
-        return bytearray(byteArr[:ibcntl]).decode("utf-8")
+        return data.decode("utf-8")
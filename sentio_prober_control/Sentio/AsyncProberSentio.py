@@ -0,0 +1,219 @@
+import asyncio
+import concurrent.futures
+import functools
+import inspect
+from typing import Any, Awaitable, Callable, TypeVar
+
+from sentio_prober_control.Communication.AsyncCommunicatorTcpIp import AsyncCommunicatorTcpIp
+from sentio_prober_control.Communication.CommunicatorBase import CommunicatorBase
+from sentio_prober_control.Sentio.Compatibility import CompatibilityLevel
+from sentio_prober_control.Sentio.CommandGroups.CommandGroupBase import CommandGroupBase
+from sentio_prober_control.Sentio.ProberSentio import SentioProber
+
+
+T = TypeVar("T")
+
+
+class LoopCommunicator(CommunicatorBase):
+    """A blocking communicator that performs its I/O on an AsyncCommunicatorTcpIp.
+
+    The I/O is scheduled on the event loop that owns the asynchronous communicator and the
+    calling thread waits for it. It must therefore be used from a thread other than the
+    event loop thread. AsyncSentioProber runs the blocking wrappers in its worker thread with
+    this communicator.
+
+    Deadlines and default_timeout are honored. When a read times out its response is
+    discarded once it arrives, like with every other communicator.
+
+    You are not meant to use this class directly. It is used by AsyncSentioProber.
+    """
+
+    def __init__(self, comm: AsyncCommunicatorTcpIp) -> None:
+        """Create the communicator.
+
+        Args:
+            comm (AsyncCommunicatorTcpIp): The communicator performing the I/O.
+        """
+        self.__comm = comm
+        self.loop: asyncio.AbstractEventLoop | None = None
+        """ The event loop that performs the I/O. Set before each wrapper call. """
+
+
+    def __run(self, coro: Awaitable[T], timeout: float | None = None) -> T:
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        try:
+            return future.result(None if timeout is None else max(timeout, 0))
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise TimeoutError("Timeout while waiting for a response from SENTIO!")
+
+
+    def connect(self, address: str, encoding: str | None = None) -> None:
+        pass
+
+
+    def disconnect(self):
+        pass
+
+
+    def send(self, msg: str):
+        self.__run(self.__comm.send(msg))
+        self._notify_sent(msg, len(msg) + 1)
+
+
+    def read_line(self):
+        return self._read_response(lambda: self.__run(self.__comm.read_line(), self.remaining_time()))
+
+
+class AsyncCommandGroup:
+    """Exposes the wrapper functions of a command group as coroutines.
+
+    You are not meant to instantiate objects of this class directly. They are
+    created by AsyncSentioProber when accessing a command group.
+    """
+
+    def __init__(self, group: CommandGroupBase, prober: "AsyncSentioProber") -> None:
+        self.__group = group
+        self.__prober = prober
+
+
+    def __getattr__(self, name: str) -> Any:
+        return self.__prober._wrap(getattr(self.__group, name))
+
+
+    def __repr__(self) -> str:
+        return f"<AsyncCommandGroup {type(self.__group).__name__}>"
+
+
+class AsyncSentioProber:
+    """The asyncio counterpart of SentioProber.
+
+    An AsyncSentioProber exposes the same functions and command groups as SentioProber
+    (map, loader, vision, status, ...) but every wrapper function returns an awaitable.
+    The functions are not a second implementation. Each call executes the existing
+    blocking wrapper of SentioProber exactly once. The wrapper's I/O is performed on an
+    AsyncCommunicatorTcpIp by the event loop, so both classes always send the same commands
+    and parse responses the same way. Side effects of a wrapper (i.e. writing image files
+    or waiting with time.sleep) happen once and do not block the event loop.
+
+    The implementation is thread-backed. Every prober owns a single worker thread that
+    executes its wrappers, and that thread is blocked while a wrapper waits for a response.
+    Controlling many stations therefore still costs one thread per station. The threads are
+    not taken from the default executor of the event loop, so long running calls (i.e.
+    wait_complete or stepping) cannot starve other users of run_in_executor. Call
+    disconnect() to release the thread and the connection.
+
+    Calls on the same prober are executed one after another. Calls on different probers
+    run concurrently.
+
+    Example:
+
+    ```py
+    async def main():
+        prober = await AsyncSentioProber.create("127.0.0.1:35555")
+        await prober.select_module(Module.Wafermap)
+        col, row, site = await prober.map.step_first_die()
+        temp = await prober.status.get_chuck_temp()
+    ```
+    """
+
+    def __init__(self, comm: AsyncCommunicatorTcpIp) -> None:
+        """Construct an unconnected AsyncSentioProber.
+
+        Use the create() coroutine instead. It will also switch SENTIO to its native
+        remote command set and determine the compatibility level.
+
+        Args:
+            comm (AsyncCommunicatorTcpIp): The communicator to use for communication with the prober.
+        """
+        self.__comm = comm
+        self.__blocking_comm = LoopCommunicator(comm)
+        self.__lock = asyncio.Lock()
+        self.__executor = concurrent.futures.ThreadPoolExecutor(1, "AsyncSentioProber")
+        self.__prober: SentioProber | None = None
+
+
+    @staticmethod
+    async def create(comm: str | AsyncCommunicatorTcpIp, compat_level: CompatibilityLevel = CompatibilityLevel.Auto) -> "AsyncSentioProber":
+        """Create an AsyncSentioProber and initialize the remote session.
+
+        Args:
+            comm (str|AsyncCommunicatorTcpIp): Either a connected communicator or an address like "127.0.0.1:35555".
+            compat_level (CompatibilityLevel): The compatibility level to use. If CompatibilityLevel.Auto is set SENTIO is queried to figure the compatibility level out.
+
+        Returns:
+            A ready to use AsyncSentioProber.
+        """
+        if isinstance(comm, str):
+            comm = await AsyncCommunicatorTcpIp.create(comm)
+
+        prober = AsyncSentioProber(comm)
+        prober.__prober = await prober.run(lambda: SentioProber(prober.__blocking_comm, compat_level))
+        return prober
+
+
+    @property
+    def comm(self) -> AsyncCommunicatorTcpIp:
+        """Get the communicator object.
+
+        Returns:
+            comm (AsyncCommunicatorTcpIp): The communicator object.
+        """
+        return self.__comm
+
+
+    @property
+    def sync_prober(self) -> SentioProber:
+        """The SentioProber instance whose wrappers are executed by this object.
+
+        Its communicator is a LoopCommunicator. Do not call its functions from the event loop thread.
+
+        @private
+        """
+        return self.__prober
+
+
+    async def disconnect(self) -> None:
+        """Disconnect from SENTIO and stop the worker thread of the prober."""
+        async with self.__lock:
+            self.__executor.shutdown(wait=False)
+            await self.__comm.disconnect()
+
+
+    async def run(self, call: Callable[[], T]) -> T:
+        """Execute a blocking wrapper call with asynchronous I/O.
+
+        The call is executed once in the worker thread of this prober. It must use
+        sync_prober (or objects created from it) for communication.
+
+        Args:
+            call (Callable): A function executing one or more wrapper functions.
+
+        Returns:
+            The return value of the call.
+        """
+        async with self.__lock:
+            loop = asyncio.get_running_loop()
+            self.__blocking_comm.loop = loop
+            return await loop.run_in_executor(self.__executor, call)
+
+
+    def _wrap(self, obj: Any) -> Any:
+        if isinstance(obj, CommandGroupBase):
+            return AsyncCommandGroup(obj, self)
+
+        if inspect.ismethod(obj):
+            @functools.wraps(obj)
+            async def wrapper(*args, **kwargs):
+                return await self.run(lambda: obj(*args, **kwargs))
+
+            return wrapper
+
+        return obj
+
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_") or self.__prober is None:
+            raise AttributeError(name)
+
+        return self._wrap(getattr(self.__prober, name))
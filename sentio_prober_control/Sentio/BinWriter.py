@@ -0,0 +1,192 @@
+import math
+from array import array
+from typing import Dict, List, Tuple, TYPE_CHECKING
+
+from sentio_prober_control.Sentio.ProberBase import ProberException
+
+if TYPE_CHECKING:
+    from sentio_prober_control.Sentio.ProberSentio import SentioProber
+
+
+class BinWriter:
+    """Collects die bins and values and writes them to the wafermap in bursts.
+
+    Setting a bin with WafermapBinsCommandGroup.set_bin costs one network round trip per
+    die. A bin writer buffers the bins and values and sends them with a command pipeline
+    when the buffer is full, when flush() is called, when the writer is closed and when the
+    route is finished. The route is finished when a stepping function of the wafermap is
+    called after the previous step reached the end of the route, so the bin of the last die
+    is included. If the same die (or subsite) is written several times between two flushes
+    only the last bin and value are sent.
+
+    Errors of the flush at the end of the route are not raised by the stepping function.
+    They are raised by the next call of flush() or close().
+
+    Bins are not visible in SENTIO before they are flushed. Call flush() before commands
+    that evaluate bins (i.e. map:path:create_from_bins or saving the wafermap).
+
+    Example:
+
+    ```py
+    with BinWriter(prober) as writer:
+        col, row, site = prober.map.step_first_die()
+        while True:
+            bin_value, value = run_test()
+            writer.write(col, row, bin_value, value=value)
+            if prober.map.end_of_route():
+                break
+            col, row, site = prober.map.step_next_die()
+    ```
+    """
+
+    NO_SITE = -1
+    """ Site index of records that bin the whole die. """
+
+    def __init__(self, prober: "SentioProber", capacity: int = 1024, depth: int = 64) -> None:
+        """Create a bin writer.
+
+        Args:
+            prober (SentioProber): The prober to write the bins to.
+            capacity (int): The number of records that are buffered before they are flushed automatically.
+            depth (int): The maximum number of commands in flight while flushing.
+        """
+        if capacity < 1:
+            raise ValueError("The capacity of a bin writer must be at least 1!")
+
+        self.__prober = prober
+        self.__capacity = capacity
+        self.__depth = depth
+        self.__cols = array("i")
+        self.__rows = array("i")
+        self.__sites = array("i")
+        self.__bins = array("q")
+        self.__values = array("d")
+        self.__num_written = 0
+        self.__closed = False
+        self.__route_end_error: ProberException | None = None
+        prober.map._add_route_end_callback(self.__flush_route_end)
+
+
+    def __enter__(self) -> "BinWriter":
+        return self
+
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+    def __len__(self) -> int:
+        return len(self.__cols)
+
+
+    @property
+    def capacity(self) -> int:
+        """The number of records that are buffered before they are flushed automatically."""
+        return self.__capacity
+
+
+    @property
+    def num_written(self) -> int:
+        """The number of set_bin and set_value commands sent by this writer."""
+        return self.__num_written
+
+
+    def write(self, col: int, row: int, bin_value: int | None, site: int | None = None, value: float | None = None) -> None:
+        """Buffer the bin and value of a die or subsite.
+
+        Args:
+            col (int): The column of the die.
+            row (int): The row of the die.
+            bin_value (int): The bin to set. None only sets the value.
+            site (int): The subsite to bin. None bins the die.
+            value (float): The value of the die. None does not change the value.
+        """
+        if self.__closed:
+            raise ValueError("The bin writer is closed!")
+
+        self.__cols.append(col)
+        self.__rows.append(row)
+        self.__sites.append(BinWriter.NO_SITE if site is None else site)
+        self.__bins.append(_NO_BIN if bin_value is None else bin_value)
+        self.__values.append(math.nan if value is None else value)
+
+        if len(self.__cols) >= self.__capacity:
+            self.flush()
+
+
+    def flush(self) -> int:
+        """Send all buffered records to SENTIO.
+
+        The buffer is empty afterwards, even if SENTIO rejected a record.
+
+        Returns:
+            The number of commands sent.
+
+        Raises:
+            ProberException: If SENTIO rejected a command. All commands are sent and their responses are read before. Also raised for a command rejected during the flush at the end of the route.
+        """
+        error, self.__route_end_error = self.__route_end_error, None
+        if len(self.__cols) == 0:
+            if error is not None:
+                raise error
+
+            return 0
+
+        cmds = self.__coalesce()
+        del self.__cols[:], self.__rows[:], self.__sites[:], self.__bins[:], self.__values[:]
+
+        with self.__prober.pipeline(self.__depth) as pipe:
+            handles = pipe.submit_all(cmds)
+
+        self.__num_written += len(cmds)
+        try:
+            for handle in handles:
+                handle.result()
+        except ProberException:
+            # the error of the earlier flush is raised first
+            if error is None:
+                raise
+
+        if error is not None:
+            raise error
+
+        return len(cmds)
+
+
+    def close(self) -> None:
+        """Flush the buffer and stop listening for the end of the route."""
+        if self.__closed:
+            return
+
+        self.__closed = True
+        self.__prober.map._remove_route_end_callback(self.__flush_route_end)
+        self.flush()
+
+
+    def __flush_route_end(self) -> None:
+        # The stepping function must not fail because of a rejected bin.
+        try:
+            self.flush()
+        except ProberException as e:
+            if self.__route_end_error is None:
+                self.__route_end_error = e
+
+
+    def __coalesce(self) -> List[str]:
+        # Only the last bin of each die/subsite and the last value of each die is sent
+        bins: Dict[Tuple[int, int, int], int] = {}
+        values: Dict[Tuple[int, int], float] = {}
+        for col, row, site, bin_value, value in zip(self.__cols, self.__rows, self.__sites, self.__bins, self.__values):
+            if bin_value != _NO_BIN:
+                bins.pop((col, row, site), None)
+                bins[(col, row, site)] = bin_value
+            if not math.isnan(value):
+                values.pop((col, row), None)
+                values[(col, row)] = value
+
+        cmds = [f"map:bins:set_bin {b}, {c}, {r}" if s == BinWriter.NO_SITE else f"map:bins:set_bin {b}, {c}, {r}, {s}" for (c, r, s), b in bins.items()]
+        cmds += [f"map:bins:set_value {v}, {c}, {r}" for (c, r), v in values.items()]
+        return cmds
+
+
+_NO_BIN = -2**63
@@ -0,0 +1,356 @@
+import functools
+import inspect
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Deque, Iterable, List, TYPE_CHECKING
+
+from sentio_prober_control.Communication.CommunicatorBase import CommunicatorBase
+from sentio_prober_control.Sentio.CommandGroups.CommandGroupBase import CommandGroupBase
+from sentio_prober_control.Sentio.ProberBase import ProberException
+from sentio_prober_control.Sentio.Response import Response
+
+if TYPE_CHECKING:
+    from sentio_prober_control.Sentio.ProberSentio import SentioProber
+
+
+class BatchCall:
+    """A handle to a wrapper call that was collected by a CommandBatch.
+
+    You are not meant to create objects of this class directly. They are returned by
+    the wrapper functions of a CommandBatch.
+    """
+
+    __slots__ = ("name", "_fn", "_done", "_value", "_error", "_sent", "_waiting", "_line", "_resume")
+
+    def __init__(self, name: str, fn: Callable[[], Any]) -> None:
+        self.name: str = name
+        self._fn = fn
+        self._done: bool = False
+        self._value: Any = None
+        self._error: BaseException | None = None
+
+        # state of the call while it is executed by a worker thread
+        self._sent: List[str] = []
+        self._waiting: bool = False
+        self._line: str | None = None
+        self._resume = threading.Semaphore(0)
+
+
+    def done(self) -> bool:
+        """Returns True if the wrapper call has completed."""
+        return self._done
+
+
+    def result(self) -> Any:
+        """Returns the return value of the wrapper call.
+
+        Raises:
+            RuntimeError: If the batch was not yet flushed.
+            ProberException: If the wrapper call failed (i.e. SENTIO returned an error).
+        """
+        if not self._done:
+            raise RuntimeError(f"The batch containing {self.name} was not yet flushed!")
+
+        if self._error is not None:
+            raise self._error
+
+        return self._value
+
+
+class _BatchCommunicator(CommunicatorBase):
+    """The communicator of the prober while a batch is flushed.
+
+    Wrapper calls of the batch run in worker threads. Commands sent by a call are collected
+    in its BatchCall. Reading a response suspends the worker thread until the batch has
+    received the response and hands it over. Only one worker thread runs at any time.
+    """
+
+    def __init__(self, yielded: threading.Semaphore) -> None:
+        self.__local = threading.local()
+        self.__yielded = yielded
+        self.__aborted = False
+
+
+    def abort(self) -> None:
+        """Make all further reads fail immediately."""
+        self.__aborted = True
+
+
+    def bind(self, call: BatchCall | None) -> None:
+        self.__local.call = call
+
+
+    def __call(self) -> BatchCall:
+        call = getattr(self.__local, "call", None)
+        if call is None:
+            raise RuntimeError("The prober cannot be used while a batch is flushed!")
+
+        return call
+
+
+    def connect(self, address: str, encoding: str | None = None) -> None:
+        pass
+
+
+    def disconnect(self):
+        pass
+
+
+    def send(self, msg: str):
+        self.__call()._sent.append(msg)
+
+
+    def send_many(self, msgs: Iterable[str]) -> None:
+        self.__call()._sent.extend(msgs)
+
+
+    def read_line(self):
+        call = self.__call()
+        if self.__aborted:
+            raise ProberException(f"The batch was aborted before {call.name} received its response!")
+
+        call._waiting = True
+        self.__yielded.release()
+        call._resume.acquire()
+        call._waiting = False
+
+        if call._line is None:
+            raise ProberException(f"The batch was aborted before {call.name} received its response!")
+
+        return call._line
+
+
+class BatchCommandGroup:
+    """Exposes the wrapper functions of a command group for collecting them in a batch.
+
+    You are not meant to instantiate objects of this class directly. They are
+    created by CommandBatch when accessing a command group.
+    """
+
+    def __init__(self, group: CommandGroupBase, batch: "CommandBatch") -> None:
+        self.__group = group
+        self.__batch = batch
+
+
+    def __getattr__(self, name: str) -> Any:
+        return self.__batch._wrap(getattr(self.__group, name))
+
+
+    def __repr__(self) -> str:
+        return f"<BatchCommandGroup {type(self.__group).__name__}>"
+
+
+class CommandBatch:
+    """Collects wrapper calls and sends their commands with as few writes as possible.
+
+    Wrapper functions called on a batch are not executed immediately. When the batch is
+    flushed each wrapper runs exactly once on the prober that created the batch. Their
+    commands are collected and transmitted with CommunicatorBase.send_many. Afterwards the
+    responses are read and handed to the wrappers, which parse them as usual. A setup phase
+    that adds hundreds of subsites, bins or dies needs a handful of writes and round trips
+    instead of one per command.
+
+    The wrappers run in worker threads so that they can wait for their responses, but only
+    one of them runs at any time. Everything a wrapper does besides communication takes
+    effect on the prober just like without a batch (i.e. end of route tracking of the
+    wafermap or invalidation of the property_cache).
+
+    At most depth commands are sent before their responses are read, so that neither side
+    blocks on a full socket buffer. Wrappers that need more than one round trip (i.e.
+    asynchronous commands) send their later commands after the commands that were batched
+    behind them. Batches are therefore meant for independent commands.
+
+    The batch does not stop at the first error. All responses are read so that the
+    communicator stays in sync and the first error is raised by flush.
+
+    You are not meant to create objects of this class directly. Use SentioProber.batch().
+
+    Example:
+
+    ```py
+    with prober.batch() as batch:
+        for i, (x, y) in enumerate(positions):
+            batch.map.subsites.add(f"S{i}", x, y)
+
+    errors = [r for r in batch.responses if r.errc() != 0]
+    ```
+    """
+
+    def __init__(self, prober: "SentioProber", depth: int = 64) -> None:
+        """Create an empty batch.
+
+        Args:
+            prober (SentioProber): The prober whose wrapper calls are collected.
+            depth (int): The maximum number of responses outstanding at any time.
+        """
+        if depth < 1:
+            raise ValueError(f"Batch depth must be at least 1! (depth={depth})")
+
+        self.__prober = prober
+        self.__depth = depth
+        self.__queue: Deque[BatchCall] = deque()
+        self.__responses: List[Response] = []
+
+
+    def __enter__(self) -> "CommandBatch":
+        return self
+
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.flush()
+            return
+
+        # Try to keep the communicator in sync but do not hide the original error.
+        try:
+            self.flush()
+        except Exception:
+            pass
+
+
+    @property
+    def pending(self) -> int:
+        """The number of wrapper calls that were collected but did not complete yet."""
+        return len(self.__queue)
+
+
+    @property
+    def prober(self) -> "SentioProber":
+        """The SentioProber whose wrapper calls are collected. Use it in functions passed to call."""
+        return self.__prober
+
+
+    @property
+    def responses(self) -> List[Response]:
+        """The responses of all commands sent by the batch in the order they were received."""
+        return self.__responses
+
+
+    def call(self, fn: Callable[[], Any], name: str = "call") -> BatchCall:
+        """Add a function that executes one or more wrapper functions of the prober.
+
+        The function is executed when the batch is flushed. Errors raised by it are
+        raised by flush and by the result() function of the returned handle.
+
+        Args:
+            fn (Callable): The function to collect.
+            name (str): A name for the call used in error messages.
+
+        Returns:
+            A handle for retrieving the result after the batch was flushed.
+        """
+        handle = BatchCall(name, fn)
+        self.__queue.append(handle)
+        return handle
+
+
+    def flush(self) -> List[Response]:
+        """Execute the collected wrapper calls and send their commands.
+
+        Returns:
+            The responses of all commands sent by the batch so far.
+
+        Raises:
+            Exception: The first error raised by a wrapper call of this flush.
+        """
+        if not self.__queue:
+            return self.__responses
+
+        comm = self.__prober.comm
+        yielded = threading.Semaphore(0)
+        batch_comm = _BatchCommunicator(yielded)
+        first_error: BaseException | None = None
+
+        def execute(call: BatchCall) -> None:
+            batch_comm.bind(call)
+            try:
+                call._value = call._fn()
+            except BaseException as e:
+                call._error = e
+            finally:
+                batch_comm.bind(None)
+                call._done = True
+                yielded.release()
+
+        # calls waiting for a response and the commands to send before reading the responses
+        waiting: Deque[BatchCall] = deque()
+        cmds: List[str] = []
+        unread = 0
+
+        def collect(call: BatchCall) -> None:
+            nonlocal first_error
+            yielded.acquire()
+            cmds.extend(call._sent)
+            call._sent.clear()
+            if call._waiting:
+                waiting.append(call)
+            elif call._error is not None and first_error is None:
+                first_error = call._error
+
+        with self.__prober._use_comm(batch_comm), ThreadPoolExecutor(self.__depth, "CommandBatch") as pool:
+            try:
+                while self.__queue or waiting:
+                    # Calls that need another round trip continue before new calls start.
+                    while self.__queue and len(waiting) < self.__depth:
+                        pool.submit(execute, self.__queue[0])
+                        collect(self.__queue.popleft())
+
+                    if cmds:
+                        comm.send_many(cmds)
+                        unread += sum(1 for cmd in cmds if CommunicatorBase.expects_response(cmd))
+                        cmds.clear()
+
+                    for _ in range(len(waiting)):
+                        call = waiting[0]
+                        try:
+                            call._line = comm.read_line()
+                        finally:
+                            # a timed out read is already marked for discarding by the communicator
+                            unread -= 1
+                        waiting.popleft()
+                        self.__responses.append(Response.parse_resp(call._line))
+                        call._resume.release()
+                        collect(call)
+
+                # commands of calls that completed without waiting for a response
+                if cmds:
+                    comm.send_many(cmds)
+            finally:
+                # Responses of commands that were sent but not read must not reach later
+                # commands of the prober.
+                for _ in range(unread):
+                    comm.discard_response()
+
+                # Calls still waiting after a communication error fail without a response.
+                batch_comm.abort()
+                for call in waiting:
+                    call._line = None
+                    call._resume.release()
+                    yielded.acquire()
+
+        if first_error is not None:
+            raise first_error
+
+        return self.__responses
+
+
+    def _wrap(self, obj: Any) -> Any:
+        if isinstance(obj, CommandGroupBase):
+            return BatchCommandGroup(obj, self)
+
+        if inspect.ismethod(obj):
+            @functools.wraps(obj)
+            def wrapper(*args, **kwargs) -> BatchCall:
+                return self.call(lambda: obj(*args, **kwargs), obj.__name__)
+
+            return wrapper
+
+        return obj
+
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        return self._wrap(getattr(self.__prober, name))
@@ -4,8 +4,10 @@ from dataclasses import dataclass
 
 from sentio_prober_control.Sentio.Enumerations import ChuckSite, ElementType
 from sentio_prober_control.Sentio.Response import Response
+from sentio_prober_control.Sentio.ResponseSchema import ResponseSchema
 from sentio_prober_control.Sentio.ProberBase import ProberException
 from sentio_prober_control.Sentio.CommandGroups.AuxCleaningGroup import AuxCleaningGroup
+from sentio_prober_control.Sentio.CommandGroups.CommandGroupBase import LazyCommandGroup
 from sentio_prober_control.Sentio.CommandGroups.ModuleCommandGroupBase import ModuleCommandGroupBase
 
 class ElementInfoResponse:
@@ -19,20 +21,7 @@ class ElementInfoResponse:
     """
     def __init__(self, raw_response: str) -> None:
         self.raw_response = raw_response
-        parts = raw_response.split(",")
-        if len(parts) < 7:
-            raise ProberException("Unexpected response for element info.")
-
-        # Parse the parts into an ElementInfo object.
-        self.element_info = ElementInfo(
-            element_type=ElementType.from_string(parts[0]),
-            element_subtype=parts[1],
-            x_position=float(parts[2]),
-            y_position=float(parts[3]),
-            spacing=float(parts[4]),
-            touch_count=int(parts[5]),
-            life_time=float(parts[6])
-        )
+        self.element_info = _ELEMENT_INFO.parse_message(raw_response)
 
     def get_element_info(self) -> "ElementInfo":
         """
@@ -54,6 +43,10 @@ class ElementInfo:
     life_time: float
 
 
+_ELEMENT_INFO = ResponseSchema.register("aux:get_element_info", ElementType, str, float, float, float, int, float, record=ElementInfo)
+_ELEMENT_POS = ResponseSchema.register("aux:get_element_pos", float, float)
+
+
 class AuxCommandGroup(ModuleCommandGroupBase):
     """This command group contains functions for working with auxiliary sites of the chuck.
     You are not meant to create instances of this class on your own. Instead, use the aux
@@ -63,9 +56,10 @@ class AuxCommandGroup(ModuleCommandGroupBase):
         cleaning (AuxCleaningGroup): A subgroup to provide logic for probe cleaning.
     """
 
+    cleaning: LazyCommandGroup[AuxCleaningGroup] = LazyCommandGroup(lambda aux: AuxCleaningGroup(aux.prober))
+
     def __init__(self, prober : 'SentioProber') -> None:
         super().__init__(prober, "aux")
-        self.cleaning: AuxCleaningGroup = AuxCleaningGroup(prober)
 
     # --- Helper method to validate that the given site is an auxiliary site ---
     def _validate_aux_site(self, site: "ChuckSite") -> None:
@@ -97,7 +91,7 @@ class AuxCommandGroup(ModuleCommandGroupBase):
 
         self.comm.send(cmd)
         resp = Response.check_resp(self.comm.read_line())
-        parts = resp.message().split(",")
+        parts = resp.fields()
         if not parts or len(parts) < 1:
             return []
 
@@ -235,7 +229,7 @@ class AuxCommandGroup(ModuleCommandGroupBase):
         cmd = f"aux:get_substrate_info {site.to_string()}"
         self.comm.send(cmd)
         resp = Response.check_resp(self.comm.read_line())
-        parts = resp.message().split(",")
+        parts = resp.fields()
         if len(parts) < 3:
             raise ProberException("Unexpected response for get_substrate_info.")
         substrate_type = parts[0]
@@ -324,12 +318,7 @@ class AuxCommandGroup(ModuleCommandGroupBase):
 
         self.comm.send(cmd)
         resp = Response.check_resp(self.comm.read_line())
-        parts = resp.message().split(",")
-        if len(parts) < 2:
-            raise ProberException("Unexpected response for get_element_pos.")
-        x = float(parts[0])
-        y = float(parts[1])
-        return (x, y)
+        return _ELEMENT_POS.parse(resp)
 
     # -------------------------------------------------------------------------
     # 10) get_element_life_time
@@ -402,6 +391,4 @@ class AuxCommandGroup(ModuleCommandGroupBase):
         self.comm.send(cmd)
         resp = Response.check_resp(self.comm.read_line())
         
-        # Use the ElementInfoResponse class to parse the raw response
-        parser = ElementInfoResponse(resp.message())
-        return parser.get_element_info()
\ No newline at end of file
+        return _ELEMENT_INFO.parse(resp)
\ No newline at end of file
@@ -1,7 +1,11 @@
 from abc import ABC
-from typing import Union
+from typing import Any, Callable, Generic, Optional, TypeVar, Union, overload
 
 from sentio_prober_control.Communication.CommunicatorBase import CommunicatorBase
+from sentio_prober_control.Sentio.Compatibility import Compatibility, CompatibilityLevel
+
+
+T = TypeVar("T")
 
 
 class CommandGroupBase(ABC):
@@ -39,3 +43,59 @@ class CommandGroupBase(ABC):
             comm (CommunicatorBase): The communicator object.
         """
         return self.__parent.comm
+
+
+class LazyCommandGroup(Generic[T]):
+    """Class attribute that creates a command group when it is accessed for the first time.
+
+    The command group is created by calling the factory with the object owning the attribute.
+    The result is stored in the instance dictionary of the owner under the attribute name, so
+    that later accesses are plain attribute lookups and do not call the descriptor again.
+
+    If a minimum compatibility level is given the command group is only available when
+    Compatibility.level is at least that level. Otherwise accessing it raises an AttributeError,
+    so that hasattr returns False just like for a command group that was never created.
+
+    Example:
+
+    ```py
+    class WafermapCommandGroup(ModuleCommandGroupBase):
+        bins = LazyCommandGroup(WafermapBinsCommandGroup)
+    ```
+    """
+
+    def __init__(self, factory: Callable[[Any], T], min_level: Optional[CompatibilityLevel] = None) -> None:
+        """Create the descriptor.
+
+        Args:
+            factory (Callable): Creates the command group. Called with the owner object (i.e. the prober or the parent command group).
+            min_level (CompatibilityLevel): The minimum compatibility level required for the command group. None if it is always available.
+        """
+        self.__factory = factory
+        self.__min_level = min_level
+        self.__name = ""
+
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.__name = name
+
+
+    @overload
+    def __get__(self, instance: None, owner: type) -> "LazyCommandGroup[T]": ...
+
+    @overload
+    def __get__(self, instance: Any, owner: type) -> T: ...
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+
+        if self.__min_level is not None and Compatibility.level < self.__min_level:
+            raise AttributeError(
+                f"'{type(instance).__name__}' object has no attribute '{self.__name}' "
+                f"(requires compatibility level {self.__min_level.name}, current level is {Compatibility.level.name})"
+            )
+
+        group = self.__factory(instance)
+        instance.__dict__[self.__name] = group
+        return group
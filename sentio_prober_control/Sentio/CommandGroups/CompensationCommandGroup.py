@@ -29,7 +29,7 @@ class CompensationCommandGroup(CommandGroupBase):
 
         self.comm.send(f"vis:compensation:enable {comp.to_string()}, {enable}")
         resp = Response.check_resp(self.comm.read_line())
-        tok = resp.message().split(",")
+        tok = resp.fields()
         return tok[0], tok[1]
 
 
@@ -2,11 +2,16 @@ from typing import Tuple
 
 from sentio_prober_control.Sentio.Enumerations import LoaderStation, OrientationMarker, RemoteCommandError, WaferStatusItem, WaferIdSide
 from sentio_prober_control.Sentio.Response import Response
-from sentio_prober_control.Sentio.CommandGroups.CommandGroupBase import CommandGroupBase
+from sentio_prober_control.Sentio.ResponseSchema import OrDefault, ResponseSchema
+from sentio_prober_control.Sentio.CommandGroups.CommandGroupBase import CommandGroupBase, LazyCommandGroup
 from sentio_prober_control.Sentio.CommandGroups.LoaderVirtualCarrierCommandGroup import LoaderVirtualCarrierCommandGroup
 from sentio_prober_control.Sentio.ProberBase import ProberException
 
 
+# SENTIO returns NaN for an unknown wafer size
+_WAFER_STATUS = ResponseSchema.register("loader:query_wafer_status", LoaderStation, int, OrDefault(int, -1), int, float)
+
+
 class LoaderCommandGroup(CommandGroupBase):
 
     """This command group contains functions for working with the loader.
@@ -23,11 +28,11 @@ class LoaderCommandGroup(CommandGroupBase):
     ```
     """
 
+    vc: LazyCommandGroup[LoaderVirtualCarrierCommandGroup] = LazyCommandGroup(LoaderVirtualCarrierCommandGroup)
+
     def __init__(self, parent : 'SentioProber') -> None:
         super().__init__(parent)
 
-        self.vc : LoaderVirtualCarrierCommandGroup = LoaderVirtualCarrierCommandGroup(self)
-
 
     def has_station(self, station: LoaderStation) -> bool:
 
@@ -110,21 +115,8 @@ class LoaderCommandGroup(CommandGroupBase):
                 return None
             else:
                 raise
-        
-        tok = resp.message().split(',')
-        origin_station = LoaderStation[tok[0]]
-        origin_slot = int(tok[1])
-        
-        try:
-           # SENTIO may return NaN for unknown size
-           size = int(tok[2])
-        except:
-            size = -1
-
-        orient = int(tok[3])
-        progress = float(tok[4])
 
-        return (origin_station, origin_slot, size, orient, progress)
+        return _WAFER_STATUS.parse(resp)
 
 
     def scan_station(self, station: LoaderStation) -> str:
@@ -249,7 +241,7 @@ class LoaderCommandGroup(CommandGroupBase):
         
         self.comm.send(f"loader:has_cassette {station.to_string()}")
         resp = Response.check_resp(self.comm.read_line())
-        tok = resp.message().split(',')
+        tok = resp.fields()
         has_cassette = tok[0] == "1"
         cassette_size = int(tok[1])
         return has_cassette, cassette_size
@@ -343,7 +335,7 @@ class LoaderCommandGroup(CommandGroupBase):
         
         self.comm.send(f"loader:swap_wafer")
         resp = Response.check_resp(self.comm.read_line())
-        tok = resp.message().split(',')
+        tok = resp.fields()
         return bool(tok[0]), bool(tok[1])
     
 
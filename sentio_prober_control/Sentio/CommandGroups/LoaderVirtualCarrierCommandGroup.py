@@ -2,10 +2,14 @@ from typing import List, Tuple
 
 from sentio_prober_control.Sentio.CommandGroups.CommandGroupBase import CommandGroupBase
 from sentio_prober_control.Sentio.Response import Response
+from sentio_prober_control.Sentio.ResponseSchema import ResponseSchema
 from sentio_prober_control.Sentio.Helper import Helper
 from sentio_prober_control.Sentio.Enumerations import VirtualCarrierInitFlags, VirtualCarrierStepProcessingState, LoaderStation
 
 
+_NEXT_STEP = ResponseSchema.register("loader:vc:start_next_step", VirtualCarrierStepProcessingState, str, LoaderStation, int, float, int)
+
+
 class LoaderVirtualCarrierCommandGroup(CommandGroupBase):
     """A command group for the Virtual Carrier functionality.
 
@@ -29,9 +33,7 @@ class LoaderVirtualCarrierCommandGroup(CommandGroupBase):
         try:
             self.comm.send("loader:vc:list")
             resp = Response.check_resp(self.comm.read_line())
-            
-            list : List[str] = resp.message().split(',')
-            return list
+            return list(resp.fields())
         except:
             return []
         
@@ -103,15 +105,7 @@ class LoaderVirtualCarrierCommandGroup(CommandGroupBase):
         resp : Response = self.prober.send_cmd("loader:vc:start_next_step")
         resp = self.prober.wait_complete(resp, timeout)
 
-        col = resp.message().split(',')
-        state = VirtualCarrierStepProcessingState[col[0]]
-        id = col[1]
-        station = LoaderStation[col[2]]
-        slot = int(col[3])
-        temp = float(col[4])
-        probecard_idx = int(col[5])
-
-        return (state, id, station, slot, temp, probecard_idx)
+        return _NEXT_STEP.parse(resp)
     
 
     def save_state(self) -> None:
@@ -1,15 +1,49 @@
 from sentio_prober_control.Sentio.Response import Response
+from sentio_prober_control.Sentio.ResponseSchema import ResponseSchema
+from sentio_prober_control.Sentio.PropertyCache import PropertyCache
 from sentio_prober_control.Sentio.CommandGroups.CommandGroupBase import CommandGroupBase
-from typing import Literal, Tuple, Union, overload
+from typing import Any, Dict, Literal, Tuple, Union, overload
 from enum import Enum
 
 class ModuleCommandGroupBase(CommandGroupBase):
     """Base class for all command groups."""
 
+    __prop_types: Dict[Tuple[str, str], ResponseSchema] = {}
+
     def __init__(self, parent : 'SentioProber', abbr) -> None:
         super().__init__(parent)
         self._groupAbbr = abbr
 
+
+    @staticmethod
+    def register_prop(abbr: str, prop_name: str, *fields: Any) -> ResponseSchema:
+        """Register the type of a module property.
+
+        get_prop has to guess the type of properties it does not know by trying to convert the
+        response into a boolean, a number or a tuple of numbers. The response of a registered
+        property is converted with its schema instead. A property with a single field is
+        returned as a single value, a property with several fields as a tuple.
+
+        Properties of different modules may share a name, so the type is registered for a
+        single module.
+
+        Args:
+            abbr (str): The abbreviation of the module (i.e. "map").
+            prop_name (str): The name of the property.
+            fields (Any): The types of the comma separated fields. See ResponseSchema for the supported types.
+
+        Returns:
+            The schema of the property.
+        """
+        schema = ResponseSchema(*fields)
+        ModuleCommandGroupBase.__prop_types[(abbr, prop_name)] = schema
+        return schema
+
+
+    def __property_cache(self) -> PropertyCache | None:
+        cache = getattr(self.prober, "property_cache", None)
+        return cache if isinstance(cache, PropertyCache) else None
+
     @overload
     def get_prop(self, prop_name: Literal["chuck_to_wafer_offset"], arg1: None | Enum | str | int | float = ...) -> Tuple[float, float]: ...
 
@@ -31,21 +65,65 @@ class ModuleCommandGroupBase(CommandGroupBase):
 
         The remote command specification contains a list of some of exposed module properties.
 
+        If the prober has a property_cache the value is taken from the cache while it is valid.
+
         :param prop_name: The name of the property to query.
         :param arg1: An optional parameter for the property.
         :raises: ProberException if an error occured.
         """
         
+        arg = ModuleCommandGroupBase._prop_arg(arg1)
+
+        cache = self.__property_cache()
+        if cache is not None:
+            value = cache.lookup(self._groupAbbr, prop_name, arg)
+            if value is not PropertyCache.MISSING:
+                return value
+
+        self.comm.send(ModuleCommandGroupBase._get_prop_cmd(self._groupAbbr, prop_name, arg))
+        resp = Response.check_resp(self.comm.read_line())
+        value = ModuleCommandGroupBase._parse_prop(self._groupAbbr, prop_name, resp)
+
+        if cache is not None:
+            cache.store(self._groupAbbr, prop_name, arg, value)
+
+        return value
+
+
+    @staticmethod
+    def _prop_arg(arg1: None | Enum | str | int | float) -> str:
+        """Format the optional parameter of a module property. Returns an empty string for None."""
         if arg1 == None:
-            self.comm.send(f"{self._groupAbbr}:get_prop {prop_name}")
+            return ""
         elif isinstance(arg1, Enum):
-            self.comm.send(f"{self._groupAbbr}:get_prop {prop_name}, {arg1.name}")
+            return arg1.name
         else:
-            self.comm.send(f"{self._groupAbbr}:get_prop {prop_name}, {arg1}")
+            return str(arg1)
+
+
+    @staticmethod
+    def _get_prop_cmd(abbr: str, prop_name: str, arg: str) -> str:
+        """Build the get_prop remote command of a module. arg is the formatted parameter."""
+        if arg == "":
+            return f"{abbr}:get_prop {prop_name}"
+        else:
+            return f"{abbr}:get_prop {prop_name}, {arg}"
 
-        resp = Response.check_resp(self.comm.read_line())
 
-        values = resp.message().split(",")
+    @staticmethod
+    def _parse_prop(abbr: str, prop_name: str, resp: Response) -> Any:
+        """Convert the response of a get_prop command with the registered type of the property."""
+        schema = ModuleCommandGroupBase.__prop_types.get((abbr, prop_name))
+        if schema is None:
+            return ModuleCommandGroupBase.__guess_prop_value(resp)
+
+        value = schema.parse(resp)
+        return value[0] if schema.width == 1 else value
+
+
+    @staticmethod
+    def __guess_prop_value(resp: Response) -> Union[float, str, bool, Tuple[float, float], Tuple[float, float, float]]:
+        values = resp.fields()
 
         # Try to figure out the type of the return value
         if len(values) == 1:
@@ -95,3 +173,30 @@ class ModuleCommandGroupBase(CommandGroupBase):
 
         self.comm.send(cmd.format(prop_name))
         Response.check_resp(self.comm.read_line())
+        self._invalidate_props(prop_name)
+
+
+    def _invalidate_props(self, *prop_names: str) -> None:
+        """Remove cached values of module properties after a command changed them.
+
+        Wrappers of commands that change module properties as a side effect must call this,
+        otherwise the property_cache returns outdated values.
+
+        Args:
+            prop_names (str): The names of the changed properties. If none are given all properties of the module are removed.
+        """
+        cache = self.__property_cache()
+        if cache is None:
+            return
+
+        if not prop_names:
+            cache.invalidate_module(self._groupAbbr)
+
+        for prop_name in prop_names:
+            cache.invalidate(prop_name, self._groupAbbr)
+
+
+ModuleCommandGroupBase.register_prop("map", "chuck_to_wafer_offset", float, float)
+ModuleCommandGroupBase.register_prop("map", "grid_chuck_mode", bool)
+ModuleCommandGroupBase.register_prop("map", "die_reference", float, float)
+ModuleCommandGroupBase.register_prop("map", "die_reference_is_set", bool)
@@ -2,7 +2,7 @@ from typing import Tuple
 
 from sentio_prober_control.Sentio.Enumerations import ProbePosition, XyReference, ZReference, ChuckSite, Stage
 from sentio_prober_control.Sentio.Response import Response
-from sentio_prober_control.Sentio.CommandGroups.CommandGroupBase import CommandGroupBase
+from sentio_prober_control.Sentio.CommandGroups.CommandGroupBase import CommandGroupBase, LazyCommandGroup
 from sentio_prober_control.Sentio.Compatibility import Compatibility, CompatibilityLevel
 from sentio_prober_control.Sentio.CommandGroups.StageCommandGroup import StageCommandGroup
 
@@ -50,34 +50,43 @@ class ProbeCommandGroup(CommandGroupBase):
     class _TopBottomPositionSelector:
         """ This is a dummy command group for providing access to top and bottom probes.
         """
+        east: LazyCommandGroup[StageCommandGroup] = LazyCommandGroup(lambda selector: selector._create("east"))
+        west: LazyCommandGroup[StageCommandGroup] = LazyCommandGroup(lambda selector: selector._create("west"))
+        north: LazyCommandGroup[StageCommandGroup] = LazyCommandGroup(lambda selector: selector._create("north"))
+        south: LazyCommandGroup[StageCommandGroup] = LazyCommandGroup(lambda selector: selector._create("south"))
+        northeast: LazyCommandGroup[StageCommandGroup] = LazyCommandGroup(lambda selector: selector._create("northeast"))
+        northwest: LazyCommandGroup[StageCommandGroup] = LazyCommandGroup(lambda selector: selector._create("northwest"))
+        southeast: LazyCommandGroup[StageCommandGroup] = LazyCommandGroup(lambda selector: selector._create("southeast"))
+        southwest: LazyCommandGroup[StageCommandGroup] = LazyCommandGroup(lambda selector: selector._create("southwest"))
+
         def __init__(self, prober: 'SentioProber', stage : Stage, stage_selector : str) -> None: # type: ignore
-            self.east : StageCommandGroup = StageCommandGroup(prober, stage, f"{stage_selector}:east")
-            self.west : StageCommandGroup = StageCommandGroup(prober, stage, f"{stage_selector}:west")
-            self.north : StageCommandGroup = StageCommandGroup(prober, stage, f"{stage_selector}:north")
-            self.south : StageCommandGroup = StageCommandGroup(prober, stage, f"{stage_selector}:south")
-            self.northeast : StageCommandGroup = StageCommandGroup(prober, stage, f"{stage_selector}:northeast")
-            self.northwest : StageCommandGroup = StageCommandGroup(prober, stage, f"{stage_selector}:northwest")
-            self.southeast : StageCommandGroup = StageCommandGroup(prober, stage, f"{stage_selector}:southeast")
-            self.southwest : StageCommandGroup = StageCommandGroup(prober, stage, f"{stage_selector}:southwest")
+            self.__prober = prober
+            self.__stage = stage
+            self.__stage_selector = stage_selector
+
+
+        def _create(self, direction: str) -> StageCommandGroup:
+            return StageCommandGroup(self.__prober, self.__stage, f"{self.__stage_selector}:{direction}")
+
+
+    top: LazyCommandGroup[_TopBottomPositionSelector] = LazyCommandGroup(
+        lambda probe: ProbeCommandGroup._TopBottomPositionSelector(probe.prober, Stage.TopProbe, "probe:top"), CompatibilityLevel.Sentio_25_2)
+    bottom: LazyCommandGroup[_TopBottomPositionSelector] = LazyCommandGroup(
+        lambda probe: ProbeCommandGroup._TopBottomPositionSelector(probe.prober, Stage.BottomProbe, "probe:bottom"), CompatibilityLevel.Sentio_25_2)
 
+    # Top probes are also available as east, west, north, south, northeast, northwest, southeast, southwest
+    east: LazyCommandGroup[StageCommandGroup] = LazyCommandGroup(lambda probe: probe.top.east, CompatibilityLevel.Sentio_25_2)
+    west: LazyCommandGroup[StageCommandGroup] = LazyCommandGroup(lambda probe: probe.top.west, CompatibilityLevel.Sentio_25_2)
+    north: LazyCommandGroup[StageCommandGroup] = LazyCommandGroup(lambda probe: probe.top.north, CompatibilityLevel.Sentio_25_2)
+    south: LazyCommandGroup[StageCommandGroup] = LazyCommandGroup(lambda probe: probe.top.south, CompatibilityLevel.Sentio_25_2)
+    northeast: LazyCommandGroup[StageCommandGroup] = LazyCommandGroup(lambda probe: probe.top.northeast, CompatibilityLevel.Sentio_25_2)
+    northwest: LazyCommandGroup[StageCommandGroup] = LazyCommandGroup(lambda probe: probe.top.northwest, CompatibilityLevel.Sentio_25_2)
+    southeast: LazyCommandGroup[StageCommandGroup] = LazyCommandGroup(lambda probe: probe.top.southeast, CompatibilityLevel.Sentio_25_2)
+    southwest: LazyCommandGroup[StageCommandGroup] = LazyCommandGroup(lambda probe: probe.top.southwest, CompatibilityLevel.Sentio_25_2)
 
     def __init__(self, prober: 'SentioProber') -> None:
         super().__init__(prober)
 
-        if Compatibility.level >= CompatibilityLevel.Sentio_25_2:
-            self.top = self._TopBottomPositionSelector(prober, Stage.TopProbe, "probe:top")
-            self.bottom = self._TopBottomPositionSelector(prober, Stage.BottomProbe, "probe:bottom")
-
-            # Top probes are also available as east, west, north, south, northeast, northwest, southeast, southwest
-            self.east = self.top.east
-            self.west = self.top.west
-            self.north = self.top.north
-            self.south = self.top.south
-            self.northeast = self.top.northeast
-            self.northwest = self.top.northwest
-            self.southeast = self.top.southeast
-            self.southwest = self.top.southwest
-       
 
     def async_step_probe_site(self, probe: ProbePosition, idx: int) -> int:
         """Start the process of stepping to a positioner site.
@@ -175,7 +184,7 @@ class ProbeCommandGroup(CommandGroupBase):
 
         self.comm.send(f"get_positioner_site {probe.to_string()},{idx}")
         resp = Response.check_resp(self.comm.read_line())
-        tok = resp.message().split(",")
+        tok = resp.fields()
 
         return str(tok[0]), float(tok[1]), float(tok[2]), str(tok[3])
 
@@ -234,8 +243,7 @@ class ProbeCommandGroup(CommandGroupBase):
 
         self.comm.send(f"get_positioner_xy {probe.to_string()},{ref.to_string()}")
         resp = Response.check_resp(self.comm.read_line())
-        tok = resp.message().split(",")
-        return float(tok[0]), float(tok[1])
+        return resp.floats(2)
 
 
     def get_probe_z(self, probe: ProbePosition, ref: ZReference) -> float:
@@ -342,8 +350,7 @@ class ProbeCommandGroup(CommandGroupBase):
 
         self.comm.send(f"move_positioner_home {probe.to_string()}")
         resp = Response.check_resp(self.comm.read_line())
-        tok = resp.message().split(",")
-        return float(tok[0]), float(tok[1])
+        return resp.floats(2)
 
 
     def move_probe_xy(self, probe: ProbePosition, ref: XyReference, x: float, y: float) -> Tuple[float, float]:
@@ -365,8 +372,7 @@ class ProbeCommandGroup(CommandGroupBase):
 
         self.comm.send(f"move_positioner_xy {probe.to_string()},{ref.to_string()},{x},{y}")
         resp = Response.check_resp(self.comm.read_line())
-        tok = resp.message().split(",")
-        return float(tok[0]), float(tok[1])
+        return resp.floats(2)
 
 
     def move_probe_z(self, probe: ProbePosition, ref: ZReference, z: float) -> float:
@@ -454,7 +460,7 @@ class ProbeCommandGroup(CommandGroupBase):
         self.comm.send(f"step_positioner_site {probe.to_string()},{idx}")
 
         resp = Response.check_resp(self.comm.read_line())
-        tok = resp.message().split(",")
+        tok = resp.fields()
         return tok[0], float(tok[1]), float(tok[2])
 
 
@@ -477,7 +483,7 @@ class ProbeCommandGroup(CommandGroupBase):
 
         self.comm.send(f"step_positioner_site_first {probe.to_string()}")
         resp = Response.check_resp(self.comm.read_line())
-        tok = resp.message().split(",")
+        tok = resp.fields()
         return tok[0], float(tok[1]), float(tok[2])
 
 
@@ -500,7 +506,7 @@ class ProbeCommandGroup(CommandGroupBase):
 
         self.comm.send(f"step_positioner_site_next {probe.to_string()}")
         resp = Response.check_resp(self.comm.read_line())
-        tok = resp.message().split(",")
+        tok = resp.fields()
         return tok[0], float(tok[1]), float(tok[2])
 
 
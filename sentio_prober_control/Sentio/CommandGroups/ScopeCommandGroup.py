@@ -2,8 +2,9 @@
 from typing import Optional
 
 
+from sentio_prober_control.Sentio.CommandGroups.CommandGroupBase import LazyCommandGroup
 from sentio_prober_control.Sentio.CommandGroups.StageCommandGroup import StageCommandGroup
-from sentio_prober_control.Sentio.Compatibility import CompatibilityLevel, Compatibility
+from sentio_prober_control.Sentio.Compatibility import CompatibilityLevel
 from sentio_prober_control.Sentio.Enumerations import Stage
 
 
@@ -25,10 +26,12 @@ class ScopeCommandGroup(StageCommandGroup):
     ```
     """
 
+    top: LazyCommandGroup[StageCommandGroup] = LazyCommandGroup(
+        lambda scope: StageCommandGroup(scope, Stage.Scope, "scope:top"), CompatibilityLevel.Sentio_25_2)
+    bottom: LazyCommandGroup[StageCommandGroup] = LazyCommandGroup(
+        lambda scope: StageCommandGroup(scope, Stage.BottomScope, "scope:bottom"), CompatibilityLevel.Sentio_25_2)
+    aux: LazyCommandGroup[StageCommandGroup] = LazyCommandGroup(
+        lambda scope: StageCommandGroup(scope, Stage.AuxiliaryScope, "scope:aux"), CompatibilityLevel.Sentio_25_2)
+
     def __init__(self, prober: 'SentioProber', stage : Stage, stage_selector : str) -> None: # type: ignore
         super().__init__(prober, stage, stage_selector)
-
-        if Compatibility.level >= CompatibilityLevel.Sentio_25_2:
-            self.top : StageCommandGroup = StageCommandGroup(self, Stage.Scope, "scope:top")
-            self.bottom : StageCommandGroup = StageCommandGroup(self, Stage.BottomScope, "scope:bottom")
-            self.aux : StageCommandGroup = StageCommandGroup(self, Stage.AuxiliaryScope, "scope:aux")
@@ -1,13 +1,15 @@
 
 from sentio_prober_control.Sentio.CommandGroups.SetupContactCounterCommandGroup import SetupContactCounterCommandGroup
 from sentio_prober_control.Sentio.CommandGroups.SetupRemoteCommandGroup import SetupRemoteCommandGroup
+from sentio_prober_control.Sentio.CommandGroups.CommandGroupBase import LazyCommandGroup
 from sentio_prober_control.Sentio.CommandGroups.ModuleCommandGroupBase import ModuleCommandGroupBase
 
 
 class SetupCommandGroup(ModuleCommandGroupBase):
     """A command group for accessing setup module functions."""
+
+    contact_counter: LazyCommandGroup[SetupContactCounterCommandGroup] = LazyCommandGroup(lambda setup: SetupContactCounterCommandGroup(setup.prober))
+    remote: LazyCommandGroup[SetupRemoteCommandGroup] = LazyCommandGroup(lambda setup: SetupRemoteCommandGroup(setup.prober))
+
     def __init__(self, prober : 'SentioProber') -> None:
-        super().__init__(prober, "setup")
-        
-        self.contact_counter: SetupContactCounterCommandGroup = SetupContactCounterCommandGroup(prober)
-        self.remote: SetupRemoteCommandGroup = SetupRemoteCommandGroup(prober)
\ No newline at end of file
+        super().__init__(prober, "setup")
\ No newline at end of file
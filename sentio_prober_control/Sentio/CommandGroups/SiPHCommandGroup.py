@@ -30,8 +30,7 @@ class SiPHCommandGroup(CommandGroupBase):
         """
         self.comm.send("siph:get_cap_sensor")
         resp = Response.check_resp(self.comm.read_line())
-        tok = resp.message().split(",")
-        return float(tok[0]), float(tok[1])
+        return resp.floats(2)
 
     def get_fiber_length(self, stage: Stage, probe: ProbePosition) -> float:
         """Retrieves the fiber length of an SiPH positioner.
@@ -128,7 +127,7 @@ class SiPHCommandGroup(CommandGroupBase):
         self.comm.send(f"siph:get_alignment {probe.to_string()},{fiber_type.to_string()}")
         resp = Response.check_resp(self.comm.read_line())
 
-        tok = resp.message().split(",")
+        tok = resp.fields()
         coarse = tok[0].strip().lower() == "true"
         fine = tok[1].strip().lower() == "true"
         gradient = tok[2].strip().lower() == "true"
@@ -312,9 +311,8 @@ class SiPHCommandGroup(CommandGroupBase):
         resp = Response.check_resp(self.comm.read_line())
 
         # Parse response message
-        tok = resp.message().split(",")
-        new_x = float(tok[0])
-        new_y = float(tok[1])
+        new_x = resp.float_at(0)
+        new_y = resp.float_at(1)
         return new_x, new_y
 
 
@@ -331,9 +329,8 @@ class SiPHCommandGroup(CommandGroupBase):
         resp = Response.check_resp(self.comm.read_line())
 
         # Parse response message
-        tok = resp.message().split(",")
-        current_x = float(tok[0])
-        current_y = float(tok[1])
+        current_x = resp.float_at(0)
+        current_y = resp.float_at(1)
         return current_x, current_y
 
 
@@ -350,6 +347,5 @@ class SiPHCommandGroup(CommandGroupBase):
         resp = Response.check_resp(self.comm.read_line())
 
         # Parse response message
-        tok = resp.message().split(",")
-        current_z = float(tok[0])
+        current_z = resp.float_at(0)
         return current_z
\ No newline at end of file
@@ -2,10 +2,18 @@ from typing import Tuple
 
 from sentio_prober_control.Sentio.Enumerations import XyReference, ZReference, Stage, ChuckSite
 from sentio_prober_control.Sentio.Response import Response
+from sentio_prober_control.Sentio.ResponseSchema import ResponseSchema
 from sentio_prober_control.Sentio.CommandGroups.CommandGroupBase import CommandGroupBase
 
 from typing import Optional
 
+# The stage commands are available for many stages (i.e. "chuck:get_xy", "scope:top:get_xy"),
+# so their schemas are not registered for a single remote command.
+_XY_SITE = ResponseSchema(float, float, ChuckSite)
+_XY_REF = ResponseSchema(float, float, XyReference)
+_Z_REF = ResponseSchema(float, ZReference)
+_SITE_XY = ResponseSchema(str, float, float)
+
 
 class StageCommandGroup(CommandGroupBase):
     """This command group contains functions for working with motorized stages.
@@ -39,8 +47,7 @@ class StageCommandGroup(CommandGroupBase):
         self.comm.send(f"{self.__stage_selector}:get_home {chuck_site.to_string()}")
         resp = Response.check_resp(self.comm.read_line())
 
-        tok = resp.message().split(",")
-        return float(tok[0]), float(tok[1]), ChuckSite.from_string(tok[2])
+        return _XY_SITE.parse(resp)
 
 
     def get_site(self, site_idx : int) -> Tuple[str, float, float, XyReference, bool]:
@@ -55,7 +62,7 @@ class StageCommandGroup(CommandGroupBase):
         """
         self.comm.send(f"{self.__stage_selector}:get_site {site_idx}")
         resp = Response.check_resp(self.comm.read_line())
-        tok = resp.message().split(",")
+        tok = resp.fields()
         return tok[0],float(tok[1]), float(tok[2]), XyReference.from_string(tok[3]), bool(tok[4])
 
 
@@ -83,8 +90,7 @@ class StageCommandGroup(CommandGroupBase):
         """
         self.comm.send(f"{self.__stage_selector}:get_xy {ref_xy.to_string()}")
         resp = Response.check_resp(self.comm.read_line())
-        tok = resp.message().split(",")
-        return float(tok[0]), float(tok[1]), XyReference.from_string(tok[2])
+        return _XY_REF.parse(resp)
 
 
     def get_z(self, ref_z : ZReference) -> Tuple[float, ZReference]:
@@ -99,8 +105,7 @@ class StageCommandGroup(CommandGroupBase):
         """
         self.comm.send(f"{self.__stage_selector}:get_z {ref_z.to_string()}")
         resp = Response.check_resp(self.comm.read_line())
-        tok = resp.message().split(",")
-        return float(tok[0]), ZReference.from_string(tok[1])
+        return _Z_REF.parse(resp)
 
 
     def has_xy(self) -> bool:
@@ -154,8 +159,7 @@ class StageCommandGroup(CommandGroupBase):
 
         self.comm.send(f"{self.__stage_selector}:move_xy {ref.to_string()},{x},{y}")
         resp = Response.check_resp(self.comm.read_line())
-        tok = resp.message().split(",")
-        return float(tok[0]), float(tok[1]), XyReference.from_string(tok[2])
+        return _XY_REF.parse(resp)
     
 
     def move_z(self, ref: ZReference, z: float) -> Tuple[float, ZReference]:
@@ -172,8 +176,7 @@ class StageCommandGroup(CommandGroupBase):
 
         self.comm.send(f"{self.__stage_selector}:move_z {ref.to_string()},{z}")
         resp = Response.check_resp(self.comm.read_line())
-        tok = resp.message().split(",")
-        return float(tok[0]), ZReference.from_string(tok[1])
+        return _Z_REF.parse(resp)
     
 
     def set_home(self, x: Optional[float] = None, y: Optional[float] = None, site: Optional[ChuckSite] = None) -> Tuple[float, float, ChuckSite]:
@@ -197,8 +200,7 @@ class StageCommandGroup(CommandGroupBase):
         self.comm.send(f"{self.__stage_selector}:set_home {args}")
 
         resp = Response.check_resp(self.comm.read_line())
-        tok = resp.message().split(",")
-        return float(tok[0]),float(tok[1]),ChuckSite.from_string(tok[2])
+        return _XY_SITE.parse(resp)
     
 
     def step_site(self, site: str | int) -> Tuple[str, float, float]:
@@ -215,8 +217,7 @@ class StageCommandGroup(CommandGroupBase):
 
         self.comm.send(f"{self.__stage_selector}:step_site {site}")
         resp = Response.check_resp(self.comm.read_line())
-        tok = resp.message().split(",")
-        return tok[0],float(tok[1]),float(tok[2])
+        return _SITE_XY.parse(resp)
 
 
     def step_site_first(self) -> Tuple[str, float, float]:
@@ -230,8 +231,7 @@ class StageCommandGroup(CommandGroupBase):
         
         self.comm.send(f"{self.__stage_selector}:step_site_first")
         resp = Response.check_resp(self.comm.read_line())
-        tok = resp.message().split(",")
-        return tok[0],float(tok[1]),float(tok[2])
+        return _SITE_XY.parse(resp)
 
 
     def step_site_next(self) -> Tuple[str, float, float]:
@@ -245,8 +245,7 @@ class StageCommandGroup(CommandGroupBase):
         
         self.comm.send(f"{self.__stage_selector}:step_site_next")
         resp = Response.check_resp(self.comm.read_line())
-        tok = resp.message().split(",")
-        return tok[0],float(tok[1]),float(tok[2])
+        return _SITE_XY.parse(resp)
 
 
     @property
@@ -37,8 +37,7 @@ class StatusCommandGroup(ModuleCommandGroupBase):
 
         self.comm.send("status:get_chuck_temp")
         resp = Response.check_resp(self.comm.read_line())
-        tok = resp.message().split(",")
-        temp = float(tok[0])
+        temp = resp.float_at(0)
         return temp
 
 
@@ -51,8 +50,7 @@ class StatusCommandGroup(ModuleCommandGroupBase):
 
         self.comm.send("status:get_chuck_temp_setpoint")
         resp = Response.check_resp(self.comm.read_line())
-        tok = resp.message().split(",")
-        temp = float(tok[0])
+        temp = resp.float_at(0)
         return temp
 
 
@@ -120,7 +118,7 @@ class StatusCommandGroup(ModuleCommandGroupBase):
 
         self.comm.send("status:get_machine_status")
         resp = Response.check_resp(self.comm.read_line())
-        tok = resp.message().split(",")
+        tok = resp.fields()
         isInitialized = "Ready" in tok
         isMeasuring = "IsMeasuring" in tok
         LoaderBusy = "LoaderBusy" in tok
@@ -126,8 +126,7 @@ class VisionCameraCommandGroup(CommandGroupBase):
 
         self.comm.send(f"vis:get_prop calib, {mp.to_string()}")
         resp = Response.check_resp(self.comm.read_line())
-        tok = resp.message().split(",")
-        return float(tok[0]), float(tok[1])
+        return resp.floats(2)
 
     def get_image_size(self, mp: CameraMountPoint) -> Tuple[int, int]:
         """Get size of the image.
@@ -142,8 +141,7 @@ class VisionCameraCommandGroup(CommandGroupBase):
 
         self.comm.send(f"vis:get_prop image_size, {mp.to_string()}")
         resp = Response.check_resp(self.comm.read_line())
-        tok = resp.message().split(",")
-        return int(tok[0]), int(tok[1])
+        return resp.ints(2)
 
     def is_pattern_trained(self, mp: CameraMountPoint, pat) -> bool:
         """Check if a pattern is trained.
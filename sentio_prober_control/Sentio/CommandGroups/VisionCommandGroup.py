@@ -1,5 +1,4 @@
-import base64
-from typing import Tuple
+from typing import BinaryIO, Tuple
 
 from sentio_prober_control.Communication.CommunicatorBase import CommunicatorBase
 from sentio_prober_control.Sentio.Enumerations import (
@@ -18,6 +17,7 @@ from sentio_prober_control.Sentio.Enumerations import (
 
 from sentio_prober_control.Sentio.ProberBase import ProberException
 from sentio_prober_control.Sentio.Response import Response
+from sentio_prober_control.Sentio.ResponseSchema import ResponseSchema
 from sentio_prober_control.Sentio.CommandGroups.ModuleCommandGroupBase import ModuleCommandGroupBase
 from sentio_prober_control.Sentio.CommandGroups.VisionCameraCommandGroup import VisionCameraCommandGroup
 from sentio_prober_control.Sentio.CommandGroups.VisionCompensationGroup import VisionCompensationGroup
@@ -25,6 +25,9 @@ from sentio_prober_control.Sentio.CommandGroups.VisionIMagProCommandGroup import
 from sentio_prober_control.Sentio.CommandGroups.VisionPatternCommandGroup import VisionPatternCommandGroup
 
 
+_AUTO_FOCUS = ResponseSchema.register("vis:auto_focus", float, lambda axis: MoveAxis[axis.capitalize()])
+
+
 class VisionCommandGroup(ModuleCommandGroupBase):
     """This command group contains functions for working with SENTIO's vision module.
     You are not meant to instantiate this class directly. Access it via the vision attribute
@@ -64,6 +67,9 @@ class VisionCommandGroup(ModuleCommandGroupBase):
 
         Response.check_resp(self.comm.read_line())
 
+        # the alignment changes wafermap properties like chuck_to_wafer_offset
+        self.prober.map._invalidate_props()
+
     def align_die(self, threshold: float = 0.05) -> Tuple[float, float, float]:
         """Perform a die alignment.
 
@@ -79,8 +85,7 @@ class VisionCommandGroup(ModuleCommandGroupBase):
 
         self.comm.send(f"vis:align_die {threshold}")
         resp = Response.check_resp(self.comm.read_line())
-        tok = resp.message().split(",")
-        return float(tok[0]), float(tok[1]), float(tok[2])
+        return resp.floats(3)
 
     def auto_focus(self, af_cmd: AutoFocusCmd = AutoFocusCmd.Focus) -> tuple[float, MoveAxis]:
         """Perform an auto focus operation.
@@ -92,14 +97,12 @@ class VisionCommandGroup(ModuleCommandGroupBase):
             The focus height in micrometer
         """
         resp = self.prober.send_cmd(f"vis:auto_focus {af_cmd.to_string()}")
-        tok = resp.message().split(",")
-        return float(tok[0]), MoveAxis[tok[1].capitalize()]
+        return _AUTO_FOCUS.parse(resp)
 
     def camera_synchronize(self) -> Tuple[float, float, float]:
         self.comm.send("vis:camera_synchronize")
         resp = Response.check_resp(self.comm.read_line())
-        tok = resp.message().split(",")
-        return float(tok[0]), float(tok[1]), float(tok[2])
+        return resp.floats(3)
 
     def detect_probetips(self, camera: CameraMountPoint, detector: DetectionAlgorithm = DetectionAlgorithm.ProbeDetector, coords: DetectionCoordindates = DetectionCoordindates.Roi) -> list:
         """Executes a built in detector on a given camera and return a list of detection results.
@@ -115,7 +118,7 @@ class VisionCommandGroup(ModuleCommandGroupBase):
 
         self.comm.send(f"vis:detect_probetips {camera.to_string()}, {detector.to_string()}, {coords.to_string()}")
         resp = Response.check_resp(self.comm.read_line())
-        str_tips = resp.message().split(",")
+        str_tips = resp.fields()
 
         found_tips = []
         cid : float = 0
@@ -172,8 +175,7 @@ class VisionCommandGroup(ModuleCommandGroupBase):
 
         self.comm.send(f"vis:find_pattern {name}, {threshold}, {pattern_index}, {reference.to_string()}")
         resp = Response.check_resp(self.comm.read_line())
-        tok = resp.message().split(",")
-        return float(tok[0]), float(tok[1]), float(tok[2]), float(tok[3])
+        return resp.floats(4)
 
     def has_camera(self, camera: CameraMountPoint) -> bool:
         """Check wether a given camera is present in the system.
@@ -222,34 +224,62 @@ class VisionCommandGroup(ModuleCommandGroupBase):
 
         self.comm.send("vis:match_tips {0}".format(ptpa_type.to_string()))
         resp = Response.check_resp(self.comm.read_line())
-        tok = resp.message().split(",")
-        return float(tok[0]), float(tok[1])
+        return resp.floats(2)
 
-    def snap_image(self, file: str, what: SnapshotType = SnapshotType.CameraRaw, where: SnapshotLocation = SnapshotLocation.Prober) -> None:
+    def snap_image(self, file: str | BinaryIO | bytearray | None, what: SnapshotType = SnapshotType.CameraRaw, where: SnapshotLocation = SnapshotLocation.Prober) -> bytes | None:
         """Save a snapshot of the current camera image to a file.
 
+        When the snapshot is downloaded (SnapshotLocation.Local) the base64 encoded image is decoded
+        incrementally while it is received. It is never held in memory completely unless the JPEG data
+        is requested as return value.
+
         Args:
-            file: The file name to save the image to.
+            file: The file name to save the image to. For SnapshotLocation.Local this may also be a writable
+                  binary stream or a bytearray the JPEG data is appended to. If None is given the JPEG data
+                  is returned.
             what: The type of snapshot to take.
             where: The location where to store the snapshot. By default this is the prober control computer. If SnapshotLocation.Local
                    is specified the image is download from the probe computer and stored loacally.
 
         Returns:
-            A Response object.
+            The JPEG data if the image was downloaded and file is None. Otherwise None.
         """
 
         if where == SnapshotLocation.Local:
             self.comm.send(f"vis:snap_image **download**, {what.to_string()}")
-            resp = Response.check_resp(self.comm.read_line())
-            jpeg_data = base64.b64decode(resp.message())
 
-            # Save the file locally
-            with open(file, "wb") as f:
-                f.write(jpeg_data)
+            if file is None:
+                jpeg_data = bytearray()
+                Response.parse_base64_stream(self.comm.iter_line_chunks(), jpeg_data.extend)
+                return bytes(jpeg_data)
+            elif isinstance(file, bytearray):
+                Response.parse_base64_stream(self.comm.iter_line_chunks(), file.extend)
+            elif isinstance(file, str):
+                # The file is created with the first block so that no file is left behind on errors
+                stream: BinaryIO | None = None
+
+                def write(data: bytes) -> None:
+                    nonlocal stream
+                    if stream is None:
+                        stream = open(file, "wb")
+                    stream.write(data)
+
+                try:
+                    Response.parse_base64_stream(self.comm.iter_line_chunks(), write)
+                finally:
+                    if stream is not None:
+                        stream.close()
+            else:
+                Response.parse_base64_stream(self.comm.iter_line_chunks(), file.write)
         else:
+            if not isinstance(file, str):
+                raise ValueError("Snapshots stored on the prober require a file name!")
+
             self.comm.send(f"vis:snap_image {file}, {what.to_string()}")
             Response.check_resp(self.comm.read_line())
 
+        return None
+
     def switch_light(self, camera: CameraMountPoint, stat: bool):
         """Switch the light of a given camera on or off.
 
@@ -278,14 +308,12 @@ class VisionCommandGroup(ModuleCommandGroupBase):
     def ptpa_find_pads(self, row: int = 0, column: int = 0):
         self.comm.send("vis:execute_ptpa_find_pads {0},{1}".format(row, column))
         resp = Response.check_resp(self.comm.read_line())
-        tok = resp.message().split(",")
-        return float(tok[0]), float(tok[1]), float(tok[2])
+        return resp.floats(3)
 
     def ptpa_find_tips(self, ptpa_mode: PtpaFindTipsMode):
         self.comm.send("vis:ptpa_find_tips {0}".format(ptpa_mode.to_string()))
         resp = Response.check_resp(self.comm.read_line())
-        tok = resp.message().split(",")
-        return float(tok[0]), float(tok[1]), float(tok[2])
+        return resp.floats(3)
 
 
     def start_fast_track(self) -> Response:
@@ -326,8 +354,7 @@ class VisionCommandGroup(ModuleCommandGroupBase):
         """
         self.comm.send("vis:find_thermal_die_size")
         resp = Response.check_resp(self.comm.read_line())
-        tok = resp.message().split(",")
-        return float(tok[0]), float(tok[1])
+        return resp.floats(2)
 
     def get_lens_zoom_level(self) -> float:
         """ Get current zoom level of the lens. 
@@ -27,7 +27,7 @@ class VisionCompensationGroup(CommandGroupBase):
         """
         self.comm.send(f"vis:compensation:enable {comp.to_string()}, {enable}")
         resp = Response.check_resp(self.comm.read_line())
-        tok = resp.message().split(",")
+        tok = resp.fields()
         return tok[0], tok[1]
 
 
@@ -47,7 +47,7 @@ class VisionCompensationGroup(CommandGroupBase):
 
         self.comm.send(f"vis:compensation:enable {comp.to_string()}, {enable}")
         resp = Response.check_resp(self.comm.read_line())
-        tok = resp.message().split(",")
+        tok = resp.fields()
         return tok[0], tok[1]
 
     def start_execute(self, type: CompensationType, mode: CompensationMode) -> Response:
@@ -70,5 +70,4 @@ class VisionIMagProCommandGroup(CommandGroupBase):
         self.comm.send(f"vis:imagpro:get_xy_comp {imag_pro_z}")
 
         resp = Response.check_resp(self.comm.read_line())
-        tok = resp.message().split(",")
-        return float(tok[0]), float(tok[1])
+        return resp.floats(2)
@@ -20,8 +20,7 @@ class VisionPatternCommandGroup(CommandGroupBase):
 
         self.comm.send(f"vis:find_pattern {name}, {threshold}, {pattern_index}, {reference.to_string()}")
         resp = Response.check_resp(self.comm.read_line())
-        tok = resp.message().split(",")
-        return float(tok[0]), float(tok[1]), float(tok[2]), float(tok[3])
+        return resp.floats(4)
 
     def get_chuck_pos(self, camera: CameraMountPoint, pattern: DefaultPattern) -> Tuple[float, float]:
         """Get the chuck XY position associated with a trained pattern.
@@ -35,8 +34,7 @@ class VisionPatternCommandGroup(CommandGroupBase):
         """
         self.comm.send(f"vis:pattern:get_chuck_pos {camera.to_string()}, {pattern.to_string()}")
         resp = Response.check_resp(self.comm.read_line())
-        tok = resp.message().split(",")
-        return float(tok[0]), float(tok[1])
+        return resp.floats(2)
 
     def set_chuck_pos(self, camera: CameraMountPoint, pattern: DefaultPattern, x: float, y: float) -> Tuple[float, float]:
         """Set the chuck XY position associated with a trained pattern.
@@ -52,8 +50,7 @@ class VisionPatternCommandGroup(CommandGroupBase):
         """
         self.comm.send(f"vis:pattern:set_chuck_pos {camera.to_string()}, {pattern.to_string()}, {x}, {y}")
         resp = Response.check_resp(self.comm.read_line())
-        tok = resp.message().split(",")
-        return float(tok[0]), float(tok[1])
+        return resp.floats(2)
 
     def show_training_box(self, visible: bool = True) -> None:
         """Show or hide the pattern training box on the vision UI.
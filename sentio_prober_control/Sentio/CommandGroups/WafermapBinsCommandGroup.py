@@ -2,9 +2,13 @@ from typing import Tuple
 
 from sentio_prober_control.Sentio.Enumerations import BinSelection, BinQuality
 from sentio_prober_control.Sentio.Response import Response
+from sentio_prober_control.Sentio.ResponseSchema import ResponseSchema
 from sentio_prober_control.Sentio.CommandGroups.CommandGroupBase import CommandGroupBase
 
 
+_BIN_INFO = ResponseSchema.register("map:bins:get_bin_info", int, str, BinQuality, str)
+
+
 class WafermapBinsCommandGroup(CommandGroupBase):
     """This command group bundles functions for setting up and using the binning table of the wafermap."""
 
@@ -58,9 +62,7 @@ class WafermapBinsCommandGroup(CommandGroupBase):
         """
         self.comm.send(f"map:bins:get_bin_info {bin}")
         resp = Response.check_resp(self.comm.read_line())
-
-        values = resp.message().split(",")
-        return int(values[0]), values[1], BinQuality[values[2]], values[3]
+        return _BIN_INFO.parse(resp)
 
     def get_num_bins(self) -> int:
         """Get the number of bins in the binning table.
@@ -1,10 +1,12 @@
-from typing import Tuple
+from typing import Callable, List, Tuple
 
 from sentio_prober_control.Sentio.Enumerations import AxisOrient, ColorScheme, DieNumber, StatusBits, RoutingStartPoint, \
     RoutingPriority, OrientationMarker
 
 from sentio_prober_control.Sentio.ProberBase import ProberException
 from sentio_prober_control.Sentio.Response import Response
+from sentio_prober_control.Sentio.ResponseSchema import ResponseSchema
+from sentio_prober_control.Sentio.CommandGroups.CommandGroupBase import LazyCommandGroup
 from sentio_prober_control.Sentio.CommandGroups.ModuleCommandGroupBase import ModuleCommandGroupBase
 from sentio_prober_control.Sentio.CommandGroups.WafermapBinsCommandGroup import WafermapBinsCommandGroup
 from sentio_prober_control.Sentio.CommandGroups.WafermapCompensationCommandGroup import WafermapCompensationCommandGroup
@@ -15,6 +17,10 @@ from sentio_prober_control.Sentio.CommandGroups.WafermapSubsiteCommandGroup impo
 from sentio_prober_control.Sentio.CommandGroups.WafermapViewCommandGroup import WafermapViewCommandGroup
 
 
+_ORIENT_MARKER = ResponseSchema.register("map:get_orient_marker", OrientationMarker, float, float)
+_ROUTING = ResponseSchema.register("map:get_routing", RoutingStartPoint, RoutingPriority)
+
+
 class WafermapCommandGroup(ModuleCommandGroupBase):
     """This class represents the SENTIO command group for wafermap related commands.
     You are not meant to instantiate objects of this class directly! This class
@@ -38,18 +44,42 @@ class WafermapCommandGroup(ModuleCommandGroupBase):
         subsites (WafermapSubsiteGroup): A group to set up subsites.
     """
 
+    bins: LazyCommandGroup[WafermapBinsCommandGroup] = LazyCommandGroup(lambda map: WafermapBinsCommandGroup(map.prober))
+    compensation: LazyCommandGroup[WafermapCompensationCommandGroup] = LazyCommandGroup(lambda map: WafermapCompensationCommandGroup(map.prober))
+    die: LazyCommandGroup[WafermapDieCommandGroup] = LazyCommandGroup(lambda map: WafermapDieCommandGroup(map.prober))
+    path: LazyCommandGroup[WafermapPathCommandGroup] = LazyCommandGroup(lambda map: WafermapPathCommandGroup(map.prober))
+    poi: LazyCommandGroup[WafermapPoiCommandGroup] = LazyCommandGroup(lambda map: WafermapPoiCommandGroup(map.prober))
+    subsites: LazyCommandGroup[WafermapSubsiteGroup] = LazyCommandGroup(lambda map: WafermapSubsiteGroup(map.prober, map))
+    view: LazyCommandGroup[WafermapViewCommandGroup] = LazyCommandGroup(lambda map: WafermapViewCommandGroup(map.prober))
+
     def __init__(self, sentio : 'SentioProber') -> None:
         super().__init__(sentio, "map")
 
         self.__end_of_route: bool = False
+        self.__route_end_callbacks: List[Callable[[], object]] = []
+
+    def _add_route_end_callback(self, callback: Callable[[], object]) -> None:
+        """Register a function that is called when the route is finished.
+
+        The route is finished when a stepping function is called after the previous stepping
+        command reached the end of the route. At that point the last die of the route was
+        tested. The callback is called before the stepping command is sent. Used by BinWriter
+        to flush its buffer.
+        """
+        self.__route_end_callbacks.append(callback)
+
+    def _remove_route_end_callback(self, callback: Callable[[], object]) -> None:
+        """Unregister a function registered with _add_route_end_callback."""
+        if callback in self.__route_end_callbacks:
+            self.__route_end_callbacks.remove(callback)
 
-        self.bins: WafermapBinsCommandGroup = WafermapBinsCommandGroup(sentio)
-        self.compensation: WafermapCompensationCommandGroup = WafermapCompensationCommandGroup(sentio)
-        self.die: WafermapDieCommandGroup = WafermapDieCommandGroup(sentio)
-        self.path: WafermapPathCommandGroup = WafermapPathCommandGroup(sentio)
-        self.poi: WafermapPoiCommandGroup = WafermapPoiCommandGroup(sentio)
-        self.subsites: WafermapSubsiteGroup = WafermapSubsiteGroup(sentio, self)
-        self.view: WafermapViewCommandGroup = WafermapViewCommandGroup(sentio)
+    def __finish_route(self) -> None:
+        if self.__end_of_route:
+            for callback in list(self.__route_end_callbacks):
+                callback()
+
+    def __update_end_of_route(self, resp: Response) -> None:
+        self.__end_of_route = (resp.status() & StatusBits.EndOfRoute) == StatusBits.EndOfRoute
 
     def bin_step_next_die(self, bin_value: int, site: int | None = None) -> Tuple[int, int, int]:
         """Bin the current die and step to the naxt die.
@@ -66,6 +96,8 @@ class WafermapCommandGroup(ModuleCommandGroupBase):
             subsite (int): The subsite index of the die after stepping
         """
 
+        self.__finish_route()
+
         # 2021-09-17: bugfix: when no site is given current site must be retained
         if site is None:
             self.comm.send(f"map:bin_step_next_die {bin_value}")
@@ -73,16 +105,13 @@ class WafermapCommandGroup(ModuleCommandGroupBase):
             self.comm.send(f"map:bin_step_next_die {bin_value}, {site}")
 
         resp = Response.parse_resp(self.comm.read_line())
-        self.__end_of_route = (
-            resp.status() & StatusBits.EndOfRoute
-        ) == StatusBits.EndOfRoute
+        self.__update_end_of_route(resp)
 
         # i.e. Stepping while at the end of the route
         if not resp.ok():
             raise ProberException(resp.message(), resp.errc())
 
-        tok = resp.message().split(",")
-        return int(tok[0]), int(tok[1]), int(tok[2])
+        return resp.ints(3)
 
     def create(self, diameter: float) -> None:
         """Create a new round wafer map.
@@ -95,6 +124,7 @@ class WafermapCommandGroup(ModuleCommandGroupBase):
 
         self.comm.send(f"map:create {diameter}")
         Response.check_resp(self.comm.read_line())
+        self._invalidate_props()
 
     def create_rect(self, cols: int, rows: int) -> None:
         """Create a new rectangular wafer map.
@@ -108,6 +138,7 @@ class WafermapCommandGroup(ModuleCommandGroupBase):
 
         self.comm.send("map:create_rect {0}, {1}".format(cols, rows))
         Response.check_resp(self.comm.read_line())
+        self._invalidate_props()
 
     def die_reference_is_set(self) -> bool:
         """Returns true if the die reference offset is set.
@@ -222,8 +253,7 @@ class WafermapCommandGroup(ModuleCommandGroupBase):
         self.comm.send("map:get_prop die_reference")
         resp = Response.check_resp(self.comm.read_line())
 
-        tok = resp.message().split(",")
-        return float(tok[0]), float(tok[1])
+        return resp.floats(2)
 
     def get_die_seq(self) -> int:
         """Returns the sequence number of the current die.
@@ -253,9 +283,7 @@ class WafermapCommandGroup(ModuleCommandGroupBase):
         """
         self.comm.send("map:get_grid_origin")
         resp = Response.check_resp(self.comm.read_line())
-        tok = resp.message().split(",")
-
-        return int(tok[0]), int(tok[1])
+        return resp.ints(2)
 
     def get_index_size(self) -> Tuple[float, float]:
         """Return the die size set up in the wafer map.
@@ -265,8 +293,7 @@ class WafermapCommandGroup(ModuleCommandGroupBase):
         """
         self.comm.send("map:get_index_size")
         resp = Response.check_resp(self.comm.read_line())
-        tok = resp.message().split(",")
-        return float(tok[0]), float(tok[1])
+        return resp.floats(2)
 
     def get_num_dies(self, selection: DieNumber) -> int:
         """Returns the number of dies in the wafer map.
@@ -297,9 +324,7 @@ class WafermapCommandGroup(ModuleCommandGroupBase):
         """
         self.comm.send("map:get_street_size")
         resp = Response.check_resp(self.comm.read_line())
-        tok = resp.message().split(",")
-
-        return int(tok[0]), int(tok[1])
+        return resp.ints(2)
 
     def get_grid_params(self) -> Tuple[float, float, float, float, float]:
         """Retrieves Information about die grid.
@@ -309,9 +334,7 @@ class WafermapCommandGroup(ModuleCommandGroupBase):
         """
         self.comm.send("map:get_grid_params")
         resp = Response.check_resp(self.comm.read_line())
-        tok = resp.message().split(",")
-
-        return float(tok[0]), float(tok[1]), float(tok[2]), float(tok[3]), float(tok[4])
+        return resp.floats(5)
 
     def get_home_die(self) -> Tuple[int, int]:
         """Retrieves index coordinates of the home die.
@@ -321,9 +344,7 @@ class WafermapCommandGroup(ModuleCommandGroupBase):
         """
         self.comm.send("map:get_home_die")
         resp = Response.check_resp(self.comm.read_line())
-        tok = resp.message().split(",")
-
-        return int(tok[0]), int(tok[1])
+        return resp.ints(2)
 
     def get_num_cols(self) -> int:
         """Retrieves the number of columns in the grid.
@@ -361,6 +382,7 @@ class WafermapCommandGroup(ModuleCommandGroupBase):
         """
         self.comm.send(f"map:set_axis_orient {orient.to_string()}")
         Response.check_resp(self.comm.read_line())
+        self._invalidate_props()
 
     def set_color_scheme(self, scheme: ColorScheme) -> None:
         """Set color scheme of the wafermap.
@@ -409,6 +431,7 @@ class WafermapCommandGroup(ModuleCommandGroupBase):
         """
         self.comm.send(f"map:set_grid_origin {x}, {y}")
         Response.check_resp(self.comm.read_line())
+        self._invalidate_props()
 
     def set_grid_params(self, ix: float, iy: float, offx: float, offy: float, edge: int) -> None:
         """Set wafermap grid parameters. This function defines the wafermapo grid layout which means setting the
@@ -437,6 +460,7 @@ class WafermapCommandGroup(ModuleCommandGroupBase):
         """
         self.comm.send(f"map:set_grid_params {ix}, {iy}, {offx}, {offy}, {edge}")
         Response.check_resp(self.comm.read_line())
+        self._invalidate_props()
 
     def set_home_die(self, x: int, y: int) -> None:
         """ " Sets the home die coordinates in custom coordinates.
@@ -449,6 +473,7 @@ class WafermapCommandGroup(ModuleCommandGroupBase):
         """
         self.comm.send(f"map:set_home_die {x}, {y}")
         Response.check_resp(self.comm.read_line())
+        self._invalidate_props()
 
     def set_index_size(self, x: float, y: float) -> None:
         """Set the size of a die.
@@ -461,6 +486,7 @@ class WafermapCommandGroup(ModuleCommandGroupBase):
         """
         self.comm.send("map:set_index_size {0}, {1}".format(x, y))
         Response.check_resp(self.comm.read_line())
+        self._invalidate_props()
 
     def set_street_size(self, x: float, y: float) -> None:
         """Set size of streetlines.
@@ -493,18 +519,16 @@ class WafermapCommandGroup(ModuleCommandGroupBase):
         Returns:
             A tuple with the column, row and site index representing the position after the step command.
         """
+        self.__finish_route()
         self.comm.send("map:step_die {0}, {1}, {2}".format(col, row, site))
         resp = Response.parse_resp(self.comm.read_line())
 
-        self.__end_of_route = (
-            resp.status() & StatusBits.EndOfRoute
-        ) == StatusBits.EndOfRoute
+        self.__update_end_of_route(resp)
 
         if not resp.ok():
             raise ProberException(resp.message(), resp.errc())
 
-        tok = resp.message().split(",")
-        return int(tok[0]), int(tok[1]), int(tok[2])
+        return resp.ints(3)
 
     def step_die_seq(self, seq: int, site: int) -> Tuple[int, int, int]:
         """Step to a specific die in the stepping sequence.
@@ -521,13 +545,11 @@ class WafermapCommandGroup(ModuleCommandGroupBase):
 
         self.comm.send("map:step_die_seq {}, {}".format(seq, site))
         resp = Response.check_resp(self.comm.read_line())
-        tok = resp.message().split(",")
-
         # i.e. Stepping while at the end of the route
         if not resp.ok():
             raise ProberException(resp.message())
 
-        return int(tok[0]), int(tok[1]), int(tok[2])
+        return resp.ints(3)
 
     def step_first_die(self, site: int | None = None) -> Tuple[int, int, int]:
         """Step to the first die in the stepping sequence.
@@ -541,6 +563,7 @@ class WafermapCommandGroup(ModuleCommandGroupBase):
             A tuple with the column, row and site index representing the position after the step command.
         """
 
+        self.__finish_route()
         if site == None:
             self.comm.send("map:step_first_die")
         else:
@@ -548,14 +571,12 @@ class WafermapCommandGroup(ModuleCommandGroupBase):
 
         resp = Response.parse_resp(self.comm.read_line())
 
-        self.__end_of_route = (resp.status() & StatusBits.EndOfRoute) == StatusBits.EndOfRoute
+        self.__update_end_of_route(resp)
 
         if not resp.ok():
             raise ProberException(resp.message(), resp.errc())
 
-        tok = resp.message().split(",")
-
-        return int(tok[0]), int(tok[1]), int(tok[2])
+        return resp.ints(3)
 
     def step_next_die(self, site: int | None = None) -> Tuple[int, int, int]:
         """Step to the next die in the stepping sequence.
@@ -566,6 +587,8 @@ class WafermapCommandGroup(ModuleCommandGroupBase):
             A tuple with the column, row and site index representing the position after the step command.
         """
 
+        self.__finish_route()
+
         # 2021-09-17: bugfix: when no site is given current site must be retained
         if site is None:
             self.comm.send(f"map:step_next_die")
@@ -573,14 +596,13 @@ class WafermapCommandGroup(ModuleCommandGroupBase):
             self.comm.send(f"map:step_next_die {site}")
 
         resp = Response.parse_resp(self.comm.read_line())
-        self.__end_of_route = (resp.status() & StatusBits.EndOfRoute) == StatusBits.EndOfRoute
+        self.__update_end_of_route(resp)
 
         # i.e. Stepping while at the end of the route
         if not resp.ok():
             raise ProberException(resp.message(), resp.errc())
 
-        tok = resp.message().split(",")
-        return int(tok[0]), int(tok[1]), int(tok[2])
+        return resp.ints(3)
 
     def get_orient_marker(self) -> Tuple[OrientationMarker, float, float]:
         """ Retrieves the type, angle, and size of the wafer orientation marker.
@@ -590,8 +612,7 @@ class WafermapCommandGroup(ModuleCommandGroupBase):
         """
         self.comm.send("map:get_orient_marker")
         resp = Response.check_resp(self.comm.read_line())
-        tok = resp.message().split(",")
-        return OrientationMarker[tok[0]], float(tok[1]), float(tok[2])
+        return _ORIENT_MARKER.parse(resp)
 
     def get_routing(self) -> Tuple[RoutingStartPoint, RoutingPriority]:
         """ Retrieves routing scheme for die stepping. 
@@ -601,13 +622,13 @@ class WafermapCommandGroup(ModuleCommandGroupBase):
         """
         self.comm.send("map:get_routing")
         resp = Response.check_resp(self.comm.read_line())
-        tok = resp.message().split(",")
-        return RoutingStartPoint.from_string(tok[0]), RoutingPriority.from_string(tok[1])
+        return _ROUTING.parse(resp)
 
     def open(self, file_path: str) -> None:
         """Open a wafer map file."""
         self.comm.send(f"map:open {file_path}")
         Response.check_resp(self.comm.read_line())
+        self._invalidate_props()
 
     def save(self, file_path: str) -> None:
         """Save current wafer map to file."""
@@ -618,6 +639,7 @@ class WafermapCommandGroup(ModuleCommandGroupBase):
         """Set wafer diameter in millimeter."""
         self.comm.send(f"map:set_diameter {diameter}")
         Response.check_resp(self.comm.read_line())
+        self._invalidate_props()
 
     def set_orient_marker(self, marker_type: str, angle: float, size: float) -> None:
         """Set wafer orientation marker type (Flat/Notch), angle and size in µm."""
@@ -626,11 +648,11 @@ class WafermapCommandGroup(ModuleCommandGroupBase):
 
     def step_previous_die(self) -> Tuple[int, int, int]:
         """Step to previous die in the stepping sequence."""
+        self.__finish_route()
         self.comm.send("map:step_previous_die")
         resp = Response.parse_resp(self.comm.read_line())
-        self.__end_of_route = (resp.status() & StatusBits.EndOfRoute) == StatusBits.EndOfRoute
+        self.__update_end_of_route(resp)
         if not resp.ok():
             raise ProberException(resp.message(), resp.errc())
-        tok = resp.message().split(",")
-        return int(tok[0]), int(tok[1]), int(tok[2])
+        return resp.ints(3)
 
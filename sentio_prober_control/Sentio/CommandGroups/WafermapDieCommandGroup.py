@@ -63,7 +63,7 @@ class WafermapDieCommandGroup(CommandGroupBase):
         self.comm.send("map:die:get_current_index")
         resp = Response.check_resp(self.comm.read_line())
 
-        values = resp.message().split(",")
+        values = resp.fields()
         if len(values) < 3:
             raise ValueError(f"Invalid response: {resp.message()}")
 
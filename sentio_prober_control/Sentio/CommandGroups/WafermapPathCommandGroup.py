@@ -1,10 +1,15 @@
-from typing import Tuple
+from typing import Any, List, Tuple
 
-from sentio_prober_control.Sentio.Enumerations import RoutingPriority, RoutingStartPoint, TestSelection, PathSelection
+from sentio_prober_control.Sentio.Enumerations import DieNumber, RemoteCommandError, RoutingPriority, RoutingStartPoint, TestSelection, PathSelection
+from sentio_prober_control.Sentio.ProberBase import ProberException
 from sentio_prober_control.Sentio.Response import Response
+from sentio_prober_control.Sentio.ResponseSchema import ResponseSchema
 from sentio_prober_control.Sentio.CommandGroups.CommandGroupBase import CommandGroupBase
 
 
+_DIE = ResponseSchema.register("map:path:get_die", int, int)
+
+
 class WafermapPathCommandGroup(CommandGroupBase):
     """This command group bundles functions for setting up and using the test path of the wafermap.
 
@@ -42,8 +47,74 @@ class WafermapPathCommandGroup(CommandGroupBase):
         """
         self.comm.send("map:path:get_die {0}".format(seq))
         resp = Response.check_resp(self.comm.read_line())
-        tok = resp.message().split(",")
-        return int(tok[0]), int(tok[1])
+        return resp.ints(2)
+
+    def get_all(self, chunk_size: int = 512, depth: int = 64) -> Any:
+        """Get the column and row of every die of the test path.
+
+        Queries the sequence numbers with pipelined map:path:get_die commands until SENTIO
+        reports the first sequence number that is out of range. The number of selected
+        dies is only used as an estimate of the path length because the path does not
+        have to match the selection (i.e. after create_from_bins). The responses are decoded
+        chunk by chunk with ResponseSchema.parse_array. Requires numpy.
+
+        Args:
+            chunk_size: The number of responses decoded at once.
+            depth: The maximum number of commands in flight.
+
+        Returns:
+            An int64 array of shape (N, 2) with the column and row of each die in stepping order.
+        """
+        try:
+            import numpy as np
+        except ImportError as e:
+            raise ImportError("WafermapPathCommandGroup.get_all requires numpy! Install it with: pip install sentio-prober-control[numpy]") from e
+
+        estimate = self.prober.map.get_num_dies(DieNumber.Selected)
+        chunks: List[Any] = []
+
+        # The next chunk is already in flight while the current one is decoded. The chunk
+        # reaching the estimate ends one past it. Beyond that the path has usually ended,
+        # so further chunks are only queried after the previous one was decoded.
+        with self.prober.pipeline(depth) as pipe:
+            start = 0
+            pending: List[Any] | None = None
+            while True:
+                if start > estimate and pending is not None:
+                    if not self.__store_chunk(chunks, pending):
+                        break
+                    pending = None
+
+                stop = start + chunk_size if start > estimate else min(start + chunk_size, estimate + 1)
+                handles = [pipe.submit(f"map:path:get_die {seq}") for seq in range(start, stop)]
+                if pending is not None and not self.__store_chunk(chunks, pending):
+                    break
+
+                pending = handles
+                start = stop
+
+        return np.concatenate(chunks) if chunks else np.empty((0, 2), dtype=np.int64)
+
+    @staticmethod
+    def __store_chunk(chunks: List[Any], handles: List[Any]) -> bool:
+        """Decode the dies of a chunk up to the end of the path.
+
+        Returns:
+            False if the path ends within the chunk.
+        """
+        responses = []
+        for handle in handles:
+            try:
+                responses.append(handle.result().message())
+            except ProberException as e:
+                if e.error() != RemoteCommandError.ArgumentOutOfBounds:
+                    raise
+                break
+
+        if responses:
+            chunks.append(_DIE.parse_array(",".join(responses)))
+
+        return len(responses) == len(handles)
 
     def select_dies(self, selection: TestSelection) -> None:
         """Select dies for testing.
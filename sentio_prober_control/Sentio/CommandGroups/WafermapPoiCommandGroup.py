@@ -1,8 +1,12 @@
 from sentio_prober_control.Sentio.Enumerations import PoiReferenceXy, Stage
 from sentio_prober_control.Sentio.Response import Response
+from sentio_prober_control.Sentio.ResponseSchema import ResponseSchema
 from sentio_prober_control.Sentio.CommandGroups.CommandGroupBase import CommandGroupBase
 
 
+_POI = ResponseSchema.register("map:poi:get", float, float, str)
+
+
 class WafermapPoiCommandGroup(CommandGroupBase):
     """A command group for working with Points of Interest (POI) on the wafermap."""
 
@@ -32,8 +36,7 @@ class WafermapPoiCommandGroup(CommandGroupBase):
         """
         self.comm.send(f"map:poi:get {idx}")
         resp = Response.check_resp(self.comm.read_line())
-        tok = resp.message().split(",")
-        return float(tok[0]), float(tok[1]), str(tok[2])
+        return _POI.parse(resp)
 
     def get_num(self) -> int:
         """Returns the number of POIs in the list.
@@ -71,8 +74,7 @@ class WafermapPoiCommandGroup(CommandGroupBase):
         """
         self.comm.send(f"map:poi:step {target}")
         resp = Response.check_resp(self.comm.read_line())
-        tok = resp.message().split(",")
-        return int(tok[0]), int(tok[1]), int(tok[2])
+        return resp.ints(3)
 
     def step_first(self) -> tuple[int, int, int]:
         """Step to the first POI in the list.
@@ -81,8 +83,7 @@ class WafermapPoiCommandGroup(CommandGroupBase):
         """
         self.comm.send("map:poi:step_first")
         resp = Response.check_resp(self.comm.read_line())
-        tok = resp.message().split(",")
-        return int(tok[0]), int(tok[1]), int(tok[2])
+        return resp.ints(3)
 
     def step_next(self) -> tuple[int, int, int]:
         """Step to the next POI in the list.
@@ -91,8 +92,7 @@ class WafermapPoiCommandGroup(CommandGroupBase):
         """
         self.comm.send("map:poi:step_next")
         resp = Response.check_resp(self.comm.read_line())
-        tok = resp.message().split(",")
-        return int(tok[0]), int(tok[1]), int(tok[2])
+        return resp.ints(3)
 
     def remove(self, idx: int | None = None) -> None:
         """Remove POI(s) from wafermap.
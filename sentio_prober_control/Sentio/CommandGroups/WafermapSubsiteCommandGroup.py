@@ -2,9 +2,13 @@ from typing import Tuple
 
 from sentio_prober_control.Sentio.Enumerations import AxisOrient, StatusBits, SubsiteGroup
 from sentio_prober_control.Sentio.Response import Response
+from sentio_prober_control.Sentio.ResponseSchema import ResponseSchema
 from sentio_prober_control.Sentio.CommandGroups.CommandGroupBase import CommandGroupBase
 
 
+_SUBSITE = ResponseSchema.register("map:subsite:get", str, float, float)
+
+
 class WafermapSubsiteGroup(CommandGroupBase):
     """Represents the wafermap subsite command group which provides
     functionality for setting up und stepping over subsites.
@@ -53,8 +57,7 @@ class WafermapSubsiteGroup(CommandGroupBase):
         resp = Response.check_resp(self.comm.read_line())
         self._parent_command_group.__end_of_route = (resp.status() & StatusBits.EndOfRoute) == StatusBits.EndOfRoute
 
-        tok = resp.message().split(",")
-        return int(tok[0]), int(tok[1]), int(tok[2])
+        return resp.ints(3)
 
     def get(self, idx: int, orient: AxisOrient | None = None) -> Tuple[str, float, float]:
         """Returns the subsite definition for a subsite with a given index.
@@ -79,9 +82,7 @@ class WafermapSubsiteGroup(CommandGroupBase):
 
         self.comm.send(f"map:subsite:get {idx}, {orient_str}")
         resp = Response.check_resp(self.comm.read_line())
-
-        tok = resp.message().split(",")
-        return str(tok[0]), float(tok[1]), float(tok[2])
+        return _SUBSITE.parse(resp)
 
     def get_num(self, group: SubsiteGroup | None = None) -> int:
         """Retrieve the number of subsites per die defined in the wafermap.
@@ -123,8 +124,7 @@ class WafermapSubsiteGroup(CommandGroupBase):
         resp = Response.check_resp(self.comm.read_line())
         self._parent_command_group.__end_of_route = (resp.status() & StatusBits.EndOfRoute) == StatusBits.EndOfRoute
 
-        tok = resp.message().split(",")
-        return int(tok[0]), int(tok[1]), int(tok[2])
+        return resp.ints(3)
 
     def step_next(self) -> Tuple[int, int, int]:
         """Step to the next active subsite.
@@ -139,8 +139,7 @@ class WafermapSubsiteGroup(CommandGroupBase):
         resp = Response.check_resp(self.comm.read_line())
         self._parent_command_group.__end_of_route = (resp.status() & StatusBits.EndOfRoute) == StatusBits.EndOfRoute
 
-        tok = resp.message().split(",")
-        return int(tok[0]), int(tok[1]), int(tok[2])
+        return resp.ints(3)
 
     def export(self, file_path: str) -> None:
         """Export subsite definitions to file.
@@ -224,7 +223,6 @@ class WafermapSubsiteGroup(CommandGroupBase):
         resp = Response.check_resp(self.comm.read_line())
         self._parent_command_group.__end_of_route = (resp.status() & StatusBits.EndOfRoute) == StatusBits.EndOfRoute
 
-        tok = resp.message().split(",")
-        return int(tok[0]), int(tok[1]), int(tok[2])
+        return resp.ints(3)
 
     
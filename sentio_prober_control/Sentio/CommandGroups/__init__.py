@@ -1,3 +1,2 @@
 """ Package initialization file for CommandGroups. 
 """
-print(f"Initializing package {__name__}")
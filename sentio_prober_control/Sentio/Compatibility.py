@@ -1,4 +1,11 @@
+import json
+import os
+import tempfile
+import time
 from enum import IntEnum
+from typing import Dict
+
+from sentio_prober_control.Communication.CommunicatorBase import CommunicationHook, CommunicatorBase
 
 
 class CompatibilityLevel(IntEnum):
@@ -40,4 +47,195 @@ class Compatibility:
             RuntimeError: If the current compatibility level is lower than the required level.
         """
         if Compatibility.level < level:
-            raise RuntimeError(f"This command is not supported by your machine! The machine reports a compatibility level of {Compatibility.level.name} but {level.name} is required to execute the command.")
\ No newline at end of file
+            raise RuntimeError(f"This command is not supported by your machine! The machine reports a compatibility level of {Compatibility.level.name} but {level.name} is required to execute the command.")
+
+
+class CompatibilityWatch(CommunicationHook):
+    """Detects errors hinting at a SENTIO version that differs from a cached compatibility level.
+
+    The watch is registered with CompatibilityCache.watch. On the first CommandHandlerNotFound or
+    NotSupported response it removes the cache entry of the station and marks the level for
+    revalidation. It also counts the responses that are still outstanding, so that the
+    prober can query the version as soon as this does not interfere with pipelined commands.
+
+    You are not meant to create objects of this class directly.
+    """
+
+    def __init__(self, cache: "CompatibilityCache", comm: CommunicatorBase, station_id: str) -> None:
+        # imported here because Enumerations depends on this module
+        from sentio_prober_control.Sentio.Enumerations import RemoteCommandError
+
+        self.__errors = (RemoteCommandError.CommandHandlerNotFound, RemoteCommandError.NotSupported)
+        self.__cache = cache
+        self.__comm = comm
+        self.__station_id = station_id
+        self.__outstanding = 0
+        self.__pending = False
+
+
+    @property
+    def station_id(self) -> str:
+        """The id of the watched station."""
+        return self.__station_id
+
+
+    @property
+    def revalidation_due(self) -> bool:
+        """True if the level must be determined again and no responses are outstanding."""
+        return self.__pending and self.__outstanding <= 0
+
+
+    def close(self) -> None:
+        """Stop watching the communicator."""
+        self.__comm.remove_hook(self)
+
+
+    def command_sent(self, msg: str, size: int, t: float) -> None:
+        if CommunicatorBase.expects_response(msg):
+            self.__outstanding += 1
+
+
+    def response_received(self, errc: int, size: int, t_first_byte: float, t: float) -> None:
+        self.__outstanding -= 1
+        if errc in self.__errors and not self.__pending:
+            self.__pending = True
+            self.__cache.invalidate(self.__station_id)
+
+
+    def response_timed_out(self, t: float) -> None:
+        self.__outstanding -= 1
+
+
+    def connection_reset(self) -> None:
+        self.__outstanding = 0
+
+
+class CompatibilityCache:
+    """A file that stores the compatibility level detected for each probe station.
+
+    SentioProber queries the SENTIO version when it is created with CompatibilityLevel.Auto.
+    With a cache the level found for a station is reused by later connections and by
+    other processes until the entry is older than ttl seconds. Stations are identified by
+    CommunicatorBase.station_id (i.e. "tcpip://192.168.1.10:35555").
+
+    Entries are not verified when they are used. Instead the entry is removed as soon as
+    SENTIO answers a command with CommandHandlerNotFound or NotSupported, which happens when
+    the station was updated in the meantime. The prober then queries the version before its
+    next command and updates Compatibility.level and the cache.
+
+    Errors reading or writing the file are ignored, in that case the version is queried
+    as without a cache.
+
+    Example:
+
+    ```py
+    SentioProber.compat_cache = CompatibilityCache()
+    prober = SentioProber.create_prober("tcpip", "127.0.0.1:35555")
+    ```
+    """
+
+    default_path: str = os.path.join(os.path.expanduser("~"), ".sentio_prober_control", "compatibility.json")
+    """ The file used when no path is given. """
+
+    def __init__(self, path: str | None = None, ttl: float = 24 * 3600) -> None:
+        """Create a compatibility cache.
+
+        Args:
+            path (str): The path of the cache file. Defaults to CompatibilityCache.default_path.
+            ttl (float): The time in seconds a cached level is used before the version is queried again.
+        """
+        self.__path = path if path is not None else CompatibilityCache.default_path
+        self.__ttl = ttl
+
+
+    @property
+    def path(self) -> str:
+        """The path of the cache file."""
+        return self.__path
+
+
+    def get(self, station_id: str) -> CompatibilityLevel | None:
+        """Return the cached compatibility level of a station.
+
+        Args:
+            station_id (str): The id of the station.
+
+        Returns:
+            The compatibility level or None if there is no entry or the entry has expired.
+        """
+        entry = self.__load().get(station_id)
+        if not isinstance(entry, dict):
+            return None
+
+        try:
+            if time.time() - float(entry["time"]) > self.__ttl:
+                return None
+
+            return CompatibilityLevel[entry["level"]]
+        except (KeyError, TypeError, ValueError):
+            return None
+
+
+    def put(self, station_id: str, level: CompatibilityLevel) -> None:
+        """Store the compatibility level of a station.
+
+        Args:
+            station_id (str): The id of the station.
+            level (CompatibilityLevel): The compatibility level detected for the station.
+        """
+        entries = self.__load()
+        entries[station_id] = {"level": level.name, "time": time.time()}
+        self.__store(entries)
+
+
+    def invalidate(self, station_id: str) -> None:
+        """Remove the entry of a station.
+
+        Args:
+            station_id (str): The id of the station.
+        """
+        entries = self.__load()
+        if entries.pop(station_id, None) is not None:
+            self.__store(entries)
+
+
+    def watch(self, comm: CommunicatorBase, station_id: str) -> CompatibilityWatch:
+        """Remove the entry of a station when SENTIO reports that a command is not supported.
+
+        Args:
+            comm (CommunicatorBase): The communicator connected to the station.
+            station_id (str): The id of the station.
+
+        Returns:
+            The hook registered with comm. Its revalidation_due property tells when the level must be determined again.
+        """
+        watch = CompatibilityWatch(self, comm, station_id)
+        comm.add_hook(watch)
+        return watch
+
+
+    def __load(self) -> Dict[str, dict]:
+        try:
+            with open(self.__path, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+        return entries if isinstance(entries, dict) else {}
+
+
+    def __store(self, entries: Dict[str, dict]) -> None:
+        # Write to a temporary file first so that concurrent readers never see a partial file.
+        try:
+            folder = os.path.dirname(self.__path) or "."
+            os.makedirs(folder, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=folder, prefix=".compatibility", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(entries, f, indent=2)
+                os.replace(tmp, self.__path)
+            except BaseException:
+                os.remove(tmp)
+                raise
+        except OSError:
+            pass
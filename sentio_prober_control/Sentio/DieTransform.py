@@ -0,0 +1,183 @@
+from typing import Any, List, Sequence, Tuple, TYPE_CHECKING
+
+from sentio_prober_control.Sentio.Compatibility import Compatibility, CompatibilityLevel
+from sentio_prober_control.Sentio.Enumerations import AxisOrient, ChuckSite, XyReference
+
+if TYPE_CHECKING:
+    from sentio_prober_control.Sentio.ProberSentio import SentioProber
+
+
+class DieTransform:
+    """Converts between wafermap die indices and chuck xy positions on the client.
+
+    The transform is built once from the wafermap parameters and then converts whole
+    arrays of dies with numpy instead of asking SENTIO for every die. Chuck positions are
+    given in micrometer with x pointing right and y pointing up, relative to the home
+    position (XyReference.Home), i.e. site 0 of the home die is at home_xy.
+
+    - The axis orientation of the wafermap defines in which direction column and row
+      indices increase.
+    - Subsite offsets are relative to site 0 of the die in chuck coordinates.
+    - The die reference (the offset of site 0 from the lower left corner of the die)
+      defines which die a chuck position belongs to in to_die.
+
+    Column and row indices are the same as in the wafermap commands. The grid origin does
+    not change the result because the home die is given in the same indices.
+
+    Requires numpy.
+
+    Example:
+
+    ```py
+    transform = DieTransform.from_prober(prober)
+    xy = transform.to_chuck(prober.map.path.get_all())
+    dies = transform.to_die(xy)
+    ```
+    """
+
+    def __init__(self,
+                 index_size: Tuple[float, float],
+                 home_die: Tuple[int, int] = (0, 0),
+                 axis_orient: AxisOrient = AxisOrient.DownRight,
+                 subsites: Sequence[Tuple[float, float]] = ((0.0, 0.0),),
+                 die_reference: Tuple[float, float] = (0.0, 0.0),
+                 home_xy: Tuple[float, float] = (0.0, 0.0)) -> None:
+        """Create a transform from wafermap parameters.
+
+        Args:
+            index_size (Tuple[float, float]): Die width and height in micrometer.
+            home_die (Tuple[int, int]): Column and row of the home die.
+            axis_orient (AxisOrient): The axis orientation of the wafermap.
+            subsites (Sequence[Tuple[float, float]]): The x and y offset of each subsite from site 0 in chuck coordinates. Element 0 is site 0.
+            die_reference (Tuple[float, float]): The offset of site 0 from the lower left corner of the die.
+            home_xy (Tuple[float, float]): The chuck position of site 0 of the home die.
+        """
+        try:
+            import numpy as np
+        except ImportError as e:
+            raise ImportError("DieTransform requires numpy! Install it with: pip install sentio-prober-control[numpy]") from e
+
+        self.__np = np
+        self.__index = np.array(index_size, dtype=np.float64)
+        self.__home_die = np.array(home_die, dtype=np.int64)
+        self.__axis_orient = axis_orient
+        self.__sign = np.array([-1 if axis_orient in (AxisOrient.DownLeft, AxisOrient.UpLeft) else 1,
+                                1 if axis_orient in (AxisOrient.UpRight, AxisOrient.UpLeft) else -1], dtype=np.int64)
+        self.__subsites = np.array(subsites, dtype=np.float64).reshape(-1, 2)
+        self.__die_reference = np.array(die_reference, dtype=np.float64)
+        self.__home_xy = np.array(home_xy, dtype=np.float64)
+
+
+    @staticmethod
+    def from_prober(prober: "SentioProber") -> "DieTransform":
+        """Create a transform with the current wafermap parameters of SENTIO.
+
+        Args:
+            prober (SentioProber): The prober to read the wafermap parameters from.
+
+        Returns:
+            A transform for chuck positions relative to the home position.
+        """
+        wafermap = prober.map
+        num_sites = wafermap.subsites.get_num()
+        subsites = [wafermap.subsites.get(i, AxisOrient.UpRight)[1:] for i in range(num_sites)]
+        subsites = [(x - subsites[0][0], y - subsites[0][1]) for x, y in subsites]
+
+        return DieTransform(wafermap.get_index_size(),
+                            wafermap.get_home_die(),
+                            wafermap.get_axis_orient(),
+                            subsites,
+                            wafermap.get_die_reference())
+
+
+    @property
+    def axis_orient(self) -> AxisOrient:
+        """The axis orientation of the wafermap."""
+        return self.__axis_orient
+
+
+    @property
+    def num_subsites(self) -> int:
+        """The number of subsites including site 0."""
+        return len(self.__subsites)
+
+
+    def to_chuck(self, dies: Any) -> Any:
+        """Convert die indices into chuck positions.
+
+        Args:
+            dies (Any): An array like of shape (N, 2) with column and row or (N, 3) with column, row and subsite.
+
+        Returns:
+            A float64 array of shape (N, 2) with the chuck x and y position in micrometer.
+
+        Raises:
+            IndexError: If a subsite index is out of range.
+        """
+        np = self.__np
+        dies = np.asarray(dies, dtype=np.int64).reshape(-1, np.shape(dies)[-1] if np.ndim(dies) else 2)
+        xy = (dies[:, :2] - self.__home_die) * self.__sign * self.__index + self.__home_xy
+        if dies.shape[1] > 2:
+            xy += self.__subsites[dies[:, 2]]
+
+        return xy
+
+
+    def to_die(self, xy: Any, tolerance: float = 1.0) -> Any:
+        """Convert chuck positions into die indices.
+
+        A position belongs to the die whose area contains it. The subsite is the subsite
+        closest to the position if it is not farther away than tolerance, otherwise -1.
+
+        Args:
+            xy (Any): An array like of shape (N, 2) with chuck x and y positions in micrometer.
+            tolerance (float): The maximum distance of a position from a subsite in micrometer.
+
+        Returns:
+            An int64 array of shape (N, 3) with column, row and subsite.
+        """
+        np = self.__np
+        xy = np.asarray(xy, dtype=np.float64).reshape(-1, 2)
+
+        # offset of the die from the home die in chuck axis directions
+        steps = np.floor((xy - self.__home_xy + self.__die_reference) / self.__index).astype(np.int64)
+        site0 = steps * self.__index + self.__home_xy
+
+        rel = xy - site0
+        dist = np.hypot(rel[:, None, 0] - self.__subsites[None, :, 0], rel[:, None, 1] - self.__subsites[None, :, 1])
+        site = dist.argmin(axis=1)
+        site[dist[np.arange(len(site)), site] > tolerance] = -1
+
+        result = np.empty((len(xy), 3), dtype=np.int64)
+        result[:, :2] = self.__home_die + steps * self.__sign
+        result[:, 2] = site
+        return result
+
+
+    def verify(self, prober: "SentioProber", dies: Sequence[Tuple[int, ...]], tolerance: float = 1.0) -> List[Tuple[Tuple[int, ...], Tuple[float, float], Tuple[float, float]]]:
+        """Compare the transform with SENTIO by stepping to dies.
+
+        Steps to each die (and subsite) with map:step_die and compares the chuck position
+        reported by SENTIO with the position computed by to_chuck. This moves the chuck.
+        Before SENTIO 25.2 the position is read with the legacy get_chuck_xy command.
+
+        Args:
+            prober (SentioProber): The prober to compare with.
+            dies (Sequence[Tuple[int, ...]]): Column, row and optionally subsite of the dies to step to.
+            tolerance (float): The maximum accepted difference in micrometer.
+
+        Returns:
+            A list of (die, computed position, SENTIO's position) tuples for each difference. An empty list if all positions match.
+        """
+        computed = self.to_chuck([tuple(d) + (0,) * (3 - len(d)) for d in dies])
+        diffs = []
+        for die, expected in zip(dies, computed.tolist()):
+            prober.map.step_die(*die)
+            if Compatibility.level < CompatibilityLevel.Sentio_25_2:
+                x, y = prober.get_chuck_xy(ChuckSite.Wafer, XyReference.Home)
+            else:
+                x, y, _ = prober.chuck.get_xy(XyReference.Home)
+            if abs(x - expected[0]) > tolerance or abs(y - expected[1]) > tolerance:
+                diffs.append((tuple(die), tuple(expected), (x, y)))
+
+        return diffs
@@ -1,8 +1,76 @@
 from enum import Enum
+from typing import Any, Callable, Dict
 
 from sentio_prober_control.Sentio.Compatibility import CompatibilityLevel, Compatibility
 
 
+class _EnumCodec:
+    """Lookup tables for converting the members of an enumeration from and to SENTIO's remote command strings.
+
+    The tables are built once when the module is loaded. to_string and from_string of the
+    enumerations only perform a dictionary lookup. The forward table is keyed by the member
+    name because hashing a member calls Enum.__hash__ in python.
+
+    If no reverse table is given it is derived from the forward table. The derived table also
+    accepts the member names and ignores the case of the string.
+    """
+
+    __slots__ = ("__forward", "__invalid", "__reverse", "__fold", "__unknown")
+
+    def __init__(self, forward: Dict[Enum, Any] | None = None, invalid: str = "", *,
+                 reverse: Dict[str, Enum] | None = None, fold: Callable[[str], str] | None = None, unknown: str | None = None) -> None:
+        """Create the tables of an enumeration.
+
+        Args:
+            forward (Dict[Enum, Any]): The string for each member.
+            invalid (str): Returned by to_string for members missing from the forward table.
+            reverse (Dict[str, Enum]): The member for each string accepted by from_string. Derived from forward if omitted.
+            fold (Callable[[str], str]): Applied to the string before it is looked up in the reverse table.
+            unknown (str): The beginning of the error message raised by from_string for unknown strings.
+        """
+        forward = {} if forward is None else forward
+        self.__forward: Dict[str, Any] = {member._name_: text for member, text in forward.items()}
+        self.__invalid = invalid
+
+        if reverse is None:
+            members = type(next(iter(forward))).__members__ if forward else {}
+            reverse = {name.lower(): member for name, member in members.items()}
+            reverse.update((str(text).lower(), member) for member, text in forward.items())
+            fold = str.lower
+
+        self.__reverse: Dict[str, Enum] = reverse
+        self.__fold = fold
+
+        if unknown is None:
+            names = {type(member).__name__ for member in reverse.values()}
+            unknown = f"Unknown {names.pop() if len(names) == 1 else 'enumeration'} abbreviation"
+
+        self.__unknown = unknown
+
+
+    @property
+    def forward(self) -> Dict[str, Any]:
+        """A copy of the forward table keyed by member name."""
+        return dict(self.__forward)
+
+
+    @property
+    def reverse(self) -> Dict[str, Enum]:
+        """A copy of the reverse table."""
+        return dict(self.__reverse)
+
+
+    def to_string(self, member: Enum) -> Any:
+        return self.__forward.get(member._name_, self.__invalid)
+
+
+    def from_string(self, abbr: str) -> Any:
+        try:
+            return self.__reverse[abbr if self.__fold is None else self.__fold(abbr)]
+        except KeyError:
+            raise ValueError(f"{self.__unknown}: {abbr}")
+
+
 class AccessLevel(Enum):
     """Specifies a SENTIO access level.
 
@@ -20,14 +88,20 @@ class AccessLevel(Enum):
     Debug = 1 << 4
 
     def to_string(self):
-        switcher = {
-            AccessLevel.Operator: "Operator",
-            AccessLevel.Admin: "Admin",
-            AccessLevel.Engineer: "Engineer",
-            AccessLevel.Service: "Service",
-            AccessLevel.Debug: "Debug",
-        }
-        return switcher.get(self, "Invalid Auto Align function")
+        return _ACCESS_LEVEL.to_string(self)
+
+    @staticmethod
+    def from_string(abbr: str) -> "AccessLevel":
+        return _ACCESS_LEVEL.from_string(abbr)
+
+
+_ACCESS_LEVEL = _EnumCodec({
+    AccessLevel.Operator: "Operator",
+    AccessLevel.Admin: "Admin",
+    AccessLevel.Engineer: "Engineer",
+    AccessLevel.Service: "Service",
+    AccessLevel.Debug: "Debug",
+}, "Invalid Auto Align function")
 
 
 class AutoAlignCmd(Enum):
@@ -46,13 +120,19 @@ class AutoAlignCmd(Enum):
     TwoPt = 3
 
     def to_string(self):
-        switcher = {
-            AutoAlignCmd.AlignOnly: "alignonly",
-            AutoAlignCmd.AutoDieSize: "auto",
-            AutoAlignCmd.UpdateDieSize: "update",
-            AutoAlignCmd.TwoPt: "2pt",
-        }
-        return switcher.get(self, "Invalid Auto Align function")
+        return _AUTO_ALIGN_CMD.to_string(self)
+
+    @staticmethod
+    def from_string(abbr: str) -> "AutoAlignCmd":
+        return _AUTO_ALIGN_CMD.from_string(abbr)
+
+
+_AUTO_ALIGN_CMD = _EnumCodec({
+    AutoAlignCmd.AlignOnly: "alignonly",
+    AutoAlignCmd.AutoDieSize: "auto",
+    AutoAlignCmd.UpdateDieSize: "update",
+    AutoAlignCmd.TwoPt: "2pt",
+}, "Invalid Auto Align function")
 
 
 class AutoFocusAlgorithm(Enum):
@@ -73,15 +153,21 @@ class AutoFocusAlgorithm(Enum):
     Harris = 5
 
     def to_string(self):
-        switcher = {
-            AutoFocusAlgorithm.Gradient: "Gradient",
-            AutoFocusAlgorithm.Bandpass: "Bandpass",
-            AutoFocusAlgorithm.Difference: "Difference",
-            AutoFocusAlgorithm.AutoCorrelation: "AutoCorrelation",
-            AutoFocusAlgorithm.LaplaceStdDev: "LaplaceStdDev",
-            AutoFocusAlgorithm.Harris: "Harris",
-        }
-        return switcher.get(self, "Invalid focus measure")
+        return _AUTO_FOCUS_ALGORITHM.to_string(self)
+
+    @staticmethod
+    def from_string(abbr: str) -> "AutoFocusAlgorithm":
+        return _AUTO_FOCUS_ALGORITHM.from_string(abbr)
+
+
+_AUTO_FOCUS_ALGORITHM = _EnumCodec({
+    AutoFocusAlgorithm.Gradient: "Gradient",
+    AutoFocusAlgorithm.Bandpass: "Bandpass",
+    AutoFocusAlgorithm.Difference: "Difference",
+    AutoFocusAlgorithm.AutoCorrelation: "AutoCorrelation",
+    AutoFocusAlgorithm.LaplaceStdDev: "LaplaceStdDev",
+    AutoFocusAlgorithm.Harris: "Harris",
+}, "Invalid focus measure")
 
 
 class AutoFocusCmd(Enum):
@@ -98,12 +184,18 @@ class AutoFocusCmd(Enum):
     GoTo = 2
 
     def to_string(self):
-        switcher = {
-            AutoFocusCmd.Calibration: "C",
-            AutoFocusCmd.Focus: "F",
-            AutoFocusCmd.GoTo: "G",
-        }
-        return switcher.get(self, "Invalid auto focus function")
+        return _AUTO_FOCUS_CMD.to_string(self)
+
+    @staticmethod
+    def from_string(abbr: str) -> "AutoFocusCmd":
+        return _AUTO_FOCUS_CMD.from_string(abbr)
+
+
+_AUTO_FOCUS_CMD = _EnumCodec({
+    AutoFocusCmd.Calibration: "C",
+    AutoFocusCmd.Focus: "F",
+    AutoFocusCmd.GoTo: "G",
+}, "Invalid auto focus function")
 
 
 class AxisOrient(Enum):
@@ -126,13 +218,19 @@ class AxisOrient(Enum):
     UpLeft = 3
 
     def to_string(self):
-        switcher = {
-            AxisOrient.DownRight: "DR",
-            AxisOrient.DownLeft: "DL",
-            AxisOrient.UpRight: "UR",
-            AxisOrient.UpLeft: "UL",
-        }
-        return switcher.get(self, "Invalid AxisOrient")
+        return _AXIS_ORIENT.to_string(self)
+
+    @staticmethod
+    def from_string(abbr: str) -> "AxisOrient":
+        return _AXIS_ORIENT.from_string(abbr)
+
+
+_AXIS_ORIENT = _EnumCodec({
+    AxisOrient.DownRight: "DR",
+    AxisOrient.DownLeft: "DL",
+    AxisOrient.UpRight: "UR",
+    AxisOrient.UpLeft: "UL",
+}, "Invalid AxisOrient")
 
 
 class BinSelection(Enum):
@@ -149,12 +247,18 @@ class BinSelection(Enum):
     SubsitesOnly = 2
 
     def to_string(self):
-        switcher = {
-            BinSelection.All: "a",
-            BinSelection.DiesOnly: "d",
-            BinSelection.SubsitesOnly: "s",
-        }
-        return switcher.get(self, "Invalid bin selection")
+        return _BIN_SELECTION.to_string(self)
+
+    @staticmethod
+    def from_string(abbr: str) -> "BinSelection":
+        return _BIN_SELECTION.from_string(abbr)
+
+
+_BIN_SELECTION = _EnumCodec({
+    BinSelection.All: "a",
+    BinSelection.DiesOnly: "d",
+    BinSelection.SubsitesOnly: "s",
+}, "Invalid bin selection")
 
 
 class BinQuality(Enum):
@@ -171,12 +275,18 @@ class BinQuality(Enum):
     Undefined = 2
 
     def to_string(self):
-        switcher = {
-            BinQuality.Pass: "pass",
-            BinQuality.Fail: "fail",
-            BinQuality.Undefined: "undefined",
-        }
-        return switcher.get(self, "Invalid bin quality identifier")
+        return _BIN_QUALITY.to_string(self)
+
+    @staticmethod
+    def from_string(abbr: str) -> "BinQuality":
+        return _BIN_QUALITY.from_string(abbr)
+
+
+_BIN_QUALITY = _EnumCodec({
+    BinQuality.Pass: "pass",
+    BinQuality.Fail: "fail",
+    BinQuality.Undefined: "undefined",
+}, "Invalid bin quality identifier")
 
 
 class CameraMountPoint(Enum):
@@ -205,18 +315,24 @@ class CameraMountPoint(Enum):
     BottomScope = 8
 
     def to_string(self):
-        switcher = {
-            CameraMountPoint.Scope: "scope",
-            CameraMountPoint.Scope2: "scope2",
-            CameraMountPoint.Chuck: "chuck",
-            CameraMountPoint.OffAxis: "offaxis",
-            CameraMountPoint.Vce: "vce01",
-            CameraMountPoint.Vce2: "vce02",
-            CameraMountPoint.Chuck2: "chuck2",
-            CameraMountPoint.Angled: "angled",
-            CameraMountPoint.BottomScope: "bottomscope"
-        }
-        return switcher.get(self, "Invalid camera mount point id")
+        return _CAMERA_MOUNT_POINT.to_string(self)
+
+    @staticmethod
+    def from_string(abbr: str) -> "CameraMountPoint":
+        return _CAMERA_MOUNT_POINT.from_string(abbr)
+
+
+_CAMERA_MOUNT_POINT = _EnumCodec({
+    CameraMountPoint.Scope: "scope",
+    CameraMountPoint.Scope2: "scope2",
+    CameraMountPoint.Chuck: "chuck",
+    CameraMountPoint.OffAxis: "offaxis",
+    CameraMountPoint.Vce: "vce01",
+    CameraMountPoint.Vce2: "vce02",
+    CameraMountPoint.Chuck2: "chuck2",
+    CameraMountPoint.Angled: "angled",
+    CameraMountPoint.BottomScope: "bottomscope",
+}, "Invalid camera mount point id")
 
 
 class ChuckPositionHint(Enum):
@@ -235,16 +351,18 @@ class ChuckPositionHint(Enum):
 
     @staticmethod
     def from_string(abbr: str):
-        mapping = {
-            "Probing": ChuckPositionHint.Center,
-            "FrontLoad": ChuckPositionHint.FrontLoad,
-            "SideLoad": ChuckPositionHint.SideLoad,
-            "OffAxisCamera": ChuckPositionHint.OffAxisCamera
-        }
-        try:
-            return mapping[abbr]
-        except KeyError:
-            raise ValueError(f"Unknown ChuckPositionHint abbreviation: {abbr}")
+        return _CHUCK_POSITION_HINT.from_string(abbr)
+
+
+_CHUCK_POSITION_HINT = _EnumCodec(
+    reverse={
+        "Probing": ChuckPositionHint.Center,
+        "FrontLoad": ChuckPositionHint.FrontLoad,
+        "SideLoad": ChuckPositionHint.SideLoad,
+        "OffAxisCamera": ChuckPositionHint.OffAxisCamera,
+    },
+    unknown="Unknown ChuckPositionHint abbreviation",
+)
 
 
 class ChuckSite(Enum):
@@ -275,36 +393,39 @@ class ChuckSite(Enum):
     ChuckCamera2 = 8
 
     def to_string(self):
-        switcher = {
-            ChuckSite.Wafer: "Wafer",
-            ChuckSite.AuxRight: "AuxRight",
-            ChuckSite.AuxLeft: "AuxLeft",
-            ChuckSite.AuxRight2: "AuxRight2",
-            ChuckSite.AuxLeft2: "AuxLeft2",
-            ChuckSite.ChuckCamera: "ChuckCamera",
-            ChuckSite.SiPhSetHoverHeight: "SiPhSetHoverHeight",
-            ChuckSite.SiPhFiberPowerMeasure: "SiPhFiberPowerMeasure",
-            ChuckSite.ChuckCamera2: "ChuckCamera2"
-        }
-        return switcher.get(self, "Invalid chuck site")
+        return _CHUCK_SITE.to_string(self)
 
     @staticmethod
     def from_string(abbr: str):
-        mapping = {
-            "Wafer": ChuckSite.Wafer,
-            "AuxRight": ChuckSite.AuxRight,
-            "AuxLeft": ChuckSite.AuxLeft,
-            "AuxRight2": ChuckSite.AuxRight2,
-            "AuxLeft2": ChuckSite.AuxLeft2,
-            "ChuckCamera": ChuckSite.ChuckCamera,
-            "SiPhSetHoverHeight": ChuckSite.SiPhSetHoverHeight,
-            "SiPhFiberPowerMeasure": ChuckSite.SiPhFiberPowerMeasure,
-            "ChuckCamera2": ChuckSite.ChuckCamera2  
-        }
-        try:
-            return mapping[abbr]
-        except KeyError:
-            raise ValueError(f"Unknown ChuckSite abbreviation: {abbr}")
+        return _CHUCK_SITE.from_string(abbr)
+
+
+_CHUCK_SITE = _EnumCodec(
+    {
+        ChuckSite.Wafer: "Wafer",
+        ChuckSite.AuxRight: "AuxRight",
+        ChuckSite.AuxLeft: "AuxLeft",
+        ChuckSite.AuxRight2: "AuxRight2",
+        ChuckSite.AuxLeft2: "AuxLeft2",
+        ChuckSite.ChuckCamera: "ChuckCamera",
+        ChuckSite.SiPhSetHoverHeight: "SiPhSetHoverHeight",
+        ChuckSite.SiPhFiberPowerMeasure: "SiPhFiberPowerMeasure",
+        ChuckSite.ChuckCamera2: "ChuckCamera2",
+    },
+    "Invalid chuck site",
+    reverse={
+        "Wafer": ChuckSite.Wafer,
+        "AuxRight": ChuckSite.AuxRight,
+        "AuxLeft": ChuckSite.AuxLeft,
+        "AuxRight2": ChuckSite.AuxRight2,
+        "AuxLeft2": ChuckSite.AuxLeft2,
+        "ChuckCamera": ChuckSite.ChuckCamera,
+        "SiPhSetHoverHeight": ChuckSite.SiPhSetHoverHeight,
+        "SiPhFiberPowerMeasure": ChuckSite.SiPhFiberPowerMeasure,
+        "ChuckCamera2": ChuckSite.ChuckCamera2,
+    },
+    unknown="Unknown ChuckSite abbreviation",
+)
 
 
 class ChuckSpeed(Enum):
@@ -316,17 +437,19 @@ class ChuckSpeed(Enum):
 
     @staticmethod
     def from_string(abbr: str):
-        mapping = {
-            "Fast": ChuckSpeed.Fast,
-            "Normal": ChuckSpeed.Normal,
-            "Slow": ChuckSpeed.Slow,
-            "Jog": ChuckSpeed.Jog,
-            "Index": ChuckSpeed.Index,
-        }
-        try:
-            return mapping[abbr]
-        except KeyError:
-            raise ValueError(f"Unknown ChuckSpeed abbreviation: {abbr}")
+        return _CHUCK_SPEED.from_string(abbr)
+
+
+_CHUCK_SPEED = _EnumCodec(
+    reverse={
+        "Fast": ChuckSpeed.Fast,
+        "Normal": ChuckSpeed.Normal,
+        "Slow": ChuckSpeed.Slow,
+        "Jog": ChuckSpeed.Jog,
+        "Index": ChuckSpeed.Index,
+    },
+    unknown="Unknown ChuckSpeed abbreviation",
+)
 
 
 class ChuckThermoEnergyMode(Enum):
@@ -336,13 +459,19 @@ class ChuckThermoEnergyMode(Enum):
     Customized = 3
 
     def to_string(self):
-        switcher = {
-            ChuckThermoEnergyMode.Fast: "Fast",
-            ChuckThermoEnergyMode.Optimal: "Optimal",
-            ChuckThermoEnergyMode.HighPower: "HighPower",
-            ChuckThermoEnergyMode.Customized: "Customized",
-        }
-        return switcher.get(self, "Invalid ChuckThermoEnergyMode")
+        return _CHUCK_THERMO_ENERGY_MODE.to_string(self)
+
+    @staticmethod
+    def from_string(abbr: str) -> "ChuckThermoEnergyMode":
+        return _CHUCK_THERMO_ENERGY_MODE.from_string(abbr)
+
+
+_CHUCK_THERMO_ENERGY_MODE = _EnumCodec({
+    ChuckThermoEnergyMode.Fast: "Fast",
+    ChuckThermoEnergyMode.Optimal: "Optimal",
+    ChuckThermoEnergyMode.HighPower: "HighPower",
+    ChuckThermoEnergyMode.Customized: "Customized",
+}, "Invalid ChuckThermoEnergyMode")
 
 
 class ChuckThermoHoldMode(Enum):
@@ -357,11 +486,17 @@ class ChuckThermoHoldMode(Enum):
     Nonactive = 1
 
     def to_string(self):
-        switcher = {
-            ChuckThermoHoldMode.Active: "Active",
-            ChuckThermoHoldMode.Nonactive: "Nonactive",
-        }
-        return switcher.get(self, "Invalid ChuckThermoHoldMode")
+        return _CHUCK_THERMO_HOLD_MODE.to_string(self)
+
+    @staticmethod
+    def from_string(abbr: str) -> "ChuckThermoHoldMode":
+        return _CHUCK_THERMO_HOLD_MODE.from_string(abbr)
+
+
+_CHUCK_THERMO_HOLD_MODE = _EnumCodec({
+    ChuckThermoHoldMode.Active: "Active",
+    ChuckThermoHoldMode.Nonactive: "Nonactive",
+}, "Invalid ChuckThermoHoldMode")
 
 
 class ColorScheme(Enum):
@@ -376,8 +511,17 @@ class ColorScheme(Enum):
     ColorFromValue = 1
 
     def to_string(self):
-        switcher = {ColorScheme.ColorFromBin: 0, ColorScheme.ColorFromValue: 1}
-        return switcher.get(self, "Invalid ColorScheme")
+        return _COLOR_SCHEME.to_string(self)
+
+    @staticmethod
+    def from_string(abbr: str) -> "ColorScheme":
+        return _COLOR_SCHEME.from_string(abbr)
+
+
+_COLOR_SCHEME = _EnumCodec({
+    ColorScheme.ColorFromBin: 0,
+    ColorScheme.ColorFromValue: 1,
+}, "Invalid ColorScheme")
 
 
 class Compensation(Enum):
@@ -395,16 +539,22 @@ class Compensation(Enum):
     Topography = 6
 
     def to_string(self):
-        switcher = {
-            Compensation.Lateral: "lateral",
-            Compensation.Vertical: "vertical",
-            Compensation.Both: "both",
-            Compensation.ProbeCard: "probecard",
-            Compensation.MapScan: "mapscan",
-            Compensation.Thermal: "thermal",
-            Compensation.Topography: "topography",
-        }
-        return switcher.get(self, "Invalid compensation type")
+        return _COMPENSATION.to_string(self)
+
+    @staticmethod
+    def from_string(abbr: str) -> "Compensation":
+        return _COMPENSATION.from_string(abbr)
+
+
+_COMPENSATION = _EnumCodec({
+    Compensation.Lateral: "lateral",
+    Compensation.Vertical: "vertical",
+    Compensation.Both: "both",
+    Compensation.ProbeCard: "probecard",
+    Compensation.MapScan: "mapscan",
+    Compensation.Thermal: "thermal",
+    Compensation.Topography: "topography",
+}, "Invalid compensation type")
 
 
 class CompensationMode(Enum):
@@ -430,16 +580,22 @@ class CompensationMode(Enum):
     Topography = 6
 
     def to_string(self):
-        switcher = {
-            CompensationMode.Lateral: "lateral",
-            CompensationMode.Vertical: "vertical",
-            CompensationMode.Both: "both",
-            CompensationMode.ProbeCard: "probecard",
-            CompensationMode.MapScan: "mapscan",
-            CompensationMode.Thermal: "thermal",
-            CompensationMode.Topography: "topography",
-        }
-        return switcher.get(self, "Invalid CompensationMode")
+        return _COMPENSATION_MODE.to_string(self)
+
+    @staticmethod
+    def from_string(abbr: str) -> "CompensationMode":
+        return _COMPENSATION_MODE.from_string(abbr)
+
+
+_COMPENSATION_MODE = _EnumCodec({
+    CompensationMode.Lateral: "lateral",
+    CompensationMode.Vertical: "vertical",
+    CompensationMode.Both: "both",
+    CompensationMode.ProbeCard: "probecard",
+    CompensationMode.MapScan: "mapscan",
+    CompensationMode.Thermal: "thermal",
+    CompensationMode.Topography: "topography",
+}, "Invalid CompensationMode")
 
 
 class CompensationType(Enum):
@@ -462,16 +618,22 @@ class CompensationType(Enum):
     OffAxis = 6
 
     def to_string(self):
-        switcher = {
-            CompensationType.DieAlign: "DieAlign",
-            CompensationType.Topography: "Topography",
-            CompensationType.MapScan: "MapScan",
-            CompensationType.AlignDie: "AlignDie",
-            CompensationType.SkateDetection: "SkateDetection",
-            CompensationType.OnTheFly: "OnTheFly",
-            CompensationType.OffAxis: "OffAxis",
-        }
-        return switcher.get(self, "Invalid CompensationType")
+        return _COMPENSATION_TYPE.to_string(self)
+
+    @staticmethod
+    def from_string(abbr: str) -> "CompensationType":
+        return _COMPENSATION_TYPE.from_string(abbr)
+
+
+_COMPENSATION_TYPE = _EnumCodec({
+    CompensationType.DieAlign: "DieAlign",
+    CompensationType.Topography: "Topography",
+    CompensationType.MapScan: "MapScan",
+    CompensationType.AlignDie: "AlignDie",
+    CompensationType.SkateDetection: "SkateDetection",
+    CompensationType.OnTheFly: "OnTheFly",
+    CompensationType.OffAxis: "OffAxis",
+}, "Invalid CompensationType")
 
 
 class DefaultPattern(Enum):
@@ -498,16 +660,22 @@ class DefaultPattern(Enum):
     Ptpa = 7
 
     def to_string(self):
-        switcher = {
-            DefaultPattern.Align: "align",
-            DefaultPattern.Home: "home",
-            DefaultPattern.DieAlignPos1: "diealignpos1",
-            DefaultPattern.DieAlignPos2: "diealignpos2",
-            DefaultPattern.TwoPoint: "2pt",
-            DefaultPattern.Vce: "vce",
-            DefaultPattern.Ptpa: "ptpa",
-        }
-        return switcher.get(self, "Invalid default pattern id")
+        return _DEFAULT_PATTERN.to_string(self)
+
+    @staticmethod
+    def from_string(abbr: str) -> "DefaultPattern":
+        return _DEFAULT_PATTERN.from_string(abbr)
+
+
+_DEFAULT_PATTERN = _EnumCodec({
+    DefaultPattern.Align: "align",
+    DefaultPattern.Home: "home",
+    DefaultPattern.DieAlignPos1: "diealignpos1",
+    DefaultPattern.DieAlignPos2: "diealignpos2",
+    DefaultPattern.TwoPoint: "2pt",
+    DefaultPattern.Vce: "vce",
+    DefaultPattern.Ptpa: "ptpa",
+}, "Invalid default pattern id")
 
 
 class DetectionAlgorithm(Enum):
@@ -532,12 +700,18 @@ class DetectionAlgorithm(Enum):
     WaferDetector = 2
 
     def to_string(self):
-        switcher = {
-            DetectionAlgorithm.Keypoint: "Keypoint",
-            DetectionAlgorithm.ProbeDetector: "ProbeDetector",
-            DetectionAlgorithm.WaferDetector: "WaferDetector",
-        }
-        return switcher.get(self, "Invalid ProbeTipDetector")
+        return _DETECTION_ALGORITHM.to_string(self)
+
+    @staticmethod
+    def from_string(abbr: str) -> "DetectionAlgorithm":
+        return _DETECTION_ALGORITHM.from_string(abbr)
+
+
+_DETECTION_ALGORITHM = _EnumCodec({
+    DetectionAlgorithm.Keypoint: "Keypoint",
+    DetectionAlgorithm.ProbeDetector: "ProbeDetector",
+    DetectionAlgorithm.WaferDetector: "WaferDetector",
+}, "Invalid ProbeTipDetector")
 
 
 class DetectionCoordindates(Enum):
@@ -556,12 +730,18 @@ class DetectionCoordindates(Enum):
     Roi = 2
 
     def to_string(self):
-        switcher = {
-            DetectionCoordindates.Image: "Image",
-            DetectionCoordindates.Fov: "Fov",
-            DetectionCoordindates.Roi: "Roi",
-        }
-        return switcher.get(self, "Invalid DetectionCoordindates")
+        return _DETECTION_COORDINDATES.to_string(self)
+
+    @staticmethod
+    def from_string(abbr: str) -> "DetectionCoordindates":
+        return _DETECTION_COORDINDATES.from_string(abbr)
+
+
+_DETECTION_COORDINDATES = _EnumCodec({
+    DetectionCoordindates.Image: "Image",
+    DetectionCoordindates.Fov: "Fov",
+    DetectionCoordindates.Roi: "Roi",
+}, "Invalid DetectionCoordindates")
 
 
 class DevicePosition(Enum):
@@ -576,11 +756,17 @@ class DevicePosition(Enum):
     Down = 1
     
     def to_string(self):
-        switcher = {
-            DevicePosition.Up: "Up",
-            DevicePosition.Down: "Down",
-        }
-        return switcher.get(self, "Invalid device position.")
+        return _DEVICE_POSITION.to_string(self)
+
+    @staticmethod
+    def from_string(abbr: str) -> "DevicePosition":
+        return _DEVICE_POSITION.from_string(abbr)
+
+
+_DEVICE_POSITION = _EnumCodec({
+    DevicePosition.Up: "Up",
+    DevicePosition.Down: "Down",
+}, "Invalid device position.")
     
 
 class DialogButtons(Enum):
@@ -607,34 +793,37 @@ class DialogButtons(Enum):
     YesNoCancel = 8
 
     def to_string(self):
-        switcher = {
-            DialogButtons.Ok: "Ok",
-            DialogButtons.Cancel: "Cancel",
-            DialogButtons.OkCancel: "OkCancel",
-            DialogButtons.Yes: "Yes",
-            DialogButtons.No: "No",
-            DialogButtons.YesNo: "YesNo",
-            DialogButtons.YesCancel: "YesCancel",
-            DialogButtons.YesNoCancel: "YesNoCancel",
-        }
-        return switcher.get(self, "Invalid button id")
+        return _DIALOG_BUTTONS.to_string(self)
 
     @staticmethod
     def from_string(abbr: str) -> "DialogButtons":
-        mapping = {
-            "Ok": DialogButtons.Ok,
-            "Cancel": DialogButtons.Cancel,
-            "OkCancel": DialogButtons.OkCancel,
-            "Yes": DialogButtons.Yes,
-            "No": DialogButtons.No,
-            "YesNo": DialogButtons.YesNo,
-            "YesCancel": DialogButtons.YesCancel,
-            "YesNoCancel": DialogButtons.YesNoCancel,
-        }
-        try:
-            return mapping[abbr]
-        except KeyError:
-            raise ValueError(f"Unknown button abbreviation: {abbr}")
+        return _DIALOG_BUTTONS.from_string(abbr)
+
+
+_DIALOG_BUTTONS = _EnumCodec(
+    {
+        DialogButtons.Ok: "Ok",
+        DialogButtons.Cancel: "Cancel",
+        DialogButtons.OkCancel: "OkCancel",
+        DialogButtons.Yes: "Yes",
+        DialogButtons.No: "No",
+        DialogButtons.YesNo: "YesNo",
+        DialogButtons.YesCancel: "YesCancel",
+        DialogButtons.YesNoCancel: "YesNoCancel",
+    },
+    "Invalid button id",
+    reverse={
+        "Ok": DialogButtons.Ok,
+        "Cancel": DialogButtons.Cancel,
+        "OkCancel": DialogButtons.OkCancel,
+        "Yes": DialogButtons.Yes,
+        "No": DialogButtons.No,
+        "YesNo": DialogButtons.YesNo,
+        "YesCancel": DialogButtons.YesCancel,
+        "YesNoCancel": DialogButtons.YesNoCancel,
+    },
+    unknown="Unknown button abbreviation",
+)
 
 
 class DieCompensationMode(Enum):
@@ -659,14 +848,20 @@ class DieCompensationMode(Enum):
     SkateDetection = 4
 
     def to_string(self):
-        switcher = {
-            DieCompensationMode.Lateral: "Lateral",
-            DieCompensationMode.Vertical: "Vertical",
-            DieCompensationMode.Both: "Both",
-            DieCompensationMode.ProbeCard: "ProbeCard",
-            DieCompensationMode.SkateDetection: "SkateDetection",
-        }
-        return switcher.get(self, "Invalid DieCompensationMode function")
+        return _DIE_COMPENSATION_MODE.to_string(self)
+
+    @staticmethod
+    def from_string(abbr: str) -> "DieCompensationMode":
+        return _DIE_COMPENSATION_MODE.from_string(abbr)
+
+
+_DIE_COMPENSATION_MODE = _EnumCodec({
+    DieCompensationMode.Lateral: "Lateral",
+    DieCompensationMode.Vertical: "Vertical",
+    DieCompensationMode.Both: "Both",
+    DieCompensationMode.ProbeCard: "ProbeCard",
+    DieCompensationMode.SkateDetection: "SkateDetection",
+}, "Invalid DieCompensationMode function")
 
 
 class DieCompensationType(Enum):
@@ -687,16 +882,22 @@ class DieCompensationType(Enum):
     Offaxis = 6
 
     def to_string(self):
-        switcher = {
-            DieCompensationType.DieAlign: "DieAlign",
-            DieCompensationType.MapScan: "MapScan",
-            DieCompensationType.Topography: "Topography",
-            DieCompensationType.AlignDie: "AlignDie",
-            DieCompensationType.ContactSense: "ContactSense",
-            DieCompensationType.OnTheFly: "OnTheFly",
-            DieCompensationType.Offaxis: "Offaxis",
-        }
-        return switcher.get(self, "Invalid Compensation_Type function")
+        return _DIE_COMPENSATION_TYPE.to_string(self)
+
+    @staticmethod
+    def from_string(abbr: str) -> "DieCompensationType":
+        return _DIE_COMPENSATION_TYPE.from_string(abbr)
+
+
+_DIE_COMPENSATION_TYPE = _EnumCodec({
+    DieCompensationType.DieAlign: "DieAlign",
+    DieCompensationType.MapScan: "MapScan",
+    DieCompensationType.Topography: "Topography",
+    DieCompensationType.AlignDie: "AlignDie",
+    DieCompensationType.ContactSense: "ContactSense",
+    DieCompensationType.OnTheFly: "OnTheFly",
+    DieCompensationType.Offaxis: "Offaxis",
+}, "Invalid Compensation_Type function")
 
 
 class DieNumber(Enum):
@@ -729,17 +930,20 @@ class ElementType(Enum):
 
     @staticmethod
     def from_string(abbr: str):
-        mapping = {
-            "open": ElementType.Open,
-            "short": ElementType.Short,
-            "thru": ElementType.Thru,
-            "load" : ElementType.Load,
-            "align": ElementType.Align
-        }
-        try:
-            return mapping[abbr.lower()]
-        except KeyError:
-            raise ValueError(f"Unknown ElementType string: {abbr}")
+        return _ELEMENT_TYPE.from_string(abbr)
+
+
+_ELEMENT_TYPE = _EnumCodec(
+    reverse={
+        "open": ElementType.Open,
+        "short": ElementType.Short,
+        "thru": ElementType.Thru,
+        "load": ElementType.Load,
+        "align": ElementType.Align,
+    },
+    fold=str.lower,
+    unknown="Unknown ElementType string",
+)
 
 
 class ExecuteAction(Enum):
@@ -751,11 +955,17 @@ class ExecuteAction(Enum):
     Abort = 1
 
     def to_string(self):
-        switcher = {
-            ExecuteAction.Execute: "execute",
-            ExecuteAction.Abort: "abort",
-        }
-        return switcher.get(self, "Invalid ExecuteAction function")
+        return _EXECUTE_ACTION.to_string(self)
+
+    @staticmethod
+    def from_string(abbr: str) -> "ExecuteAction":
+        return _EXECUTE_ACTION.from_string(abbr)
+
+
+_EXECUTE_ACTION = _EnumCodec({
+    ExecuteAction.Execute: "execute",
+    ExecuteAction.Abort: "abort",
+}, "Invalid ExecuteAction function")
 
 
 class ExecuteCompensation(Enum):
@@ -769,12 +979,18 @@ class ExecuteCompensation(Enum):
     Topography = 2
 
     def to_string(self):
-        switcher = {
-            ExecuteCompensation.AlignDie: "AlignDie",
-            ExecuteCompensation.MapScan: "MapScan",
-            ExecuteCompensation.Topography: "Topography",
-        }
-        return switcher.get(self, "Invalid compensation type")
+        return _EXECUTE_COMPENSATION.to_string(self)
+
+    @staticmethod
+    def from_string(abbr: str) -> "ExecuteCompensation":
+        return _EXECUTE_COMPENSATION.from_string(abbr)
+
+
+_EXECUTE_COMPENSATION = _EnumCodec({
+    ExecuteCompensation.AlignDie: "AlignDie",
+    ExecuteCompensation.MapScan: "MapScan",
+    ExecuteCompensation.Topography: "Topography",
+}, "Invalid compensation type")
 
 
 class FiberType(Enum):
@@ -791,12 +1007,18 @@ class FiberType(Enum):
     Lensed = 2
 
     def to_string(self):
-        switcher = {
-            FiberType.Single: "Single",
-            FiberType.Array: "Array",
-            FiberType.Lensed: "Lensed",
-        }
-        return switcher.get(self, "Invalid fiber type enumerator")
+        return _FIBER_TYPE.to_string(self)
+
+    @staticmethod
+    def from_string(abbr: str) -> "FiberType":
+        return _FIBER_TYPE.from_string(abbr)
+
+
+_FIBER_TYPE = _EnumCodec({
+    FiberType.Single: "Single",
+    FiberType.Array: "Array",
+    FiberType.Lensed: "Lensed",
+}, "Invalid fiber type enumerator")
 
 
 class FindPatternReference(Enum):
@@ -811,11 +1033,17 @@ class FindPatternReference(Enum):
     CenterOfRoi = 1
 
     def to_string(self):
-        switcher = {
-            FindPatternReference.DieHome: "DieHome",
-            FindPatternReference.CenterOfRoi: "CenterOfRoi",
-        }
-        return switcher.get(self, "Invalid find pattern reference id")
+        return _FIND_PATTERN_REFERENCE.to_string(self)
+
+    @staticmethod
+    def from_string(abbr: str) -> "FindPatternReference":
+        return _FIND_PATTERN_REFERENCE.from_string(abbr)
+
+
+_FIND_PATTERN_REFERENCE = _EnumCodec({
+    FindPatternReference.DieHome: "DieHome",
+    FindPatternReference.CenterOfRoi: "CenterOfRoi",
+}, "Invalid find pattern reference id")
 
 
 class HighPowerAirState(Enum):
@@ -823,10 +1051,17 @@ class HighPowerAirState(Enum):
     On = 1
 
     def to_string(self) -> str:
-        return {
-            HighPowerAirState.Off: "0",
-            HighPowerAirState.On: "1",
-        }.get(self, "Invalid HighPowerAirState")
+        return _HIGH_POWER_AIR_STATE.to_string(self)
+
+    @staticmethod
+    def from_string(abbr: str) -> "HighPowerAirState":
+        return _HIGH_POWER_AIR_STATE.from_string(abbr)
+
+
+_HIGH_POWER_AIR_STATE = _EnumCodec({
+    HighPowerAirState.Off: "0",
+    HighPowerAirState.On: "1",
+}, "Invalid HighPowerAirState")
 
 
 class ImagePattern(Enum):
@@ -838,15 +1073,21 @@ class ImagePattern(Enum):
     calc = 5
 
     def toSentioArg(self):
-        switcher = {
-            ImagePattern.align: "align",
-            ImagePattern.home: "home",
-            ImagePattern.diealignpos1: "diealignpos1",
-            ImagePattern.diealignpos2: "diealignpos2",
-            ImagePattern.twoPt: "2pt",
-            ImagePattern.calc: "calc",
-        }
-        return switcher.get(self, "Invalid image pattern parameter")
+        return _IMAGE_PATTERN.to_string(self)
+
+    @staticmethod
+    def from_string(abbr: str) -> "ImagePattern":
+        return _IMAGE_PATTERN.from_string(abbr)
+
+
+_IMAGE_PATTERN = _EnumCodec({
+    ImagePattern.align: "align",
+    ImagePattern.home: "home",
+    ImagePattern.diealignpos1: "diealignpos1",
+    ImagePattern.diealignpos2: "diealignpos2",
+    ImagePattern.twoPt: "2pt",
+    ImagePattern.calc: "calc",
+}, "Invalid image pattern parameter")
 
 
 class IMagProZReference(Enum):
@@ -855,12 +1096,18 @@ class IMagProZReference(Enum):
     Center = 2
 
     def to_string(self):
-        switcher = {
-            IMagProZReference.Zero: "Zero",
-            IMagProZReference.Relative: "Relative",
-            IMagProZReference.Center: "Center",
-        }
-        return switcher.get(self, "Invalid image pro z reference")
+        return _I_MAG_PRO_Z_REFERENCE.to_string(self)
+
+    @staticmethod
+    def from_string(abbr: str) -> "IMagProZReference":
+        return _I_MAG_PRO_Z_REFERENCE.from_string(abbr)
+
+
+_I_MAG_PRO_Z_REFERENCE = _EnumCodec({
+    IMagProZReference.Zero: "Zero",
+    IMagProZReference.Relative: "Relative",
+    IMagProZReference.Center: "Center",
+}, "Invalid image pro z reference")
 
 
 class LoaderStation(Enum):
@@ -887,16 +1134,22 @@ class LoaderStation(Enum):
     IdReader = 7
 
     def to_string(self):
-        switcher = {
-            LoaderStation.Cassette1: "cas1",
-            LoaderStation.Cassette2: "cas2",
-            LoaderStation.PreAligner: "pa",
-            LoaderStation.Chuck: "chuck",
-            LoaderStation.ForkA: "forka",
-            LoaderStation.ForkB: "forkb",
-            LoaderStation.WaferWallet: "ww",
-        }
-        return switcher.get(self, "Invalid loader station id")
+        return _LOADER_STATION.to_string(self)
+
+    @staticmethod
+    def from_string(abbr: str) -> "LoaderStation":
+        return _LOADER_STATION.from_string(abbr)
+
+
+_LOADER_STATION = _EnumCodec({
+    LoaderStation.Cassette1: "cas1",
+    LoaderStation.Cassette2: "cas2",
+    LoaderStation.PreAligner: "pa",
+    LoaderStation.Chuck: "chuck",
+    LoaderStation.ForkA: "forka",
+    LoaderStation.ForkB: "forkb",
+    LoaderStation.WaferWallet: "ww",
+}, "Invalid loader station id")
 
 
 class LoadPosition(Enum):
@@ -915,12 +1168,18 @@ class LoadPosition(Enum):
     Center = 2
 
     def to_string(self):
-        switcher = {
-            LoadPosition.Front: "front", 
-            LoadPosition.Side: "side", 
-            LoadPosition.Center: "center"
-        }
-        return switcher.get(self, "Invalid Load position")
+        return _LOAD_POSITION.to_string(self)
+
+    @staticmethod
+    def from_string(abbr: str) -> "LoadPosition":
+        return _LOAD_POSITION.from_string(abbr)
+
+
+_LOAD_POSITION = _EnumCodec({
+    LoadPosition.Front: "front",
+    LoadPosition.Side: "side",
+    LoadPosition.Center: "center",
+}, "Invalid Load position")
 
 
 class Module(Enum):
@@ -952,17 +1211,23 @@ class Module(Enum):
     Dashboard = 7
 
     def to_string(self):
-        switcher = {
-            Module.Wafermap: "Wafermap",
-            Module.Vision: "Vision",
-            Module.Setup: "Setup",
-            Module.Service: "Service",
-            Module.Qalibria: "Qalibria",
-            Module.AuxSites: "AuxSites",
-            Module.Loader: "Loader",
-            Module.Dashboard: "Dashboard",
-        }
-        return switcher.get(self, "Invalid Module Name")
+        return _MODULE.to_string(self)
+
+    @staticmethod
+    def from_string(abbr: str) -> "Module":
+        return _MODULE.from_string(abbr)
+
+
+_MODULE = _EnumCodec({
+    Module.Wafermap: "Wafermap",
+    Module.Vision: "Vision",
+    Module.Setup: "Setup",
+    Module.Service: "Service",
+    Module.Qalibria: "Qalibria",
+    Module.AuxSites: "AuxSites",
+    Module.Loader: "Loader",
+    Module.Dashboard: "Dashboard",
+}, "Invalid Module Name")
 
 
 class MoveAxis(Enum):
@@ -973,12 +1238,18 @@ class MoveAxis(Enum):
     Chuck = 2
 
     def to_string(self):
-        switcher = {
-            MoveAxis.Scope: "scope",
-            MoveAxis.Imagpro: "imagpro",
-            MoveAxis.Chuck: "chuck",
-        }
-        return switcher.get(self, "Invalid AxisOrient")
+        return _MOVE_AXIS.to_string(self)
+
+    @staticmethod
+    def from_string(abbr: str) -> "MoveAxis":
+        return _MOVE_AXIS.from_string(abbr)
+
+
+_MOVE_AXIS = _EnumCodec({
+    MoveAxis.Scope: "scope",
+    MoveAxis.Imagpro: "imagpro",
+    MoveAxis.Chuck: "chuck",
+}, "Invalid AxisOrient")
     
     
 class OnTheFlyMode(Enum):
@@ -993,13 +1264,19 @@ class OnTheFlyMode(Enum):
     ProbeCard = 3
 
     def to_string(self):
-        switcher = {
-            OnTheFlyMode.Lateral: "AlignDie",
-            OnTheFlyMode.Vertical: "MapScan",
-            OnTheFlyMode.Both: "Topography",
-            OnTheFlyMode.ProbeCard: "ProbeCard",
-        }
-        return switcher.get(self, "Invalid OTF mode")
+        return _ON_THE_FLY_MODE.to_string(self)
+
+    @staticmethod
+    def from_string(abbr: str) -> "OnTheFlyMode":
+        return _ON_THE_FLY_MODE.from_string(abbr)
+
+
+_ON_THE_FLY_MODE = _EnumCodec({
+    OnTheFlyMode.Lateral: "AlignDie",
+    OnTheFlyMode.Vertical: "MapScan",
+    OnTheFlyMode.Both: "Topography",
+    OnTheFlyMode.ProbeCard: "ProbeCard",
+}, "Invalid OTF mode")
 
 
 class OrientationMarker(Enum):
@@ -1021,8 +1298,17 @@ class OrientationMarker(Enum):
     Flat = 1
 
     def to_string(self):
-        switcher = {OrientationMarker.Notch: "Notch", OrientationMarker.Flat: "Flat"}
-        return switcher.get(self, "Invalid orientation marker")
+        return _ORIENTATION_MARKER.to_string(self)
+
+    @staticmethod
+    def from_string(abbr: str) -> "OrientationMarker":
+        return _ORIENTATION_MARKER.from_string(abbr)
+
+
+_ORIENTATION_MARKER = _EnumCodec({
+    OrientationMarker.Notch: "Notch",
+    OrientationMarker.Flat: "Flat",
+}, "Invalid orientation marker")
 
 
 class PathSelection(Enum):
@@ -1041,13 +1327,19 @@ class PathSelection(Enum):
     Unbinned = 3
 
     def to_string(self):
-        switcher = {
-            PathSelection.Pass: "pass",
-            PathSelection.Fail: "fail",
-            PathSelection.Undefined: "undefined",
-            PathSelection.Unbinned: "unbinned",
-        }
-        return switcher.get(self, "Invalid path selection identifier")
+        return _PATH_SELECTION.to_string(self)
+
+    @staticmethod
+    def from_string(abbr: str) -> "PathSelection":
+        return _PATH_SELECTION.from_string(abbr)
+
+
+_PATH_SELECTION = _EnumCodec({
+    PathSelection.Pass: "pass",
+    PathSelection.Fail: "fail",
+    PathSelection.Undefined: "undefined",
+    PathSelection.Unbinned: "unbinned",
+}, "Invalid path selection identifier")
     
 
 class PoiReferenceXy(Enum):
@@ -1065,11 +1357,17 @@ class PoiReferenceXy(Enum):
     StageCenter = 1
 
     def to_string(self):
-        switcher = {
-            PoiReferenceXy.DieCenter: "DieCenter",
-            PoiReferenceXy.StageCenter: "StageCenter",
-        }
-        return switcher.get(self, "Invalid stage")
+        return _POI_REFERENCE_XY.to_string(self)
+
+    @staticmethod
+    def from_string(abbr: str) -> "PoiReferenceXy":
+        return _POI_REFERENCE_XY.from_string(abbr)
+
+
+_POI_REFERENCE_XY = _EnumCodec({
+    PoiReferenceXy.DieCenter: "DieCenter",
+    PoiReferenceXy.StageCenter: "StageCenter",
+}, "Invalid stage")
 
 
 class ProjectFileInfo(Enum):
@@ -1084,11 +1382,17 @@ class ProjectFileInfo(Enum):
     FullPath = 1
 
     def to_string(self):
-        switcher = {
-            ProjectFileInfo.NameOnly: "Name",
-            ProjectFileInfo.FullPath: "FullPath",
-        }
-        return switcher.get(self, "Invalid ProjectFileInfo")
+        return _PROJECT_FILE_INFO.to_string(self)
+
+    @staticmethod
+    def from_string(abbr: str) -> "ProjectFileInfo":
+        return _PROJECT_FILE_INFO.from_string(abbr)
+
+
+_PROJECT_FILE_INFO = _EnumCodec({
+    ProjectFileInfo.NameOnly: "Name",
+    ProjectFileInfo.FullPath: "FullPath",
+}, "Invalid ProjectFileInfo")
 
 
 class PtpaType(Enum):
@@ -1103,8 +1407,17 @@ class PtpaType(Enum):
     OnAxis = 1
 
     def to_string(self):
-        switcher = {PtpaType.OffAxis: "offaxis", PtpaType.OnAxis: "onaxis"}
-        return switcher.get(self, "Invalid ptpa type")
+        return _PTPA_TYPE.to_string(self)
+
+    @staticmethod
+    def from_string(abbr: str) -> "PtpaType":
+        return _PTPA_TYPE.from_string(abbr)
+
+
+_PTPA_TYPE = _EnumCodec({
+    PtpaType.OffAxis: "offaxis",
+    PtpaType.OnAxis: "onaxis",
+}, "Invalid ptpa type")
 
 
 class SnapshotType(Enum):
@@ -1120,8 +1433,17 @@ class SnapshotType(Enum):
 
     def to_string(self):
         """Turn the SnapshotType into a string that can be used as a parameter for SENTIO's snap_image command."""
-        switcher = {SnapshotType.CameraRaw: "0", SnapshotType.WithOverlays: "1"}
-        return switcher.get(self, "Invalid SnapshotType type")
+        return _SNAPSHOT_TYPE.to_string(self)
+
+    @staticmethod
+    def from_string(abbr: str) -> "SnapshotType":
+        return _SNAPSHOT_TYPE.from_string(abbr)
+
+
+_SNAPSHOT_TYPE = _EnumCodec({
+    SnapshotType.CameraRaw: "0",
+    SnapshotType.WithOverlays: "1",
+}, "Invalid SnapshotType type")
 
 
 class SnapshotLocation(Enum):
@@ -1140,10 +1462,17 @@ class SoftContactState(Enum):
     Enable = 1
 
     def to_string(self) -> str:
-        return {
-            SoftContactState.Disable: "0",
-            SoftContactState.Enable: "1",
-        }.get(self, "Invalid SoftContactState")
+        return _SOFT_CONTACT_STATE.to_string(self)
+
+    @staticmethod
+    def from_string(abbr: str) -> "SoftContactState":
+        return _SOFT_CONTACT_STATE.from_string(abbr)
+
+
+_SOFT_CONTACT_STATE = _EnumCodec({
+    SoftContactState.Disable: "0",
+    SoftContactState.Enable: "1",
+}, "Invalid SoftContactState")
     
 
 class Stage(Enum):
@@ -1182,22 +1511,28 @@ class Stage(Enum):
     AuxiliaryScope = 12
 
     def to_string(self):
-        switcher = {
-            Stage.Chuck: "chuck",
-            Stage.Scope: "scope",
-            Stage.Vce: "vce01",
-            Stage.Vce2: "vce02",
-            Stage.Probe1: "Probe01",
-            Stage.Probe2: "Probe02",
-            Stage.Probe3: "Probe03",
-            Stage.Probe4: "Probe04",
-            Stage.BottomPlaten: "bottomplaten",
-            Stage.BottomScope: "bottomscope",
-            Stage.TopProbe: "topprobe",
-            Stage.BottomProbe: "bottomprobe",
-            Stage.AuxiliaryScope: "auxscope",
-        }
-        return switcher.get(self, "Invalid stage")
+        return _STAGE.to_string(self)
+
+    @staticmethod
+    def from_string(abbr: str) -> "Stage":
+        return _STAGE.from_string(abbr)
+
+
+_STAGE = _EnumCodec({
+    Stage.Chuck: "chuck",
+    Stage.Scope: "scope",
+    Stage.Vce: "vce01",
+    Stage.Vce2: "vce02",
+    Stage.Probe1: "Probe01",
+    Stage.Probe2: "Probe02",
+    Stage.Probe3: "Probe03",
+    Stage.Probe4: "Probe04",
+    Stage.BottomPlaten: "bottomplaten",
+    Stage.BottomScope: "bottomscope",
+    Stage.TopProbe: "topprobe",
+    Stage.BottomProbe: "bottomprobe",
+    Stage.AuxiliaryScope: "auxscope",
+}, "Invalid stage")
 
 
 class SteppingContactMode(Enum):
@@ -1214,12 +1549,18 @@ class SteppingContactMode(Enum):
     LockContact = 2
 
     def to_string(self):
-        switcher = {
-            SteppingContactMode.BackToContact: "BackToContact",
-            SteppingContactMode.StepToSeparation: "StepToSeparation",
-            SteppingContactMode.LockContact: "LockContact",
-        }
-        return switcher.get(self, "Invalid stepping mode")
+        return _STEPPING_CONTACT_MODE.to_string(self)
+
+    @staticmethod
+    def from_string(abbr: str) -> "SteppingContactMode":
+        return _STEPPING_CONTACT_MODE.from_string(abbr)
+
+
+_STEPPING_CONTACT_MODE = _EnumCodec({
+    SteppingContactMode.BackToContact: "BackToContact",
+    SteppingContactMode.StepToSeparation: "StepToSeparation",
+    SteppingContactMode.LockContact: "LockContact",
+}, "Invalid stepping mode")
 
 
 class TestSelection(Enum):
@@ -1242,14 +1583,20 @@ class TestSelection(Enum):
     All = 4
 
     def to_string(self):
-        switcher = {
-            TestSelection.Nothing: "n",
-            TestSelection.Good: "g",
-            TestSelection.GoodAndUgly: "u",
-            TestSelection.GoodUglyAndEdge: "e",
-            TestSelection.All: "a",
-        }
-        return switcher.get(self, "Invalid TestSelection")
+        return _TEST_SELECTION.to_string(self)
+
+    @staticmethod
+    def from_string(abbr: str) -> "TestSelection":
+        return _TEST_SELECTION.from_string(abbr)
+
+
+_TEST_SELECTION = _EnumCodec({
+    TestSelection.Nothing: "n",
+    TestSelection.Good: "g",
+    TestSelection.GoodAndUgly: "u",
+    TestSelection.GoodUglyAndEdge: "e",
+    TestSelection.All: "a",
+}, "Invalid TestSelection")
 
 
 class ProbePosition(Enum):
@@ -1276,17 +1623,23 @@ class ProbePosition(Enum):
     NorthWest = 7
 
     def to_string(self):
-        switcher = {
-            ProbePosition.East: "East",
-            ProbePosition.West: "West",
-            ProbePosition.North: "North",
-            ProbePosition.South: "South",
-            ProbePosition.NorthEast: "NorthEast",
-            ProbePosition.SouthEast: "SouthEast",
-            ProbePosition.SouthWest: "SouthWest",
-            ProbePosition.NorthWest: "NorthWest",
-        }
-        return switcher.get(self, "Invalid ProbePosition enumerator")
+        return _PROBE_POSITION.to_string(self)
+
+    @staticmethod
+    def from_string(abbr: str) -> "ProbePosition":
+        return _PROBE_POSITION.from_string(abbr)
+
+
+_PROBE_POSITION = _EnumCodec({
+    ProbePosition.East: "East",
+    ProbePosition.West: "West",
+    ProbePosition.North: "North",
+    ProbePosition.South: "South",
+    ProbePosition.NorthEast: "NorthEast",
+    ProbePosition.SouthEast: "SouthEast",
+    ProbePosition.SouthWest: "SouthWest",
+    ProbePosition.NorthWest: "NorthWest",
+}, "Invalid ProbePosition enumerator")
 
 
 class PtpaFindTipsMode(Enum):
@@ -1301,11 +1654,17 @@ class PtpaFindTipsMode(Enum):
     OffAxis = 1
 
     def to_string(self):
-        switcher = {
-            PtpaFindTipsMode.OnAxis: "OnAxis",
-            PtpaFindTipsMode.OffAxis: "OffAxis",
-        }
-        return switcher.get(self, "Invalid PTPA_Find_Tips_Mode function")
+        return _PTPA_FIND_TIPS_MODE.to_string(self)
+
+    @staticmethod
+    def from_string(abbr: str) -> "PtpaFindTipsMode":
+        return _PTPA_FIND_TIPS_MODE.from_string(abbr)
+
+
+_PTPA_FIND_TIPS_MODE = _EnumCodec({
+    PtpaFindTipsMode.OnAxis: "OnAxis",
+    PtpaFindTipsMode.OffAxis: "OffAxis",
+}, "Invalid PTPA_Find_Tips_Mode function")
 
 
 class RemoteCommandError:
@@ -1508,26 +1867,30 @@ class RoutingPriority(Enum):
     ColBiDir = 3
 
     def to_string(self):
-        switcher = {
-            RoutingPriority.RowUniDir: "r",
-            RoutingPriority.ColUniDir: "c",
-            RoutingPriority.RowBiDir: "wr",
-            RoutingPriority.ColBiDir: "wc",
-        }
-        return switcher.get(self, "Invalid RoutingPriority enumerator")
+        return _ROUTING_PRIORITY.to_string(self)
 
     @staticmethod
     def from_string(abbr: str):
-        mapping = {
-            "R": RoutingPriority.RowUniDir,
-            "C": RoutingPriority.ColUniDir,
-            "WR": RoutingPriority.RowBiDir,
-            "WC": RoutingPriority.ColBiDir,
-        }
-        try:
-            return mapping[abbr.upper()]
-        except KeyError:
-            raise ValueError(f"Unknown RoutingPriority abbreviation: {abbr}")
+        return _ROUTING_PRIORITY.from_string(abbr)
+
+
+_ROUTING_PRIORITY = _EnumCodec(
+    {
+        RoutingPriority.RowUniDir: "r",
+        RoutingPriority.ColUniDir: "c",
+        RoutingPriority.RowBiDir: "wr",
+        RoutingPriority.ColBiDir: "wc",
+    },
+    "Invalid RoutingPriority enumerator",
+    reverse={
+        "R": RoutingPriority.RowUniDir,
+        "C": RoutingPriority.ColUniDir,
+        "WR": RoutingPriority.RowBiDir,
+        "WC": RoutingPriority.ColBiDir,
+    },
+    fold=str.upper,
+    unknown="Unknown RoutingPriority abbreviation",
+)
 
 
 class RoutingStartPoint(Enum):
@@ -1546,26 +1909,30 @@ class RoutingStartPoint(Enum):
     LowerRight = 3
 
     def to_string(self):
-        switcher = {
-            RoutingStartPoint.UpperLeft: "ul",
-            RoutingStartPoint.UpperRight: "ur",
-            RoutingStartPoint.LowerLeft: "ll",
-            RoutingStartPoint.LowerRight: "lr",
-        }
-        return switcher.get(self, "Invalid RoutingStartPoint enumerator")
+        return _ROUTING_START_POINT.to_string(self)
 
     @staticmethod
     def from_string(abbr: str):
-        mapping = {
-            "UL": RoutingStartPoint.UpperLeft,
-            "UR": RoutingStartPoint.UpperRight,
-            "LL": RoutingStartPoint.LowerLeft,
-            "LR": RoutingStartPoint.LowerRight,
-        }
-        try:
-            return mapping[abbr.upper()]
-        except KeyError:
-            raise ValueError(f"Unknown RoutingStartPoint abbreviation: {abbr}")
+        return _ROUTING_START_POINT.from_string(abbr)
+
+
+_ROUTING_START_POINT = _EnumCodec(
+    {
+        RoutingStartPoint.UpperLeft: "ul",
+        RoutingStartPoint.UpperRight: "ur",
+        RoutingStartPoint.LowerLeft: "ll",
+        RoutingStartPoint.LowerRight: "lr",
+    },
+    "Invalid RoutingStartPoint enumerator",
+    reverse={
+        "UL": RoutingStartPoint.UpperLeft,
+        "UR": RoutingStartPoint.UpperRight,
+        "LL": RoutingStartPoint.LowerLeft,
+        "LR": RoutingStartPoint.LowerRight,
+    },
+    fold=str.upper,
+    unknown="Unknown RoutingStartPoint abbreviation",
+)
 
 
 class StatusBits:
@@ -1600,13 +1967,19 @@ class SoftwareFence(Enum):
     SoftwareLimit = 3
 
     def toSentioArg(self):
-        switcher = {
-            SoftwareFence.Disabled: "Disable",
-            SoftwareFence.Rectangle: "Rectangle",
-            SoftwareFence.Round: "Round",
-            SoftwareFence.SoftwareLimit: "SoftwareLimit",
-        }
-        return switcher.get(self, "Invalid SoftwareFence parameter")
+        return _SOFTWARE_FENCE.to_string(self)
+
+    @staticmethod
+    def from_string(abbr: str) -> "SoftwareFence":
+        return _SOFTWARE_FENCE.from_string(abbr)
+
+
+_SOFTWARE_FENCE = _EnumCodec({
+    SoftwareFence.Disabled: "Disable",
+    SoftwareFence.Rectangle: "Rectangle",
+    SoftwareFence.Round: "Round",
+    SoftwareFence.SoftwareLimit: "SoftwareLimit",
+}, "Invalid SoftwareFence parameter")
 
 
 class SubsiteGroup(Enum):
@@ -1628,15 +2001,21 @@ class SubsiteGroup(Enum):
     WaferSelected = 5
 
     def to_string(self) -> str:
-        switcher = {
-            SubsiteGroup.Present: "P",
-            SubsiteGroup.Selected: "S",
-            SubsiteGroup.GlobalPresent: "GP",
-            SubsiteGroup.GlobalSelected: "GS",
-            SubsiteGroup.WaferPresent: "WP",
-            SubsiteGroup.WaferSelected: "WS",
-        }
-        return switcher.get(self, "Invalid subsite group identifier")
+        return _SUBSITE_GROUP.to_string(self)
+
+    @staticmethod
+    def from_string(abbr: str) -> "SubsiteGroup":
+        return _SUBSITE_GROUP.from_string(abbr)
+
+
+_SUBSITE_GROUP = _EnumCodec({
+    SubsiteGroup.Present: "P",
+    SubsiteGroup.Selected: "S",
+    SubsiteGroup.GlobalPresent: "GP",
+    SubsiteGroup.GlobalSelected: "GS",
+    SubsiteGroup.WaferPresent: "WP",
+    SubsiteGroup.WaferSelected: "WS",
+}, "Invalid subsite group identifier")
     
 
 class SwapBridgeSide(Enum):    
@@ -1653,12 +2032,18 @@ class SwapBridgeSide(Enum):
     Current = 2
     
     def to_string(self):
-        switcher = {
-            SwapBridgeSide.Right: "Right",
-            SwapBridgeSide.Left: "Left",
-            SwapBridgeSide.Current: "Current",
-        }
-        return switcher.get(self, "Invalid swap bridge side.")
+        return _SWAP_BRIDGE_SIDE.to_string(self)
+
+    @staticmethod
+    def from_string(abbr: str) -> "SwapBridgeSide":
+        return _SWAP_BRIDGE_SIDE.from_string(abbr)
+
+
+_SWAP_BRIDGE_SIDE = _EnumCodec({
+    SwapBridgeSide.Right: "Right",
+    SwapBridgeSide.Left: "Left",
+    SwapBridgeSide.Current: "Current",
+}, "Invalid swap bridge side.")
     
 
 class ThermoChuckState(Enum):
@@ -1696,19 +2081,22 @@ class ThermoChuckState(Enum):
         Raises:
             ValueError: If the abbreviation is not recognized.
         """
-        mapping = {
-            "soaking": ThermoChuckState.Soaking,
-            "cooling": ThermoChuckState.Cooling,
-            "heating": ThermoChuckState.Heating,
-            "uncontrolled": ThermoChuckState.Uncontrolled,
-            "standby": ThermoChuckState.Standby,
-            "error": ThermoChuckState.Error,
-            "controlling": ThermoChuckState.Controlling,
-        }
-        try:
-            return mapping[abbr.lower()]
-        except KeyError:
-            raise ValueError(f"Unknown ThermoChuckState abbreviation: {abbr}")
+        return _THERMO_CHUCK_STATE.from_string(abbr)
+
+
+_THERMO_CHUCK_STATE = _EnumCodec(
+    reverse={
+        "soaking": ThermoChuckState.Soaking,
+        "cooling": ThermoChuckState.Cooling,
+        "heating": ThermoChuckState.Heating,
+        "uncontrolled": ThermoChuckState.Uncontrolled,
+        "standby": ThermoChuckState.Standby,
+        "error": ThermoChuckState.Error,
+        "controlling": ThermoChuckState.Controlling,
+    },
+    fold=str.lower,
+    unknown="Unknown ThermoChuckState abbreviation",
+)
 
 
 class ThetaReference(Enum):
@@ -1725,12 +2113,18 @@ class ThetaReference(Enum):
     Current = 2
 
     def to_string(self):
-        switcher = {
-            ThetaReference.Zero: "Z",
-            ThetaReference.Align: "S",
-            ThetaReference.Current: "R",
-        }
-        return switcher.get(self, "Invalid chuck theta reference")
+        return _THETA_REFERENCE.to_string(self)
+
+    @staticmethod
+    def from_string(abbr: str) -> "ThetaReference":
+        return _THETA_REFERENCE.from_string(abbr)
+
+
+_THETA_REFERENCE = _EnumCodec({
+    ThetaReference.Zero: "Z",
+    ThetaReference.Align: "S",
+    ThetaReference.Current: "R",
+}, "Invalid chuck theta reference")
 
 
 class UserCoordState(Enum):
@@ -1738,10 +2132,17 @@ class UserCoordState(Enum):
     Scope = 1
 
     def to_string(self) -> str:
-        return {
-            UserCoordState.Chuck: "chuck",
-            UserCoordState.Scope: "scope"
-        }.get(self, "Invalid UserCoordState")
+        return _USER_COORD_STATE.to_string(self)
+
+    @staticmethod
+    def from_string(abbr: str) -> "UserCoordState":
+        return _USER_COORD_STATE.from_string(abbr)
+
+
+_USER_COORD_STATE = _EnumCodec({
+    UserCoordState.Chuck: "chuck",
+    UserCoordState.Scope: "scope",
+}, "Invalid UserCoordState")
 
 
 class UvwAxis(Enum):
@@ -1758,12 +2159,18 @@ class UvwAxis(Enum):
     W = 2
 
     def to_string(self):
-        switcher = {
-            UvwAxis.U: "U",
-            UvwAxis.V: "V",
-            UvwAxis.W: "W",
-        }
-        return switcher.get(self, "Invalid UVW enumerator")
+        return _UVW_AXIS.to_string(self)
+
+    @staticmethod
+    def from_string(abbr: str) -> "UvwAxis":
+        return _UVW_AXIS.from_string(abbr)
+
+
+_UVW_AXIS = _EnumCodec({
+    UvwAxis.U: "U",
+    UvwAxis.V: "V",
+    UvwAxis.W: "W",
+}, "Invalid UVW enumerator")
     
 
 class VacuumState(Enum):
@@ -1771,21 +2178,25 @@ class VacuumState(Enum):
     On = 1
 
     def to_string(self) -> str:
-        return {
-            VacuumState.Off: "Off",
-            VacuumState.On: "On",
-        }.get(self, "Invalid VacuumState")
+        return _VACUUM_STATE.to_string(self)
 
     @staticmethod
     def from_string(abbr: str):
-        mapping = {
-            "0": VacuumState.Off,
-            "1": VacuumState.On
-        }
-        try:
-            return mapping[abbr]
-        except KeyError:
-            raise ValueError(f"Unknown VacuumState abbreviation: {abbr}")
+        return _VACUUM_STATE.from_string(abbr)
+
+
+_VACUUM_STATE = _EnumCodec(
+    {
+        VacuumState.Off: "Off",
+        VacuumState.On: "On",
+    },
+    "Invalid VacuumState",
+    reverse={
+        "0": VacuumState.Off,
+        "1": VacuumState.On,
+    },
+    unknown="Unknown VacuumState abbreviation",
+)
 
 
 class VirtualCarrierInitFlags(Enum):
@@ -1800,11 +2211,17 @@ class VirtualCarrierInitFlags(Enum):
     Continue = 1
 
     def to_string(self):
-        switcher = {
-            VirtualCarrierInitFlags.Start: "Start",
-            VirtualCarrierInitFlags.Continue: "Continue",
-        }
-        return switcher.get(self, "Invalid VirtualCarrierInitFlags")
+        return _VIRTUAL_CARRIER_INIT_FLAGS.to_string(self)
+
+    @staticmethod
+    def from_string(abbr: str) -> "VirtualCarrierInitFlags":
+        return _VIRTUAL_CARRIER_INIT_FLAGS.from_string(abbr)
+
+
+_VIRTUAL_CARRIER_INIT_FLAGS = _EnumCodec({
+    VirtualCarrierInitFlags.Start: "Start",
+    VirtualCarrierInitFlags.Continue: "Continue",
+}, "Invalid VirtualCarrierInitFlags")
 
 
 class VirtualCarrierStepProcessingState(Enum):
@@ -1820,12 +2237,18 @@ class VirtualCarrierStepProcessingState(Enum):
     Ready = 2
 
     def to_string(self):
-        switcher = {
-            VirtualCarrierStepProcessingState.Skip: "Skip",
-            VirtualCarrierStepProcessingState.Done: "Done",
-            VirtualCarrierStepProcessingState.Ready: "Ready",
-        }
-        return switcher.get(self, "Invalid VirtualCarrierStepProcessingState")
+        return _VIRTUAL_CARRIER_STEP_PROCESSING_STATE.to_string(self)
+
+    @staticmethod
+    def from_string(abbr: str) -> "VirtualCarrierStepProcessingState":
+        return _VIRTUAL_CARRIER_STEP_PROCESSING_STATE.from_string(abbr)
+
+
+_VIRTUAL_CARRIER_STEP_PROCESSING_STATE = _EnumCodec({
+    VirtualCarrierStepProcessingState.Skip: "Skip",
+    VirtualCarrierStepProcessingState.Done: "Done",
+    VirtualCarrierStepProcessingState.Ready: "Ready",
+}, "Invalid VirtualCarrierStepProcessingState")
 
 
 class WaferIdSide(Enum):
@@ -1841,11 +2264,17 @@ class WaferIdSide(Enum):
     Bottom = 1
 
     def to_string(self):
-        switcher = {
-            WaferIdSide.Top: "T",
-            WaferIdSide.Bottom: "B",
-        }
-        return switcher.get(self, "Invalid WaferIdSide")
+        return _WAFER_ID_SIDE.to_string(self)
+
+    @staticmethod
+    def from_string(abbr: str) -> "WaferIdSide":
+        return _WAFER_ID_SIDE.from_string(abbr)
+
+
+_WAFER_ID_SIDE = _EnumCodec({
+    WaferIdSide.Top: "T",
+    WaferIdSide.Bottom: "B",
+}, "Invalid WaferIdSide")
 
 
 class WaferStatusItem(Enum):
@@ -1860,11 +2289,17 @@ class WaferStatusItem(Enum):
     Orientation = 1
 
     def to_string(self):
-        switcher = {
-            WaferStatusItem.Progress: "Progress",
-            WaferStatusItem.Orientation: "Orientation",
-        }
-        return switcher.get(self, "Invalid WaferStatusItem")
+        return _WAFER_STATUS_ITEM.to_string(self)
+
+    @staticmethod
+    def from_string(abbr: str) -> "WaferStatusItem":
+        return _WAFER_STATUS_ITEM.from_string(abbr)
+
+
+_WAFER_STATUS_ITEM = _EnumCodec({
+    WaferStatusItem.Progress: "Progress",
+    WaferStatusItem.Orientation: "Orientation",
+}, "Invalid WaferStatusItem")
     
 
 class WorkArea(Enum):
@@ -1879,11 +2314,17 @@ class WorkArea(Enum):
     Offaxis = 1
 
     def to_string(self):
-        switcher = {
-            WorkArea.Probing: "Probing",
-            WorkArea.Offaxis: "Offaxis",
-        }
-        return switcher.get(self, "Invalid chuck site")
+        return _WORK_AREA.to_string(self)
+
+    @staticmethod
+    def from_string(abbr: str) -> "WorkArea":
+        return _WORK_AREA.from_string(abbr)
+
+
+_WORK_AREA = _EnumCodec({
+    WorkArea.Probing: "Probing",
+    WorkArea.Offaxis: "Offaxis",
+}, "Invalid chuck site")
 
 
 class XyCompensationType(Enum):
@@ -1903,13 +2344,19 @@ class XyCompensationType(Enum):
     Thermal = 3
 
     def to_string(self):
-        switcher = {
-            XyCompensationType.Disable: "None",
-            XyCompensationType.OnTheFly: "OnTheFly",
-            XyCompensationType.MapScan: "MapScan",
-            XyCompensationType.Thermal: "Thermal",
-        }
-        return switcher.get(self, "Invalid XyCompensationType")
+        return _XY_COMPENSATION_TYPE.to_string(self)
+
+    @staticmethod
+    def from_string(abbr: str) -> "XyCompensationType":
+        return _XY_COMPENSATION_TYPE.from_string(abbr)
+
+
+_XY_COMPENSATION_TYPE = _EnumCodec({
+    XyCompensationType.Disable: "None",
+    XyCompensationType.OnTheFly: "OnTheFly",
+    XyCompensationType.MapScan: "MapScan",
+    XyCompensationType.Thermal: "Thermal",
+}, "Invalid XyCompensationType")
 
 
 class XyReference(Enum):
@@ -1934,41 +2381,45 @@ class XyReference(Enum):
     RealPos = 6
 
     def to_string(self):
-        switcher = {
-            XyReference.Machine: "M",
-            XyReference.Home: "H",
-            XyReference.Center: "C",
-            XyReference.Zero: "Z",
-            XyReference.UserDefined: "U",
-            XyReference.Current: "R", 
-            XyReference.RealPos: "A",
-        }
-        return switcher.get(self, "Invalid xy reference")
+        return _XY_REFERENCE.to_string(self)
 
     @staticmethod
     def from_string(abbr: str) -> "XyReference":
         """ Convert a string to a XyReference. """
-        mapping = {
-            "m" :          XyReference.Machine,
-            "machine" :    XyReference.Machine,
-            "h" :          XyReference.Home,
-            "home" :       XyReference.Home,
-            "c":           XyReference.Center,
-            "center":      XyReference.Center,
-            "z":           XyReference.Zero,
-            "zero":        XyReference.Zero,
-            "u":           XyReference.UserDefined,
-            "userdefined": XyReference.UserDefined,
-            "r":           XyReference.Current, 
-            "relative":    XyReference.Current, 
-            "current":     XyReference.Current, 
-            "a":           XyReference.RealPos,
-            "realpos":     XyReference.RealPos,
-        }
-        try:
-            return mapping[abbr.lower()]
-        except KeyError:
-            raise ValueError(f"Unknown XyReference abbreviation: {abbr}")
+        return _XY_REFERENCE.from_string(abbr)
+
+
+_XY_REFERENCE = _EnumCodec(
+    {
+        XyReference.Machine: "M",
+        XyReference.Home: "H",
+        XyReference.Center: "C",
+        XyReference.Zero: "Z",
+        XyReference.UserDefined: "U",
+        XyReference.Current: "R",
+        XyReference.RealPos: "A",
+    },
+    "Invalid xy reference",
+    reverse={
+        "m": XyReference.Machine,
+        "machine": XyReference.Machine,
+        "h": XyReference.Home,
+        "home": XyReference.Home,
+        "c": XyReference.Center,
+        "center": XyReference.Center,
+        "z": XyReference.Zero,
+        "zero": XyReference.Zero,
+        "u": XyReference.UserDefined,
+        "userdefined": XyReference.UserDefined,
+        "r": XyReference.Current,
+        "relative": XyReference.Current,
+        "current": XyReference.Current,
+        "a": XyReference.RealPos,
+        "realpos": XyReference.RealPos,
+    },
+    fold=str.lower,
+    unknown="Unknown XyReference abbreviation",
+)
         
 
 class ZCompensationType(Enum):
@@ -1987,12 +2438,18 @@ class ZCompensationType(Enum):
     Topography = 2
 
     def to_string(self):
-        switcher = {
-            ZCompensationType.Disable: "None",
-            ZCompensationType.OnTheFly: "OnTheFly",
-            ZCompensationType.Topography: "Topography",
-        }
-        return switcher.get(self, "Invalid XyCompensationType")
+        return _Z_COMPENSATION_TYPE.to_string(self)
+
+    @staticmethod
+    def from_string(abbr: str) -> "ZCompensationType":
+        return _Z_COMPENSATION_TYPE.from_string(abbr)
+
+
+_Z_COMPENSATION_TYPE = _EnumCodec({
+    ZCompensationType.Disable: "None",
+    ZCompensationType.OnTheFly: "OnTheFly",
+    ZCompensationType.Topography: "Topography",
+}, "Invalid XyCompensationType")
 
 
 class ZPositionHint(Enum):
@@ -2018,31 +2475,35 @@ class ZPositionHint(Enum):
     Transfer = 5
 
     def to_string(self):
-        switcher = {
-            ZPositionHint.Default: "Default",
-            ZPositionHint.Contact: "Contact",
-            ZPositionHint.Hover: "Hover",
-            ZPositionHint.Separation: "Separation",
-            ZPositionHint.Lift: "Lift",
-            ZPositionHint.Transfer: "Transfer",
-        }
-        return switcher.get(self, "Invalid ZPositionHint")
+        return _Z_POSITION_HINT.to_string(self)
 
     @staticmethod
     def from_string(abbr: str) -> "ZPositionHint":
         """Convert a string to a ZPositionHint. """
-        mapping = {
-            "default":ZPositionHint.Default,
-            "contact":ZPositionHint.Contact,
-            "hover":ZPositionHint.Hover,
-            "separation":ZPositionHint.Separation,
-            "lift":ZPositionHint.Lift,
-            "transfer":ZPositionHint.Transfer,
-        }
-        try:
-            return mapping[abbr.lower()]
-        except KeyError:
-            raise ValueError(f"Unknown ChuckPositionHint abbreviation: {abbr}")
+        return _Z_POSITION_HINT.from_string(abbr)
+
+
+_Z_POSITION_HINT = _EnumCodec(
+    {
+        ZPositionHint.Default: "Default",
+        ZPositionHint.Contact: "Contact",
+        ZPositionHint.Hover: "Hover",
+        ZPositionHint.Separation: "Separation",
+        ZPositionHint.Lift: "Lift",
+        ZPositionHint.Transfer: "Transfer",
+    },
+    "Invalid ZPositionHint",
+    reverse={
+        "default": ZPositionHint.Default,
+        "contact": ZPositionHint.Contact,
+        "hover": ZPositionHint.Hover,
+        "separation": ZPositionHint.Separation,
+        "lift": ZPositionHint.Lift,
+        "transfer": ZPositionHint.Transfer,
+    },
+    fold=str.lower,
+    unknown="Unknown ChuckPositionHint abbreviation",
+)
 
 
 class ZReference(Enum):
@@ -2075,55 +2536,60 @@ class ZReference(Enum):
             compat_level = Compatibility.level
 
         if compat_level < CompatibilityLevel.Sentio_25_2:
-            # This is the original implementation for SENTIO <25.2. 
-            # Older versions of SENTIO are inconsistent with what they expect 
-            # as remote command parameters. Most older remote commands accept both 
-            # long and short form of the z reference although some may only work with 
-            # the long form.
-            switcher = {
-                ZReference.Contact: "C",
-                ZReference.Separation: "S",
-                ZReference.Hover: "H",
-                ZReference.Zero: "Z",
-                ZReference.Current: "R",
-                ZReference.Vce1: "VCE01",
-                ZReference.Vce2: "VCE02",
-                ZReference.Ready: "Ready",
-                ZReference.RealPos: "RealPos",
-            }
-        else:
-            # This is for SENTIO >=25.2.
-            # Newer versions of SENTIO always accept both long and short versions. 
-            # For clarity the long version is used exclusively.
-            switcher = {
-                ZReference.Contact: "Contact",
-                ZReference.Separation: "Separation",
-                ZReference.Hover: "Hover",
-                ZReference.Zero: "Zero",
-                ZReference.Current: "Current",
-                ZReference.Vce1: "VCE01",
-                ZReference.Vce2: "VCE02",
-                ZReference.Ready: "Ready",
-                ZReference.RealPos: "RealPos",
-            }
-
-        return switcher.get(self, "Invalid chuck z reference")
-    
+            return _Z_REFERENCE_SHORT.to_string(self)
+
+        return _Z_REFERENCE.to_string(self)
+
     @staticmethod
     def from_string(abbr: str) -> "ZReference":
         """ Convert a string to a ZReference. """
-        mapping = {
-            "contact" :         ZReference.Contact,
-            "separation" :      ZReference.Separation,
-            "hover":            ZReference.Hover,
-            "zero":             ZReference.Zero,
-            "current":          ZReference.Current,
-            "vce01":            ZReference.Vce1,
-            "vce02":            ZReference.Vce2,
-            "ready":            ZReference.Ready,
-            "realpos":          ZReference.RealPos,
-        }
-        try:
-            return mapping[abbr.lower()]
-        except KeyError:
-            raise ValueError(f"Unknown ZReference abbreviation: {abbr}")
+        return _Z_REFERENCE.from_string(abbr)
+
+
+# This is the original representation for SENTIO <25.2.
+# Older versions of SENTIO are inconsistent with what they expect
+# as remote command parameters. Most older remote commands accept both
+# long and short form of the z reference although some may only work with
+# the long form.
+_Z_REFERENCE_SHORT = _EnumCodec({
+    ZReference.Contact: "C",
+    ZReference.Separation: "S",
+    ZReference.Hover: "H",
+    ZReference.Zero: "Z",
+    ZReference.Current: "R",
+    ZReference.Vce1: "VCE01",
+    ZReference.Vce2: "VCE02",
+    ZReference.Ready: "Ready",
+    ZReference.RealPos: "RealPos",
+}, "Invalid chuck z reference")
+
+# This is for SENTIO >=25.2.
+# Newer versions of SENTIO always accept both long and short versions.
+# For clarity the long version is used exclusively.
+_Z_REFERENCE = _EnumCodec(
+    {
+        ZReference.Contact: "Contact",
+        ZReference.Separation: "Separation",
+        ZReference.Hover: "Hover",
+        ZReference.Zero: "Zero",
+        ZReference.Current: "Current",
+        ZReference.Vce1: "VCE01",
+        ZReference.Vce2: "VCE02",
+        ZReference.Ready: "Ready",
+        ZReference.RealPos: "RealPos",
+    },
+    "Invalid chuck z reference",
+    reverse={
+        "contact": ZReference.Contact,
+        "separation": ZReference.Separation,
+        "hover": ZReference.Hover,
+        "zero": ZReference.Zero,
+        "current": ZReference.Current,
+        "vce01": ZReference.Vce1,
+        "vce02": ZReference.Vce2,
+        "ready": ZReference.Ready,
+        "realpos": ZReference.RealPos,
+    },
+    fold=str.lower,
+    unknown="Unknown ZReference abbreviation",
+)
@@ -1,4 +1,6 @@
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Iterator
 
 from sentio_prober_control.Communication.CommunicatorBase import CommunicatorBase
 
@@ -61,6 +63,23 @@ class ProberBase(ABC):
             comm (CommunicatorBase): The communicator object.
         """
         return self.__comm
+
+
+    @contextmanager
+    def _use_comm(self, comm: CommunicatorBase) -> Iterator[None]:
+        """Temporarily replace the communicator of the prober and of all its command groups.
+
+        Args:
+            comm (CommunicatorBase): The communicator to use inside of the with block.
+
+        @private
+        """
+        previous = self.__comm
+        self.__comm = comm
+        try:
+            yield
+        finally:
+            self.__comm = previous
     
 
     @abstractmethod
@@ -1,7 +1,8 @@
 import base64
+import importlib
 import os
 import re
-from typing import Tuple, Optional, Callable, TypeVar
+from typing import Any, Dict, Iterable, Tuple, Optional, Callable, ContextManager, TypeVar, TYPE_CHECKING
 from enum import Enum
 
 from sentio_prober_control.Sentio.Enumerations import (
@@ -13,6 +14,7 @@ from sentio_prober_control.Sentio.Enumerations import (
     LoadPosition,
     Module,
     ProjectFileInfo,
+    RemoteCommandError,
     SoftContactState,
     Stage,
     SteppingContactMode,
@@ -25,15 +27,18 @@ from sentio_prober_control.Sentio.Enumerations import (
     XyReference,
     ZReference
 )
-from sentio_prober_control.Sentio.Compatibility import CompatibilityLevel, Compatibility
+from sentio_prober_control.Sentio.Compatibility import CompatibilityLevel, Compatibility, CompatibilityCache, CompatibilityWatch
+from sentio_prober_control.Sentio.PropertyCache import PropertyCache
 from sentio_prober_control.Sentio.ProberBase import ProberBase, ProberException
 from sentio_prober_control.Sentio.Response import Response
+from sentio_prober_control.Sentio.ResponseSchema import ResponseSchema
+from sentio_prober_control.Sentio.CommandBatch import CommandBatch
 from sentio_prober_control.Communication.CommunicatorBase import CommunicatorBase
-from sentio_prober_control.Communication.CommunicatorGpib import CommunicatorGpib, GpibCardVendor
+from sentio_prober_control.Communication.CommandPipeline import CommandPipeline
 from sentio_prober_control.Communication.CommunicatorTcpIp import CommunicatorTcpIp
-from sentio_prober_control.Communication.CommunicatorVisa import CommunicatorVisa
 from sentio_prober_control.Sentio.CommandGroups.AuxCommandGroup import AuxCommandGroup
 from sentio_prober_control.Sentio.CommandGroups.CompensationCommandGroup import CompensationCommandGroup
+from sentio_prober_control.Sentio.CommandGroups.ModuleCommandGroupBase import ModuleCommandGroupBase
 from sentio_prober_control.Sentio.CommandGroups.LoaderCommandGroup import LoaderCommandGroup
 from sentio_prober_control.Sentio.CommandGroups.ProbeCommandGroup import ProbeCommandGroup
 from sentio_prober_control.Sentio.CommandGroups.QAlibriaCommandGroup import QAlibriaCommandGroup
@@ -45,6 +50,26 @@ from sentio_prober_control.Sentio.CommandGroups.WafermapCommandGroup import Wafe
 from sentio_prober_control.Sentio.CommandGroups.SetupCommandGroup import SetupCommandGroup
 from sentio_prober_control.Sentio.CommandGroups.StageCommandGroup import StageCommandGroup
 from sentio_prober_control.Sentio.CommandGroups.ScopeCommandGroup import ScopeCommandGroup
+from sentio_prober_control.Sentio.CommandGroups.CommandGroupBase import LazyCommandGroup
+
+if TYPE_CHECKING:
+    from sentio_prober_control.Communication.CommunicatorGpib import GpibCardVendor
+
+
+# The GPIB and VISA communicators are imported when they are used. They used to be imported
+# by this module, so they can still be imported from here.
+_LAZY_IMPORTS = {
+    "CommunicatorGpib": "sentio_prober_control.Communication.CommunicatorGpib",
+    "GpibCardVendor": "sentio_prober_control.Communication.CommunicatorGpib",
+    "CommunicatorVisa": "sentio_prober_control.Communication.CommunicatorVisa",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_IMPORTS:
+        return getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class SentioCommunicationType(Enum):
@@ -60,7 +85,13 @@ class SentioCommunicationType(Enum):
     Gpib = 1
     Visa = 2
 
-  
+
+_CHUCK_SITE_HEIGHTS = ResponseSchema.register("set_chuck_site_heights", ChuckSite, float, float, float, float)
+_CHUCK_POSITION_HINT = ResponseSchema.register("get_chuck_position_hint", ChuckPositionHint, ChuckSite)
+_STEP_SCOPE_SITE = ResponseSchema.register("step_scope_site", str, float, float)
+_STEP_SCOPE_SITE_FIRST = ResponseSchema.register("step_scope_site_first", str, float, float)
+_STEP_SCOPE_SITE_NEXT = ResponseSchema.register("step_scope_site_next", str, float, float)
+
 
 class SentioProber(ProberBase):
     """This class represents the SENTIO probe station in python.
@@ -80,7 +111,45 @@ class SentioProber(ProberBase):
         vision (VisionCommandGroup): The vision command group provides access to the vision modules functionality.
     """
 
-    def __init__(self, comm: CommunicatorBase, compat_level : CompatibilityLevel = CompatibilityLevel.Auto) -> None:
+    wait_complete_grace: float = 10
+    """ Time in seconds wait_complete waits for SENTIO's answer in addition to the SENTIO side timeout before it gives up. """
+
+    abort_timeout: float = 10
+    """ Time in seconds to wait for the answer to abort_command when an overrunning async command is cancelled. """
+
+    compat_cache: CompatibilityCache | None = None
+    """ Cache for the compatibility level determined with CompatibilityLevel.Auto. None queries the SENTIO version on every connect. """
+
+    property_cache: PropertyCache | None = None
+    """ Cache for module properties queried with get_prop. None queries every property from SENTIO. Assign a PropertyCache to a prober to enable it. """
+
+    # Command groups are created on first access. Constructing a prober therefore only
+    # costs the *RCS 1 command and the version query.
+
+    # Standard command groups
+    aux: LazyCommandGroup[AuxCommandGroup] = LazyCommandGroup(AuxCommandGroup)
+    loader: LazyCommandGroup[LoaderCommandGroup] = LazyCommandGroup(LoaderCommandGroup)
+    map: LazyCommandGroup[WafermapCommandGroup] = LazyCommandGroup(WafermapCommandGroup)
+    probe: LazyCommandGroup[ProbeCommandGroup] = LazyCommandGroup(ProbeCommandGroup)
+    qalibria: LazyCommandGroup[QAlibriaCommandGroup] = LazyCommandGroup(QAlibriaCommandGroup)
+    service: LazyCommandGroup[ServiceCommandGroup] = LazyCommandGroup(ServiceCommandGroup)
+    siph: LazyCommandGroup[SiPHCommandGroup] = LazyCommandGroup(SiPHCommandGroup)
+    status: LazyCommandGroup[StatusCommandGroup] = LazyCommandGroup(StatusCommandGroup)
+    vision: LazyCommandGroup[VisionCommandGroup] = LazyCommandGroup(VisionCommandGroup)
+    setup: LazyCommandGroup[SetupCommandGroup] = LazyCommandGroup(SetupCommandGroup)
+
+    # Command groups for stages; Only available for Sentio > 25.2
+    scope: LazyCommandGroup[ScopeCommandGroup] = LazyCommandGroup(
+        lambda prober: ScopeCommandGroup(prober, Stage.Scope, "scope:top"), CompatibilityLevel.Sentio_25_2)
+    chuck: LazyCommandGroup[StageCommandGroup] = LazyCommandGroup(
+        lambda prober: StageCommandGroup(prober, Stage.Chuck, "chuck"), CompatibilityLevel.Sentio_25_2)
+
+    # Deprecated command groups
+    #
+    # DO NOT USE THEM IN NEW CODE! They will be removed in the future!
+    compensation: LazyCommandGroup[CompensationCommandGroup] = LazyCommandGroup(CompensationCommandGroup)
+
+    def __init__(self, comm: CommunicatorBase, compat_level : CompatibilityLevel = CompatibilityLevel.Auto, compat_cache: CompatibilityCache | None = None) -> None:
         """Construct a SENTIO prober object.
 
         The prober must be initialized with a communication object that
@@ -89,66 +158,81 @@ class SentioProber(ProberBase):
         Args:
             comm (CommunicatorBase): The communicator to use for communication with the prober.
             compat_level (CompatibilityLevel): The compatibility level to use. If CompatibilityLevel.Auto is set SENTIO is queried to figure the compatibility level out.
+            compat_cache (CompatibilityCache): Cache for the compatibility level determined with CompatibilityLevel.Auto. Defaults to SentioProber.compat_cache.
         """
         ProberBase.__init__(self, comm)
 
-        # Standard command groups
-        self.aux: AuxCommandGroup = AuxCommandGroup(self)
-        self.loader: LoaderCommandGroup = LoaderCommandGroup(self)
-        self.map: WafermapCommandGroup = WafermapCommandGroup(self)
-        self.qalibria: QAlibriaCommandGroup = QAlibriaCommandGroup(self)
-        self.service: ServiceCommandGroup = ServiceCommandGroup(self)
-        self.siph: SiPHCommandGroup = SiPHCommandGroup(self)
-        self.status: StatusCommandGroup = StatusCommandGroup(self)
-        self.vision: VisionCommandGroup = VisionCommandGroup(self)
-        self.setup: SetupCommandGroup = SetupCommandGroup(self)
-
         self.__name = "SentioProber"
+        self.__compat_cache: CompatibilityCache | None = None
+        self.__compat_watch: CompatibilityWatch | None = None
         self.comm.send("*RCS 1")  # switch to the native SENTIO remote command set
 
         # If the compatibility Level is set to Auto, we will try to determine the compatibility level
         if compat_level == CompatibilityLevel.Auto:
-            version : str = self.status.get_version()
-
-            # Extract version string
-            match = re.search(r"Version:\s*([\d\.]+)", version)
-            if match:
-                version = match.group(1)
-                parts = version.split(".")
-                major = int(parts[0]) if len(parts) > 0 else None
-                minor = int(parts[1]) if len(parts) > 1 else None
-                release = int(parts[2]) if len(parts) > 2 else None
-                if major==25 and (minor==1 or (minor==0 and release==99)):
-                    Compatibility.level = CompatibilityLevel.Sentio_25_1
-                elif major==25 and (minor==2 or (minor==1 and release==99)):
-                    Compatibility.level = CompatibilityLevel.Sentio_25_2
-                else:
-                    Compatibility.level = CompatibilityLevel.Sentio_24_0
+            cache = compat_cache if compat_cache is not None else SentioProber.compat_cache
+            station_id = self.comm.station_id if cache is not None else None
+            cached_level = cache.get(station_id) if cache is not None and station_id is not None else None
+
+            if cached_level is not None:
+                Compatibility.level = cached_level
+                self.__compat_cache = cache
+                self.__compat_watch = cache.watch(self.comm, station_id)
+            else:
+                level = SentioProber.__compat_level_from_version(self.status.get_version())
+                if level is not None:
+                    Compatibility.level = level
+                    if cache is not None and station_id is not None:
+                        cache.put(station_id, level)
 
         # make sure there is a valid compatibility level now
         assert Compatibility.level != CompatibilityLevel.Auto, "Compatibility level could not be determined. Please set it manually."
 
-        #
-        # More command groups not supported by all SENTIO versions.
-        #
-        
-        # The probe command group has optional sub-groups for top and bottom 
-        # probes. These are only available for Sentio > 25.2. Therefore 
-        # this command group must be initialized after determining the 
-        # compatibility level.
-        self.probe: ProbeCommandGroup = ProbeCommandGroup(self)
 
-        # Command groups for stages; Only available for Sentio > 25.2
-        if Compatibility.level >= CompatibilityLevel.Sentio_25_2:
-            self.scope: ScopeCommandGroup = ScopeCommandGroup(self, Stage.Scope, "scope:top")
-            self.chuck: StageCommandGroup = StageCommandGroup(self, Stage.Chuck, "chuck")
+    @property
+    def comm(self) -> CommunicatorBase:
+        """Get the communicator object.
+
+        If the compatibility level was taken from the compat_cache and SENTIO reported an
+        unknown or unsupported command since, the SENTIO version is queried again first.
+
+        Returns:
+            comm (CommunicatorBase): The communicator object.
+        """
+        if self.__compat_watch is not None and self.__compat_watch.revalidation_due:
+            self.__revalidate_compat_level()
+
+        return ProberBase.comm.fget(self)
+
 
-        #
-        # Deprecated command groups
-        #
-        # DO NOT USE THEM IN NEW CODE! They will be removed in the future!
+    def __revalidate_compat_level(self) -> None:
+        watch = self.__compat_watch
+        self.__compat_watch = None
+        watch.close()
 
-        self.compensation: CompensationCommandGroup = CompensationCommandGroup(self)
+        level = SentioProber.__compat_level_from_version(self.status.get_version())
+        if level is not None:
+            Compatibility.level = level
+            self.__compat_cache.put(watch.station_id, level)
+
+
+    @staticmethod
+    def __compat_level_from_version(version: str) -> CompatibilityLevel | None:
+        # Extract version string
+        match = re.search(r"Version:\s*([\d\.]+)", version)
+        if not match:
+            return None
+
+        version = match.group(1)
+        parts = version.split(".")
+        major = int(parts[0]) if len(parts) > 0 else None
+        minor = int(parts[1]) if len(parts) > 1 else None
+        release = int(parts[2]) if len(parts) > 2 else None
+        if major==25 and (minor==1 or (minor==0 and release==99)):
+            return CompatibilityLevel.Sentio_25_1
+        elif major==25 and (minor==2 or (minor==1 and release==99)):
+            return CompatibilityLevel.Sentio_25_2
+        else:
+            return CompatibilityLevel.Sentio_24_0
 
 
     def abort_command(self, cmd_id: int) -> Response:
@@ -183,7 +267,7 @@ class SentioProber(ProberBase):
 
 
     @staticmethod
-    def create_prober(comm_type : str | SentioCommunicationType, arg1 : str | GpibCardVendor = "127.0.0.1:35555", arg2 : str = "") -> 'SentioProber':
+    def create_prober(comm_type : str | SentioCommunicationType, arg1 : "str | GpibCardVendor" = "127.0.0.1:35555", arg2 : str = "") -> 'SentioProber':
         """ Create an instance of a SentioProber object that is bound to a certain communication method. Your choices of communication are tcpip, gpib and visa.
          
             Args:
@@ -201,11 +285,15 @@ class SentioProber(ProberBase):
             
             return SentioProber(CommunicatorTcpIp.create(arg1))
         elif comm_type == "gpib" or comm_type == SentioCommunicationType.Gpib:
+            from sentio_prober_control.Communication.CommunicatorGpib import CommunicatorGpib, GpibCardVendor
+
             if not isinstance(arg1, GpibCardVendor):
                 raise ValueError(f"Invalid argument for gpib communication: {arg1}. Expected a GpibCardVendor specification (either NI or ADLINK).")
 
             return SentioProber(CommunicatorGpib.create(arg1, arg2))
         elif comm_type == "visa" or comm_type == SentioCommunicationType.Visa:
+            from sentio_prober_control.Communication.CommunicatorVisa import CommunicatorVisa
+
             if not isinstance(arg1, str):
                 raise ValueError(f"Invalid argument for VISA communication: {arg1}. Expected a string containing a VISA resource identifier. i.e.: \"GPIB0::20::INSTR\".")
 
@@ -214,6 +302,30 @@ class SentioProber(ProberBase):
             raise ValueError(f'Unknown prober type: "{comm_type}"')
 
 
+    def deadline(self, timeout: float | None) -> ContextManager[None]:
+        """Set a deadline for all remote commands inside of a with block.
+
+        This applies to the functions of the prober object and of all command groups. A
+        TimeoutError is raised by the first command that does not get its response before
+        the deadline.
+
+        Example:
+
+        ```py
+        with prober.deadline(30):
+            prober.map.step_first_die()
+            prober.vision.auto_focus()
+        ```
+
+        Args:
+            timeout (float): The time in seconds from now until the deadline. None does not set a deadline.
+
+        Returns:
+            A context manager.
+        """
+        return self.comm.deadline(timeout)
+
+
     def enable_chuck_overtravel(self, stat: bool) -> None:
 
         """Enable chuck overtravel.
@@ -288,26 +400,45 @@ class SentioProber(ProberBase):
         Response.check_resp(self.comm.read_line())
 
 
-    def file_transfer(self, source: str, dest: str) -> None:
+    def file_transfer(self, source: str, dest: str, progress: Callable[[int, int], None] | None = None, chunk_size: int = 3 * 2**18) -> None:
 
         """Transfer a file to the prober.
 
         This function will transfer a file to the prober. The file will be stored in the position specified by
         the dest argument. Transmission of the file may take some time.
 
+        The file is read and base64 encoded in blocks that are sent as soon as they are encoded. Memory
+        usage does not depend on the file size.
+
         Args:
             source (str): The path to the file to transfer.
             dest (str): The destination path on the prober. Must be a complete path including file name. Make sure that SENTIO has write access to the given destination.
+            progress (Callable[[int, int], None]): An optional callback. It is called after each block with the number of bytes sent so far and the file size.
+            chunk_size (int): The number of file bytes encoded per block. Must be a multiple of 3 so that the encoded blocks can be concatenated.
         """
 
         # open file and encode with base64
         if not os.path.isfile(source):
             raise ProberException(f"File {source} not found!")
 
-        file_bytes = open(source, "rb").read()
-        encoded = base64.b64encode(file_bytes).decode("ascii")
+        if chunk_size <= 0 or chunk_size % 3 != 0:
+            raise ValueError("chunk_size must be a positive multiple of 3!")
+
+        total = os.path.getsize(source)
+
+        def chunks(f):
+            yield f"file_transfer {dest}, ".encode()
+
+            done = 0
+            while block := f.read(chunk_size):
+                yield base64.b64encode(block)
+                done += len(block)
+                if progress is not None:
+                    progress(done, total)
+
+        with open(source, "rb") as f:
+            self.comm.send_chunks(chunks(f))
 
-        self.comm.send(f"file_transfer {dest}, {encoded}")
         Response.check_resp(self.comm.read_line())
 
 
@@ -334,12 +465,10 @@ class SentioProber(ProberBase):
         self.comm.send("get_chuck_site_heights {0}".format(site.to_string()))
         resp = Response.check_resp(self.comm.read_line())
 
-        tok = resp.message().split(",")
-
-        contact = float(tok[0])
-        separation = float(tok[1])
-        overtravel_gap = float(tok[2])
-        hover_gap = float(tok[3])
+        contact = resp.float_at(0)
+        separation = resp.float_at(1)
+        overtravel_gap = resp.float_at(2)
+        hover_gap = resp.float_at(3)
 
         return contact, separation, overtravel_gap, hover_gap
 
@@ -361,7 +490,7 @@ class SentioProber(ProberBase):
         self.comm.send("get_chuck_site_status {0}".format(site.to_string()))
         resp = Response.check_resp(self.comm.read_line())
 
-        tok = resp.message().split(",")
+        tok = resp.fields()
 
         def str_to_bool(v: str):
             if v == "0":
@@ -421,8 +550,7 @@ class SentioProber(ProberBase):
             self.comm.send(f"get_chuck_xy {site.to_string()}, {ref.to_string()}")
 
         resp = Response.check_resp(self.comm.read_line())
-        tok = resp.message().split(",")
-        return float(tok[0]), float(tok[1])
+        return resp.floats(2)
 
 
     def get_chuck_xy_pos(self) -> Tuple[float, float]:
@@ -435,9 +563,8 @@ class SentioProber(ProberBase):
         """
         self.comm.send("get_chuck_xy")
         resp = Response.check_resp(self.comm.read_line())
-        tok = resp.message().split(",")
-        curX = float(tok[0])
-        curY = float(tok[1])
+        curX = resp.float_at(0)
+        curY = resp.float_at(1)
         return curX, curY
 
 
@@ -491,8 +618,7 @@ class SentioProber(ProberBase):
 
         self.comm.send("get_scope_xy")
         resp = Response.check_resp(self.comm.read_line())
-        tok = resp.message().split(",")
-        return float(tok[0]), float(tok[1])
+        return resp.floats(2)
 
 
     def get_scope_z(self) -> float:
@@ -530,7 +656,7 @@ class SentioProber(ProberBase):
 
         self.comm.send(f"get_scope_site {idx}")
         resp = Response.check_resp(self.comm.read_line())
-        tok = resp.message().split(",")
+        tok = resp.fields()
 
         id = tok[0]
         x = float(tok[1])
@@ -687,8 +813,7 @@ class SentioProber(ProberBase):
 
         self.comm.send("move_chuck_home ")
         resp = Response.check_resp(self.comm.read_line())
-        tok = resp.message().split(",")
-        return float(tok[0]), float(tok[1])
+        return resp.floats(2)
 
 
     def move_chuck_load(self, pos: LoadPosition) -> None:
@@ -734,8 +859,7 @@ class SentioProber(ProberBase):
         """
         self.comm.send("move_chuck_site {0}".format(site.to_string()))
         resp = Response.check_resp(self.comm.read_line())
-        tok = resp.message().split(",")
-        return float(tok[0]), float(tok[1]), float(tok[2]), float(tok[3])
+        return resp.floats(4)
 
 
     def move_chuck_theta(self, ref: ThetaReference, angle: float) -> float:
@@ -773,8 +897,7 @@ class SentioProber(ProberBase):
         self.comm.send(f"move_chuck_xy {ref.to_string()}, {x}, {y}")
         resp = Response.check_resp(self.comm.read_line())
 
-        tok = resp.message().split(",")
-        return float(tok[0]), float(tok[1])
+        return resp.floats(2)
 
 
     def move_chuck_z(self, ref: ZReference, z: float) -> float:
@@ -841,8 +964,7 @@ class SentioProber(ProberBase):
         self.comm.send(f"move_scope_xy {ref.to_string()}, {x}, {y}")
         resp = Response.check_resp(self.comm.read_line())
 
-        tok = resp.message().split(",")
-        return float(tok[0]), float(tok[1])
+        return resp.floats(2)
 
 
     def move_scope_lift(self, state: bool):
@@ -928,6 +1050,120 @@ class SentioProber(ProberBase):
         self.comm.send(f"open_project {project}, {restore_heights}")
         Response.check_resp(self.comm.read_line())
 
+    def pipeline(self, depth: int = 16) -> CommandPipeline:
+        """Create a command pipeline for sending many independent remote commands.
+
+        A pipeline keeps up to depth commands in flight and avoids paying one full network
+        round trip per command. Each submitted command returns a handle whose result()
+        method returns the Response object of the command. Error responses raise a
+        ProberException when result() is called.
+
+        Do not call other wrapper functions while the pipeline has commands in flight.
+        Leaving the with block reads all outstanding responses.
+
+        Example:
+
+        ```py
+        with prober.pipeline(32) as pipe:
+            handles = [pipe.submit(f"map:bins:get_bin {c}, {r}") for c, r in dies]
+
+        bins = [int(h.result().message()) for h in handles]
+        ```
+
+        Args:
+            depth: The maximum number of commands in flight.
+
+        Returns:
+            A CommandPipeline bound to the communicator of this prober.
+        """
+        return CommandPipeline(self.comm, depth, Response.check_resp)
+
+
+    def batch(self, depth: int = 64) -> CommandBatch:
+        """Create a batch that collects wrapper calls and sends their commands together.
+
+        Wrapper functions called on the batch return a BatchCall handle instead of their
+        result. When the with block is left the wrappers are executed on this prober, their
+        commands are sent with as few socket writes as possible, the responses are read and
+        the wrappers complete. This is meant for setup phases with many independent commands.
+
+        Example:
+
+        ```py
+        with prober.batch() as batch:
+            for i, (x, y) in enumerate(positions):
+                batch.map.subsites.add(f"S{i}", x, y)
+            for idx, desc, quality, color in bins:
+                batch.map.bins.set_bin_info(idx, desc, quality, color)
+
+        print(len(batch.responses))
+        ```
+
+        Args:
+            depth: The maximum number of responses outstanding at any time.
+
+        Returns:
+            A CommandBatch bound to the communicator of this prober.
+        """
+        return CommandBatch(self, depth)
+
+
+    def get_props(self, props: Iterable[Tuple[Any, ...]], depth: int = 16) -> Dict[Tuple[Any, ...], Any]:
+        """Query many module properties with a single pipelined exchange.
+
+        Each property is given as a tuple of the module abbreviation, the property name and
+        an optional parameter. The queries are sent through a command pipeline so that all
+        of them together cost about one network round trip. The values are converted like
+        in ModuleCommandGroupBase.get_prop and the property_cache is used if it is set.
+
+        Example:
+
+        ```py
+        props = prober.get_props([("map", "grid_chuck_mode"), ("map", "chuck_to_wafer_offset"), ("vis", "light", "scope")])
+        if props[("map", "grid_chuck_mode")]:
+            ...
+        ```
+
+        Args:
+            props: The properties to query as (module, prop_name) or (module, prop_name, arg1) tuples.
+            depth: The maximum number of queries in flight.
+
+        Returns:
+            A dictionary with the value of each property. The keys are the tuples passed in props.
+
+        Raises:
+            ProberException: If one of the queries failed. All responses are read before the exception is raised.
+        """
+        cache = self.property_cache
+        values: Dict[Tuple[Any, ...], Any] = {}
+        pending = []
+
+        with self.pipeline(depth) as pipe:
+            for key in props:
+                if key in values:
+                    continue
+
+                abbr, prop_name = key[0], key[1]
+                arg = ModuleCommandGroupBase._prop_arg(key[2] if len(key) > 2 else None)
+                if cache is not None:
+                    value = cache.lookup(abbr, prop_name, arg)
+                    if value is not PropertyCache.MISSING:
+                        values[key] = value
+                        continue
+
+                values[key] = None
+                pending.append((key, arg, pipe.submit(ModuleCommandGroupBase._get_prop_cmd(abbr, prop_name, arg))))
+
+        for key, arg, handle in pending:
+            value = ModuleCommandGroupBase._parse_prop(key[0], key[1], handle.result())
+            if cache is not None:
+                cache.store(key[0], key[1], arg, value)
+
+            values[key] = value
+
+        return values
+
+
     def query_command_status(self, cmd_id: int) -> Response:
         """Query the status of an async command.
 
@@ -994,7 +1230,7 @@ class SentioProber(ProberBase):
         Response.check_resp(self.comm.read_line())
 
 
-    def send_cmd(self, cmd: str) -> Response:
+    def send_cmd(self, cmd: str, timeout: float | None = None) -> Response:
         """Sends a command to the prober and return a response object.
 
         This function is intended for directly sending remote commands that
@@ -1006,20 +1242,25 @@ class SentioProber(ProberBase):
         It will then return a Response object with the extracted data from
         SENTIO's response.
 
+        Args:
+            cmd (str): The remote command to send.
+            timeout (float): An optional time in seconds after which waiting for the response is aborted with a TimeoutError.
+
         Returns:
             A response object with the result of the command.
         """
     
-        self.comm.send(cmd)
-        
-        if '*' in cmd and '?' in cmd:
-            return Response(0,0,0,self.comm.read_line())
+        with self.comm.deadline(timeout):
+            self.comm.send(cmd)
+            
+            if '*' in cmd and '?' in cmd:
+                return Response(0,0,0,self.comm.read_line())
 
-        elif '*' in cmd:
-            return Response(0,0,0,"")
-        
-        else:
-            return Response.check_resp(self.comm.read_line())
+            elif '*' in cmd:
+                return Response(0,0,0,"")
+            
+            else:
+                return Response.check_resp(self.comm.read_line())
 
     def set_chuck_site_height(
         self,
@@ -1054,14 +1295,7 @@ class SentioProber(ProberBase):
 
         self.comm.send(f"set_chuck_site_heights {site.to_string()},{contact},{separation},{overtravel_dist},{hover_gap}")
         resp = Response.check_resp(self.comm.read_line())        
-        tok = resp.message().split(",")
-        site = ChuckSite[tok[0]]
-        contact = float(tok[1])
-        separation = float(tok[2])
-        overtravel_dist = float(tok[3])
-        hover_gap = float(tok[4])
-
-        return site, contact, separation, overtravel_dist, hover_gap
+        return _CHUCK_SITE_HEIGHTS.parse(resp)
 
 
     def set_ink(self, idx_inker : int) -> None:
@@ -1225,22 +1459,90 @@ class SentioProber(ProberBase):
         return Response.check_resp(self.comm.read_line())
 
 
-    def wait_complete(self, id_or_resp: int | Response, timeout: int = 300) -> Response:
+    def wait_complete(self, id_or_resp: int | Response, timeout: int = 300, abort_on_timeout: bool = True) -> Response:
         """Wait for a single async command to complete.
 
+        If SENTIO does not answer within timeout plus wait_complete_grace seconds a TimeoutError
+        is raised. An active deadline (see deadline()) may shorten this.
+
         Args:
             cmd_id: The id of the async command to wait for.
             timeout: The timeout in seconds.
+            abort_on_timeout: If True the async command is aborted with abort_command when it
+                              does not complete in time.
 
         Returns:
             A response object with the result of the command.
         """
-        if isinstance(id_or_resp, Response):
-            self.comm.send(f"wait_complete {id_or_resp.cmd_id()}, {timeout}")    
-        else:
-            self.comm.send(f"wait_complete {id_or_resp}, {timeout}")
+        cmd_id = id_or_resp.cmd_id() if isinstance(id_or_resp, Response) else id_or_resp
+        self.comm.send(f"wait_complete {cmd_id}, {timeout}")
 
-        return Response.check_resp(self.comm.read_line())
+        try:
+            with self.comm.deadline(timeout + self.wait_complete_grace):
+                resp = Response.parse_resp(self.comm.read_line())
+        except TimeoutError:
+            if abort_on_timeout:
+                self.__abort_overrun(cmd_id, self.comm.reclaim_response())
+            raise
+
+        if not resp.ok():
+            if abort_on_timeout and resp.errc() == RemoteCommandError.Timeout:
+                self.__abort_overrun(cmd_id)
+            resp.check()
+
+        return resp
+
+
+    def __abort_overrun(self, cmd_id: int, late_response: bool = False) -> None:
+        """Abort an async command whose wait_complete did not succeed.
+
+        Args:
+            cmd_id (int): The id of the async command.
+            late_response (bool): True if the response to wait_complete is still outstanding and
+                                  was reclaimed from the communicator. It is read together with
+                                  the response to abort_command. Otherwise the communicator
+                                  discards it when it arrives.
+        """
+        # Best effort. The original error is more relevant to the caller than a failed abort.
+        try:
+            with self.comm.deadline(self.abort_timeout):
+                if not late_response:
+                    self.abort_command(cmd_id)
+                    return
+
+                self.comm.send(f"abort_command {cmd_id}")
+                self.__read_abort_responses(cmd_id)
+        except (TimeoutError, ProberException):
+            pass
+
+
+    def __read_abort_responses(self, cmd_id: int) -> Response:
+        """Read the late response to wait_complete and the response to abort_command.
+
+        SENTIO may answer the two commands in either order. The answer to wait_complete
+        carries the id of the async command, the answer to abort_command does not. If both
+        or none carry it the arrival order decides.
+
+        Returns:
+            The response to abort_command.
+        """
+        responses = []
+        try:
+            for _ in range(2):
+                responses.append(Response.parse_resp(self.comm.read_line()))
+        except TimeoutError:
+            # The communicator discards the line that timed out. If it was the first one
+            # the other one is still outstanding and must be discarded too.
+            if not responses:
+                self.comm.discard_response()
+            raise
+
+        first, second = responses
+        if second.cmd_id() == cmd_id and first.cmd_id() != cmd_id:
+            first, second = second, first
+
+        second.check()
+        return second
 
 
     def get_scope_home(self) -> tuple[float, float]:
@@ -1255,9 +1557,8 @@ class SentioProber(ProberBase):
         resp = Response.check_resp(self.comm.read_line())
 
         # Parse response message
-        tok = resp.message().split(",")
-        home_x = float(tok[0])
-        home_y = float(tok[1])
+        home_x = resp.float_at(0)
+        home_y = resp.float_at(1)
         return home_x, home_y
 
 
@@ -1295,14 +1596,7 @@ class SentioProber(ProberBase):
         """
         self.comm.send(f"step_scope_site {site_index}")
         resp = Response.check_resp(self.comm.read_line())
-
-        # Parse response message
-        tok = resp.message().split(",")
-        site_id = tok[0]
-        offset_x = float(tok[1])
-        offset_y = float(tok[2])
-
-        return site_id, offset_x, offset_y
+        return _STEP_SCOPE_SITE.parse(resp)
 
 
     def step_scope_site_first(self) -> tuple[str, float, float]:
@@ -1316,14 +1610,7 @@ class SentioProber(ProberBase):
         """
         self.comm.send("step_scope_site_first")
         resp = Response.check_resp(self.comm.read_line())
-
-        # Parse response message
-        tok = resp.message().split(",")
-        site_id = tok[0]
-        offset_x = float(tok[1])
-        offset_y = float(tok[2])
-
-        return site_id, offset_x, offset_y
+        return _STEP_SCOPE_SITE_FIRST.parse(resp)
 
     def step_scope_site_next(self) -> tuple[str, float, float]:
         """Steps the scope to the next site and sets it as the current site.
@@ -1336,14 +1623,7 @@ class SentioProber(ProberBase):
         """
         self.comm.send("step_scope_site_next")
         resp = Response.check_resp(self.comm.read_line())
-
-        # Parse response message
-        tok = resp.message().split(",")
-        site_id = tok[0]
-        offset_x = float(tok[1])
-        offset_y = float(tok[2])
-
-        return site_id, offset_x, offset_y
+        return _STEP_SCOPE_SITE_NEXT.parse(resp)
 
     def get_chuck_position_hint(self) -> tuple[ChuckPositionHint, ChuckSite]:
         """Get a verbal representation of the current chuck position and the active site.
@@ -1354,16 +1634,7 @@ class SentioProber(ProberBase):
         """
         self.comm.send("get_chuck_position_hint")
         resp = Response.check_resp(self.comm.read_line())
-
-        # Parse response message
-        tok = resp.message().split(",")
-        pos_hint_str = tok[0]
-        site_str = tok[1]
-
-        pos_hint = ChuckPositionHint.from_string(pos_hint_str)
-        site = ChuckSite.from_string(site_str)
-
-        return pos_hint, site
+        return _CHUCK_POSITION_HINT.parse(resp)
 
     def get_chuck_site_count(self) -> int:
         """Retrieve the number of chuck sites.
@@ -1377,8 +1648,7 @@ class SentioProber(ProberBase):
         resp = Response.check_resp(self.comm.read_line())
 
         # Parse response message
-        tok = resp.message().split(",")
-        count = int(tok[0])
+        count = resp.int_at(0)
 
         return count
 
@@ -1399,8 +1669,7 @@ class SentioProber(ProberBase):
         resp = Response.check_resp(self.comm.read_line())
 
         # Parse response message
-        tok = resp.message().split(",")
-        index = int(tok[0])
+        index = resp.int_at(0)
 
         return index
 
@@ -1439,10 +1708,9 @@ class SentioProber(ProberBase):
             self.comm.send("get_chuck_site_pos")
 
         resp = Response.check_resp(self.comm.read_line())
-        tok = resp.message().split(",")
-        home_x = float(tok[0])
-        home_y = float(tok[1])
-        angle = float(tok[2])
+        home_x = resp.float_at(0)
+        home_y = resp.float_at(1)
+        angle = resp.float_at(2)
         return home_x, home_y, angle
 
     def get_chuck_speed(self) -> ChuckSpeed:
@@ -1453,9 +1721,7 @@ class SentioProber(ProberBase):
         """
         self.comm.send("get_chuck_speed")
         resp = Response.check_resp(self.comm.read_line())
-        speed_str = resp.message().split(",")[0]
-
-        speed = ChuckSpeed.from_string(speed_str)
+        speed = ChuckSpeed.from_string(resp.fields()[0])
 
         return speed
 
@@ -1475,9 +1741,7 @@ class SentioProber(ProberBase):
             self.comm.send("get_vacuum_status")
 
         resp = Response.check_resp(self.comm.read_line())
-        status = resp.message().split(",")[0]
-
-        return VacuumState.from_string(status)
+        return VacuumState.from_string(resp.fields()[0])
     
     def get_wafer_diameter(self) -> float:
         """Get the diameter of wafer on chuck.
@@ -1504,8 +1768,7 @@ class SentioProber(ProberBase):
         resp = Response.check_resp(self.comm.read_line())
 
         # Parse response message
-        tok = resp.message().split(",")
-        z_pos = float(tok[0])
+        z_pos = resp.float_at(0)
 
         return z_pos
 
@@ -1527,9 +1790,8 @@ class SentioProber(ProberBase):
         resp = Response.check_resp(self.comm.read_line())
 
         # Parse response message
-        tok = resp.message().split(",")
-        new_x = float(tok[0])
-        new_y = float(tok[1])
+        new_x = resp.float_at(0)
+        new_y = resp.float_at(1)
 
         return new_x, new_y
 
@@ -1720,7 +1982,7 @@ class SentioProber(ProberBase):
         resp = Response.check_resp(self.comm.read_line())
 
         # Parse response message
-        tok = resp.message().split(",")
+        tok = resp.fields()
         full_path = tok[0]
 
         return full_path
@@ -1733,8 +1995,7 @@ class SentioProber(ProberBase):
         """
         self.comm.send("get_indexer_pos")
         resp = Response.check_resp(self.comm.read_line())
-        location, position = resp.message().split(",")
-        return int(location), position
+        return resp.int_at(0), resp.fields()[1]
 
     def indexer_cda(self, on: bool) -> None:
         """Turn indexer CDA on or off.
@@ -1867,8 +2128,7 @@ class SentioProber(ProberBase):
         """
         self.comm.send(f"get_door_status {door.lower()}")
         resp = Response.check_resp(self.comm.read_line())
-        closed, locked = resp.message().split(",")
-        return closed == "1", locked == "1"
+        return resp.bool_at(0), resp.bool_at(1)
 
     def set_door_lock(self, door: str, lock: bool) -> None:
         """Locks or unlocks the specified door.
@@ -0,0 +1,136 @@
+import math
+import time
+from typing import Any, Dict, Tuple
+
+
+class PropertyCache:
+    """Keeps the values of module properties for a limited time.
+
+    Scripts often poll the same module properties (i.e. chuck_to_wafer_offset or
+    grid_chuck_mode) again and again. With a property cache ModuleCommandGroupBase.get_prop
+    answers repeated queries from the cache instead of sending a remote command each time.
+
+    A cached value is used until its time to live has passed. Setting a property with
+    set_prop removes all cached values of that property. Wrappers of commands that change
+    properties as a side effect remove the values of their module (i.e. map.set_grid_origin,
+    map.set_home_die, map.create or vision.align_wafer remove all wafermap properties), so
+    changes made through the prober object are seen immediately. Changes made by other
+    means (i.e. in the SENTIO user interface or with send_cmd) are only seen after the time
+    to live has passed. Call clear() after such changes and only use math.inf for properties
+    that are never changed by other means.
+
+    The cache is disabled by default. Enable it by assigning it to a prober:
+
+    ```py
+    prober.property_cache = PropertyCache(default_ttl=2.0)
+    prober.property_cache.set_ttl("grid_chuck_mode", math.inf)  # cache until the prober changes it
+    prober.property_cache.set_ttl("die_reference", 0)           # never cache
+    ```
+    """
+
+    MISSING: Any = object()
+    """ Returned by lookup when there is no valid entry. """
+
+    def __init__(self, default_ttl: float = 1.0, ttls: Dict[str, float] | None = None) -> None:
+        """Create an empty property cache.
+
+        Args:
+            default_ttl (float): The time in seconds a property value is used before it is queried again.
+            ttls (Dict[str, float]): Time to live for individual properties, by property name. Overrides default_ttl.
+        """
+        self.__default_ttl = default_ttl
+        self.__ttls: Dict[str, float] = dict(ttls) if ttls is not None else {}
+        self.__entries: Dict[Tuple[str, str, str], Tuple[float, Any]] = {}
+        self.__hits = 0
+        self.__misses = 0
+
+
+    @property
+    def default_ttl(self) -> float:
+        """The time in seconds a property value is used when no time to live is set for the property."""
+        return self.__default_ttl
+
+
+    @property
+    def hits(self) -> int:
+        """The number of queries answered from the cache."""
+        return self.__hits
+
+
+    @property
+    def misses(self) -> int:
+        """The number of queries that were not answered from the cache."""
+        return self.__misses
+
+
+    def set_ttl(self, prop_name: str, ttl: float) -> None:
+        """Set the time to live of a property.
+
+        Args:
+            prop_name (str): The name of the property.
+            ttl (float): Time in seconds. Use 0 to never cache the property and math.inf to keep it until it is set.
+        """
+        self.__ttls[prop_name] = ttl
+        self.invalidate(prop_name)
+
+
+    def lookup(self, module: str, prop_name: str, arg: str) -> Any:
+        """Return the cached value of a property.
+
+        Args:
+            module (str): The abbreviation of the module (i.e. "map").
+            prop_name (str): The name of the property.
+            arg (str): The formatted argument of the property. Empty if there is none.
+
+        Returns:
+            The cached value or PropertyCache.MISSING.
+        """
+        entry = self.__entries.get((module, prop_name, arg))
+        if entry is not None and entry[0] > time.monotonic():
+            self.__hits += 1
+            return entry[1]
+
+        self.__misses += 1
+        return PropertyCache.MISSING
+
+
+    def store(self, module: str, prop_name: str, arg: str, value: Any) -> None:
+        """Store the value of a property.
+
+        Args:
+            module (str): The abbreviation of the module (i.e. "map").
+            prop_name (str): The name of the property.
+            arg (str): The formatted argument of the property. Empty if there is none.
+            value (Any): The value.
+        """
+        ttl = self.__ttls.get(prop_name, self.__default_ttl)
+        if ttl <= 0:
+            return
+
+        self.__entries[(module, prop_name, arg)] = (math.inf if ttl == math.inf else time.monotonic() + ttl, value)
+
+
+    def invalidate(self, prop_name: str, module: str | None = None) -> None:
+        """Remove the cached values of a property for all arguments.
+
+        Args:
+            prop_name (str): The name of the property.
+            module (str): The abbreviation of the module. None removes the property of all modules.
+        """
+        for key in [k for k in self.__entries if k[1] == prop_name and (module is None or k[0] == module)]:
+            del self.__entries[key]
+
+
+    def invalidate_module(self, module: str) -> None:
+        """Remove the cached values of all properties of a module.
+
+        Args:
+            module (str): The abbreviation of the module (i.e. "map").
+        """
+        for key in [k for k in self.__entries if k[0] == module]:
+            del self.__entries[key]
+
+
+    def clear(self) -> None:
+        """Remove all cached values."""
+        self.__entries.clear()
@@ -1,3 +1,6 @@
+import binascii
+from typing import Any, Callable, Iterable, Tuple
+
 from sentio_prober_control.Sentio.ProberBase import ProberException
 
 
@@ -7,8 +10,17 @@ class Response:
     Sentio's remote command response is a comma separated string that contains three fields
     which represent 4 data items. (error code and status code are combined)
 
+    The fields of the message are split only once when they are first requested by one of the
+    typed accessors (fields, ints, floats, int_at, float_at and bool_at). Wrappers usually
+    read several fields of the same response one by one, which then costs a single split.
+
+    Responses are kept in large numbers by pipelines, batches and recordings, therefore the
+    class declares __slots__. This reduces the size of a response object from 168 to 136 bytes
+    (see benchmarks/bench_response.py). It does not make parsing faster.
     """
 
+    __slots__ = ("__errc", "__stat", "__cmd_id", "__msg", "__fields")
+
     def __init__(self, errc: int, stat: int, cmd_id: int, msg: str):
         """Creates a new Response object.
 
@@ -22,6 +34,7 @@ class Response:
         self.__stat = stat
         self.__cmd_id = cmd_id
         self.__msg = msg
+        self.__fields: Tuple[str, ...] | None = None
 
 
     @staticmethod
@@ -36,23 +49,81 @@ class Response:
         - an async command id (only used by async commands)
         - a response message
 
+        The response may also be given as raw bytes (i.e. from CommunicatorBase.read_line_bytes).
+        In this case the message is only decoded when it is requested.
+
         Returns:
             response (Resppnse): A Response object created from the information in SENTIO's response string.
         """
-        tok = resp.split(",", 2)
+        if resp.__class__ is str:
+            tok = resp.split(",", 2)
+        else:
+            tok = bytes(resp).split(b",", 2)
+
+        # lowermost 10 bits are the error code, everything from bit 10 on is the status
+        head = int(tok[0])
+        return Response(head & 1023, head >> 10, int(tok[1]), tok[2].rstrip())
+    
 
-        # split response items
-        errc = int(tok[0]) & 1023  # lowermost 10 bits are the error code
-        stat = (int(tok[0]) & ~1023) >> 10  # everything from bit 10 on is the status
+    @staticmethod
+    def parse_base64_stream(chunks: Iterable[bytes | memoryview], write: Callable[[bytes], Any]) -> "Response":
+        """A static method that parses a response whose message is base64 encoded binary data.
 
-        cmd_id = int(tok[1])
-        msg = tok[2].rstrip()
+        The response is given in chunks (i.e. from CommunicatorBase.iter_line_chunks). The message
+        is decoded incrementally and passed to the write callback block by block, so the response is
+        never held in memory completely. The chunks are always consumed completely, so that the
+        communicator stays in sync even if an exception is raised.
+
+        Args:
+            chunks (Iterable[bytes|memoryview]): The pieces of a single response line without the line terminator.
+            write (Callable[[bytes], Any]): A function receiving the decoded data.
+
+        Returns:
+            response (Response): A Response object with an empty message.
+
+        Raises:
+            ProberException: If the response indicates an error (nothing is written in this case) or its header is malformed.
+        """
+        it = iter(chunks)
+        header = bytearray()
+        for chunk in it:
+            header += chunk
+            if header.count(b",") >= 2:
+                break
+
+        tok = bytes(header).split(b",", 2)
+        try:
+            head = int(tok[0])
+            cmd_id = int(tok[1]) if len(tok) > 1 else 0
+        except ValueError:
+            for _ in it:
+                pass
+            raise ProberException(f"Malformed response header: {bytes(header[:64])!r}")
+
+        errc = head & 1023
+        stat = head >> 10
+
+        if errc != 0:
+            msg = (tok[2] if len(tok) > 2 else b"") + b"".join(bytes(chunk) for chunk in it)
+            raise ProberException(msg.decode("utf-8", errors="replace").rstrip(), errc)
+
+        if len(tok) < 3:
+            raise ProberException(f"Malformed response header: {bytes(header[:64])!r}")
+
+        # only decode complete groups of 4 characters, the rest is kept for the next chunk
+        pending = bytearray(tok[2])
+        for chunk in it:
+            pending += chunk
+            n = len(pending) & ~3
+            if n > 0:
+                write(binascii.a2b_base64(pending[:n]))
+                del pending[:n]
+
+        if pending.strip():
+            write(binascii.a2b_base64(pending))
+
+        return Response(errc, stat, cmd_id, "")
 
-        # seperate error code an status code
-        resp = Response(errc, stat, cmd_id, msg)
-        # resp.dump()
-        return resp
-    
 
     @staticmethod
     def check_resp(str_resp: str) -> "Response":
@@ -114,9 +185,128 @@ class Response:
         Returns:
             msg (str): The response message returned by SENTIO.
         """
+        if self.__msg.__class__ is bytes:
+            self.__msg = self.__msg.decode()
+
         return self.__msg
 
 
+    def message_bytes(self) -> bytes:
+        """The undecoded response message returned by SENTIO.
+
+        Returns:
+            msg (bytes): The response message returned by SENTIO.
+        """
+        return self.__msg if isinstance(self.__msg, bytes) else self.__msg.encode()
+
+
+    def fields(self) -> Tuple[str, ...]:
+        """The comma separated fields of the response message.
+
+        The message is split only once, subsequent calls return the same tuple. Fields are
+        not stripped.
+
+        Returns:
+            fields (Tuple[str, ...]): The fields of the message.
+        """
+        fields = self.__fields
+        if fields is None:
+            fields = self.__fields = tuple(self.message().split(","))
+
+        return fields
+
+
+    def ints(self, count: int | None = None) -> Tuple[int, ...]:
+        """The fields of the response message converted to integers.
+
+        Args:
+            count (int): The number of leading fields to convert. None converts all fields.
+
+        Returns:
+            values (Tuple[int, ...]): The converted fields.
+
+        Raises:
+            IndexError: If the message has less than count fields.
+        """
+        fields = self.fields()
+        if count is None or count == len(fields):
+            return tuple(map(int, fields))
+
+        if count > len(fields):
+            raise IndexError(f"Response has {len(fields)} fields but {count} were requested!")
+
+        return tuple(map(int, fields[:count]))
+
+
+    def floats(self, count: int | None = None) -> Tuple[float, ...]:
+        """The fields of the response message converted to floats.
+
+        Args:
+            count (int): The number of leading fields to convert. None converts all fields.
+
+        Returns:
+            values (Tuple[float, ...]): The converted fields.
+
+        Raises:
+            IndexError: If the message has less than count fields.
+        """
+        fields = self.fields()
+        if count is None or count == len(fields):
+            return tuple(map(float, fields))
+
+        if count > len(fields):
+            raise IndexError(f"Response has {len(fields)} fields but {count} were requested!")
+
+        return tuple(map(float, fields[:count]))
+
+
+    def int_at(self, index: int) -> int:
+        """A single field of the response message converted to an integer.
+
+        Args:
+            index (int): The index of the field.
+
+        Returns:
+            value (int): The converted field.
+        """
+        return int(self.fields()[index])
+
+
+    def float_at(self, index: int) -> float:
+        """A single field of the response message converted to a float.
+
+        Args:
+            index (int): The index of the field.
+
+        Returns:
+            value (float): The converted field.
+        """
+        return float(self.fields()[index])
+
+
+    def bool_at(self, index: int) -> bool:
+        """A single field of the response message converted to a boolean.
+
+        SENTIO reports booleans either as "1"/"0" or as "true"/"false" in any case.
+
+        Args:
+            index (int): The index of the field.
+
+        Returns:
+            value (bool): The converted field.
+
+        Raises:
+            ValueError: If the field is not a boolean.
+        """
+        value = self.fields()[index].strip().lower()
+        if value in ("1", "true"):
+            return True
+        if value in ("0", "false"):
+            return False
+
+        raise ValueError(f"Response field {index} is not a boolean: \"{value}\"")
+
+
     def status(self):
         """The status coode extracted from the response.
 
@@ -143,9 +333,9 @@ class Response:
             This function is obsolete and will be removed in a future release. \
             Use print() instead."
         """
-        print('errc={0}; stat={1}; msg="{2}"; id={3}'.format(self.__errc, self.__stat, self.__msg, self.__cmd_id))
+        print('errc={0}; stat={1}; msg="{2}"; id={3}'.format(self.__errc, self.__stat, self.message(), self.__cmd_id))
 
 
     def print(self) -> None:
         """Prints the content of the response object to the console."""
-        print('errc={0}; stat={1}; msg="{2}"; id={3}'.format(self.__errc, self.__stat, self.__msg, self.__cmd_id))
+        print('errc={0}; stat={1}; msg="{2}"; id={3}'.format(self.__errc, self.__stat, self.message(), self.__cmd_id))
@@ -0,0 +1,283 @@
+from enum import Enum
+from typing import Any, Callable, Dict, List, Sequence
+
+from sentio_prober_control.Sentio.ProberBase import ProberException
+from sentio_prober_control.Sentio.Response import Response
+
+
+class OrDefault:
+    """A field that falls back to a default value if it cannot be converted.
+
+    SENTIO reports unknown values of some commands as NaN. Wrapping the field type with
+    OrDefault turns those into a default value instead of raising.
+
+    Example:
+
+    ```py
+    ResponseSchema(LoaderStation, int, OrDefault(int, -1))
+    ```
+    """
+
+    def __init__(self, field: Any, default: Any = None) -> None:
+        """Create a field with a default value.
+
+        Args:
+            field (Any): The type of the field. See ResponseSchema for the supported types.
+            default (Any): The value returned if the field cannot be converted.
+        """
+        self.__convert = ResponseSchema.converter(field)
+        self.__default = default
+
+
+    def __call__(self, value: str) -> Any:
+        try:
+            return self.__convert(value)
+        except (ValueError, KeyError):
+            return self.__default
+
+
+def _to_bool(value: str) -> bool:
+    value = value.strip().lower()
+    if value in ("1", "true"):
+        return True
+    if value in ("0", "false"):
+        return False
+
+    raise ValueError(f"Response field is not a boolean: \"{value}\"")
+
+
+class ResponseSchema:
+    """A declarative description of the message of a remote command response.
+
+    A schema lists the type of each comma separated field of the response message. When the
+    schema is created it compiles a parser function for exactly these fields so that parsing a
+    response is a single function call without any per field dispatch. Supported field types are:
+
+    - str: The field is returned unchanged.
+    - int, float: The field is converted with int() or float().
+    - bool: "1"/"0" or "true"/"false" in any case.
+    - An Enum: Converted with the from_string function of the enumeration if it has one,
+      otherwise by the name of the enumeration member.
+    - OrDefault(type, default): A field that may be NaN or unknown.
+    - Any other callable that takes the field string and returns the converted value.
+
+    Responses that consist of a repeated record (i.e. a list of positions) are described
+    by setting repeat. The parser then returns a list with one entry per record. Numeric
+    repeated records can also be decoded into a numpy array with parse_array.
+
+    Schemas are registered for the remote command they describe. The registry allows code
+    that only knows the command (i.e. a pipeline or a replayed trace) to decode its responses.
+    It is not a complete description of the remote command set. Only commands whose wrappers
+    parse mixed field types with a schema are registered (see commands()). Wrappers of the
+    other commands convert their responses with the accessors of Response and get()
+    returns None for them.
+
+    Example:
+
+    ```py
+    BIN_INFO = ResponseSchema.register("map:bins:get_bin_info", int, str, BinQuality, str)
+
+    resp = Response.check_resp(comm.read_line())
+    index, desc, quality, color = BIN_INFO.parse(resp)
+    ```
+    """
+
+    __registry: Dict[str, "ResponseSchema"] = {}
+
+    def __init__(self, *fields: Any, record: Callable[..., Any] | None = None, repeat: bool = False, skip: int = 0) -> None:
+        """Create and compile a response schema.
+
+        Args:
+            fields (Any): The types of the fields in the order they appear in the message.
+            record (Callable): Called with the converted fields to create the result (i.e. a dataclass). If omitted a tuple is returned.
+            repeat (bool): The message consists of any number of records described by fields.
+            skip (int): The number of leading fields to ignore (i.e. a count that precedes a list).
+        """
+        if not fields:
+            raise ValueError("A response schema needs at least one field!")
+
+        self.__fields = fields
+        self.__converters = [ResponseSchema.converter(field) for field in fields]
+        self.__record = record
+        self.__repeat = repeat
+        self.__skip = skip
+        self.__command = "response"
+        self.__parse = self.__compile()
+
+
+    @property
+    def width(self) -> int:
+        """The number of fields of a single record."""
+        return len(self.__fields)
+
+
+    @property
+    def repeat(self) -> bool:
+        """True if the message consists of repeated records."""
+        return self.__repeat
+
+
+    @staticmethod
+    def converter(field: Any) -> Callable[[str], Any] | None:
+        """The function that converts a field string into a value of a field type.
+
+        Args:
+            field (Any): The field type.
+
+        Returns:
+            The conversion function or None if the field string is used unchanged.
+        """
+        if field is str:
+            return None
+        if field is bool:
+            return _to_bool
+        if field is int or field is float:
+            return field
+        if isinstance(field, type) and issubclass(field, Enum):
+            if hasattr(field, "from_string"):
+                return field.from_string
+
+            return dict(field.__members__).__getitem__
+        if callable(field):
+            return field
+
+        raise TypeError(f"Unsupported response field type: {field!r}")
+
+
+    def __compile(self) -> Callable[[Sequence[str]], Any]:
+        namespace: Dict[str, Any] = {"ProberException": ProberException, "record": self.__record}
+        width = len(self.__converters)
+        skip = self.__skip
+        index = "f[{0}]" if not self.__repeat else "f[i + {0}]"
+
+        values = []
+        for n, convert in enumerate(self.__converters):
+            item = index.format(skip + n if not self.__repeat else n)
+            if convert is None:
+                values.append(item)
+            else:
+                namespace[f"c{n}"] = convert
+                values.append(f"c{n}({item})")
+
+        if self.__record is not None:
+            value = f"record({', '.join(values)})"
+        else:
+            value = f"({', '.join(values)},)"
+
+        if self.__repeat:
+            source = (
+                f"def parse(f, command):\n"
+                f"    n = len(f)\n"
+                f"    if n == {skip + 1} and not f[{skip}].strip():\n"
+                f"        return []\n"
+                f"    if n < {skip} or (n - {skip}) % {width}:\n"
+                f"        raise ProberException(f\"Unexpected response for {{command}}: {{n - {skip}}} fields are not a multiple of {width}.\")\n"
+                f"    return [{value} for i in range({skip}, n, {width})]\n"
+            )
+        else:
+            source = (
+                f"def parse(f, command):\n"
+                f"    if len(f) < {skip + width}:\n"
+                f"        raise ProberException(f\"Unexpected response for {{command}}: expected {width} fields but got {{len(f) - {skip}}}.\")\n"
+                f"    return {value}\n"
+            )
+
+        exec(compile(source, "<ResponseSchema>", "exec"), namespace)
+        return namespace["parse"]
+
+
+    def parse(self, resp: Response) -> Any:
+        """Convert the message of a response.
+
+        Args:
+            resp (Response): The response. Its fields are split only once.
+
+        Returns:
+            A tuple of the converted fields or the object created by record. A list of those if the schema is repeated.
+
+        Raises:
+            ProberException: If the message has too few fields.
+            ValueError: If a field cannot be converted to its type.
+        """
+        return self.__parse(resp.fields(), self.__command)
+
+
+    def parse_message(self, msg: str) -> Any:
+        """Convert a response message string. See parse."""
+        return self.__parse(msg.split(","), self.__command)
+
+
+    def parse_array(self, resp: Response | str, dtype: Any = None) -> Any:
+        """Decode a response of numeric records into a two dimensional numpy array.
+
+        Conversion is done by numpy in a single step, which is considerably faster than
+        converting the fields one by one for long responses. Requires numpy.
+
+        Args:
+            resp (Response|str): The response or its message.
+            dtype (Any): The numpy data type of the array. Defaults to int64 if all fields are int, float64 otherwise.
+
+        Returns:
+            An array with one row per record and one column per field.
+
+        Raises:
+            TypeError: If the schema has fields that are not int or float.
+            ProberException: If the message has a wrong number of fields.
+        """
+        try:
+            import numpy as np
+        except ImportError as e:
+            raise ImportError("ResponseSchema.parse_array requires numpy! Install it with: pip install sentio-prober-control[numpy]") from e
+
+        if any(field is not int and field is not float for field in self.__fields):
+            raise TypeError("Only schemas with int and float fields can be decoded into an array!")
+
+        if dtype is None:
+            dtype = np.int64 if all(field is int for field in self.__fields) else np.float64
+
+        fields = resp.fields() if isinstance(resp, Response) else resp.split(",")
+        fields = fields[self.__skip:]
+        if len(fields) == 1 and not fields[0].strip():
+            fields = []
+
+        if len(fields) % self.width:
+            raise ProberException(f"Unexpected response for {self.__command}: {len(fields)} fields are not a multiple of {self.width}.")
+
+        return np.array(fields, dtype=dtype).reshape(-1, self.width)
+
+
+    @classmethod
+    def register(cls, command: str, *fields: Any, **kwargs: Any) -> "ResponseSchema":
+        """Create a schema and register it for a remote command.
+
+        Args:
+            command (str): The name of the remote command (i.e. "map:bins:get_bin_info").
+            fields (Any): The field types. See ResponseSchema.
+            kwargs (Any): Further arguments of ResponseSchema (record, repeat, skip).
+
+        Returns:
+            The registered schema.
+        """
+        schema = ResponseSchema(*fields, **kwargs)
+        schema.__command = command
+        cls.__registry[command] = schema
+        return schema
+
+
+    @classmethod
+    def get(cls, command: str) -> "ResponseSchema | None":
+        """The schema registered for a remote command.
+
+        Args:
+            command (str): The remote command. Arguments are ignored, so a complete command line can be passed.
+
+        Returns:
+            The schema or None if no schema is registered for the command. This is the case for most remote commands.
+        """
+        return cls.__registry.get(command.split(" ", 1)[0])
+
+
+    @classmethod
+    def commands(cls) -> List[str]:
+        """The names of all remote commands with a registered schema."""
+        return sorted(cls.__registry)
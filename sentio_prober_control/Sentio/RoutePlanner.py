@@ -0,0 +1,163 @@
+import random
+from typing import Dict, Iterable, List, Tuple, TYPE_CHECKING
+
+from sentio_prober_control.Sentio.Enumerations import DieNumber, RoutingPriority, RoutingStartPoint
+from sentio_prober_control.Sentio.ProberBase import ProberException
+
+if TYPE_CHECKING:
+    from sentio_prober_control.Sentio.ProberSentio import SentioProber
+    from sentio_prober_control.Sentio.WaferMapModel import WaferMapModel
+
+
+class RoutePlanner:
+    """Computes the stepping order of the wafermap on the client.
+
+    SENTIO steps through the selected dies line by line. The routing start point defines
+    the corner of the grid where stepping starts, the routing priority whether the lines
+    are rows or columns and whether odd lines are stepped backwards. A route planner
+    computes the same order from the selected dies, so that a test executive can prepare
+    data for the whole route before stepping starts.
+
+    The route is a list of (column, row) tuples. Element n is the die SENTIO steps to
+    with sequence number n (see WafermapPathCommandGroup.get_die). Use verify() to
+    compare the planned route with the route of SENTIO.
+
+    Example:
+
+    ```py
+    with WaferMapModel(prober) as model:
+        model.sync()
+        planner = RoutePlanner.from_prober(prober)
+        route = planner.plan_model(model)
+        if planner.verify(prober, route):
+            raise RuntimeError("The planned route does not match SENTIO's route!")
+    ```
+    """
+
+    def __init__(self, start: RoutingStartPoint = RoutingStartPoint.UpperLeft, priority: RoutingPriority = RoutingPriority.RowUniDir) -> None:
+        """Create a route planner.
+
+        Args:
+            start (RoutingStartPoint): The corner of the grid where stepping starts.
+            priority (RoutingPriority): The stepping order.
+        """
+        self.__start = start
+        self.__priority = priority
+
+
+    @staticmethod
+    def from_prober(prober: "SentioProber") -> "RoutePlanner":
+        """Create a route planner with the routing settings of SENTIO.
+
+        Args:
+            prober (SentioProber): The prober to read the routing settings from.
+
+        Returns:
+            A route planner.
+        """
+        return RoutePlanner(*prober.map.get_routing())
+
+
+    @property
+    def start(self) -> RoutingStartPoint:
+        """The corner of the grid where stepping starts."""
+        return self.__start
+
+
+    @property
+    def priority(self) -> RoutingPriority:
+        """The stepping order."""
+        return self.__priority
+
+
+    def plan(self, selected: Iterable[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        """Compute the route through a set of dies.
+
+        Args:
+            selected (Iterable[Tuple[int, int]]): Column and row of the selected dies.
+
+        Returns:
+            The dies in stepping order.
+        """
+        col_desc = self.__start in (RoutingStartPoint.UpperRight, RoutingStartPoint.LowerRight)
+        row_desc = self.__start in (RoutingStartPoint.LowerLeft, RoutingStartPoint.LowerRight)
+        by_row = self.__priority in (RoutingPriority.RowUniDir, RoutingPriority.RowBiDir)
+        winding = self.__priority in (RoutingPriority.RowBiDir, RoutingPriority.ColBiDir)
+
+        # outer is the index of the line, inner the position within the line
+        outer, inner = (1, 0) if by_row else (0, 1)
+        outer_desc, inner_desc = (row_desc, col_desc) if by_row else (col_desc, row_desc)
+
+        lines: Dict[int, List[Tuple[int, int]]] = {}
+        for die in selected:
+            lines.setdefault(die[outer], []).append(die)
+
+        # With BiDir routing SENTIO steps odd lines backwards (see RoutingPriority). Lines are
+        # counted from the first stepped line by their grid index, so a line without selected
+        # dies still counts and the line after it keeps the direction of the line before it.
+        keys = sorted(lines, reverse=outer_desc)
+        route: List[Tuple[int, int]] = []
+        for key in keys:
+            backwards = winding and abs(key - keys[0]) % 2 == 1
+            route += sorted(lines[key], key=lambda d: d[inner], reverse=inner_desc != backwards)
+
+        return route
+
+
+    def plan_model(self, model: "WaferMapModel") -> List[Tuple[int, int]]:
+        """Compute the route through the selected dies of a wafermap model.
+
+        Args:
+            model (WaferMapModel): A synchronized wafermap model.
+
+        Returns:
+            The dies in stepping order.
+        """
+        ox, oy = model.grid_origin
+        rows, cols = (model.status == model.SELECTED).nonzero()
+        return self.plan(zip((cols - ox).tolist(), (rows - oy).tolist()))
+
+
+    @staticmethod
+    def verify(prober: "SentioProber", route: List[Tuple[int, int]], sample: int = 32, seed: int | None = None) -> List[Tuple[int, Tuple[int, int] | None, Tuple[int, int] | None]]:
+        """Compare a planned route with SENTIO's route.
+
+        Queries the dies of the first, the last and sample randomly chosen sequence numbers
+        with pipelined map:path:get_die commands. The number of selected dies is compared
+        with the length of the route.
+
+        Args:
+            prober (SentioProber): The prober whose route is compared.
+            route (List[Tuple[int, int]]): The planned route.
+            sample (int): The number of randomly chosen sequence numbers to compare.
+            seed (int): Seed for choosing the sequence numbers.
+
+        Returns:
+            A list of (sequence number, planned die, SENTIO's die) tuples for each difference. The
+            planned die or SENTIO's die is None if the sequence number is beyond the end of the
+            respective route. An empty list if no difference was found.
+        """
+        num_selected = prober.map.get_num_dies(DieNumber.Selected)
+        length = max(num_selected, len(route))
+        if length == 0:
+            return []
+
+        seqs = sorted({0, length - 1} | set(random.Random(seed).sample(range(length), min(sample, length))))
+        queried = [seq for seq in seqs if seq < num_selected]
+        with prober.pipeline() as pipe:
+            handles = [pipe.submit(f"map:path:get_die {seq}") for seq in queried]
+
+        actual: Dict[int, Tuple[int, int]] = {}
+        for seq, handle in zip(queried, handles):
+            try:
+                actual[seq] = handle.result().ints(2)
+            except ProberException:
+                actual[seq] = None
+
+        diffs = []
+        for seq in seqs:
+            planned = route[seq] if seq < len(route) else None
+            if planned != actual.get(seq):
+                diffs.append((seq, planned, actual.get(seq)))
+
+        return diffs
@@ -0,0 +1,321 @@
+from typing import Any, Iterable, Set, Tuple, TYPE_CHECKING
+
+from sentio_prober_control.Communication.CommunicatorBase import CommunicationHook
+from sentio_prober_control.Sentio.Enumerations import RemoteCommandError
+from sentio_prober_control.Sentio.Response import Response
+
+if TYPE_CHECKING:
+    from sentio_prober_control.Sentio.ProberSentio import SentioProber
+
+
+# Remote commands that change a single die and the position of its column argument
+_DIE_COMMANDS = {
+    "map:die:add": 0,
+    "map:die:remove": 0,
+    "map:die:select": 0,
+    "map:die:unselect": 0,
+    "map:bins:set_bin": 1,
+}
+
+# Wafermap commands that do not change the presence, selection or bins of any die
+_READ_ONLY_PREFIXES = ("get_", "step_", "has_", "view:")
+_READ_ONLY_COMMANDS = ("map:bins:get_", "map:die:get_", "map:path:get_", "map:subsite:get", "map:subsite:step", "map:poi:get", "map:get_prop")
+
+
+def _import_numpy() -> Any:
+    try:
+        import numpy as np
+    except ImportError as e:
+        raise ImportError("WaferMapModel requires numpy! Install it with: pip install sentio-prober-control[numpy]") from e
+
+    return np
+
+
+class _ChangeTracker(CommunicationHook):
+    """Watches the commands sent to SENTIO and records the dies they change."""
+
+    def __init__(self, model: "WaferMapModel") -> None:
+        self.__model = model
+
+
+    def command_sent(self, msg: str, size: int, t: float) -> None:
+        name, _, rest = msg.partition(" ")
+        name = name.strip().lower()
+        if not name.startswith("map:"):
+            return
+
+        args = [a.strip() for a in rest.split(",")] if rest.strip() else []
+
+        try:
+            if name in _DIE_COMMANDS:
+                first = _DIE_COMMANDS[name]
+                if len(args) >= first + 2:
+                    self.__model._mark_dirty(int(args[first]), int(args[first + 1]))
+                    return
+            elif name == "map:bins:set_value" and len(args) == 3:
+                self.__model._set_value(int(args[1]), int(args[2]), float(args[0]))
+                return
+            elif name == "map:bins:clear_all_values":
+                self.__model._set_value(None, None, float("nan"))
+                return
+            elif name.startswith(_READ_ONLY_COMMANDS) or name[4:].startswith(_READ_ONLY_PREFIXES):
+                return
+        except ValueError:
+            pass
+
+        # The command may have changed any die, or we cannot tell which one (i.e. binning the current die)
+        self.__model._mark_all_dirty()
+
+
+class WaferMapModel:
+    """A local copy of the SENTIO wafermap in numpy arrays.
+
+    Querying the state of a wafermap die by die takes one remote command per die and
+    property. The model downloads the whole map once with pipelined queries and keeps
+    it as arrays indexed by [row, column] of the grid. Array index (0, 0) is the upper
+    left die of the grid. Column and row indices used by the functions of this class are
+    the same as in the wafermap commands (relative to the grid origin).
+
+    - status: 1 = selected, 2 = not selected, 3 = not present (like WafermapDieCommandGroup.get_status).
+    - bins: The bin of each die or -1 if the die is not present or has no bin.
+    - values: The values set with map:bins:set_value. SENTIO cannot report die values, so
+      the model only knows values set through the communicator of the prober while the
+      model was attached. Unknown values are NaN.
+
+    While the model is attached it watches the commands sent through the communicator of
+    the prober. sync() then only queries the dies that were changed by these commands.
+    Commands that may change any die (i.e. map:create or binning the current die) cause a
+    full download. Changes made in the SENTIO user interface are not noticed, call
+    invalidate() after such changes.
+
+    Requires numpy.
+
+    Example:
+
+    ```py
+    with WaferMapModel(prober) as model:
+        model.sync()
+        print(f"{(model.status == 1).sum()} dies selected")
+
+        prober.map.bins.set_bin(3, 10, 12)
+        model.sync()  # queries die (10, 12) only
+        print(model.bin(10, 12))
+    ```
+    """
+
+    SELECTED = 1
+    NOT_SELECTED = 2
+    NOT_PRESENT = 3
+
+    def __init__(self, prober: "SentioProber", depth: int = 64) -> None:
+        """Create a model and attach it to the communicator of a prober. The map is downloaded by the first call to sync().
+
+        Args:
+            prober (SentioProber): The prober to read the wafermap from.
+            depth (int): The maximum number of queries in flight while downloading.
+        """
+        self.__np = _import_numpy()
+        self.__prober = prober
+        self.__depth = depth
+        self.__origin = (0, 0)
+        self.__status = self.__np.full((0, 0), WaferMapModel.NOT_PRESENT, dtype=self.__np.int8)
+        self.__bins = self.__np.full((0, 0), -1, dtype=self.__np.int32)
+        self.__values = self.__np.full((0, 0), self.__np.nan)
+        self.__dirty: Set[Tuple[int, int]] = set()
+        self.__all_dirty = True
+        self.__tracker: _ChangeTracker | None = _ChangeTracker(self)
+        prober.comm.add_hook(self.__tracker)
+
+
+    def __enter__(self) -> "WaferMapModel":
+        return self
+
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+    @property
+    def status(self) -> Any:
+        """The status of each die as numpy array indexed by [row, column]."""
+        return self.__status
+
+
+    @property
+    def bins(self) -> Any:
+        """The bin of each die as numpy array indexed by [row, column]."""
+        return self.__bins
+
+
+    @property
+    def values(self) -> Any:
+        """The value of each die as numpy array indexed by [row, column]."""
+        return self.__values
+
+
+    @property
+    def num_cols(self) -> int:
+        """The number of columns of the grid."""
+        return self.__status.shape[1]
+
+
+    @property
+    def num_rows(self) -> int:
+        """The number of rows of the grid."""
+        return self.__status.shape[0]
+
+
+    @property
+    def grid_origin(self) -> Tuple[int, int]:
+        """The grid origin at the time of the last full download."""
+        return self.__origin
+
+
+    @property
+    def num_dirty(self) -> int:
+        """The number of dies sync() will query. -1 if the next sync() downloads the whole map."""
+        return -1 if self.__all_dirty else len(self.__dirty)
+
+
+    def close(self) -> None:
+        """Detach the model from the communicator. The arrays keep their content."""
+        if self.__tracker is not None:
+            self.__prober.comm.remove_hook(self.__tracker)
+            self.__tracker = None
+
+
+    def index(self, col: int, row: int) -> Tuple[int, int]:
+        """Convert the column and row of a die into an index of the arrays.
+
+        Args:
+            col (int): Column of the die relative to the grid origin.
+            row (int): Row of the die relative to the grid origin.
+
+        Returns:
+            A tuple with the array index (row, column).
+        """
+        return row + self.__origin[1], col + self.__origin[0]
+
+
+    def die_status(self, col: int, row: int) -> int:
+        """Return the status of a die. See WafermapDieCommandGroup.get_status."""
+        return int(self.__status[self.index(col, row)])
+
+
+    def bin(self, col: int, row: int) -> int:
+        """Return the bin of a die or -1 if it has none."""
+        return int(self.__bins[self.index(col, row)])
+
+
+    def invalidate(self, dies: Iterable[Tuple[int, int]] | None = None) -> None:
+        """Mark dies as changed so that the next sync() queries them again.
+
+        Args:
+            dies (Iterable[Tuple[int, int]]): Column and row of the dies. None downloads the whole map with the next sync().
+        """
+        if dies is None:
+            self.__all_dirty = True
+        else:
+            self.__dirty.update(dies)
+
+
+    def sync(self) -> int:
+        """Bring the model up to date with SENTIO.
+
+        Downloads the whole map on the first call and after commands that may have changed
+        any die. Otherwise only the dies changed since the last call are queried.
+
+        Returns:
+            The number of dies that were queried.
+
+        Raises:
+            ProberException: If a query failed. The dies that were not updated are queried again by the next sync().
+        """
+        if self.__all_dirty:
+            return self.__download()
+
+        dies = [d for d in self.__dirty if 0 <= self.index(*d)[0] < self.num_rows and 0 <= self.index(*d)[1] < self.num_cols]
+        self.__dirty = set()
+        try:
+            self.__query(dies)
+        except BaseException:
+            self.__dirty.update(dies)
+            raise
+
+        return len(dies)
+
+
+    def __download(self) -> int:
+        np = self.__np
+        self.__all_dirty = False
+        self.__dirty = set()
+
+        try:
+            wafermap = self.__prober.map
+            cols, rows = wafermap.get_num_cols(), wafermap.get_num_rows()
+            self.__origin = wafermap.get_grid_origin()
+
+            values = self.__values
+            self.__status = np.full((rows, cols), WaferMapModel.NOT_PRESENT, dtype=np.int8)
+            self.__bins = np.full((rows, cols), -1, dtype=np.int32)
+            if values.shape != (rows, cols):
+                self.__values = np.full((rows, cols), np.nan)
+
+            ox, oy = self.__origin
+            self.__query([(c - ox, r - oy) for r in range(rows) for c in range(cols)])
+        except BaseException:
+            self.__all_dirty = True
+            raise
+
+        return self.__status.size
+
+
+    def __query(self, dies: list) -> None:
+        if not dies:
+            return
+
+        status = []
+        with self.__prober.pipeline(self.__depth) as pipe:
+            for col, row in dies:
+                status.append(pipe.submit(f"map:die:get_status {col}, {row}"))
+
+        present = []
+        for (col, row), handle in zip(dies, status):
+            value = int(handle.result().message())
+            self.__status[self.index(col, row)] = value
+            self.__bins[self.index(col, row)] = -1
+            if value != WaferMapModel.NOT_PRESENT:
+                present.append((col, row))
+
+        # SENTIO answers get_bin with InvalidParameter for present dies that were not binned yet
+        bins = []
+        with self.__prober.pipeline(self.__depth) as pipe:
+            for col, row in present:
+                bins.append(pipe.submit(f"map:bins:get_bin {col}, {row}", Response.parse_resp))
+
+        for (col, row), handle in zip(present, bins):
+            resp = handle.result()
+            if not resp.ok() and resp.errc() == RemoteCommandError.InvalidParameter:
+                self.__bins[self.index(col, row)] = -1
+                continue
+
+            resp.check()
+            self.__bins[self.index(col, row)] = int(resp.message())
+
+
+    def _mark_dirty(self, col: int, row: int) -> None:
+        self.__dirty.add((col, row))
+
+
+    def _mark_all_dirty(self) -> None:
+        self.__all_dirty = True
+
+
+    def _set_value(self, col: int | None, row: int | None, value: float) -> None:
+        if col is None or row is None:
+            self.__values[:] = value
+            return
+
+        idx = self.index(col, row)
+        if 0 <= idx[0] < self.__values.shape[0] and 0 <= idx[1] < self.__values.shape[1]:
+            self.__values[idx] = value
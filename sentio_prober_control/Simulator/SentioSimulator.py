@@ -0,0 +1,1256 @@
+import base64
+import binascii
+import heapq
+import math
+import socket
+import threading
+import time
+from typing import Callable, Dict, List, Tuple
+
+from sentio_prober_control.Sentio.Enumerations import LoaderStation, RemoteCommandError, StatusBits
+
+
+Reply = str | Tuple[int, int, str]
+"""The return value of a command handler. Either a message or a tuple of status bits, command id and message."""
+
+
+class SimulatorError(Exception):
+    """Raised by a command handler to answer a remote command with an error code."""
+
+    def __init__(self, errc: int, msg: str, cmd_id: int = 0) -> None:
+        super().__init__(msg)
+        self.errc = errc
+        self.msg = msg
+        self.cmd_id = cmd_id
+
+
+class _AsyncCommand:
+    __slots__ = ("due", "aborted")
+
+    def __init__(self, due: float) -> None:
+        self.due = due
+        self.aborted = False
+
+    def pending(self, now: float) -> bool:
+        return not self.aborted and now < self.due
+
+
+class SentioSimulator:
+    """A local stand-in for the SENTIO remote command server.
+
+    The simulator listens on a TCP/IP port and answers remote commands with SENTIO's
+    "errc,cmd_id,msg" response protocol. It models enough prober state to run real
+    remote command flows without hardware:
+
+    - a rectangular or round wafermap with present and selected dies, routing and stepping,
+    - bin codes, bin values and the bin table,
+    - subsites,
+    - the chuck position (x, y, z and theta); stepping to a die moves the chuck,
+    - asynchronous "start_*" commands with command ids, wait_complete, wait_all,
+      query_command_status and abort_command,
+    - loader stations and their slots,
+    - module properties ("*:get_prop" and "*:set_prop") of all modules.
+
+    Commands that are not modelled are answered with RemoteCommandError.CommandHandlerNotFound.
+
+    Latency can be injected in two ways. The link latency delays every response by a fixed
+    round trip time without blocking the processing of subsequent commands, just like a network
+    would. The processing time is spent serially for every command, like a busy prober would.
+
+    Example:
+
+    ```py
+    with SentioSimulator(port=0, latency=0.001) as sim:
+        prober = SentioProber.create_prober("tcpip", sim.address)
+        prober.map.create_rect(10, 10)
+        col, row, site = prober.map.step_first_die()
+    ```
+    """
+
+    def __init__(self, port: int = 35555, host: str = "127.0.0.1", latency: float = 0.0, processing_time: float = 0.0, async_duration: float = 0.0) -> None:
+        """Create a simulator. The server is not started until start() is called.
+
+        Args:
+            port (int): The port to listen on. Use 0 to pick a free port.
+            host (str): The interface to listen on.
+            latency (float): Simulated round trip time of the link in seconds.
+            processing_time (float): Simulated execution time of each command in seconds.
+            async_duration (float): Time in seconds until an async "start_*" command completes.
+        """
+        self.latency = latency
+        self.processing_time = processing_time
+        self.async_duration = async_duration
+
+        self.snapshot = b"\xff\xd8\xff\xe0" + bytes(range(256)) * 16 + b"\xff\xd9"
+        """The image data returned by vis:snap_image."""
+
+        self.__host = host
+        self.__port = port
+        self.__cond = threading.Condition(threading.RLock())
+        self.__listener: socket.socket | None = None
+        self.__connections: List[socket.socket] = []
+        self.__threads: List[threading.Thread] = []
+        self.__num_commands = 0
+
+        self.__handlers: Dict[str, Callable[[List[str]], Reply]] = {
+            "*idn?": self.__idn,
+            "status:get_version": lambda args: "Version: 25.2.0.0",
+            "status:get_chuck_temp": lambda args: str(self.__temp),
+            "status:get_chuck_temp_setpoint": lambda args: str(self.__temp),
+            "status:set_chuck_temp": self.__set_chuck_temp,
+            "select_module": lambda args: "ok",
+            "file_transfer": self.__file_transfer,
+            "vis:snap_image": self.__vis_snap_image,
+            "map:view:show_current_die": lambda args: "ok",
+
+            # async commands
+            "wait_complete": self.__wait_complete,
+            "wait_all": self.__wait_all,
+            "query_command_status": self.__query_command_status,
+            "abort_command": self.__abort_command,
+
+            # wafermap
+            "map:create": self.__map_create,
+            "map:create_rect": self.__map_create_rect,
+            "map:get_num_cols": lambda args: str(self.__cols),
+            "map:get_num_rows": lambda args: str(self.__rows),
+            "map:get_num_dies": self.__map_get_num_dies,
+            "map:get_diameter": lambda args: str(self.__diameter),
+            "map:set_diameter": self.__map_set_diameter,
+            "map:get_index_size": lambda args: f"{self.__index[0]},{self.__index[1]}",
+            "map:set_index_size": self.__map_set_index_size,
+            "map:get_street_size": lambda args: f"{self.__street[0]},{self.__street[1]}",
+            "map:set_street_size": self.__map_set_street_size,
+            "map:get_grid_origin": lambda args: f"{self.__grid_origin[0]},{self.__grid_origin[1]}",
+            "map:set_grid_origin": self.__map_set_grid_origin,
+            "map:get_home_die": lambda args: f"{self.__home_die[0]},{self.__home_die[1]}",
+            "map:set_home_die": self.__map_set_home_die,
+            "map:get_axis_orient": lambda args: self.__axis_orient,
+            "map:set_axis_orient": self.__map_set_axis_orient,
+            "map:get_routing": lambda args: f"{self.__routing[0]},{self.__routing[1]}",
+            "map:set_routing": self.__map_set_routing,
+            "map:get_die_seq": lambda args: str(self.__route_pos),
+            "map:step_first_die": self.__map_step_first_die,
+            "map:step_next_die": self.__map_step_next_die,
+            "map:step_previous_die": self.__map_step_previous_die,
+            "map:step_die": self.__map_step_die,
+            "map:step_die_seq": self.__map_step_die_seq,
+            "map:bin_step_next_die": self.__map_bin_step_next_die,
+            "map:die:add": self.__map_die_add,
+            "map:die:remove": self.__map_die_remove,
+            "map:die:select": self.__map_die_select,
+            "map:die:unselect": self.__map_die_unselect,
+            "map:die:get_status": self.__map_die_get_status,
+            "map:die:get_current_index": self.__map_die_get_current_index,
+            "map:die:get_current_subsite": lambda args: str(self.__site),
+            "map:path:get_die": self.__map_path_get_die,
+            "map:path:select_dies": self.__map_path_select_dies,
+            "map:path:create_from_bins": self.__map_path_create_from_bins,
+
+            # bins
+            "map:bins:get_bin": self.__map_bins_get_bin,
+            "map:bins:set_bin": self.__map_bins_set_bin,
+            "map:bins:set_all": self.__map_bins_set_all,
+            "map:bins:clear_all": self.__map_bins_clear_all,
+            "map:bins:clear_all_values": self.__map_bins_clear_all_values,
+            "map:bins:set_value": self.__map_bins_set_value,
+            "map:bins:get_num_bins": lambda args: str(len(self.__bin_table)),
+            "map:bins:resize": self.__map_bins_resize,
+            "map:bins:get_bin_info": self.__map_bins_get_bin_info,
+            "map:bins:set_bin_info": self.__map_bins_set_bin_info,
+
+            # subsites
+            "map:subsite:add": self.__map_subsite_add,
+            "map:subsite:get": self.__map_subsite_get,
+            "map:subsite:get_num": lambda args: str(len(self.__subsites)),
+            "map:subsite:remove": self.__map_subsite_remove,
+            "map:subsite:reset": self.__map_subsite_reset,
+            "map:subsite:step": self.__map_subsite_step,
+            "map:subsite:step_next": self.__map_subsite_step_next,
+            "map:subsite:step_previous": self.__map_subsite_step_previous,
+            "map:subsite:bin_step_next": self.__map_subsite_bin_step_next,
+
+            # chuck
+            "get_chuck_xy": self.__get_chuck_xy,
+            "move_chuck_xy": self.__move_chuck_xy,
+            "get_chuck_z": self.__get_chuck_z,
+            "move_chuck_z": self.__move_chuck_z,
+            "get_chuck_theta": lambda args: str(self.__chuck[3]),
+            "move_chuck_theta": self.__move_chuck_theta,
+            "move_chuck_contact": self.__move_chuck_contact,
+            "move_chuck_separation": self.__move_chuck_separation,
+            "move_chuck_home": self.__move_chuck_home,
+            "chuck:get_xy": self.__stage_get_chuck_xy,
+            "chuck:move_xy": self.__move_chuck_xy,
+            "chuck:get_z": self.__get_chuck_z,
+            "chuck:move_z": self.__move_chuck_z,
+            "chuck:has_xy": lambda args: "1",
+            "chuck:has_z": lambda args: "1",
+
+            # loader
+            "loader:has_station": self.__loader_has_station,
+            "loader:has_cassette": self.__loader_has_cassette,
+            "loader:scan_station": self.__loader_scan_station,
+            "loader:load_wafer": self.__loader_load_wafer,
+            "loader:unload_wafer": self.__loader_unload_wafer,
+            "loader:transfer_wafer": self.__loader_transfer_wafer,
+            "loader:query_wafer_status": self.__loader_query_wafer_status,
+        }
+
+        self.reset()
+
+
+    def __enter__(self) -> "SentioSimulator":
+        self.start()
+        return self
+
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+
+
+    @property
+    def address(self) -> str:
+        """The address of the simulator in the format "IP_ADDRESS:PORT" as expected by the communicators."""
+        return f"{self.__host}:{self.__port}"
+
+
+    @property
+    def port(self) -> int:
+        """The port the simulator listens on. When the simulator was created with port 0 this is the port picked by start()."""
+        return self.__port
+
+
+    @property
+    def files(self) -> Dict[str, bytes]:
+        """The files received with the file_transfer command by destination path."""
+        with self.__cond:
+            return dict(self.__files)
+
+
+    @property
+    def num_commands(self) -> int:
+        """The number of remote commands executed since the last reset."""
+        return self.__num_commands
+
+
+    def reset(self) -> None:
+        """Reset the simulated prober to its initial state.
+
+        The wafermap is empty, the chuck is at its zero position, cassette 1 is filled
+        with 25 wafers and all other loader stations are empty.
+        """
+        with self.__cond:
+            self.__num_commands = 0
+            self.__temp = 25.0
+            self.__files: Dict[str, bytes] = {}
+
+            # module properties by module and "name[, parameters]"
+            self.__props: Dict[Tuple[str, str], str] = {
+                ("map", "grid_chuck_mode"): "false",
+                ("map", "chuck_to_wafer_offset"): "0,0",
+                ("map", "die_reference_is_set"): "false",
+                ("map", "die_reference"): "0,0",
+                ("status", "active_stage, chuck"): "Wafer",
+                ("vis", "light, scope"): "80",
+                ("vis", "exposure, scope"): "2000",
+            }
+
+            # async commands
+            self.__next_cmd_id = 1
+            self.__async: Dict[int, _AsyncCommand] = {}
+
+            # wafermap; present dies map to their selection state
+            self.__cols = 0
+            self.__rows = 0
+            self.__diameter = 200
+            self.__dies: Dict[Tuple[int, int], bool] = {}
+            self.__index = (5000.0, 5000.0)
+            self.__street = (0.0, 0.0)
+            self.__grid_origin = (0, 0)
+            self.__home_die = (0, 0)
+            self.__axis_orient = "DR"
+            self.__routing = ("ul", "r")
+            self.__route: List[Tuple[int, int]] | None = None
+            self.__route_pos = -1
+            self.__die: Tuple[int, int] | None = None
+            self.__site = 0
+
+            # bins
+            self.__bins: Dict[Tuple[int, int, int], int] = {}
+            self.__values: Dict[Tuple[int, int], float] = {}
+            self.__bin_table: List[Tuple[str, str, str]] = [("Pass", "Pass", "#00FF00")] + [(f"Bin {i}", "Fail", "#FF0000") for i in range(1, 16)]
+
+            # subsites in chuck coordinates relative to the die reference; subsite 0 is the die reference
+            self.__subsites: List[Tuple[str, float, float]] = [("0", 0.0, 0.0)]
+
+            # chuck x, y, z, theta
+            self.__chuck = [0.0, 0.0, 0.0, 0.0]
+            self.__contact_height = 10000.0
+            self.__separation_gap = 50.0
+
+            # loader stations map slot numbers to wafers [origin station, origin slot, size, orient, progress]
+            self.__slots: Dict[str, int] = {s.to_string(): 25 if s in (LoaderStation.Cassette1, LoaderStation.Cassette2) else 1 for s in LoaderStation}
+            self.__stations: Dict[str, Dict[int, list]] = {st: {} for st in self.__slots}
+            for slot in range(1, 26):
+                self.__stations["cas1"][slot] = ["cas1", slot, 200, 0, 0.0]
+
+
+    def start(self) -> None:
+        """Start listening for connections in a background thread."""
+        self.__listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.__listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.__listener.bind((self.__host, self.__port))
+        self.__listener.listen()
+        self.__port = self.__listener.getsockname()[1]
+
+        thread = threading.Thread(target=self.__accept, args=(self.__listener,), daemon=True)
+        thread.start()
+        self.__threads.append(thread)
+
+
+    def stop(self) -> None:
+        """Stop the server and close all connections."""
+        if self.__listener is not None:
+            # shutdown wakes up the thread blocked in accept()
+            try:
+                self.__listener.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            self.__listener.close()
+            self.__listener = None
+
+        self.drop_connections()
+
+        for thread in self.__threads:
+            thread.join(1)
+
+        self.__connections = []
+        self.__threads = []
+
+
+    def drop_connections(self) -> None:
+        """Close all client connections but keep listening for new ones.
+
+        This simulates a broken link. Responses that were not yet sent are lost.
+        """
+        for conn in list(self.__connections):
+            try:
+                conn.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            conn.close()
+
+        with self.__cond:
+            self.__cond.notify_all()
+
+
+    def execute(self, cmd: str) -> str | None:
+        """Execute a single remote command.
+
+        This is what the server does for every received line. It can also be used to test
+        command handlers without a connection.
+
+        Args:
+            cmd (str): The remote command.
+
+        Returns:
+            The response line without a line terminator or None if SENTIO does not answer the command.
+        """
+        cmd = cmd.strip()
+        if cmd.startswith("*") and "?" not in cmd:
+            return None
+
+        name, _, rest = cmd.partition(" ")
+        name = name.lower()
+        args = [a.strip() for a in rest.split(",")] if rest.strip() else []
+
+        with self.__cond:
+            self.__num_commands += 1
+            if self.processing_time > 0:
+                time.sleep(self.processing_time)
+
+            try:
+                handler = self.__handlers.get(name)
+                if handler is not None:
+                    reply = handler(args)
+                elif name.rsplit(":", 1)[-1].startswith("start_"):
+                    reply = self.__start_async()
+                elif name.endswith(":get_prop"):
+                    reply = self.__get_prop(name.rsplit(":", 1)[0], args)
+                elif name.endswith(":set_prop"):
+                    reply = self.__set_prop(name.rsplit(":", 1)[0], args)
+                else:
+                    raise SimulatorError(RemoteCommandError.CommandHandlerNotFound, f"Command handler for \"{name}\" not found")
+            except SimulatorError as e:
+                return f"{e.errc},{e.cmd_id},{e.msg}"
+            except (ValueError, IndexError):
+                return f"{RemoteCommandError.InvalidParameter},0,Invalid parameter"
+
+        if isinstance(reply, str):
+            return f"0,0,{reply}"
+
+        status, cmd_id, msg = reply
+        return f"{status << 10},{cmd_id},{msg}"
+
+
+    #
+    # Server
+    #
+
+    def __accept(self, listener: socket.socket) -> None:
+        while True:
+            try:
+                conn, _ = listener.accept()
+            except OSError:
+                return
+
+            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self.__connections.append(conn)
+            thread = threading.Thread(target=self.__serve, args=(conn,), daemon=True)
+            thread.start()
+            self.__threads.append(thread)
+
+
+    def __serve(self, conn: socket.socket) -> None:
+        # Responses are queued with their due time and written by a separate thread.
+        # This delays each response by the link latency without delaying the processing
+        # of commands that arrive in the meantime.
+        queue: List[Tuple[float, int, bytes]] = []
+        cond = threading.Condition()
+        closed = False
+
+        def write():
+            while True:
+                with cond:
+                    while not queue and not closed:
+                        cond.wait()
+                    if not queue:
+                        return
+                    due, _, data = queue[0]
+                    now = time.perf_counter()
+                    if due > now:
+                        cond.wait(due - now)
+                        continue
+                    heapq.heappop(queue)
+                try:
+                    conn.sendall(data)
+                except OSError:
+                    return
+
+        writer = threading.Thread(target=write, daemon=True)
+        writer.start()
+
+        seq = 0
+        buf = bytearray()
+        try:
+            while True:
+                try:
+                    data = conn.recv(65536)
+                except OSError:
+                    break
+                if not data:
+                    break
+
+                # only search the new data for line terminators, commands may be huge (i.e. file_transfer)
+                scan = len(buf)
+                buf += data
+                lines = []
+                while (pos := buf.find(b"\n", scan)) >= 0:
+                    lines.append(bytes(buf[:pos]))
+                    del buf[:pos + 1]
+                    scan = 0
+
+                for line in lines:
+                    resp = self.execute(line.decode("utf-8", errors="replace"))
+                    if resp is None:
+                        continue
+
+                    seq += 1
+                    with cond:
+                        heapq.heappush(queue, (time.perf_counter() + self.latency, seq, (resp + "\n").encode("utf-8")))
+                        cond.notify()
+        finally:
+            with cond:
+                closed = True
+                cond.notify()
+            writer.join()
+            conn.close()
+            if conn in self.__connections:
+                self.__connections.remove(conn)
+
+
+    #
+    # Helper
+    #
+
+    @staticmethod
+    def __expect(args: List[str], min_args: int, max_args: int | None = None) -> None:
+        if len(args) < min_args or len(args) > (min_args if max_args is None else max_args):
+            raise SimulatorError(RemoteCommandError.InvalidNumberOfParameters, "Invalid number of parameters")
+
+
+    @staticmethod
+    def __is_relative(ref: str) -> bool:
+        return ref.lower() in ("r", "current", "relative")
+
+
+    def __idn(self, args: List[str]) -> Reply:
+        return "MPI Corporation,SENTIO Simulator,0,25.2.0.0"
+
+
+    def __set_chuck_temp(self, args: List[str]) -> Reply:
+        self.__expect(args, 1)
+        self.__temp = float(args[0])
+        return "ok"
+
+
+    def __get_prop(self, module: str, args: List[str]) -> Reply:
+        self.__expect(args, 1, 2)
+        value = self.__props.get((module, ", ".join(args).lower()))
+        if value is None:
+            raise SimulatorError(RemoteCommandError.InvalidParameter, f"Unknown property {args[0]}")
+
+        return value
+
+
+    def __set_prop(self, module: str, args: List[str]) -> Reply:
+        self.__expect(args, 2, 3)
+        self.__props[(module, ", ".join(args[:-1]).lower())] = args[-1]
+        return "ok"
+
+
+    def __file_transfer(self, args: List[str]) -> Reply:
+        self.__expect(args, 2)
+        try:
+            self.__files[args[0]] = base64.b64decode(args[1], validate=True)
+        except binascii.Error:
+            raise SimulatorError(RemoteCommandError.InvalidParameter, "Invalid base64 data")
+
+        return "ok"
+
+
+    def __vis_snap_image(self, args: List[str]) -> Reply:
+        self.__expect(args, 1, 2)
+        if args[0] == "**download**":
+            return base64.b64encode(self.snapshot).decode("ascii")
+
+        self.__files[args[0]] = self.snapshot
+        return "ok"
+
+
+    #
+    # Async commands
+    #
+
+    def __start_async(self) -> Reply:
+        cmd_id = self.__next_cmd_id
+        self.__next_cmd_id += 1
+        self.__async[cmd_id] = _AsyncCommand(time.perf_counter() + self.async_duration)
+        return 0, cmd_id, "ok"
+
+
+    def __get_async(self, args: List[str]) -> Tuple[int, _AsyncCommand]:
+        cmd_id = int(args[0])
+        if cmd_id not in self.__async:
+            raise SimulatorError(RemoteCommandError.UnknownCommandId, f"Unknown command id {cmd_id}")
+
+        return cmd_id, self.__async[cmd_id]
+
+
+    def __wait_complete(self, args: List[str]) -> Reply:
+        self.__expect(args, 1, 2)
+        cmd_id, job = self.__get_async(args)
+        deadline = time.perf_counter() + (float(args[1]) if len(args) > 1 else 300)
+
+        # waiting on the condition releases the lock so that other connections are served
+        while job.pending(now := time.perf_counter()):
+            if now >= deadline:
+                raise SimulatorError(RemoteCommandError.Timeout, "Timeout", cmd_id)
+            self.__cond.wait(min(job.due, deadline) - now)
+
+        if job.aborted:
+            raise SimulatorError(RemoteCommandError.AsyncCommandAborted, "Command aborted", cmd_id)
+
+        return 0, cmd_id, "ok"
+
+
+    def __wait_all(self, args: List[str]) -> Reply:
+        self.__expect(args, 0, 1)
+        deadline = time.perf_counter() + (float(args[0]) if args else 90)
+
+        while any(job.pending(now := time.perf_counter()) for job in self.__async.values()):
+            if now >= deadline:
+                raise SimulatorError(RemoteCommandError.Timeout, "Timeout")
+            self.__cond.wait(min(max(job.due for job in self.__async.values() if job.pending(now)), deadline) - now)
+
+        return "ok"
+
+
+    def __query_command_status(self, args: List[str]) -> Reply:
+        self.__expect(args, 1)
+        cmd_id, job = self.__get_async(args)
+
+        if job.aborted:
+            raise SimulatorError(RemoteCommandError.AsyncCommandAborted, "Command aborted", cmd_id)
+
+        if job.pending(time.perf_counter()):
+            raise SimulatorError(RemoteCommandError.CommandPending, "Command pending", cmd_id)
+
+        return 0, cmd_id, "ok"
+
+
+    def __abort_command(self, args: List[str]) -> Reply:
+        self.__expect(args, 1)
+        _, job = self.__get_async(args)
+
+        if job.pending(time.perf_counter()):
+            job.aborted = True
+            self.__cond.notify_all()
+
+        return "ok"
+
+
+    #
+    # Wafermap
+    #
+
+    def __create_grid(self, cols: int, rows: int, present: Callable[[int, int], bool]) -> None:
+        self.__cols = cols
+        self.__rows = rows
+        self.__dies = {(c, r): True for r in range(rows) for c in range(cols) if present(c, r)}
+        self.__bins.clear()
+        self.__values.clear()
+        self.__route = None
+        self.__route_pos = -1
+        self.__die = None
+        self.__site = 0
+
+
+    def __map_create(self, args: List[str]) -> Reply:
+        self.__expect(args, 1)
+        self.__diameter = int(float(args[0]))
+        radius = self.__diameter * 500.0
+        cols = max(1, math.ceil(2 * radius / self.__index[0]))
+        rows = max(1, math.ceil(2 * radius / self.__index[1]))
+
+        def inside(c: int, r: int) -> bool:
+            x = (c + 0.5) * self.__index[0] - cols * self.__index[0] / 2
+            y = (r + 0.5) * self.__index[1] - rows * self.__index[1] / 2
+            return x * x + y * y <= radius * radius
+
+        self.__create_grid(cols, rows, inside)
+        return "ok"
+
+
+    def __map_create_rect(self, args: List[str]) -> Reply:
+        self.__expect(args, 2)
+        cols, rows = int(args[0]), int(args[1])
+        if cols <= 0 or rows <= 0:
+            raise SimulatorError(RemoteCommandError.ArgumentOutOfBounds, "Invalid map size")
+
+        self.__create_grid(cols, rows, lambda c, r: True)
+        return "ok"
+
+
+    def __map_get_num_dies(self, args: List[str]) -> Reply:
+        self.__expect(args, 1)
+        what = args[0].lower()
+        if what == "present":
+            return str(len(self.__dies))
+        elif what == "selected":
+            return str(sum(self.__dies.values()))
+        elif what == "total":
+            return str(self.__cols * self.__rows)
+
+        raise SimulatorError(RemoteCommandError.InvalidParameter, f"Invalid die number selector {args[0]}")
+
+
+    def __map_set_diameter(self, args: List[str]) -> Reply:
+        self.__expect(args, 1)
+        self.__diameter = int(float(args[0]))
+        return "ok"
+
+
+    def __map_set_index_size(self, args: List[str]) -> Reply:
+        self.__expect(args, 2)
+        self.__index = (float(args[0]), float(args[1]))
+        return "ok"
+
+
+    def __map_set_street_size(self, args: List[str]) -> Reply:
+        self.__expect(args, 2)
+        self.__street = (float(args[0]), float(args[1]))
+        return "ok"
+
+
+    def __map_set_grid_origin(self, args: List[str]) -> Reply:
+        self.__expect(args, 2)
+        self.__grid_origin = (int(args[0]), int(args[1]))
+        return "ok"
+
+
+    def __map_set_home_die(self, args: List[str]) -> Reply:
+        self.__expect(args, 2)
+        self.__home_die = (int(args[0]), int(args[1]))
+        return "ok"
+
+
+    def __map_set_axis_orient(self, args: List[str]) -> Reply:
+        self.__expect(args, 1)
+        orient = args[0].upper()
+        if orient not in ("UL", "UR", "DL", "DR"):
+            raise SimulatorError(RemoteCommandError.InvalidParameter, f"Invalid axis orientation {args[0]}")
+
+        self.__axis_orient = orient
+        return "ok"
+
+
+    def __map_set_routing(self, args: List[str]) -> Reply:
+        self.__expect(args, 2)
+        start, priority = args[0].lower(), args[1].lower()
+        if start not in ("ul", "ur", "ll", "lr") or priority not in ("r", "c", "wr", "wc"):
+            raise SimulatorError(RemoteCommandError.InvalidParameter, "Invalid routing")
+
+        self.__routing = (start, priority)
+        self.__route = None
+        return "ok"
+
+
+    def __get_route(self) -> List[Tuple[int, int]]:
+        if self.__route is not None:
+            return self.__route
+
+        start, priority = self.__routing
+        col_desc = start in ("ur", "lr")
+        row_desc = start in ("ll", "lr")
+        by_row = priority in ("r", "wr")
+        winding = priority in ("wr", "wc")
+
+        lines: Dict[int, List[Tuple[int, int]]] = {}
+        for (c, r), selected in self.__dies.items():
+            if selected:
+                lines.setdefault(r if by_row else c, []).append((c, r))
+
+        # odd lines counted from the first stepped line are stepped backwards
+        keys = sorted(lines, reverse=row_desc if by_row else col_desc)
+        route: List[Tuple[int, int]] = []
+        for key in keys:
+            inner_desc = col_desc if by_row else row_desc
+            if winding and abs(key - keys[0]) % 2 == 1:
+                inner_desc = not inner_desc
+
+            route += sorted(lines[key], key=lambda d: d[0] if by_row else d[1], reverse=inner_desc)
+
+        self.__route = route
+        return route
+
+
+    def __die_position(self, col: int, row: int, site: int) -> Tuple[float, float]:
+        # The axis orientation defines in which direction column and row indices increase.
+        sx = -1 if self.__axis_orient[1] == "L" else 1
+        sy = 1 if self.__axis_orient[0] == "U" else -1
+        _, dx, dy = self.__subsites[site]
+        return (sx * (col - self.__home_die[0]) * self.__index[0] + dx,
+                sy * (row - self.__home_die[1]) * self.__index[1] + dy)
+
+
+    def __goto(self, col: int, row: int, site: int) -> Reply:
+        if (col, row) not in self.__dies:
+            raise SimulatorError(RemoteCommandError.InvalidParameter, f"Die {col}, {row} is not present")
+
+        if site < 0 or site >= len(self.__subsites):
+            raise SimulatorError(RemoteCommandError.ArgumentOutOfBounds, f"Invalid subsite {site}")
+
+        route = self.__get_route()
+        if (col, row) in route:
+            self.__route_pos = route.index((col, row))
+
+        self.__die = (col, row)
+        self.__site = site
+        self.__chuck[0], self.__chuck[1] = self.__die_position(col, row, site)
+
+        status = 0
+        if route and self.__route_pos == len(route) - 1 and route[-1] == (col, row):
+            status |= StatusBits.EndOfRoute
+        if site == len(self.__subsites) - 1:
+            status |= StatusBits.LastSite
+
+        return status, 0, f"{col},{row},{site}"
+
+
+    def __goto_seq(self, seq: int, site: int) -> Reply:
+        route = self.__get_route()
+        if not route:
+            raise SimulatorError(RemoteCommandError.InvalidOperation, "No dies selected for test")
+        if seq < 0 or seq >= len(route):
+            raise SimulatorError(RemoteCommandError.EndOfRoute, "End of route")
+
+        self.__route_pos = seq
+        return self.__goto(*route[seq], site)
+
+
+    def __current_die(self) -> Tuple[int, int]:
+        if self.__die is None:
+            raise SimulatorError(RemoteCommandError.InvalidOperation, "No current die")
+
+        return self.__die
+
+
+    def __map_step_first_die(self, args: List[str]) -> Reply:
+        self.__expect(args, 0, 1)
+        return self.__goto_seq(0, int(args[0]) if args else 0)
+
+
+    def __map_step_next_die(self, args: List[str]) -> Reply:
+        self.__expect(args, 0, 1)
+        return self.__goto_seq(self.__route_pos + 1, int(args[0]) if args else self.__site)
+
+
+    def __map_step_previous_die(self, args: List[str]) -> Reply:
+        self.__expect(args, 0)
+        if self.__route_pos <= 0:
+            raise SimulatorError(RemoteCommandError.EndOfRoute, "Start of route")
+
+        return self.__goto_seq(self.__route_pos - 1, self.__site)
+
+
+    def __map_step_die(self, args: List[str]) -> Reply:
+        self.__expect(args, 2, 3)
+        return self.__goto(int(args[0]), int(args[1]), int(args[2]) if len(args) > 2 else 0)
+
+
+    def __map_step_die_seq(self, args: List[str]) -> Reply:
+        self.__expect(args, 2)
+        return self.__goto_seq(int(args[0]), int(args[1]))
+
+
+    def __map_bin_step_next_die(self, args: List[str]) -> Reply:
+        self.__expect(args, 1, 2)
+        col, row = self.__current_die()
+        self.__bins[(col, row, self.__site)] = int(args[0])
+        return self.__map_step_next_die(args[1:])
+
+
+    def __die_arg(self, args: List[str]) -> Tuple[int, int]:
+        self.__expect(args, 2)
+        die = (int(args[0]), int(args[1]))
+        if not 0 <= die[0] < self.__cols or not 0 <= die[1] < self.__rows:
+            raise SimulatorError(RemoteCommandError.ArgumentOutOfBounds, f"Die {die[0]}, {die[1]} is outside of the map")
+
+        return die
+
+
+    def __map_die_add(self, args: List[str]) -> Reply:
+        die = self.__die_arg(args)
+        self.__dies.setdefault(die, True)
+        self.__route = None
+        return "ok"
+
+
+    def __map_die_remove(self, args: List[str]) -> Reply:
+        die = self.__die_arg(args)
+        self.__dies.pop(die, None)
+        self.__route = None
+        return "ok"
+
+
+    def __select(self, args: List[str], selected: bool) -> Reply:
+        die = self.__die_arg(args)
+        if die not in self.__dies:
+            raise SimulatorError(RemoteCommandError.InvalidParameter, f"Die {die[0]}, {die[1]} is not present")
+
+        self.__dies[die] = selected
+        self.__route = None
+        return "ok"
+
+
+    def __map_die_select(self, args: List[str]) -> Reply:
+        return self.__select(args, True)
+
+
+    def __map_die_unselect(self, args: List[str]) -> Reply:
+        return self.__select(args, False)
+
+
+    def __map_die_get_status(self, args: List[str]) -> Reply:
+        die = self.__die_arg(args)
+        if die not in self.__dies:
+            return "3"
+
+        return "1" if self.__dies[die] else "2"
+
+
+    def __map_die_get_current_index(self, args: List[str]) -> Reply:
+        col, row = self.__current_die()
+        return f"{col},{row},{self.__site}"
+
+
+    def __map_path_get_die(self, args: List[str]) -> Reply:
+        self.__expect(args, 1)
+        route = self.__get_route()
+        seq = int(args[0])
+        if seq < 0 or seq >= len(route):
+            raise SimulatorError(RemoteCommandError.ArgumentOutOfBounds, f"Invalid sequence number {seq}")
+
+        return f"{route[seq][0]},{route[seq][1]}"
+
+
+    def __map_path_select_dies(self, args: List[str]) -> Reply:
+        # The simulator does not model die quality. Everything but "n" selects all present dies.
+        self.__expect(args, 1)
+        selected = args[0].lower() != "n"
+        for die in self.__dies:
+            self.__dies[die] = selected
+
+        self.__route = None
+        return "ok"
+
+
+    def __map_path_create_from_bins(self, args: List[str]) -> Reply:
+        wanted = set()
+        for arg in args:
+            first, _, last = arg.partition("-")
+            wanted.update(range(int(first), int(last or first) + 1))
+
+        for (c, r) in self.__dies:
+            self.__dies[(c, r)] = self.__bins.get((c, r, 0), -1) in wanted
+
+        self.__route = None
+        return str(sum(self.__dies.values()))
+
+
+    #
+    # Bins
+    #
+
+    def __bin_target(self, args: List[str]) -> Tuple[int, int, int]:
+        if not args:
+            col, row = self.__current_die()
+            return col, row, self.__site
+
+        col, row = self.__die_arg(args[:2])
+        return col, row, int(args[2]) if len(args) > 2 else 0
+
+
+    def __map_bins_get_bin(self, args: List[str]) -> Reply:
+        self.__expect(args, 0, 3)
+        return str(self.__bins.get(self.__bin_target(args), -1))
+
+
+    def __map_bins_set_bin(self, args: List[str]) -> Reply:
+        self.__expect(args, 1, 4)
+        self.__bins[self.__bin_target(args[1:])] = int(args[0])
+        return "ok"
+
+
+    def __map_bins_set_all(self, args: List[str]) -> Reply:
+        self.__expect(args, 2)
+        value, selection = int(args[0]), args[1].lower()
+        sites = {"a": range(len(self.__subsites)), "d": range(1), "s": range(1, len(self.__subsites))}.get(selection)
+        if sites is None:
+            raise SimulatorError(RemoteCommandError.InvalidParameter, f"Invalid bin selection {args[1]}")
+
+        for (c, r), selected in self.__dies.items():
+            if selected:
+                for site in sites:
+                    self.__bins[(c, r, site)] = value
+
+        return "ok"
+
+
+    def __map_bins_clear_all(self, args: List[str]) -> Reply:
+        self.__bins.clear()
+        return "ok"
+
+
+    def __map_bins_clear_all_values(self, args: List[str]) -> Reply:
+        self.__values.clear()
+        return "ok"
+
+
+    def __map_bins_set_value(self, args: List[str]) -> Reply:
+        self.__expect(args, 3)
+        self.__values[self.__die_arg(args[1:])] = float(args[0])
+        return "ok"
+
+
+    def __map_bins_resize(self, args: List[str]) -> Reply:
+        self.__expect(args, 1)
+        size = int(args[0])
+        if size < 1:
+            raise SimulatorError(RemoteCommandError.ArgumentOutOfBounds, "Invalid bin table size")
+
+        self.__bin_table = self.__bin_table[:size] + [(f"Bin {i}", "Undefined", "#808080") for i in range(len(self.__bin_table), size)]
+        return "ok"
+
+
+    def __bin_index(self, arg: str) -> int:
+        index = int(arg)
+        if index < 0 or index >= len(self.__bin_table):
+            raise SimulatorError(RemoteCommandError.ArgumentOutOfBounds, f"Invalid bin {index}")
+
+        return index
+
+
+    def __map_bins_get_bin_info(self, args: List[str]) -> Reply:
+        self.__expect(args, 1)
+        index = self.__bin_index(args[0])
+        desc, quality, color = self.__bin_table[index]
+        return f"{index},{desc},{quality},{color}"
+
+
+    def __map_bins_set_bin_info(self, args: List[str]) -> Reply:
+        self.__expect(args, 4)
+        index = self.__bin_index(args[0])
+        self.__bin_table[index] = (args[1], args[2].capitalize(), args[3])
+        return "ok"
+
+
+    #
+    # Subsites
+    #
+
+    def __orient_signs(self, orient: str) -> Tuple[int, int]:
+        orient = orient.upper()
+        if orient not in ("UL", "UR", "DL", "DR"):
+            raise SimulatorError(RemoteCommandError.InvalidParameter, f"Invalid axis orientation {orient}")
+
+        return (-1 if orient[1] == "L" else 1), (1 if orient[0] == "U" else -1)
+
+
+    def __subsite_index(self, arg: str) -> int:
+        for i, (sid, _, _) in enumerate(self.__subsites):
+            if sid == arg:
+                return i
+
+        index = int(arg)
+        if index < 0 or index >= len(self.__subsites):
+            raise SimulatorError(RemoteCommandError.ArgumentOutOfBounds, f"Invalid subsite {arg}")
+
+        return index
+
+
+    def __map_subsite_add(self, args: List[str]) -> Reply:
+        self.__expect(args, 3, 4)
+        sx, sy = self.__orient_signs(args[3] if len(args) > 3 else "UR")
+        self.__subsites.append((args[0], sx * float(args[1]), sy * float(args[2])))
+        return str(len(self.__subsites) - 1)
+
+
+    def __map_subsite_get(self, args: List[str]) -> Reply:
+        self.__expect(args, 1, 2)
+        sid, x, y = self.__subsites[self.__subsite_index(args[0])]
+        sx, sy = self.__orient_signs(args[1] if len(args) > 1 and args[1] else "UR")
+        return f"{sid},{sx * x},{sy * y}"
+
+
+    def __map_subsite_remove(self, args: List[str]) -> Reply:
+        self.__expect(args, 1)
+        index = self.__subsite_index(args[0])
+        if index == 0:
+            raise SimulatorError(RemoteCommandError.InvalidOperation, "The die reference cannot be removed")
+
+        del self.__subsites[index]
+        self.__site = min(self.__site, len(self.__subsites) - 1)
+        return "ok"
+
+
+    def __map_subsite_reset(self, args: List[str]) -> Reply:
+        self.__subsites = self.__subsites[:1]
+        self.__site = 0
+        return "ok"
+
+
+    def __map_subsite_step(self, args: List[str]) -> Reply:
+        self.__expect(args, 1)
+        col, row = self.__current_die()
+        return self.__goto(col, row, self.__subsite_index(args[0]))
+
+
+    def __map_subsite_step_next(self, args: List[str]) -> Reply:
+        col, row = self.__current_die()
+        if self.__site + 1 < len(self.__subsites):
+            return self.__goto(col, row, self.__site + 1)
+
+        return self.__goto_seq(self.__route_pos + 1, 0)
+
+
+    def __map_subsite_step_previous(self, args: List[str]) -> Reply:
+        col, row = self.__current_die()
+        if self.__site > 0:
+            return self.__goto(col, row, self.__site - 1)
+
+        if self.__route_pos <= 0:
+            raise SimulatorError(RemoteCommandError.EndOfRoute, "Start of route")
+
+        return self.__goto_seq(self.__route_pos - 1, len(self.__subsites) - 1)
+
+
+    def __map_subsite_bin_step_next(self, args: List[str]) -> Reply:
+        self.__expect(args, 1)
+        col, row = self.__current_die()
+        self.__bins[(col, row, self.__site)] = int(args[0])
+        return self.__map_subsite_step_next([])
+
+
+    #
+    # Chuck
+    #
+
+    def __get_chuck_xy(self, args: List[str]) -> Reply:
+        # The stage command group only passes the reference, the legacy command also passes the chuck site.
+        ref = args[-1] if args else "Z"
+        if self.__is_relative(ref):
+            return "0.0,0.0"
+
+        return f"{self.__chuck[0]},{self.__chuck[1]}"
+
+
+    def __stage_get_chuck_xy(self, args: List[str]) -> Reply:
+        # Since SENTIO 25.2 the reference is returned along with the position.
+        self.__expect(args, 0, 1)
+        return f"{self.__get_chuck_xy(args)},{args[0] if args else 'Z'}"
+
+
+    def __move_chuck_xy(self, args: List[str]) -> Reply:
+        self.__expect(args, 3)
+        x, y = float(args[1]), float(args[2])
+        if self.__is_relative(args[0]):
+            x += self.__chuck[0]
+            y += self.__chuck[1]
+
+        self.__chuck[0], self.__chuck[1] = x, y
+        return f"{x},{y}"
+
+
+    def __z_reference(self, ref: str) -> float:
+        ref = ref.lower()
+        if ref in ("c", "contact"):
+            return self.__contact_height
+        elif ref in ("s", "separation", "h", "hover"):
+            return self.__contact_height - self.__separation_gap
+        elif self.__is_relative(ref):
+            return self.__chuck[2]
+
+        return 0.0
+
+
+    def __get_chuck_z(self, args: List[str]) -> Reply:
+        self.__expect(args, 0, 1)
+        return str(self.__chuck[2] - self.__z_reference(args[0] if args else "Z"))
+
+
+    def __move_chuck_z(self, args: List[str]) -> Reply:
+        self.__expect(args, 2)
+        self.__chuck[2] = self.__z_reference(args[0]) + float(args[1])
+        return str(self.__chuck[2])
+
+
+    def __move_chuck_theta(self, args: List[str]) -> Reply:
+        self.__expect(args, 2)
+        angle = float(args[1])
+        self.__chuck[3] = self.__chuck[3] + angle if self.__is_relative(args[0]) else angle
+        return str(self.__chuck[3])
+
+
+    def __move_chuck_contact(self, args: List[str]) -> Reply:
+        self.__chuck[2] = self.__contact_height
+        return str(self.__chuck[2])
+
+
+    def __move_chuck_separation(self, args: List[str]) -> Reply:
+        self.__chuck[2] = self.__contact_height - self.__separation_gap
+        return str(self.__chuck[2])
+
+
+    def __move_chuck_home(self, args: List[str]) -> Reply:
+        self.__chuck[0], self.__chuck[1] = 0.0, 0.0
+        return "0.0,0.0"
+
+
+    #
+    # Loader
+    #
+
+    def __station(self, arg: str) -> Dict[int, list]:
+        station = self.__stations.get(arg.lower())
+        if station is None:
+            raise SimulatorError(RemoteCommandError.InvalidParameter, f"Invalid loader station {arg}")
+
+        return station
+
+
+    def __slot(self, station: str, slot: str) -> Tuple[Dict[int, list], int]:
+        slots = self.__station(station)
+        index = int(slot)
+        if index < 1 or index > self.__slots[station.lower()]:
+            raise SimulatorError(RemoteCommandError.ArgumentOutOfBounds, f"Invalid slot {slot}")
+
+        return slots, index
+
+
+    def __move_wafer(self, src: str, src_slot: str, dst: str, dst_slot: str) -> None:
+        src_station, src_index = self.__slot(src, src_slot)
+        dst_station, dst_index = self.__slot(dst, dst_slot)
+
+        if src_index not in src_station:
+            raise SimulatorError(RemoteCommandError.SlotOrStationEmpty, "Source slot is empty")
+        if dst_index in dst_station:
+            raise SimulatorError(RemoteCommandError.SlotOrStationOccupied, "Destination slot is occupied")
+
+        dst_station[dst_index] = src_station.pop(src_index)
+
+
+    def __loader_has_station(self, args: List[str]) -> Reply:
+        self.__expect(args, 1)
+        return "1" if args[0].lower() in self.__stations else "0"
+
+
+    def __loader_has_cassette(self, args: List[str]) -> Reply:
+        self.__expect(args, 1)
+        self.__station(args[0])
+        return "1,200" if self.__slots[args[0].lower()] > 1 else "0,0"
+
+
+    def __loader_scan_station(self, args: List[str]) -> Reply:
+        self.__expect(args, 1)
+        station = self.__station(args[0])
+        return "".join("1" if slot in station else "0" for slot in range(1, self.__slots[args[0].lower()] + 1))
+
+
+    def __loader_load_wafer(self, args: List[str]) -> Reply:
+        self.__expect(args, 2, 3)
+        self.__move_wafer(args[0], args[1], "chuck", "1")
+        return "ok"
+
+
+    def __loader_unload_wafer(self, args: List[str]) -> Reply:
+        self.__expect(args, 0, 2)
+        wafer = self.__stations["chuck"].get(1)
+        if wafer is None:
+            raise SimulatorError(RemoteCommandError.SlotOrStationEmpty, "No wafer on chuck")
+
+        if len(args) == 2:
+            self.__move_wafer("chuck", "1", args[0], args[1])
+        else:
+            self.__move_wafer("chuck", "1", wafer[0], str(wafer[1]))
+
+        return "ok"
+
+
+    def __loader_transfer_wafer(self, args: List[str]) -> Reply:
+        self.__expect(args, 4)
+        self.__move_wafer(*args)
+        return "ok"
+
+
+    def __loader_query_wafer_status(self, args: List[str]) -> Reply:
+        self.__expect(args, 2)
+        station, index = self.__slot(args[0], args[1])
+        if index not in station:
+            raise SimulatorError(RemoteCommandError.SlotOrStationEmpty, "Slot is empty")
+
+        origin, origin_slot, size, orient, progress = station[index]
+        name = next(s.name for s in LoaderStation if s.to_string() == origin)
+        return f"{name},{origin_slot},{size},{orient},{progress}"
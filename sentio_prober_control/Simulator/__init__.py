@@ -0,0 +1,6 @@
+""" A local stand-in for the SENTIO remote command server.
+
+    The simulator speaks SENTIO's "errc,cmd_id,msg" response protocol over TCP/IP and models
+    enough prober state (wafermap, bins, subsites, chuck position, async commands and loader slots)
+    to run real remote command flows without hardware.
+"""
@@ -0,0 +1,42 @@
+import unittest
+
+from sentio_prober_control.Communication.CommunicatorBase import CommunicatorBase
+from sentio_prober_control.Communication.CommunicatorTcpIp import CommunicatorTcpIp
+from sentio_prober_control.Sentio.ProberSentio import SentioProber
+from sentio_prober_control.Simulator.SentioSimulator import SentioSimulator
+
+
+class SimulatorTestCase(unittest.TestCase):
+    """Base class for tests that talk to a local SentioSimulator over TCP/IP.
+
+    setUp starts a simulator on a free port and connects a communicator and a prober to it.
+    Both are shut down again after every test. Derived classes that need a different
+    communicator override create_comm. Derived classes that count the commands received
+    by the simulator set create_prober to False, because constructing a prober queries the
+    SENTIO version.
+    """
+
+    create_prober: bool = True
+    """ Wether setUp creates self.prober. """
+
+    def setUp(self):
+        self.sim = SentioSimulator(port=0)
+        self.sim.start()
+        self.addCleanup(self.sim.stop)
+
+        self.comm = self.create_comm(self.sim.address)
+        self.addCleanup(self.comm.disconnect)
+
+        if self.create_prober:
+            self.prober = SentioProber(self.comm)
+
+    def create_comm(self, address: str) -> CommunicatorBase:
+        """Create the communicator connected to the simulator.
+
+        Args:
+            address (str): The address of the simulator in the form "IP_ADDRESS:PORT".
+
+        Returns:
+            The connected communicator. It is disconnected after the test.
+        """
+        return CommunicatorTcpIp.create(address)
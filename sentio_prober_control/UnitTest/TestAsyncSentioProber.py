@@ -0,0 +1,156 @@
+import asyncio
+import threading
+import time
+import unittest
+from sentio_prober_control.Communication.AsyncCommunicatorTcpIp import AsyncCommunicatorTcpIp
+from sentio_prober_control.Sentio.AsyncProberSentio import AsyncSentioProber
+from sentio_prober_control.Sentio.Compatibility import CompatibilityLevel
+from sentio_prober_control.Sentio.Enumerations import ChuckSite, XyReference
+from sentio_prober_control.Sentio.ProberBase import ProberException
+
+
+class FakeAsyncComm:
+    """An asynchronous communicator that answers from a list of canned responses."""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.sent = []
+
+    async def send(self, msg):
+        self.sent.append(msg)
+
+    async def read_line(self):
+        await asyncio.sleep(0)
+        return self.responses.pop(0)
+
+
+class TestAsyncSentioProber(unittest.TestCase):
+    def create(self, responses):
+        self.comm = FakeAsyncComm(["0,0,Version: 25.2.0.0"] + responses)
+        return asyncio.run(self.make_prober())
+
+    async def make_prober(self):
+        return await AsyncSentioProber.create(self.comm)
+
+    def test_create_initializes_session(self):
+        self.create([])
+        self.assertEqual(self.comm.sent, ["*RCS 1", "status:get_version"])
+
+    def test_command_group_functions_are_awaitable(self):
+        prober = self.create(["0,0,3,4,0"])
+
+        async def run():
+            return await prober.map.step_die(3, 4)
+
+        self.assertEqual(asyncio.run(run()), (3, 4, 0))
+        self.assertEqual(self.comm.sent[-1], "map:step_die 3, 4, 0")
+
+    def test_prober_functions_are_awaitable(self):
+        prober = self.create(["0,0,100,200"])
+
+        async def run():
+            return await prober.get_chuck_xy(ChuckSite.Wafer, XyReference.Zero)
+
+        self.assertEqual(asyncio.run(run()), (100.0, 200.0))
+
+    def test_multiple_round_trips(self):
+        prober = self.create(["0,42,ok", "0,42,ok"])
+
+        async def run():
+            await prober.show_hint_and_wait("msg", "sub", "Ok", 10)
+
+        asyncio.run(run())
+        self.assertEqual(self.comm.sent[-2:], ['status:start_show_hint "msg", "sub", "Ok", "True"', "wait_complete 42, 10"])
+
+    def test_error_is_raised(self):
+        prober = self.create(["2,0,end of route"])
+
+        async def run():
+            await prober.map.step_next_die()
+
+        with self.assertRaises(ProberException):
+            asyncio.run(run())
+
+    def test_wrapper_runs_once(self):
+        prober = self.create(["0,0,10", "0,0,20"])
+        runs = []
+
+        def call():
+            runs.append(1)
+            return prober.sync_prober.map.get_num_cols(), prober.sync_prober.map.get_num_rows()
+
+        async def run():
+            return await prober.run(call)
+
+        self.assertEqual(asyncio.run(run()), (10, 20))
+        self.assertEqual(len(runs), 1)
+
+    def test_blocking_wrapper_does_not_block_event_loop(self):
+        prober = self.create(["0,0,10"])
+        ticks = []
+
+        def call():
+            time.sleep(0.2)
+            return prober.sync_prober.map.get_num_cols()
+
+        async def tick():
+            for _ in range(5):
+                await asyncio.sleep(0.01)
+                ticks.append(time.perf_counter())
+
+        async def run():
+            return (await asyncio.gather(prober.run(call), tick()))[0]
+
+        start = time.perf_counter()
+        self.assertEqual(asyncio.run(run()), 10)
+        self.assertEqual(len(ticks), 5)
+        self.assertLess(ticks[-1] - start, 0.15)
+
+    def test_dedicated_worker_thread(self):
+        prober = self.create([])
+
+        async def run():
+            # a busy default executor must not delay the wrappers
+            loop = asyncio.get_running_loop()
+            blocker = loop.run_in_executor(None, time.sleep, 0.3)
+            name = await asyncio.wait_for(prober.run(lambda: threading.current_thread().name), 0.2)
+            await blocker
+            return name
+
+        self.assertTrue(asyncio.run(run()).startswith("AsyncSentioProber"))
+
+    def test_wrappers_catching_exceptions(self):
+        prober = self.create(["0,0,vc1,vc2"])
+
+        async def run():
+            return await prober.loader.vc.list()
+
+        self.assertEqual(asyncio.run(run()), ["vc1", "vc2"])
+
+
+class TestAsyncCommunicatorTcpIp(unittest.TestCase):
+    def test_round_trip(self):
+        async def handle(reader, writer):
+            while line := await reader.readline():
+                if line.startswith(b"*RCS"):
+                    continue
+                writer.write(b"0,0,Version: 25.2.0.0\n" if b"get_version" in line else b"0,0,17.5\n")
+                await writer.drain()
+            writer.close()
+
+        async def run():
+            server = await asyncio.start_server(handle, "127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            comm = await AsyncCommunicatorTcpIp.create(f"127.0.0.1:{port}")
+            prober = await AsyncSentioProber.create(comm, CompatibilityLevel.Auto)
+            temps = await asyncio.gather(prober.status.get_chuck_temp(), prober.status.get_chuck_temp())
+            await prober.disconnect()
+            server.close()
+            await server.wait_closed()
+            return temps
+
+        self.assertEqual(asyncio.run(run()), [17.5, 17.5])
+
+
+if __name__ == "__main__":
+    unittest.main()
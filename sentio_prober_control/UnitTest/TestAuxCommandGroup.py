@@ -1,5 +1,5 @@
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 from sentio_prober_control.Communication.CommunicatorTcpIp import CommunicatorTcpIp
 from sentio_prober_control.Sentio.ProberSentio import SentioProber
 from sentio_prober_control.Sentio.Response import Response
@@ -24,23 +24,20 @@ class FakeResponse:
             return self._message[len(prefix):]
         return self._message
 
-# Save the original Response.check_resp so we can restore it after tests.
-_original_check_resp = Response.check_resp
-# Patch Response.check_resp to wrap the raw line in a FakeResponse.
-Response.check_resp = lambda line: FakeResponse(line)
-
 class TestAuxCommandGroup(unittest.TestCase):
     def setUp(self):
+        # Patch Response.check_resp to wrap the raw line in a FakeResponse.
+        # The original is restored after each test.
+        patcher = patch.object(Response, "check_resp", lambda line: FakeResponse(line))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
         # Create a mock communicator based on CommunicatorTcpIp.
         self.mock_comm = MagicMock(spec=CommunicatorTcpIp)
         # Create a SentioProber instance (which instantiates the aux command group).
         self.prober = SentioProber(self.mock_comm)
         self.aux: AuxCommandGroup = self.prober.aux
 
-    def tearDown(self):
-        # Restore the original Response.check_resp.
-        Response.check_resp = _original_check_resp
-
     # 1) Test retrieve_substrate_data
     def test_retrieve_substrate_data_no_site(self):
         # Return response with three sites: AuxRight, AuxLeft, AuxRight2
@@ -0,0 +1,84 @@
+import unittest
+
+from sentio_prober_control.Sentio.BinWriter import BinWriter
+from sentio_prober_control.Sentio.ProberBase import ProberException
+from sentio_prober_control.UnitTest.SimulatorTestCase import SimulatorTestCase
+
+
+class TestBinWriter(SimulatorTestCase):
+    def setUp(self):
+        super().setUp()
+        self.prober.map.create_rect(5, 4)
+
+    def test_flush_at_end_of_route(self):
+        binned = {}
+        with BinWriter(self.prober, capacity=1000) as writer:
+            col, row, site = self.prober.map.step_first_die()
+            while True:
+                binned[(col, row)] = (col + row) % 3
+                writer.write(col, row, binned[(col, row)], value=col * 0.5)
+                if len(binned) == 10:
+                    self.assertEqual(self.prober.map.bins.get_bin(col, row), -1)
+
+                if self.prober.map.end_of_route():
+                    break
+
+                col, row, site = self.prober.map.step_next_die()
+
+            # the route is finished by the next stepping command, the last die is included
+            self.assertEqual(len(writer), 20)
+            self.prober.map.step_first_die()
+            self.assertEqual(len(writer), 0)
+            self.assertEqual(writer.num_written, 2 * len(binned))
+
+        self.assertEqual(len(binned), 20)
+        for (col, row), bin_value in binned.items():
+            self.assertEqual(self.prober.map.bins.get_bin(col, row), bin_value)
+
+    def test_route_end_error_is_raised_by_flush(self):
+        writer = BinWriter(self.prober)
+        self.prober.map.step_first_die()
+        while not self.prober.map.end_of_route():
+            self.prober.map.step_next_die()
+
+        writer.write(99, 99, 3)
+        writer.write(2, 2, 4)
+        self.assertEqual(len(self.prober.map.step_first_die()), 3)
+        self.assertEqual(len(writer), 0)
+        self.assertEqual(self.prober.map.bins.get_bin(2, 2), 4)
+
+        with self.assertRaises(ProberException):
+            writer.close()
+
+    def test_coalesce_and_capacity(self):
+        writer = BinWriter(self.prober, capacity=4)
+        writer.write(1, 1, 3)
+        writer.write(1, 1, 4)
+        writer.write(1, 1, 5, site=0)
+        self.assertEqual(len(writer), 3)
+
+        count = self.sim.num_commands
+        writer.write(2, 1, None, value=1.5)
+        self.assertEqual(len(writer), 0)
+        self.assertEqual(self.sim.num_commands, count + 3)
+        self.assertEqual(self.prober.map.bins.get_bin(1, 1), 5)
+
+        writer.close()
+        with self.assertRaises(ValueError):
+            writer.write(1, 1, 3)
+
+    def test_error_is_raised_after_all_records_were_sent(self):
+        writer = BinWriter(self.prober)
+        writer.write(1, 1, 3)
+        writer.write(99, 99, 3)
+        writer.write(2, 2, 4)
+
+        with self.assertRaises(ProberException):
+            writer.flush()
+
+        self.assertEqual(len(writer), 0)
+        self.assertEqual(self.prober.map.bins.get_bin(2, 2), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+import math
+import unittest
+from unittest.mock import patch
+
+from sentio_prober_control.Sentio.Enumerations import AxisOrient, BinQuality, DieNumber
+from sentio_prober_control.Sentio.ProberBase import ProberException
+from sentio_prober_control.Sentio.PropertyCache import PropertyCache
+from sentio_prober_control.UnitTest.SimulatorTestCase import SimulatorTestCase
+
+
+class TestCommandBatch(SimulatorTestCase):
+    def setUp(self):
+        super().setUp()
+        self.prober.map.create_rect(10, 10)
+
+    def test_send_many(self):
+        self.comm.send_many(["map:get_num_cols", "*RCS 1", "map:get_num_rows"])
+        self.assertEqual(self.comm.read_line(), "0,0,10")
+        self.assertEqual(self.comm.read_line(), "0,0,10")
+
+    def test_batch_is_sent_in_few_writes(self):
+        with patch.object(self.comm, "send_many", wraps=self.comm.send_many) as send_many, \
+             patch.object(self.comm, "send", wraps=self.comm.send) as send:
+            with self.prober.batch(depth=64) as batch:
+                handles = [batch.map.subsites.add(f"S{i}", i, 2 * i) for i in range(200)]
+                self.assertFalse(handles[0].done())
+
+        self.assertEqual(send_many.call_count, 4)
+        self.assertEqual(send.call_count, 0)
+        self.assertEqual(len(batch.responses), 200)
+        self.assertEqual(batch.pending, 0)
+        self.assertEqual([h.result() for h in handles], list(range(1, 201)))
+        self.assertEqual(self.prober.map.subsites.get_num(), 201)
+        self.assertEqual(self.prober.map.subsites.get(5, AxisOrient.UpRight), ("S4", 4.0, 8.0))
+
+    def test_errors_are_raised_after_all_responses(self):
+        with self.assertRaises(ProberException):
+            with self.prober.batch() as batch:
+                batch.map.bins.set_bin_info(0, "Good", BinQuality.Pass, "#FF00FF00")
+                failed = batch.map.die.get_status(99, 99)
+                last = batch.map.get_num_cols()
+
+        self.assertEqual(len(batch.responses), 3)
+        self.assertNotEqual(batch.responses[1].errc(), 0)
+        with self.assertRaises(ProberException):
+            failed.result()
+        self.assertEqual(last.result(), 10)
+
+        # the communicator is still in sync
+        self.assertEqual(self.prober.map.bins.get_bin_info(0)[1], "Good")
+
+    def test_timeout_discards_unread_responses(self):
+        self.prober.map.create_rect(5, 4)
+        self.sim.latency = 0.3
+        with self.assertRaises(TimeoutError):
+            with self.comm.deadline(0.1):
+                with self.prober.batch() as batch:
+                    batch.map.get_num_rows()
+                    batch.map.get_num_rows()
+                    batch.map.get_num_rows()
+
+        # the latency is kept, the simulator would otherwise answer the next command first
+        with self.comm.deadline(5):
+            self.assertEqual(self.prober.map.get_num_cols(), 5)
+            self.assertEqual(len(self.prober.map.get_index_size()), 2)
+
+    def test_calls_with_several_round_trips(self):
+        with self.prober.batch(depth=2) as batch:
+            both = batch.call(lambda: (batch.prober.map.get_num_cols(), batch.prober.map.get_num_rows()))
+            cols = batch.map.get_num_cols()
+            rows = batch.map.get_num_rows()
+
+        self.assertEqual(both.result(), (10, 10))
+        self.assertEqual((cols.result(), rows.result()), (10, 10))
+        self.assertEqual(len(batch.responses), 4)
+
+    def test_calls_run_once(self):
+        runs = []
+
+        def setup():
+            runs.append(1)
+            return self.prober.map.get_num_cols(), self.prober.map.get_num_rows(), self.prober.map.get_num_cols()
+
+        with self.prober.batch(depth=1) as batch:
+            handle = batch.call(setup)
+            batch.map.get_num_rows()
+
+        self.assertEqual(handle.result(), (10, 10, 10))
+        self.assertEqual(len(runs), 1)
+        self.assertEqual(len(batch.responses), 4)
+
+    def test_state_changes_land_on_prober(self):
+        self.prober.property_cache = PropertyCache(math.inf)
+        self.assertFalse(self.prober.map.get_prop("grid_chuck_mode"))
+        num_dies = self.prober.map.get_num_dies(DieNumber.Selected)
+
+        with self.prober.batch() as batch:
+            batch.map.set_prop("grid_chuck_mode", True)
+            batch.map.step_die_seq(num_dies - 2, 0)
+            batch.map.step_next_die()
+
+        self.assertTrue(self.prober.map.get_prop("grid_chuck_mode"))
+        self.assertTrue(self.prober.map.end_of_route())
+
+    def test_communication_error_releases_calls(self):
+        with patch.object(self.comm, "read_line", side_effect=ConnectionError("lost")):
+            with self.assertRaises(ConnectionError):
+                with self.prober.batch() as batch:
+                    first = batch.map.get_num_cols()
+                    second = batch.map.get_num_rows()
+
+        for handle in (first, second):
+            with self.assertRaises(ProberException):
+                handle.result()
+        self.assertIs(self.prober.comm, self.comm)
+
+    def test_result_before_flush(self):
+        batch = self.prober.batch()
+        handle = batch.map.get_num_cols()
+        with self.assertRaises(RuntimeError):
+            handle.result()
+
+        batch.flush()
+        self.assertEqual(handle.result(), 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,126 @@
+import unittest
+from unittest.mock import MagicMock
+from sentio_prober_control.Communication.CommunicatorTcpIp import CommunicatorTcpIp
+from sentio_prober_control.Communication.CommandPipeline import CommandPipeline
+from sentio_prober_control.Sentio.ProberBase import ProberException
+from sentio_prober_control.Sentio.ProberSentio import SentioProber
+from sentio_prober_control.Sentio.Response import Response
+from sentio_prober_control.UnitTest.SimulatorTestCase import SimulatorTestCase
+
+
+class TestCommandPipeline(unittest.TestCase):
+    def setUp(self):
+        self.mock_comm = MagicMock(spec=CommunicatorTcpIp)
+        self.events = []
+        self.mock_comm.send.side_effect = lambda msg: self.events.append(("send", msg))
+
+        def read_line():
+            self.events.append(("read", None))
+            return f"0,0,{sum(1 for e in self.events if e[0] == 'read')}"
+
+        self.mock_comm.read_line.side_effect = read_line
+
+    def test_depth_limits_commands_in_flight(self):
+        pipe = CommandPipeline(self.mock_comm, depth=2)
+        handles = pipe.submit_all(["a", "b", "c"])
+
+        # The third command must wait until the first response was read
+        self.assertEqual(self.events, [("send", "a"), ("send", "b"), ("read", None), ("send", "c")])
+        self.assertTrue(handles[0].done())
+        self.assertFalse(handles[2].done())
+        self.assertEqual(pipe.in_flight, 2)
+
+    def test_responses_are_matched_in_order(self):
+        with CommandPipeline(self.mock_comm, depth=8) as pipe:
+            handles = pipe.submit_all(["a", "b", "c"])
+
+        self.assertEqual(pipe.in_flight, 0)
+        self.assertEqual([h.result() for h in handles], ["0,0,1", "0,0,2", "0,0,3"])
+        self.assertEqual([h.command for h in handles], ["a", "b", "c"])
+
+    def test_result_reads_up_to_own_response(self):
+        pipe = CommandPipeline(self.mock_comm, depth=8)
+        handles = pipe.submit_all(["a", "b", "c"])
+
+        self.assertEqual(handles[1].result(), "0,0,2")
+        self.assertTrue(handles[0].done())
+        self.assertFalse(handles[2].done())
+
+    def test_silent_commands_are_not_read(self):
+        pipe = CommandPipeline(self.mock_comm, depth=1)
+        handle = pipe.submit("*RCS 1")
+
+        self.assertTrue(handle.done())
+        self.assertIsNone(handle.result())
+        self.mock_comm.read_line.assert_not_called()
+
+    def test_parser_is_applied(self):
+        pipe = CommandPipeline(self.mock_comm, depth=4, parser=Response.parse_resp)
+        handle = pipe.submit("map:get_num_cols")
+        raw = pipe.submit("*IDN?", parser=str)
+
+        self.assertIsInstance(handle.result(), Response)
+        self.assertEqual(handle.result().message(), "1")
+        self.assertEqual(raw.result(), "0,0,2")
+
+    def test_parser_error_is_raised_by_result(self):
+        def parser(line):
+            raise ProberException("Invalid die", 2)
+
+        with CommandPipeline(self.mock_comm, depth=4, parser=parser) as pipe:
+            handle = pipe.submit("map:bins:get_bin 99, 99")
+
+        self.assertTrue(handle.done())
+        with self.assertRaises(ProberException):
+            handle.result()
+
+    def test_invalid_depth(self):
+        with self.assertRaises(ValueError):
+            CommandPipeline(self.mock_comm, depth=0)
+
+
+class TestProberPipeline(unittest.TestCase):
+    def setUp(self):
+        self.mock_comm = MagicMock(spec=CommunicatorTcpIp)
+        self.mock_comm.read_line.return_value = "0,0,Version: 25.2.0.0"
+        self.prober = SentioProber(self.mock_comm)
+
+    def test_results_are_responses(self):
+        self.mock_comm.read_line.side_effect = ["0,0,3", "0,0,4"]
+
+        with self.prober.pipeline(4) as pipe:
+            first = pipe.submit("map:bins:get_bin 0, 0")
+            second = pipe.submit("map:bins:get_bin 1, 0")
+
+        self.mock_comm.send.assert_called_with("map:bins:get_bin 1, 0")
+        self.assertEqual(first.result().message(), "3")
+        self.assertEqual(second.result().message(), "4")
+
+
+class TestPipelineTimeout(SimulatorTestCase):
+    def setUp(self):
+        super().setUp()
+        self.prober.map.create_rect(5, 4)
+
+    def test_timed_out_handle_keeps_its_response(self):
+        self.sim.latency = 0.3
+        pipe = self.prober.pipeline(4)
+        cols = pipe.submit("map:get_num_cols")
+        rows = pipe.submit("map:get_num_rows")
+
+        with self.assertRaises(TimeoutError):
+            with self.comm.deadline(0.1):
+                cols.result()
+
+        self.sim.latency = 0
+        with self.assertRaises(TimeoutError):
+            cols.result()
+
+        with self.comm.deadline(5):
+            self.assertEqual(rows.result().message(), "4")
+            pipe.flush()
+            self.assertEqual(self.prober.map.get_num_cols(), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+import csv
+import io
+import json
+import random
+import unittest
+from sentio_prober_control.Communication.CommandStats import CommandStats
+from sentio_prober_control.Communication.Histogram import Histogram
+from sentio_prober_control.Sentio.Enumerations import RemoteCommandError
+from sentio_prober_control.UnitTest.SimulatorTestCase import SimulatorTestCase
+
+
+class TestHistogram(unittest.TestCase):
+    def test_small_values_are_exact(self):
+        h = Histogram()
+        for v in range(100):
+            h.record(v)
+
+        self.assertEqual(h.count, 100)
+        self.assertEqual(h.total, 4950)
+        self.assertEqual((h.min, h.max), (0, 99))
+        self.assertEqual(h.percentile(50), 49)
+        self.assertEqual(h.percentile(100), 99)
+
+    def test_relative_error(self):
+        rng = random.Random(1)
+        values = sorted(rng.randrange(1, 10**9) for _ in range(5000))
+        h = Histogram()
+        for v in values:
+            h.record(v)
+
+        for p in (10, 50, 90, 99):
+            exact = values[int(p / 100 * len(values) + 0.5) - 1]
+            self.assertLessEqual(abs(h.percentile(p) - exact) / exact, 0.01)
+
+        self.assertEqual(sum(h.buckets().values()), 5000)
+
+    def test_merge(self):
+        a, b = Histogram(), Histogram()
+        a.record(10)
+        b.record(5000, 3)
+        a.merge(b)
+
+        self.assertEqual((a.count, a.min, a.max, a.total), (4, 10, 5000, 15010))
+        with self.assertRaises(ValueError):
+            a.merge(Histogram(precision_bits=4))
+
+
+class TestCommandStats(SimulatorTestCase):
+    def setUp(self):
+        super().setUp()
+        self.stats = CommandStats()
+        self.stats.attach(self.comm)
+
+    def test_latency_per_command(self):
+        self.sim.latency = 0.02
+        self.prober.map.create_rect(3, 3)
+        for _ in range(3):
+            self.prober.map.get_num_cols()
+
+        entry = self.stats["map:get_num_cols"]
+        self.assertEqual(entry.total.count, 3)
+        self.assertGreaterEqual(entry.total.percentile(50), 20000)
+        self.assertLessEqual(entry.first_byte.max, entry.total.max)
+        self.assertEqual(entry.request_size.total, 3 * len("map:get_num_cols\n"))
+        self.assertEqual(entry.response_size.total, 3 * len("0,0,3"))
+        self.assertEqual(entry.errors, {0: 3})
+        self.assertEqual([row["command"] for row in self.stats.summary()], ["map:get_num_cols", "map:create_rect"])
+
+    def test_pipelined_commands_and_errors(self):
+        self.prober.map.create_rect(3, 3)
+        with self.comm.pipeline(4) as pipe:
+            pipe.submit_all(["map:get_num_cols", "map:die:get_status 9, 9", "map:get_num_rows"])
+
+        self.assertEqual(self.stats["map:get_num_cols"].errors, {0: 1})
+        self.assertEqual(self.stats["map:die:get_status"].errors, {RemoteCommandError.ArgumentOutOfBounds: 1})
+        self.assertEqual(self.stats["map:get_num_rows"].errors, {0: 1})
+        self.assertNotIn("*RCS", self.stats)
+
+    def test_timeouts(self):
+        self.sim.latency = 0.1
+        self.comm.send("map:get_num_cols")
+        with self.assertRaises(TimeoutError):
+            with self.comm.deadline(0.01):
+                self.comm.read_line()
+
+        self.prober.map.get_num_rows()
+        self.assertEqual(self.stats["map:get_num_cols"].timeouts, 1)
+        self.assertEqual(self.stats["map:get_num_cols"].total.count, 0)
+        self.assertEqual(self.stats["map:get_num_rows"].total.count, 1)
+
+    def test_export(self):
+        self.prober.map.create_rect(3, 3)
+        self.prober.map.get_num_cols()
+
+        out = io.StringIO()
+        self.stats.to_csv(out)
+        rows = list(csv.DictReader(io.StringIO(out.getvalue())))
+        self.assertEqual({row["command"] for row in rows}, {"map:create_rect", "map:get_num_cols"})
+
+        out = io.StringIO()
+        self.stats.to_json(out)
+        data = json.loads(out.getvalue())
+        self.assertEqual(sum(sum(d["histograms"]["total_us"].values()) for d in data), 2)
+
+    def test_detach(self):
+        self.stats.detach(self.comm)
+        self.prober.map.get_num_cols()
+        self.assertEqual(self.stats.names(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+import time
+import unittest
+from unittest.mock import patch
+
+from sentio_prober_control.Communication.CommunicatorGpib import CommunicatorGpib, GpibCardVendor
+
+
+# durations of the NI-488.2 timeout codes, code 0 disables the timeout
+STEPS = (None, 10e-6, 30e-6, 100e-6, 300e-6, 1e-3, 3e-3, 10e-3, 30e-3, 100e-3, 300e-3, 1, 3, 10, 30, 100, 300, 1000)
+
+
+class FakeGpibDriver:
+    """Answers every command after a fixed delay and honours the board timeout like the NI driver."""
+
+    def __init__(self):
+        self.delay = 0.0
+        self.send_timeout = False
+        self.codes = []
+        self.cleared = 0
+        self.__ready = []
+
+    def connect(self, board_name, address):
+        pass
+
+    def set_timeout(self, code):
+        self.codes.append(code)
+
+    def clear(self):
+        self.cleared += 1
+        self.__ready.clear()
+
+    def send(self, msg):
+        if self.send_timeout:
+            raise TimeoutError("Sending timed out.")
+        self.__ready.append(time.monotonic() + self.delay)
+
+    def receive(self):
+        step = STEPS[self.codes[-1]]
+        wait = self.__ready[0] - time.monotonic()
+        if step is not None and wait > step:
+            time.sleep(step)
+            raise TimeoutError("Receive timed out.")
+
+        time.sleep(max(wait, 0))
+        self.__ready.pop(0)
+        return "0,0,ok\n"
+
+
+class TestCommunicatorGpib(unittest.TestCase):
+    def setUp(self):
+        with patch("sentio_prober_control.Devices.GpibNiDriver.GpibNiDriver", FakeGpibDriver):
+            self.comm = CommunicatorGpib.create(GpibCardVendor.NationalInstruments, "GPIB0:1")
+        self.driver = self.comm._driver
+
+    def test_no_deadline_disables_board_timeout(self):
+        self.driver.delay = 0.02
+        self.comm.send("map:get_num_cols")
+        self.assertEqual(self.comm.read_line(), "0,0,ok")
+        self.assertEqual(self.driver.codes, [0])
+
+    def test_deadline_is_enforced(self):
+        self.driver.delay = 1
+        self.comm.send("map:get_num_cols")
+
+        start = time.monotonic()
+        with self.assertRaises(TimeoutError):
+            with self.comm.deadline(0.05):
+                self.comm.read_line()
+
+        elapsed = time.monotonic() - start
+        self.assertGreaterEqual(elapsed, 0.05)
+        self.assertLess(elapsed, 0.5)
+        # the longest step ending before the deadline is used first
+        self.assertEqual(self.driver.codes[1], 8)
+
+    def test_response_arriving_between_steps(self):
+        self.driver.delay = 0.05
+        self.comm.send("map:get_num_cols")
+        with self.comm.deadline(0.2):
+            self.assertEqual(self.comm.read_line(), "0,0,ok")
+
+    def test_stale_response_is_discarded(self):
+        self.driver.delay = 0.1
+        self.comm.send("map:get_num_cols")
+        with self.assertRaises(TimeoutError):
+            with self.comm.deadline(0.02):
+                self.comm.read_line()
+
+        self.driver.delay = 0
+        self.comm.send("map:get_num_rows")
+        self.assertEqual(self.comm.read_line(), "0,0,ok")
+
+    def test_send_timeout_clears_device(self):
+        self.driver.delay = 0.1
+        self.comm.send("map:get_num_cols")
+        with self.assertRaises(TimeoutError):
+            with self.comm.deadline(0.02):
+                self.comm.read_line()
+
+        self.driver.send_timeout = True
+        with self.assertRaises(TimeoutError):
+            self.comm.send("map:create_rect 5, 5")
+        self.assertEqual(self.driver.cleared, 1)
+
+        # the response of the timed out read was cleared and must not be waited for
+        self.driver.send_timeout = False
+        self.driver.delay = 0
+        self.comm.send("map:get_num_rows")
+        with self.comm.deadline(1):
+            self.assertEqual(self.comm.read_line(), "0,0,ok")
+
+
+if __name__ == "__main__":
+    unittest.main()
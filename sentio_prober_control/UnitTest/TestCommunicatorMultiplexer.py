@@ -0,0 +1,116 @@
+import threading
+import time
+import unittest
+from sentio_prober_control.Communication.CommunicatorMultiplexer import CommunicatorMultiplexer
+from sentio_prober_control.Communication.CommunicatorTcpIp import CommunicatorTcpIp
+from sentio_prober_control.Sentio.Enumerations import DieNumber
+from sentio_prober_control.Sentio.ProberSentio import SentioProber
+from sentio_prober_control.UnitTest.SimulatorTestCase import SimulatorTestCase
+
+
+class TestCommunicatorMultiplexer(SimulatorTestCase):
+    create_prober = False
+
+    def create_comm(self, address):
+        return CommunicatorMultiplexer(CommunicatorTcpIp.create(address))
+
+    def run_threads(self, *targets):
+        errors = []
+
+        def guarded(target):
+            try:
+                target()
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=guarded, args=(t,)) for t in targets]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        if errors:
+            raise errors[0]
+
+    def test_threads_get_their_own_responses(self):
+        prober = SentioProber(self.comm)
+        prober.map.create_rect(6, 4)
+        temps, cols, rows = [], [], []
+
+        def monitor():
+            for _ in range(50):
+                temps.append(prober.status.get_chuck_temp())
+
+        def stepper():
+            for _ in range(50):
+                cols.append(prober.map.get_num_cols())
+                rows.append(prober.map.get_num_rows())
+
+        self.run_threads(monitor, stepper, stepper)
+
+        self.assertEqual(temps, [25.0] * 50)
+        self.assertEqual(cols, [6] * 100)
+        self.assertEqual(rows, [4] * 100)
+        self.assertEqual(self.comm.pending, 0)
+
+    def test_commands_of_waiting_threads_are_pipelined(self):
+        self.sim.latency = 0.05
+        results = []
+
+        def worker():
+            for _ in range(3):
+                self.comm.send("map:bins:get_num_bins")
+                results.append(self.comm.read_line())
+
+        start = time.perf_counter()
+        self.run_threads(*[worker] * 6)
+
+        # 18 round trips when serialized by a lock, 3 when pipelined
+        self.assertLess(time.perf_counter() - start, 0.5)
+        self.assertEqual(results, ["0,0,16"] * 18)
+
+    def test_timeout_while_waiting_for_other_thread(self):
+        self.sim.async_duration = 0.3
+        prober = SentioProber(self.comm)
+        prober.map.create_rect(4, 3)
+        cmd_id = prober.send_cmd("loader:start_prepare_station cas1").cmd_id()
+        waited = []
+
+        def slow():
+            self.comm.send(f"wait_complete {cmd_id}, 5")
+            waited.append(self.comm.read_line())
+
+        def impatient():
+            time.sleep(0.05)
+            self.comm.send("map:get_num_cols")
+            with self.assertRaises(TimeoutError):
+                with self.comm.deadline(0.05):
+                    self.comm.read_line()
+
+            # the abandoned response must not be returned for the next command
+            self.assertEqual(prober.map.get_num_dies(DieNumber.Present), 12)
+
+        self.run_threads(slow, impatient)
+        self.assertEqual(waited, [f"0,{cmd_id},ok"])
+        self.assertEqual(prober.map.get_num_rows(), 3)
+        self.assertEqual(self.comm.pending, 0)
+
+    def test_deadlines_are_per_thread(self):
+        remaining = []
+
+        def other():
+            remaining.append(self.comm.remaining_time())
+
+        with self.comm.deadline(1):
+            self.run_threads(other)
+            self.assertIsNotNone(self.comm.remaining_time())
+
+        self.assertEqual(remaining, [None])
+
+    def test_read_without_command(self):
+        with self.assertRaises(RuntimeError):
+            self.comm.read_line()
+
+
+if __name__ == "__main__":
+    unittest.main()
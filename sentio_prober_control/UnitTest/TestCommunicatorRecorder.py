@@ -0,0 +1,133 @@
+import io
+import json
+import os
+import tempfile
+import time
+import unittest
+from sentio_prober_control.Communication.CommunicatorRecorder import CommunicatorRecorder
+from sentio_prober_control.Communication.CommunicatorReplay import CommunicatorReplay, ReplayError
+from sentio_prober_control.Communication.CommunicatorTcpIp import CommunicatorTcpIp
+from sentio_prober_control.Sentio.Enumerations import SnapshotLocation, SnapshotType
+from sentio_prober_control.Sentio.ProberSentio import SentioProber
+from sentio_prober_control.UnitTest.SimulatorTestCase import SimulatorTestCase
+
+
+def run_script(prober: SentioProber):
+    prober.map.create_rect(3, 2)
+    result = [prober.map.step_first_die(), prober.map.step_next_die(), prober.status.get_chuck_temp()]
+    result.append(prober.vision.snap_image(None, SnapshotType.CameraRaw, SnapshotLocation.Local))
+    return result
+
+
+class TestCommunicatorRecorder(SimulatorTestCase):
+    create_prober = False
+
+    def setUp(self):
+        self.trace = io.StringIO()
+        super().setUp()
+
+    def create_comm(self, address):
+        return CommunicatorRecorder(CommunicatorTcpIp.create(address), self.trace)
+
+    def events(self):
+        return [json.loads(line) for line in self.trace.getvalue().splitlines()]
+
+    def replay(self, **kwargs):
+        return CommunicatorReplay(io.StringIO(self.trace.getvalue()), **kwargs)
+
+    def test_trace_format(self):
+        self.comm.send("*RCS 1")
+        self.comm.send("map:get_num_cols")
+        self.comm.read_line()
+
+        events = self.events()
+        self.assertEqual(events[0], {"trace": "sentio", "version": 2})
+        self.assertEqual([e.get("send", e.get("read")) for e in events[1:]], ["*RCS 1", "map:get_num_cols", "0,0,0"])
+        times = [e["t"] for e in events[1:]]
+        self.assertEqual(times, sorted(times))
+
+    def test_replay_reproduces_session(self):
+        expected = run_script(SentioProber(self.comm))
+
+        replay = self.replay()
+        self.assertEqual(run_script(SentioProber(replay)), expected)
+        self.assertEqual(replay.remaining, 0)
+
+    def test_replay_detects_divergence(self):
+        SentioProber(self.comm).map.create_rect(3, 2)
+
+        prober = SentioProber(self.replay())
+        with self.assertRaises(ReplayError):
+            prober.map.create_rect(4, 2)
+
+        prober = SentioProber(self.replay(check=False))
+        prober.map.create_rect(4, 2)
+
+    def test_realtime_replay(self):
+        self.sim.latency = 0.05
+        prober = SentioProber(self.comm)
+        for _ in range(3):
+            prober.map.get_num_cols()
+
+        start = time.perf_counter()
+        prober = SentioProber(self.replay())
+        for _ in range(3):
+            prober.map.get_num_cols()
+        self.assertLess(time.perf_counter() - start, 0.05)
+
+        start = time.perf_counter()
+        prober = SentioProber(self.replay(realtime=True))
+        for _ in range(3):
+            prober.map.get_num_cols()
+        self.assertGreaterEqual(time.perf_counter() - start, 0.2)
+
+    def test_chunked_lines_are_recorded_in_parts(self):
+        data = bytes(range(256)) * 400
+        self.sim.snapshot = data
+        with tempfile.TemporaryDirectory() as tmp:
+            source = os.path.join(tmp, "upload.bin")
+            with open(source, "wb") as f:
+                f.write(data)
+
+            prober = SentioProber(self.comm)
+            prober.file_transfer(source, "C:/upload.bin", chunk_size=3 * 1024)
+            self.assertEqual(prober.vision.snap_image(None, SnapshotType.CameraRaw, SnapshotLocation.Local), data)
+
+            # no event holds a whole line
+            events = self.events()
+            sent = [e for e in events if "send_part" in e]
+            received = [e for e in events if "read_part" in e]
+            self.assertGreater(len(sent), 30)
+            self.assertGreater(len(received), 1)
+            self.assertLess(max(len(e.get("send_part", e.get("read_part", ""))) for e in events[1:]), len(data))
+
+            replay = self.replay()
+            prober = SentioProber(replay)
+            prober.file_transfer(source, "C:/upload.bin", chunk_size=3 * 1024)
+            self.assertEqual(prober.vision.snap_image(None, SnapshotType.CameraRaw, SnapshotLocation.Local), data)
+            self.assertEqual(replay.remaining, 0)
+
+            # other chunk boundaries replay the same command, other content does not
+            prober = SentioProber(self.replay())
+            prober.file_transfer(source, "C:/upload.bin", chunk_size=3 * 700)
+            with open(source, "r+b") as f:
+                f.write(b"x")
+            prober = SentioProber(self.replay())
+            with self.assertRaises(ReplayError):
+                prober.file_transfer(source, "C:/upload.bin", chunk_size=3 * 1024)
+
+    def test_timeouts_are_recorded(self):
+        self.sim.latency = 0.1
+        self.comm.send("map:get_num_cols")
+        with self.assertRaises(TimeoutError):
+            with self.comm.deadline(0.01):
+                self.comm.read_line()
+
+        replay = self.replay()
+        replay.send("map:get_num_cols")
+        with self.assertRaises(TimeoutError):
+            replay.read_line()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,170 @@
+import threading
+import time
+import unittest
+from unittest.mock import call, patch
+from sentio_prober_control.Communication.CommunicatorBase import CommunicatorBase
+from sentio_prober_control.Communication.CommunicatorTcpIp import CommunicatorTcpIp
+from sentio_prober_control.Sentio.ProberSentio import SentioProber
+from sentio_prober_control.UnitTest.SimulatorTestCase import SimulatorTestCase
+
+
+class TestCommunicatorTcpIpDeadlines(SimulatorTestCase):
+    create_prober = False
+
+    def test_no_deadline_blocks(self):
+        self.sim.latency = 0.05
+        self.assertIsNone(self.comm.remaining_time())
+        self.comm.send("map:get_num_cols")
+        self.assertEqual(self.comm.read_line(), "0,0,0")
+
+    def test_deadline_raises_and_stale_response_is_discarded(self):
+        self.sim.latency = 0.2
+        self.comm.send("map:create_rect 4, 3")
+        self.comm.read_line()
+
+        self.comm.send("map:get_num_cols")
+        start = time.perf_counter()
+        with self.assertRaises(TimeoutError):
+            with self.comm.deadline(0.05):
+                self.comm.read_line()
+        self.assertLess(time.perf_counter() - start, 0.15)
+
+        # the late response to map:get_num_cols must not be returned for the next command
+        self.comm.send("map:get_num_rows")
+        self.assertEqual(self.comm.read_line(), "0,0,3")
+
+    def test_nested_deadlines(self):
+        with self.comm.deadline(10):
+            with self.comm.deadline(0.5):
+                self.assertLessEqual(self.comm.remaining_time(), 0.5)
+                with self.comm.deadline(5):
+                    self.assertLessEqual(self.comm.remaining_time(), 0.5)
+            self.assertGreater(self.comm.remaining_time(), 5)
+        self.assertIsNone(self.comm.remaining_time())
+
+    def test_default_timeout(self):
+        self.sim.latency = 0.2
+        self.comm.default_timeout = 0.05
+        self.comm.send("map:get_num_cols")
+        with self.assertRaises(TimeoutError):
+            self.comm.read_line()
+
+        # a deadline replaces the default timeout
+        self.comm.send("map:get_num_rows")
+        with self.comm.deadline(5):
+            self.assertEqual(self.comm.read_line(), "0,0,0")
+
+    def test_expired_deadline_still_reads_buffered_lines(self):
+        self.comm.send("map:get_num_cols")
+        time.sleep(0.05)
+        with self.comm.deadline(-1):
+            self.assertEqual(self.comm.read_line(), "0,0,0")
+
+
+class TestCommunicatorTcpIpReconnect(SimulatorTestCase):
+    create_prober = False
+
+    def setUp(self):
+        super().setUp()
+        self.comm.reconnect_attempts = 3
+        self.comm.reconnect_delay = 0.05
+
+    def test_idempotent(self):
+        self.assertTrue(CommunicatorBase.is_idempotent("status:get_chuck_temp"))
+        self.assertTrue(CommunicatorBase.is_idempotent("loader:query_wafer_status chuck, 1"))
+        self.assertTrue(CommunicatorBase.is_idempotent("*IDN?"))
+        self.assertFalse(CommunicatorBase.is_idempotent("map:step_next_die"))
+        self.assertFalse(CommunicatorBase.is_idempotent("*RCS 1"))
+
+    def test_disabled_by_default(self):
+        self.comm.reconnect_attempts = 0
+        self.comm.send("map:get_num_cols")
+        self.comm.read_line()
+        self.sim.drop_connections()
+
+        with self.assertRaises(ConnectionError):
+            self.comm.send("map:get_num_cols")
+            self.comm.read_line()
+
+    def test_query_is_retried_and_session_is_restored(self):
+        self.sim.latency = 0.1
+        with patch.object(self.sim, "execute", wraps=self.sim.execute) as execute:
+            prober = SentioProber(self.comm)
+            prober.map.create_rect(4, 3)
+
+            self.comm.send("map:get_num_cols")
+            while execute.call_args != call("map:get_num_cols"):
+                time.sleep(0.001)
+            self.sim.drop_connections()
+            self.assertEqual(self.comm.read_line(), "0,0,4")
+
+        self.assertEqual(execute.call_args_list.count(call("*RCS 1")), 2)
+        self.assertEqual(execute.call_args_list[-2:], [call("*RCS 1"), call("map:get_num_cols")])
+
+    def test_lost_response_of_command_with_side_effects(self):
+        self.comm.send("*IDN?")
+        self.comm.read_line()
+
+        self.sim.latency = 0.1
+        executed = self.sim.num_commands + 1
+        self.comm.send("map:create_rect 5, 2")
+        while self.sim.num_commands < executed:
+            time.sleep(0.001)
+        self.sim.drop_connections()
+
+        with self.assertRaises(ConnectionError) as ctx:
+            self.comm.read_line()
+        self.assertIn("map:create_rect", str(ctx.exception))
+
+        # the communicator is usable again
+        self.comm.send("map:get_num_cols")
+        self.assertEqual(self.comm.read_line(), "0,0,5")
+
+    def send_until_timeout(self):
+        # SENTIO is busy and does not read, the huge command fills the socket buffers
+        self.sim.processing_time = 0.3
+        self.comm.send("map:get_num_cols")
+        with self.assertRaises(TimeoutError):
+            with self.comm.deadline(0.05):
+                self.comm.send("map:create_rect 5, " + "0" * (64 << 20))
+        self.sim.processing_time = 0
+
+    def test_send_timeout_breaks_connection(self):
+        self.send_until_timeout()
+
+        # the lost query is sent again over the new connection, the truncated command is gone
+        self.comm.send("map:get_num_rows")
+        self.assertEqual(self.comm.read_line(), "0,0,0")
+        self.assertEqual(self.comm.read_line(), "0,0,0")
+        self.comm.send("map:get_num_cols")
+        self.assertEqual(self.comm.read_line(), "0,0,0")
+
+    def test_send_timeout_without_reconnect(self):
+        self.comm.reconnect_attempts = 0
+        self.send_until_timeout()
+
+        with self.assertRaises(ConnectionError):
+            self.comm.send("map:get_num_rows")
+
+    def test_backoff_until_server_is_back(self):
+        self.sim.stop()
+        restart = threading.Timer(0.1, self.sim.start)
+        restart.start()
+        self.addCleanup(restart.join)
+
+        start = time.perf_counter()
+        self.comm.send("map:bins:get_num_bins")
+        self.assertEqual(self.comm.read_line(), "0,0,16")
+        self.assertGreaterEqual(time.perf_counter() - start, 0.1)
+
+    def test_gives_up_after_last_attempt(self):
+        self.sim.stop()
+        self.comm.reconnect_attempts = 2
+
+        with self.assertRaises(ConnectionError):
+            self.comm.send("map:get_num_cols")
+            self.comm.read_line()
+
+
+if __name__ == "__main__":
+    unittest.main()
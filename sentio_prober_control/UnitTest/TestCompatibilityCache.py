@@ -0,0 +1,105 @@
+import json
+import os
+import tempfile
+import time
+import unittest
+
+from sentio_prober_control.Communication.CommunicatorTcpIp import CommunicatorTcpIp
+from sentio_prober_control.Sentio.Compatibility import Compatibility, CompatibilityCache, CompatibilityLevel
+from sentio_prober_control.Sentio.ProberBase import ProberException
+from sentio_prober_control.Sentio.ProberSentio import SentioProber
+from sentio_prober_control.Simulator.SentioSimulator import SentioSimulator
+
+
+class TestCompatibilityCache(unittest.TestCase):
+    def setUp(self):
+        level = Compatibility.level
+        self.addCleanup(setattr, Compatibility, "level", level)
+
+        folder = tempfile.TemporaryDirectory()
+        self.addCleanup(folder.cleanup)
+        self.path = os.path.join(folder.name, "cache", "compatibility.json")
+        self.cache = CompatibilityCache(self.path, ttl=60)
+
+    def test_put_get_invalidate(self):
+        self.assertIsNone(self.cache.get("tcpip://10.0.0.1:35555"))
+
+        self.cache.put("tcpip://10.0.0.1:35555", CompatibilityLevel.Sentio_25_1)
+        self.cache.put("tcpip://10.0.0.2:35555", CompatibilityLevel.Sentio_25_2)
+        self.assertEqual(CompatibilityCache(self.path).get("tcpip://10.0.0.1:35555"), CompatibilityLevel.Sentio_25_1)
+
+        self.cache.invalidate("tcpip://10.0.0.1:35555")
+        self.assertIsNone(self.cache.get("tcpip://10.0.0.1:35555"))
+        self.assertEqual(self.cache.get("tcpip://10.0.0.2:35555"), CompatibilityLevel.Sentio_25_2)
+
+    def test_expired_and_broken_entries(self):
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.cache.path, "w") as f:
+            json.dump({"old": {"level": "Sentio_25_2", "time": time.time() - 61}, "broken": {"level": "Sentio_99"}}, f)
+
+        self.assertIsNone(self.cache.get("old"))
+        self.assertIsNone(self.cache.get("broken"))
+
+        with open(self.cache.path, "w") as f:
+            f.write("{ not json")
+
+        self.assertIsNone(self.cache.get("old"))
+        self.cache.put("new", CompatibilityLevel.Sentio_24_0)
+        self.assertEqual(self.cache.get("new"), CompatibilityLevel.Sentio_24_0)
+
+    def test_prober_skips_version_query(self):
+        with SentioSimulator(port=0) as sim:
+            comm = CommunicatorTcpIp.create(sim.address)
+            self.addCleanup(comm.disconnect)
+
+            SentioProber(comm, compat_cache=self.cache)
+            self.assertEqual(sim.num_commands, 1)
+            self.assertEqual(self.cache.get(comm.station_id), CompatibilityLevel.Sentio_25_2)
+
+            Compatibility.level = CompatibilityLevel.Auto
+            prober = SentioProber(comm, compat_cache=self.cache)
+            self.assertEqual(sim.num_commands, 1)
+            self.assertEqual(Compatibility.level, CompatibilityLevel.Sentio_25_2)
+
+            # An unknown command hints at a different SENTIO version, the entry is dropped.
+            prober.map.get_num_cols()
+            self.assertIsNotNone(self.cache.get(comm.station_id))
+            with self.assertRaises(ProberException):
+                prober.send_cmd("map:no_such_command")
+
+            self.assertIsNone(self.cache.get(comm.station_id))
+            SentioProber(comm, compat_cache=self.cache)
+            self.assertEqual(sim.num_commands, 4)
+
+    def test_outdated_level_is_revalidated(self):
+        with SentioSimulator(port=0) as sim:
+            comm = CommunicatorTcpIp.create(sim.address)
+            self.addCleanup(comm.disconnect)
+            self.cache.put(comm.station_id, CompatibilityLevel.Sentio_25_1)
+
+            prober = SentioProber(comm, compat_cache=self.cache)
+            self.assertEqual(Compatibility.level, CompatibilityLevel.Sentio_25_1)
+            self.assertEqual(sim.num_commands, 0)
+            prober.map.create_rect(10, 10)
+            num_commands = sim.num_commands
+
+            # The version is not queried while pipelined responses are outstanding.
+            with prober.pipeline() as pipe:
+                failed = pipe.submit("map:no_such_command")
+                cols = pipe.submit("map:get_num_cols")
+                with self.assertRaises(ProberException):
+                    failed.result()
+                self.assertEqual(Compatibility.level, CompatibilityLevel.Sentio_25_1)
+                self.assertIsNone(self.cache.get(comm.station_id))
+
+            self.assertEqual(cols.result().message(), "10")
+
+            # The next command queries the version first and updates the live level.
+            self.assertEqual(prober.map.get_num_rows(), 10)
+            self.assertEqual(Compatibility.level, CompatibilityLevel.Sentio_25_2)
+            self.assertEqual(self.cache.get(comm.station_id), CompatibilityLevel.Sentio_25_2)
+            self.assertEqual(sim.num_commands, num_commands + 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
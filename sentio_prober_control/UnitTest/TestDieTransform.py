@@ -0,0 +1,85 @@
+import unittest
+
+from sentio_prober_control.Communication.CommunicatorTcpIp import CommunicatorTcpIp
+from sentio_prober_control.Sentio.Compatibility import Compatibility, CompatibilityLevel
+from sentio_prober_control.Sentio.Enumerations import AxisOrient
+from sentio_prober_control.Sentio.ProberSentio import SentioProber
+from sentio_prober_control.Simulator.SentioSimulator import SentioSimulator
+
+try:
+    import numpy
+    from sentio_prober_control.Sentio.DieTransform import DieTransform
+except ImportError:
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, "requires numpy")
+class TestDieTransform(unittest.TestCase):
+    def test_to_chuck_honors_axis_orient(self):
+        expected = {
+            AxisOrient.UpRight: (2000, 3000),
+            AxisOrient.DownRight: (2000, -3000),
+            AxisOrient.DownLeft: (-2000, -3000),
+            AxisOrient.UpLeft: (-2000, 3000),
+        }
+
+        for orient, xy in expected.items():
+            with self.subTest(orient=orient):
+                transform = DieTransform((1000, 1000), (1, 1), orient)
+                numpy.testing.assert_array_equal(transform.to_chuck([(3, 4), (1, 1)]), [xy, (0, 0)])
+
+    def test_to_chuck_adds_subsite_offsets(self):
+        transform = DieTransform((1000, 500), (0, 0), AxisOrient.DownRight, [(0, 0), (100, 50), (-200, 25)], home_xy=(10, 20))
+        numpy.testing.assert_array_equal(transform.to_chuck([(1, 1, 0), (1, 1, 1), (0, 0, 2)]),
+                                         [(1010, -480), (1110, -430), (-190, 45)])
+
+        with self.assertRaises(IndexError):
+            transform.to_chuck([(0, 0, 3)])
+
+    def test_round_trip(self):
+        dies = numpy.array([(c, r, s) for c in range(-3, 4) for r in range(-2, 5) for s in range(3)])
+        for orient in AxisOrient:
+            with self.subTest(orient=orient):
+                transform = DieTransform((1200, 800), (2, -1), orient, [(0, 0), (300, 200), (-100, -300)], (400, 500))
+                numpy.testing.assert_array_equal(transform.to_die(transform.to_chuck(dies)), dies)
+
+    def test_to_die_without_subsite(self):
+        transform = DieTransform((1000, 1000), (0, 0), AxisOrient.UpRight, die_reference=(500, 500))
+        numpy.testing.assert_array_equal(transform.to_die([(499, -501), (250, -500)]), [(0, -1, -1), (0, 0, -1)])
+        numpy.testing.assert_array_equal(transform.to_die([(250, 250)], tolerance=400), [(0, 0, 0)])
+
+    def test_verify_with_simulator(self):
+        with SentioSimulator(port=0) as sim:
+            comm = CommunicatorTcpIp.create(sim.address)
+            self.addCleanup(comm.disconnect)
+            prober = SentioProber(comm)
+            prober.map.set_index_size(2000, 1500)
+            prober.map.create(30)
+            prober.map.set_home_die(3, 4)
+            prober.map.subsites.add("A", 300, 200)
+            prober.map.subsites.add("B", -100, 400, AxisOrient.DownLeft)
+
+            dies = [(3, 4, 0), (5, 7, 1), (8, 2, 2), (1, 9, 0)]
+            for orient in AxisOrient:
+                with self.subTest(orient=orient):
+                    prober.map.set_axis_orient(orient)
+                    transform = DieTransform.from_prober(prober)
+                    self.assertEqual(transform.axis_orient, orient)
+                    self.assertEqual(transform.num_subsites, 3)
+                    self.assertEqual(transform.verify(prober, dies), [])
+
+            transform = DieTransform((2000, 1000), (3, 4), AxisOrient.UpLeft)
+            diffs = transform.verify(prober, [d[:2] for d in dies])
+            self.assertEqual([d[0] for d in diffs], [d[:2] for d in dies[1:]])
+
+            # SENTIO before 25.2 has no chuck command group
+            level = Compatibility.level
+            self.addCleanup(setattr, Compatibility, "level", level)
+            Compatibility.level = CompatibilityLevel.Sentio_24_0
+            prober = SentioProber(comm, CompatibilityLevel.Sentio_24_0)
+            prober.map.set_axis_orient(AxisOrient.UpRight)
+            self.assertEqual(DieTransform.from_prober(prober).verify(prober, dies), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+import inspect
+import unittest
+from enum import Enum
+
+import sentio_prober_control.Sentio.Enumerations as Enumerations
+from sentio_prober_control.Sentio.Compatibility import Compatibility, CompatibilityLevel
+from sentio_prober_control.Sentio.Enumerations import BinQuality, ChuckSite, DialogButtons, LoaderStation, RoutingPriority, RoutingStartPoint, \
+    VacuumState, XyReference, ZPositionHint, ZReference
+
+
+# Enumerations whose from_string uses a hand written table instead of the one derived from to_string
+EXPLICIT_REVERSE = (ChuckSite, DialogButtons, RoutingPriority, RoutingStartPoint, VacuumState, XyReference, ZPositionHint, ZReference)
+
+
+def enumerations():
+    return [c for c in vars(Enumerations).values() if inspect.isclass(c) and issubclass(c, Enum) and c.__module__ == Enumerations.__name__]
+
+
+def encoder(enum):
+    return getattr(enum, "to_string", None) or getattr(enum, "toSentioArg", None)
+
+
+class TestEnumerations(unittest.TestCase):
+    def setUp(self):
+        level = Compatibility.level
+        self.addCleanup(setattr, Compatibility, "level", level)
+
+    def test_round_trip(self):
+        # (enumeration, member) pairs that are not meant to survive a round trip
+        not_invertible = {
+            (LoaderStation, LoaderStation.IdReader),  # has no remote command string
+            (VacuumState, VacuumState.Off),           # SENTIO reports the vacuum state as 0/1
+            (VacuumState, VacuumState.On),
+        }
+
+        for level in (CompatibilityLevel.Sentio_24_0, CompatibilityLevel.Sentio_25_2):
+            Compatibility.level = level
+            for enum in enumerations():
+                encode = encoder(enum)
+                if encode is None:
+                    continue
+
+                for member in enum:
+                    with self.subTest(level=level, member=member):
+                        text = encode(member)
+                        self.assertIsInstance(text, (str, int))
+                        if (enum, member) in not_invertible or (enum is ZReference and level < CompatibilityLevel.Sentio_25_2):
+                            continue
+
+                        self.assertIs(enum.from_string(str(text)), member)
+
+    def test_derived_reverse_table(self):
+        for enum in enumerations():
+            if encoder(enum) is None or enum in EXPLICIT_REVERSE:
+                continue
+
+            for member in enum:
+                with self.subTest(member=member):
+                    self.assertIs(enum.from_string(member.name), member)
+                    self.assertIs(enum.from_string(member.name.upper()), member)
+
+        self.assertIs(BinQuality.from_string("Pass"), BinQuality.Pass)
+        with self.assertRaisesRegex(ValueError, "Unknown BinQuality abbreviation: Good"):
+            BinQuality.from_string("Good")
+
+    def test_explicit_reverse_tables(self):
+        self.assertIs(XyReference.from_string("relative"), XyReference.Current)
+        self.assertIs(XyReference.from_string("R"), XyReference.Current)
+        self.assertIs(VacuumState.from_string("1"), VacuumState.On)
+        self.assertEqual(ZReference.Hover.to_string(CompatibilityLevel.Sentio_24_0), "H")
+        self.assertEqual(ZReference.Hover.to_string(CompatibilityLevel.Sentio_25_2), "Hover")
+        self.assertEqual(LoaderStation.IdReader.to_string(), "Invalid loader station id")
+
+        # the explicit tables are case sensitive unless they fold the string
+        with self.assertRaisesRegex(ValueError, "Unknown ChuckSite abbreviation: wafer"):
+            ChuckSite.from_string("wafer")
+        with self.assertRaises(ValueError):
+            VacuumState.from_string("On")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,5 @@
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 from sentio_prober_control.Sentio.Enumerations import LoaderStation, OrientationMarker, WaferStatusItem, RemoteCommandError
 from sentio_prober_control.Sentio.ProberBase import ProberException
 from sentio_prober_control.Sentio.Response import Response
@@ -8,15 +8,18 @@ from sentio_prober_control.Sentio.CommandGroups.LoaderCommandGroup import Loader
 class TestLoaderCommandGroup(unittest.TestCase):
 
     def setUp(self):
+        # The tests replace Response.check_resp. Restore it after each test.
+        patcher = patch.object(Response, "check_resp", Response.check_resp)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
         self.mock_comm = MagicMock()
         self.mock_parent = MagicMock()
         self.mock_parent.comm = self.mock_comm
         self.loader = LoaderCommandGroup(self.mock_parent)
 
     def mock_response(self, message="OK"):
-        mock_resp = MagicMock()
-        mock_resp.message.return_value = message
-        return mock_resp
+        return Response(0, 0, 0, message)
 
     def test_has_station_true(self):
         self.mock_comm.read_line.return_value = "0,0,1"
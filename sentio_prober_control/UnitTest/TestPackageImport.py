@@ -0,0 +1,39 @@
+import subprocess
+import sys
+import unittest
+
+
+def run_python(code: str) -> str:
+    return subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout
+
+
+class TestPackageImport(unittest.TestCase):
+    def test_import_is_silent_and_does_not_load_transports(self):
+        out = run_python(
+            "import sys\n"
+            "from sentio_prober_control.Sentio.ProberSentio import SentioProber\n"
+            "print(sorted(m for m in ('pyvisa', 'sentio_prober_control.Devices.GpibNiDriver', 'sentio_prober_control.Communication.CommunicatorVisa') if m in sys.modules))\n"
+        )
+        self.assertEqual(out, "[]\n")
+
+    def test_lazy_package_attributes(self):
+        out = run_python(
+            "import sys\n"
+            "import sentio_prober_control as spc\n"
+            "print('sentio_prober_control.Sentio.ProberSentio' in sys.modules)\n"
+            "print(spc.SentioProber.__name__, spc.CommunicatorTcpIp.__name__)\n"
+            "print('SentioProber' in dir(spc))\n"
+        )
+        self.assertEqual(out.split("\n")[:3], ["False", "SentioProber CommunicatorTcpIp", "True"])
+
+    def test_former_imports_of_prober_module(self):
+        from sentio_prober_control.Sentio import ProberSentio
+
+        self.assertEqual(ProberSentio.GpibCardVendor.__name__, "GpibCardVendor")
+        self.assertEqual(ProberSentio.CommunicatorGpib.__name__, "CommunicatorGpib")
+        with self.assertRaises(AttributeError):
+            ProberSentio.NoSuchName
+
+
+if __name__ == "__main__":
+    unittest.main()
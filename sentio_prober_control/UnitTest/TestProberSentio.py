@@ -1,8 +1,17 @@
+import base64
+import os
+import tempfile
 import unittest
 from unittest.mock import MagicMock
+from sentio_prober_control.Communication.CommunicatorBase import CommunicatorBase
 from sentio_prober_control.Communication.CommunicatorTcpIp import CommunicatorTcpIp
+from sentio_prober_control.Sentio.Compatibility import Compatibility, CompatibilityLevel
+from sentio_prober_control.Sentio.Enumerations import RemoteCommandError
+from sentio_prober_control.Sentio.ProberBase import ProberException
 from sentio_prober_control.Sentio.ProberSentio import SentioProber
 from sentio_prober_control.Sentio.Response import Response
+from sentio_prober_control.Simulator.SentioSimulator import SentioSimulator
+from sentio_prober_control.UnitTest.SimulatorTestCase import SimulatorTestCase
 
 class TestScopeCommandGroup(unittest.TestCase):
     def setUp(self):
@@ -155,5 +164,172 @@ class TestScopeCommandGroup(unittest.TestCase):
         self.assertIsInstance(resp, Response)
 
 
+class TestLazyCommandGroups(unittest.TestCase):
+    def setUp(self):
+        level = Compatibility.level
+        self.addCleanup(setattr, Compatibility, "level", level)
+
+        self.mock_comm = MagicMock(spec=CommunicatorTcpIp)
+        self.mock_comm.read_line.return_value = "0,0,Version: 25.2.0.0"
+
+    def test_construction_only_queries_version(self):
+        prober = SentioProber(self.mock_comm)
+
+        self.assertEqual([c.args[0] for c in self.mock_comm.send.call_args_list], ["*RCS 1", "status:get_version"])
+        self.assertEqual(Compatibility.level, CompatibilityLevel.Sentio_25_2)
+        self.assertNotIn("map", vars(prober))
+        self.assertNotIn("probe", vars(prober))
+
+    def test_groups_are_cached(self):
+        prober = SentioProber(self.mock_comm)
+
+        self.assertIs(prober.map, prober.map)
+        self.assertIs(prober.map.bins, prober.map.bins)
+        self.assertIs(prober.map.subsites.prober, prober)
+        self.assertIs(prober.loader.vc.comm, self.mock_comm)
+        self.assertIn("map", vars(prober))
+        self.assertNotIn("die", vars(prober.map))
+
+    def test_stage_groups_require_sentio_25_2(self):
+        prober = SentioProber(self.mock_comm)
+        self.assertIs(prober.probe.east, prober.probe.top.east)
+        self.assertIsNot(prober.probe.top.east, prober.probe.bottom.east)
+        self.assertIs(prober.scope.aux.prober, prober)
+
+        self.mock_comm.read_line.return_value = "0,0,Version: 24.0.4.0"
+        old = SentioProber(self.mock_comm)
+        self.assertFalse(hasattr(old, "chuck"))
+        self.assertFalse(hasattr(old.probe, "top"))
+        self.assertFalse(hasattr(old.probe, "east"))
+        with self.assertRaises(AttributeError):
+            old.scope
+
+
+class TestFileTransfer(unittest.TestCase):
+    def setUp(self):
+        self.mock_comm = MagicMock(spec=CommunicatorTcpIp)
+        self.mock_comm.read_line.return_value = "0,0,Version: 25.2.0.0"
+        self.test_prober = SentioProber(self.mock_comm)
+        self.mock_comm.send.reset_mock()
+
+        self.chunks = []
+        self.mock_comm.send_chunks.side_effect = lambda chunks: self.chunks.extend(chunks)
+        self.mock_comm.read_line.return_value = "0,0,ok"
+
+        fd, self.path = tempfile.mkstemp()
+        os.write(fd, bytes(range(256)) * 40)
+        os.close(fd)
+        self.addCleanup(os.remove, self.path)
+
+    def test_file_is_streamed_in_blocks(self):
+        progress = []
+        self.test_prober.file_transfer(self.path, "C:\\tmp\\file.bin", lambda done, total: progress.append((done, total)), chunk_size=3000)
+
+        self.assertEqual(self.chunks[0], b"file_transfer C:\\tmp\\file.bin, ")
+        self.assertEqual(len(self.chunks), 5)
+        self.assertEqual(base64.b64decode(b"".join(self.chunks[1:])), bytes(range(256)) * 40)
+        self.assertEqual(progress, [(3000, 10240), (6000, 10240), (9000, 10240), (10240, 10240)])
+        self.mock_comm.send.assert_not_called()
+
+    def test_invalid_chunk_size(self):
+        with self.assertRaises(ValueError):
+            self.test_prober.file_transfer(self.path, "C:\\tmp\\file.bin", chunk_size=1000)
+
+    def test_file_transfer_to_simulator(self):
+        with SentioSimulator(port=0) as sim:
+            comm = CommunicatorTcpIp.create(sim.address)
+            prober = SentioProber(comm)
+            prober.file_transfer(self.path, "C:\\tmp\\file.bin", chunk_size=999)
+            comm.disconnect()
+
+            self.assertEqual(sim.files["C:\\tmp\\file.bin"], bytes(range(256)) * 40)
+
+
+class _ScriptedComm(CommunicatorBase):
+    """Returns prepared lines. None stands for a read that times out."""
+
+    def __init__(self, lines):
+        self.lines = list(lines)
+        self.sent = []
+
+    def send(self, msg):
+        self.sent.append(msg)
+
+    def read_line(self):
+        def read():
+            line = self.lines.pop(0)
+            if line is None:
+                raise TimeoutError("timed out")
+            return line
+
+        return self._read_response(read)
+
+
+class TestAbortOverrun(unittest.TestCase):
+    def setUp(self):
+        level = Compatibility.level
+        self.addCleanup(setattr, Compatibility, "level", level)
+        Compatibility.level = CompatibilityLevel.Sentio_25_2
+
+    def run_overrun(self, lines):
+        comm = _ScriptedComm(lines + ["0,0,10"])
+        prober = SentioProber(comm, CompatibilityLevel.Sentio_25_2)
+        with self.assertRaises(TimeoutError):
+            prober.wait_complete(42, timeout=1)
+
+        self.assertEqual(comm.sent[-1], "abort_command 42")
+        self.assertEqual(prober.map.get_num_cols(), 10)
+        self.assertEqual(comm.lines, [])
+
+    def test_late_reply_before_abort_reply(self):
+        self.run_overrun([None, f"{RemoteCommandError.AsyncCommandAborted},42,aborted", "0,0,ok"])
+
+    def test_abort_reply_before_late_reply(self):
+        self.run_overrun([None, "0,0,ok", f"{RemoteCommandError.AsyncCommandAborted},42,aborted"])
+
+    def test_abort_reply_times_out(self):
+        # both outstanding replies are discarded before the next command reads its response
+        self.run_overrun([None, None, "0,0,ok", f"{RemoteCommandError.AsyncCommandAborted},42,aborted"])
+
+
+class TestDeadlines(SimulatorTestCase):
+    def test_send_cmd_timeout(self):
+        self.sim.latency = 0.2
+        with self.assertRaises(TimeoutError):
+            self.prober.send_cmd("map:get_num_cols", timeout=0.05)
+
+        self.sim.latency = 0
+        self.assertEqual(self.prober.send_cmd("map:get_num_rows", timeout=5).message(), "0")
+
+    def test_deadline_applies_to_command_groups(self):
+        self.sim.processing_time = 0.2
+        with self.assertRaises(TimeoutError):
+            with self.prober.deadline(0.05):
+                self.prober.map.get_num_cols()
+
+    def test_wait_complete_aborts_overrun(self):
+        self.sim.async_duration = 60
+        resp = self.prober.send_cmd("loader:start_prepare_station cas1")
+
+        with self.assertRaises(ProberException) as ctx:
+            self.prober.wait_complete(resp, timeout=0.1)
+
+        self.assertEqual(ctx.exception.error(), RemoteCommandError.Timeout)
+        self.assertEqual(self.prober.query_command_status(resp.cmd_id()).errc(), RemoteCommandError.AsyncCommandAborted)
+
+    def test_wait_complete_local_deadline(self):
+        self.sim.async_duration = 60
+        resp = self.prober.send_cmd("loader:start_prepare_station cas1")
+
+        # the link is dead for longer than SENTIO's timeout plus grace time
+        self.prober.wait_complete_grace = 0
+        self.sim.latency = 0.5
+        with self.assertRaises(TimeoutError):
+            self.prober.wait_complete(resp, timeout=0.05)
+
+        self.sim.latency = 0
+        self.assertEqual(self.prober.query_command_status(resp.cmd_id()).errc(), RemoteCommandError.AsyncCommandAborted)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,163 @@
+import math
+import unittest
+from unittest.mock import MagicMock, patch
+
+from sentio_prober_control.Sentio.CommandGroups.ModuleCommandGroupBase import ModuleCommandGroupBase
+from sentio_prober_control.Sentio.CommandGroups.StatusCommandGroup import StatusCommandGroup
+from sentio_prober_control.Sentio.CommandGroups.VisionCommandGroup import VisionCommandGroup
+from sentio_prober_control.Sentio.CommandGroups.WafermapCommandGroup import WafermapCommandGroup
+from sentio_prober_control.Sentio.Enumerations import Stage
+from sentio_prober_control.Sentio.ProberBase import ProberException
+from sentio_prober_control.Sentio.PropertyCache import PropertyCache
+from sentio_prober_control.UnitTest.SimulatorTestCase import SimulatorTestCase
+
+
+class TestPropertyCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = PropertyCache(default_ttl=10)
+        self.mock_parent = MagicMock()
+        self.mock_comm = MagicMock()
+        self.mock_parent.comm = self.mock_comm
+        self.mock_parent.prober.property_cache = self.cache
+        self.map = WafermapCommandGroup(self.mock_parent)
+
+    def test_lookup_store_invalidate(self):
+        self.assertIs(self.cache.lookup("map", "die_reference", ""), PropertyCache.MISSING)
+        self.cache.store("map", "die_reference", "", (1.0, 2.0))
+        self.cache.store("map", "grid_origin", "1", 5.0)
+        self.cache.store("vis", "grid_origin", "1", 6.0)
+        self.assertEqual(self.cache.lookup("map", "die_reference", ""), (1.0, 2.0))
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+        self.cache.invalidate("grid_origin", "map")
+        self.assertIs(self.cache.lookup("map", "grid_origin", "1"), PropertyCache.MISSING)
+        self.assertEqual(self.cache.lookup("vis", "grid_origin", "1"), 6.0)
+
+        self.cache.clear()
+        self.assertIs(self.cache.lookup("map", "die_reference", ""), PropertyCache.MISSING)
+
+    def test_ttl(self):
+        self.cache.set_ttl("never", 0)
+        self.cache.set_ttl("forever", math.inf)
+        self.cache.store("map", "never", "", 1.0)
+        self.cache.store("map", "forever", "", 2.0)
+
+        with patch("sentio_prober_control.Sentio.PropertyCache.time.monotonic", return_value=1e12):
+            self.assertIs(self.cache.lookup("map", "never", ""), PropertyCache.MISSING)
+            self.assertIs(self.cache.lookup("map", "die_reference", ""), PropertyCache.MISSING)
+            self.assertEqual(self.cache.lookup("map", "forever", ""), 2.0)
+
+    def test_get_prop_is_cached_per_argument(self):
+        self.mock_comm.read_line.return_value = "0,0,1.5,2.5"
+        self.assertEqual(self.map.get_prop("chuck_to_wafer_offset", "A"), (1.5, 2.5))
+        self.assertEqual(self.map.get_prop("chuck_to_wafer_offset", "A"), (1.5, 2.5))
+        self.assertEqual(self.mock_comm.send.call_count, 1)
+
+        self.map.get_prop("chuck_to_wafer_offset", "B")
+        self.mock_comm.send.assert_called_with("map:get_prop chuck_to_wafer_offset, B")
+        self.assertEqual(self.mock_comm.send.call_count, 2)
+
+    def test_set_prop_invalidates(self):
+        self.mock_comm.read_line.return_value = "0,0,true"
+        self.assertTrue(self.map.get_prop("grid_chuck_mode"))
+
+        self.mock_comm.read_line.return_value = "0,0,ok"
+        self.map.set_prop("grid_chuck_mode", False)
+        self.mock_comm.read_line.return_value = "0,0,false"
+        self.assertFalse(self.map.get_prop("grid_chuck_mode"))
+        self.assertEqual(self.mock_comm.send.call_count, 3)
+
+        # Setting the property of another module keeps the cached value
+        status = StatusCommandGroup(self.mock_parent)
+        self.mock_comm.read_line.return_value = "0,0,ok"
+        status.set_prop("grid_chuck_mode", True)
+        self.assertFalse(self.map.get_prop("grid_chuck_mode"))
+        self.assertEqual(self.mock_comm.send.call_count, 4)
+
+    def test_map_setup_commands_invalidate(self):
+        self.cache.set_ttl("chuck_to_wafer_offset", math.inf)
+        vision = VisionCommandGroup(self.mock_parent)
+        self.mock_parent.prober.map = self.map
+
+        for change in (lambda: self.map.set_grid_origin(1, 2), lambda: self.map.set_home_die(0, 0),
+                       lambda: self.map.set_grid_params(100, 100, 50, 50, 0), lambda: self.map.create_rect(5, 5),
+                       lambda: vision.align_wafer()):
+            self.mock_comm.read_line.return_value = "0,0,1.5,2.5"
+            self.map.get_prop("chuck_to_wafer_offset")
+            count = self.mock_comm.send.call_count
+
+            self.mock_comm.read_line.return_value = "0,0,ok"
+            change()
+            self.mock_comm.read_line.return_value = "0,0,3.5,4.5"
+            self.assertEqual(self.map.get_prop("chuck_to_wafer_offset"), (3.5, 4.5))
+            self.assertEqual(self.mock_comm.send.call_count, count + 2)
+
+        # wafermap commands do not touch the properties of other modules
+        self.cache.store("vis", "light", "scope", 80.0)
+        self.map.set_home_die(1, 1)
+        self.assertEqual(self.cache.lookup("vis", "light", "scope"), 80.0)
+
+    def test_registered_types_skip_guessing(self):
+        self.mock_parent.prober.property_cache = None
+
+        # without registration "1" would be guessed as a float
+        self.mock_comm.read_line.return_value = "0,0,1"
+        self.assertIs(self.map.get_prop("die_reference_is_set"), True)
+        self.assertEqual(self.map.get_prop("some_unknown_prop"), 1.0)
+
+        ModuleCommandGroupBase.register_prop("map", "test_prop_label", str)
+        self.mock_comm.read_line.return_value = "0,0,123"
+        self.assertEqual(self.map.get_prop("test_prop_label"), "123")
+
+    def test_registered_types_are_per_module(self):
+        self.mock_parent.prober.property_cache = None
+        vision = VisionCommandGroup(self.mock_parent)
+
+        # a property of another module with the same name is still guessed
+        self.mock_comm.read_line.return_value = "0,0,1.5"
+        self.assertEqual(vision.get_prop("grid_chuck_mode"), 1.5)
+        self.mock_comm.read_line.return_value = "0,0,1,2,3"
+        self.assertEqual(vision.get_prop("die_reference"), (1.0, 2.0, 3.0))
+
+
+class TestGetProps(SimulatorTestCase):
+    def setUp(self):
+        super().setUp()
+        self.sim.reset()
+
+    def test_values_match_get_prop(self):
+        props = [("map", "grid_chuck_mode"), ("map", "chuck_to_wafer_offset"), ("vis", "light", "scope"), ("status", "active_stage", Stage.Chuck)]
+        self.prober.map.set_prop("grid_chuck_mode", True)
+
+        values = self.prober.get_props(props)
+        self.assertEqual(list(values), props)
+        self.assertEqual(values, {
+            ("map", "grid_chuck_mode"): True,
+            ("map", "chuck_to_wafer_offset"): (0.0, 0.0),
+            ("vis", "light", "scope"): 80.0,
+            ("status", "active_stage", Stage.Chuck): "Wafer",
+        })
+        self.assertEqual(values[("vis", "light", "scope")], self.prober.vision.get_prop("light", "scope"))
+
+    def test_error_is_raised_after_all_responses_were_read(self):
+        with self.assertRaises(ProberException):
+            self.prober.get_props([("map", "grid_chuck_mode"), ("map", "no_such_prop"), ("map", "die_reference")])
+
+        # The connection is still in sync
+        self.assertEqual(self.prober.map.get_prop("die_reference"), (0.0, 0.0))
+
+    def test_uses_property_cache(self):
+        self.prober.property_cache = PropertyCache(default_ttl=60)
+        self.prober.map.get_prop("grid_chuck_mode")
+        count = self.sim.num_commands
+
+        values = self.prober.get_props([("map", "grid_chuck_mode"), ("map", "die_reference_is_set")])
+        self.assertEqual(values, {("map", "grid_chuck_mode"): False, ("map", "die_reference_is_set"): False})
+        self.assertEqual(self.sim.num_commands, count + 1)
+
+        self.prober.get_props([("map", "die_reference_is_set")])
+        self.assertEqual(self.sim.num_commands, count + 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
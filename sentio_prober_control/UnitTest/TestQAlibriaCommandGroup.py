@@ -1,5 +1,5 @@
 import unittest
-from unittest.mock import MagicMock, call
+from unittest.mock import MagicMock, call, patch
 from sentio_prober_control.Communication.CommunicatorTcpIp import CommunicatorTcpIp
 from sentio_prober_control.Sentio.CommandGroups.QAlibriaCommandGroup import QAlibriaCommandGroup, DriftType
 from sentio_prober_control.Sentio.Response import Response
@@ -19,8 +19,6 @@ class DummyResponse:
     def message(self):
         return self._message
 
-# Patch Response.check_resp to return a DummyResponse instance.
-Response.check_resp = lambda x: DummyResponse(x)
 
 # Dummy parent class that contains a 'comm' attribute.
 class DummyParent:
@@ -29,6 +27,11 @@ class DummyParent:
 
 class TestQAlibriaCommandGroup(unittest.TestCase):
     def setUp(self):
+        # Patch Response.check_resp to return a DummyResponse instance.
+        patcher = patch.object(Response, "check_resp", lambda x: DummyResponse(x))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
         # Create a mock communicator based on the TCP/IP communicator.
         self.mock_comm = MagicMock(spec=CommunicatorTcpIp)
         # Wrap the communicator in a dummy parent so that __parent.comm works.
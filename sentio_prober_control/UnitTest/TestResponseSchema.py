@@ -0,0 +1,71 @@
+import unittest
+
+from sentio_prober_control.Sentio.Enumerations import BinQuality, ChuckSite, LoaderStation
+from sentio_prober_control.Sentio.ProberBase import ProberException
+from sentio_prober_control.Sentio.Response import Response
+from sentio_prober_control.Sentio.ResponseSchema import OrDefault, ResponseSchema
+from sentio_prober_control.Sentio.ProberSentio import SentioProber  # registers the schemas of the command groups
+
+
+class TestResponseSchema(unittest.TestCase):
+    def test_fields(self):
+        schema = ResponseSchema(int, str, BinQuality, ChuckSite, bool, float)
+        resp = Response.parse_resp("0,0,3,TestBin,Pass,AuxRight,true,1.5")
+
+        self.assertEqual(schema.parse(resp), (3, "TestBin", BinQuality.Pass, ChuckSite.AuxRight, True, 1.5))
+
+    def test_too_few_fields(self):
+        schema = ResponseSchema(float, float, float)
+        with self.assertRaises(ProberException):
+            schema.parse_message("1.0,2.0")
+
+        with self.assertRaises(ValueError):
+            schema.parse_message("1.0,2.0,abc")
+
+    def test_or_default(self):
+        schema = ResponseSchema(LoaderStation, OrDefault(int, -1))
+        self.assertEqual(schema.parse_message("Cassette1,NaN"), (LoaderStation.Cassette1, -1))
+        self.assertEqual(schema.parse_message("Cassette1,200"), (LoaderStation.Cassette1, 200))
+
+    def test_record_and_skip(self):
+        schema = ResponseSchema(float, str, record=lambda x, name: {name: x}, skip=1)
+        self.assertEqual(schema.parse_message("99,1.5,a"), {"a": 1.5})
+
+    def test_repeated_records(self):
+        schema = ResponseSchema(int, int, repeat=True, skip=1)
+        self.assertEqual(schema.parse_message("2,1,2,3,4"), [(1, 2), (3, 4)])
+        self.assertEqual(schema.parse_message("0,"), [])
+
+        with self.assertRaises(ProberException):
+            schema.parse_message("2,1,2,3")
+
+    def test_parse_array(self):
+        try:
+            import numpy as np
+        except ImportError:
+            self.skipTest("numpy is not installed")
+
+        schema = ResponseSchema(float, float, repeat=True)
+        arr = schema.parse_array("1,2.5, 3,4")
+        self.assertEqual(arr.shape, (2, 2))
+        self.assertEqual(arr.dtype, np.float64)
+        self.assertEqual(arr.tolist(), [[1.0, 2.5], [3.0, 4.0]])
+        self.assertEqual(ResponseSchema(int, repeat=True).parse_array("").shape, (0, 1))
+
+        with self.assertRaises(TypeError):
+            ResponseSchema(str, float).parse_array("a,1")
+
+    def test_registry(self):
+        schema = ResponseSchema.get("map:bins:get_bin_info 3")
+        self.assertIsNotNone(schema)
+        self.assertEqual(schema.parse_message("3,TestBin,Fail,#FF00FFFF"), (3, "TestBin", BinQuality.Fail, "#FF00FFFF"))
+        self.assertIn("loader:query_wafer_status", ResponseSchema.commands())
+        self.assertIsNone(ResponseSchema.get("map:unknown_command"))
+
+        with self.assertRaises(ProberException) as ctx:
+            schema.parse_message("3,TestBin")
+        self.assertIn("map:bins:get_bin_info", str(ctx.exception))
+
+
+if __name__ == "__main__":
+    unittest.main()
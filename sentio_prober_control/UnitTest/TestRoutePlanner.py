@@ -0,0 +1,100 @@
+import unittest
+
+from sentio_prober_control.Sentio.Enumerations import RoutingPriority, RoutingStartPoint
+from sentio_prober_control.Sentio.RoutePlanner import RoutePlanner
+from sentio_prober_control.UnitTest.SimulatorTestCase import SimulatorTestCase
+
+try:
+    import numpy
+    from sentio_prober_control.Sentio.WaferMapModel import WaferMapModel
+except ImportError:
+    numpy = None
+
+
+class TestRoutePlanner(SimulatorTestCase):
+    def setUp(self):
+        super().setUp()
+        self.prober.map.create(40)
+        for col, row in ((3, 3), (4, 2), (2, 5)):
+            self.prober.map.die.unselect(col, row)
+
+        self.selected = [(c, r) for r in range(self.prober.map.get_num_rows()) for c in range(self.prober.map.get_num_cols())
+                         if self.prober.map.die.get_status(c, r) == 1]
+
+    def test_plan_matches_stepping_order(self):
+        self.assertEqual(RoutePlanner().plan([(1, 1), (0, 1), (1, 0), (0, 0)]), [(0, 0), (1, 0), (0, 1), (1, 1)])
+        self.assertEqual(RoutePlanner(RoutingStartPoint.LowerRight, RoutingPriority.ColBiDir).plan([(1, 1), (0, 1), (1, 0), (0, 0)]),
+                         [(1, 1), (1, 0), (0, 0), (0, 1)])
+
+        for start in RoutingStartPoint:
+            for priority in RoutingPriority:
+                with self.subTest(start=start, priority=priority):
+                    self.prober.map.path.set_routing(start, priority)
+                    planner = RoutePlanner.from_prober(self.prober)
+                    route = planner.plan(self.selected)
+
+                    self.assertEqual(route, [self.prober.map.path.get_die(seq) for seq in range(len(route))])
+                    self.assertEqual(planner.verify(self.prober, route, sample=8, seed=1), [])
+
+    def test_bidir_parity_counts_empty_lines(self):
+        # 3x4 grid, row 1 and column 1 have no selected dies
+        dies = [(c, r) for r in (0, 2, 3) for c in range(3)]
+        self.assertEqual(RoutePlanner(RoutingStartPoint.UpperLeft, RoutingPriority.RowBiDir).plan(dies), [
+            (0, 0), (1, 0), (2, 0),
+            (0, 2), (1, 2), (2, 2),
+            (2, 3), (1, 3), (0, 3),
+        ])
+
+        dies = [(c, r) for c in (0, 2, 3) for r in range(2)]
+        self.assertEqual(RoutePlanner(RoutingStartPoint.LowerRight, RoutingPriority.ColBiDir).plan(dies), [
+            (3, 1), (3, 0),
+            (2, 0), (2, 1),
+            (0, 0), (0, 1),
+        ])
+
+    def test_bidir_route_of_simulator(self):
+        # Checks the route of the simulator independently from the planner. In both maps the
+        # first stepped line is not the first line of the grid and an empty line is skipped.
+        self.prober.map.create_rect(3, 5)
+        for col in range(3):
+            self.prober.map.die.unselect(col, 0)
+            self.prober.map.die.unselect(col, 2)
+
+        self.prober.map.path.set_routing(RoutingStartPoint.UpperLeft, RoutingPriority.RowBiDir)
+        self.assertEqual([self.prober.map.path.get_die(seq) for seq in range(9)], [
+            (0, 1), (1, 1), (2, 1),
+            (0, 3), (1, 3), (2, 3),
+            (2, 4), (1, 4), (0, 4),
+        ])
+
+        self.prober.map.create_rect(4, 3)
+        for row in range(3):
+            self.prober.map.die.unselect(3, row)
+            self.prober.map.die.unselect(1, row)
+
+        self.prober.map.path.set_routing(RoutingStartPoint.LowerRight, RoutingPriority.ColBiDir)
+        self.assertEqual([self.prober.map.path.get_die(seq) for seq in range(6)], [
+            (2, 2), (2, 1), (2, 0),
+            (0, 2), (0, 1), (0, 0),
+        ])
+
+    def test_verify_reports_differences(self):
+        route = RoutePlanner().plan(self.selected)
+        self.prober.map.path.set_routing(RoutingStartPoint.UpperLeft, RoutingPriority.RowBiDir)
+
+        diffs = RoutePlanner.verify(self.prober, route, sample=len(route))
+        self.assertTrue(diffs)
+        self.assertTrue(all(planned != actual for _, planned, actual in diffs))
+
+        diffs = RoutePlanner.verify(self.prober, route + [(0, 0)], sample=0)
+        self.assertEqual(diffs[-1], (len(route), (0, 0), None))
+
+    @unittest.skipIf(numpy is None, "requires numpy")
+    def test_plan_model(self):
+        with WaferMapModel(self.prober) as model:
+            model.sync()
+            self.assertEqual(RoutePlanner().plan_model(model), RoutePlanner().plan(self.selected))
+
+
+if __name__ == "__main__":
+    unittest.main()
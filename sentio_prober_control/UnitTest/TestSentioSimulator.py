@@ -0,0 +1,131 @@
+import threading
+import time
+import unittest
+from sentio_prober_control.Communication.CommunicatorTcpIp import CommunicatorTcpIp
+from sentio_prober_control.Sentio.Enumerations import (
+    ChuckSite,
+    DieNumber,
+    LoaderStation,
+    RemoteCommandError,
+    RoutingPriority,
+    RoutingStartPoint,
+    StatusBits,
+    XyReference,
+)
+from sentio_prober_control.Sentio.ProberBase import ProberException
+from sentio_prober_control.Sentio.Response import Response
+from sentio_prober_control.Simulator.SentioSimulator import SentioSimulator
+from sentio_prober_control.UnitTest.SimulatorTestCase import SimulatorTestCase
+
+
+class TestSentioSimulatorCommands(unittest.TestCase):
+    def setUp(self):
+        self.sim = SentioSimulator(port=0)
+
+    def test_response_format(self):
+        self.assertEqual(self.sim.execute("status:get_version"), "0,0,Version: 25.2.0.0")
+        self.assertIsNone(self.sim.execute("*RCS 1"))
+        self.assertEqual(self.sim.execute("unknown_command").split(",")[0], str(RemoteCommandError.CommandHandlerNotFound))
+        self.assertEqual(self.sim.execute("map:create_rect 3").split(",")[0], str(RemoteCommandError.InvalidNumberOfParameters))
+
+    def test_route_and_end_of_route(self):
+        self.sim.execute("map:create_rect 2, 2")
+        self.sim.execute("map:set_routing ll, wr")
+
+        route = [self.sim.execute(f"map:path:get_die {i}") for i in range(4)]
+        self.assertEqual(route, ["0,0,0,1", "0,0,1,1", "0,0,1,0", "0,0,0,0"])
+
+        # a die has a single subsite unless subsites were added, so the last site flag is set
+        self.assertEqual(self.sim.execute("map:step_die_seq 2, 0"), f"{StatusBits.LastSite << 10},0,1,0,0")
+        last = Response.parse_resp(self.sim.execute("map:step_next_die"))
+        self.assertEqual(last.status(), StatusBits.EndOfRoute | StatusBits.LastSite)
+        self.assertEqual(Response.parse_resp(self.sim.execute("map:step_next_die")).errc(), RemoteCommandError.EndOfRoute)
+
+    def test_async_commands(self):
+        self.sim.async_duration = 60
+        resp = Response.parse_resp(self.sim.execute("status:start_show_hint \"a\", \"b\", \"Ok\", \"True\""))
+        self.assertEqual(resp.errc(), 0)
+        self.assertGreater(resp.cmd_id(), 0)
+
+        self.assertEqual(Response.parse_resp(self.sim.execute(f"query_command_status {resp.cmd_id()}")).errc(), RemoteCommandError.CommandPending)
+        self.assertEqual(self.sim.execute(f"abort_command {resp.cmd_id()}"), "0,0,ok")
+        self.assertEqual(Response.parse_resp(self.sim.execute(f"wait_complete {resp.cmd_id()}, 5")).errc(), RemoteCommandError.AsyncCommandAborted)
+        self.assertEqual(Response.parse_resp(self.sim.execute("wait_complete 999, 5")).errc(), RemoteCommandError.UnknownCommandId)
+
+    def test_wait_complete_blocks_until_done(self):
+        self.sim.async_duration = 0.05
+        cmd_id = Response.parse_resp(self.sim.execute("loader:start_prepare_station cas1")).cmd_id()
+
+        start = time.perf_counter()
+        self.assertEqual(self.sim.execute(f"wait_complete {cmd_id}, 5"), f"0,{cmd_id},ok")
+        self.assertGreaterEqual(time.perf_counter() - start, 0.04)
+
+    def test_loader_slots(self):
+        self.assertEqual(self.sim.execute("loader:scan_station cas2"), "0,0," + "0" * 25)
+        self.assertEqual(self.sim.execute("loader:load_wafer cas1, 3"), "0,0,ok")
+        self.assertEqual(Response.parse_resp(self.sim.execute("loader:load_wafer cas1, 4")).errc(), RemoteCommandError.SlotOrStationOccupied)
+        self.assertEqual(self.sim.execute("loader:query_wafer_status chuck, 1"), "0,0,Cassette1,3,200,0,0.0")
+        self.assertEqual(self.sim.execute("loader:unload_wafer"), "0,0,ok")
+        self.assertEqual(Response.parse_resp(self.sim.execute("loader:query_wafer_status chuck, 1")).errc(), RemoteCommandError.SlotOrStationEmpty)
+
+
+class TestSentioSimulatorServer(SimulatorTestCase):
+    def test_wafermap_flow(self):
+        self.prober.map.create_rect(4, 3)
+        self.prober.map.path.set_routing(RoutingStartPoint.UpperLeft, RoutingPriority.RowUniDir)
+        self.prober.map.die.unselect(1, 0)
+
+        self.assertEqual(self.prober.map.get_num_dies(DieNumber.Selected), 11)
+        self.assertEqual(self.prober.map.step_first_die(), (0, 0, 0))
+        self.assertEqual(self.prober.map.bin_step_next_die(3), (2, 0, 0))
+        self.assertEqual(self.prober.map.bins.get_bin(0, 0), 3)
+
+        self.prober.map.step_die(3, 2)
+        self.assertTrue(self.prober.map.end_of_route())
+        with self.assertRaises(ProberException):
+            self.prober.map.step_next_die()
+
+    def test_stepping_moves_chuck(self):
+        self.prober.map.create_rect(3, 3)
+        self.prober.map.set_index_size(1000, 2000)
+        self.prober.map.subsites.add("A", 100, 50)
+
+        self.prober.map.step_die(2, 1, 1)
+        self.assertEqual(self.prober.get_chuck_xy(ChuckSite.Wafer, XyReference.Zero), (2100.0, -1950.0))
+
+    def test_loader(self):
+        self.assertEqual(self.prober.loader.load_wafer(LoaderStation.Cassette1, 1), "")
+        station, slot, size, _, _ = self.prober.loader.query_wafer_status(LoaderStation.Chuck, 1)
+        self.assertEqual((station, slot, size), (LoaderStation.Cassette1, 1, 200))
+
+    def test_latency_does_not_serialize_pipelined_commands(self):
+        self.sim.latency = 0.05
+        start = time.perf_counter()
+
+        with self.comm.pipeline(8) as pipe:
+            handles = pipe.submit_all(["map:get_num_cols"] * 8)
+
+        self.assertLess(time.perf_counter() - start, 0.3)
+        self.assertEqual([h.result() for h in handles], ["0,0,0"] * 8)
+
+    def test_concurrent_connections_share_state(self):
+        results = []
+
+        def worker():
+            comm = CommunicatorTcpIp.create(self.sim.address)
+            for _ in range(20):
+                comm.send("map:bins:get_num_bins")
+                results.append(comm.read_line())
+            comm.disconnect()
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(results, ["0,0,16"] * 80)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+import socket
+import threading
+import unittest
+from sentio_prober_control.Communication.SocketLineReader import SocketLineReader
+from sentio_prober_control.Sentio.Response import Response
+
+
+class TestSocketLineReader(unittest.TestCase):
+    def setUp(self):
+        self.server, self.client = socket.socketpair()
+        self.addCleanup(self.server.close)
+        self.addCleanup(self.client.close)
+
+    def send_async(self, data: bytes):
+        thread = threading.Thread(target=self.server.sendall, args=(data,))
+        thread.start()
+        self.addCleanup(thread.join)
+
+    def test_lines_are_split_on_raw_bytes(self):
+        self.server.sendall(b"0,0,ok\r\n0,0,1,2\n0,0,\xc3\xa4  \n")
+        reader = SocketLineReader(self.client)
+
+        self.assertEqual(reader.read_line_bytes(), b"0,0,ok")
+        self.assertEqual(reader.read_line_bytes(), b"0,0,1,2")
+        self.assertEqual(reader.read_line_bytes(), "0,0,ä".encode())
+
+    def test_buffer_is_compacted_and_grown(self):
+        lines = [b"0,0," + bytes([65 + i]) * (i * 7) for i in range(20)]
+        self.send_async(b"\n".join(lines) + b"\n" + b"0,0," + b"x" * 100 + b"\n")
+        reader = SocketLineReader(self.client, buffer_size=32)
+
+        self.assertEqual([reader.read_line_bytes() for _ in lines], lines)
+        self.assertEqual(len(reader.read_line_bytes()), 104)
+        self.assertGreaterEqual(reader.buffer_size, 105)
+
+    def test_line_chunks(self):
+        payload = b"".join(bytes([48 + i % 10]) for i in range(1000))
+        self.send_async(payload + b"\r\n0,0,next\n")
+        reader = SocketLineReader(self.client, buffer_size=64)
+
+        chunks = [bytes(c) for c in reader.iter_line_chunks()]
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(b"".join(chunks), payload)
+        self.assertEqual(reader.read_line_bytes(), b"0,0,next")
+        self.assertEqual(reader.buffer_size, 64)
+
+    def test_closed_connection(self):
+        self.server.sendall(b"0,0,partial")
+        self.server.close()
+        reader = SocketLineReader(self.client)
+
+        with self.assertRaises(ConnectionError):
+            reader.read_line_bytes()
+
+
+class TestResponseFromBytes(unittest.TestCase):
+    def test_parse_bytes(self):
+        resp = Response.parse_resp(bytearray(b"2049,5,a,b,c"))
+
+        self.assertEqual(resp.errc(), 1)
+        self.assertEqual(resp.status(), 2)
+        self.assertEqual(resp.cmd_id(), 5)
+        self.assertEqual(resp.message_bytes(), b"a,b,c")
+        self.assertEqual(resp.message(), "a,b,c")
+
+    def test_typed_fields(self):
+        resp = Response.parse_resp(b"0,0,3,-2, 1.5,TRUE\n")
+
+        self.assertIs(resp.fields(), resp.fields())
+        self.assertEqual(resp.fields(), ("3", "-2", " 1.5", "TRUE"))
+        self.assertEqual(resp.ints(2), (3, -2))
+        self.assertEqual(resp.floats(3), (3.0, -2.0, 1.5))
+        self.assertEqual(resp.int_at(1), -2)
+        self.assertEqual(resp.float_at(2), 1.5)
+        self.assertTrue(resp.bool_at(3))
+
+        with self.assertRaises(IndexError):
+            resp.ints(5)
+        with self.assertRaises(ValueError):
+            resp.bool_at(0)
+        with self.assertRaises(AttributeError):
+            resp.extra = 1
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,13 @@
+import base64
+import io
+import os
+import tempfile
 import unittest
 from unittest.mock import MagicMock
 from sentio_prober_control.Sentio.ProberSentio import SentioProber
 from sentio_prober_control.Communication.CommunicatorTcpIp import CommunicatorTcpIp
+from sentio_prober_control.Sentio.ProberBase import ProberException
+from sentio_prober_control.Simulator.SentioSimulator import SentioSimulator
 from sentio_prober_control.Sentio.Enumerations import (
     CameraMountPoint,
     AutoFocusCmd,
@@ -163,5 +169,65 @@ class TestVisionCommandGroup(unittest.TestCase):
         self.assertGreater(result.cmd_id(), 0, "cmd_id should be greater than 0")
 
 
+class TestSnapImageDownload(unittest.TestCase):
+    def setUp(self):
+        self.mock_comm = MagicMock(spec=CommunicatorTcpIp)
+        self.mock_comm.read_line.return_value = "0,0,Version: 25.2.0.0"
+        self.prober = SentioProber(self.mock_comm)
+        self.jpeg = b"\xff\xd8" + bytes(range(256)) * 3 + b"\xff\xd9"
+
+    def respond(self, line: bytes):
+        # hand out the response in small, unaligned pieces like a socket would
+        self.mock_comm.iter_line_chunks.side_effect = lambda: iter([line[i:i + 7] for i in range(0, len(line), 7)])
+
+    def test_download_returns_jpeg_bytes(self):
+        self.respond(b"0,0," + base64.b64encode(self.jpeg))
+        result = self.prober.vision.snap_image(None, SnapshotType.CameraRaw, SnapshotLocation.Local)
+        self.mock_comm.send.assert_called_with("vis:snap_image **download**, 0")
+        self.assertEqual(result, self.jpeg)
+
+    def test_download_to_file_and_buffer(self):
+        self.respond(b"0,0," + base64.b64encode(self.jpeg))
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "snap.jpg")
+            self.assertIsNone(self.prober.vision.snap_image(path, SnapshotType.CameraRaw, SnapshotLocation.Local))
+            with open(path, "rb") as f:
+                self.assertEqual(f.read(), self.jpeg)
+
+        buffer = bytearray(b"x")
+        self.prober.vision.snap_image(buffer, SnapshotType.WithOverlays, SnapshotLocation.Local)
+        self.assertEqual(buffer, b"x" + self.jpeg)
+
+    def test_download_error(self):
+        self.respond(b"36,0,Camera does not exist")
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "snap.jpg")
+            with self.assertRaises(ProberException) as ctx:
+                self.prober.vision.snap_image(path, SnapshotType.CameraRaw, SnapshotLocation.Local)
+
+            self.assertEqual(ctx.exception.error(), 36)
+            self.assertFalse(os.path.exists(path))
+
+    def test_malformed_or_short_responses(self):
+        for line, errc in ((b"36,0", 36), (b"36", 36), (b"0,0", -1), (b"0", -1), (b"", -1), (b"no header at all", -1)):
+            with self.subTest(line=line):
+                self.respond(line)
+                with self.assertRaises(ProberException) as ctx:
+                    self.prober.vision.snap_image(None, SnapshotType.CameraRaw, SnapshotLocation.Local)
+                self.assertEqual(ctx.exception.error(), errc)
+
+    def test_download_from_simulator(self):
+        with SentioSimulator(port=0) as sim:
+            sim.snapshot = self.jpeg * 500
+            comm = CommunicatorTcpIp.create(sim.address)
+            prober = SentioProber(comm)
+
+            stream = io.BytesIO()
+            prober.vision.snap_image(stream, SnapshotType.CameraRaw, SnapshotLocation.Local)
+            comm.disconnect()
+
+        self.assertEqual(stream.getvalue(), self.jpeg * 500)
+
+
 if __name__ == "__main__":
     unittest.main()
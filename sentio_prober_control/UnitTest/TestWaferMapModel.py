@@ -0,0 +1,113 @@
+import math
+import unittest
+from unittest.mock import patch
+
+from sentio_prober_control.Sentio.Enumerations import BinSelection, RemoteCommandError
+from sentio_prober_control.Sentio.ProberBase import ProberException
+from sentio_prober_control.UnitTest.SimulatorTestCase import SimulatorTestCase
+
+try:
+    import numpy
+    from sentio_prober_control.Sentio.WaferMapModel import WaferMapModel
+except ImportError:
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, "requires numpy")
+class TestWaferMapModel(SimulatorTestCase):
+    def setUp(self):
+        super().setUp()
+        self.prober.map.create(50)
+        self.prober.map.bins.set_bin(4, 2, 3)
+        self.prober.map.die.unselect(3, 3)
+
+        self.model = WaferMapModel(self.prober, depth=16)
+        self.addCleanup(self.model.close)
+
+    def test_download_matches_die_queries(self):
+        self.assertEqual(self.model.sync(), self.prober.map.get_num_cols() * self.prober.map.get_num_rows())
+        self.assertEqual(self.model.status.shape, (self.model.num_rows, self.model.num_cols))
+
+        for row in range(self.model.num_rows):
+            for col in range(self.model.num_cols):
+                status = self.prober.map.die.get_status(col, row)
+                self.assertEqual(self.model.die_status(col, row), status)
+                if status != WaferMapModel.NOT_PRESENT:
+                    self.assertEqual(self.model.bin(col, row), self.prober.map.bins.get_bin(col, row))
+
+        self.assertEqual(self.model.bin(2, 3), 4)
+        self.assertEqual(self.model.die_status(3, 3), WaferMapModel.NOT_SELECTED)
+
+    def test_present_die_without_bin(self):
+        execute = self.sim.execute
+
+        def no_bin(cmd):
+            if cmd.strip() == "map:bins:get_bin 4, 4":
+                return f"{RemoteCommandError.InvalidParameter},0,die has no bin"
+            return execute(cmd)
+
+        with patch.object(self.sim, "execute", side_effect=no_bin):
+            self.model.sync()
+
+        self.assertNotEqual(self.model.die_status(4, 4), WaferMapModel.NOT_PRESENT)
+        self.assertEqual(self.model.bin(4, 4), -1)
+        self.assertEqual(self.model.bin(2, 3), 4)
+        self.assertEqual(self.model.num_dirty, 0)
+
+    def test_bin_query_error_is_raised(self):
+        execute = self.sim.execute
+
+        def failing(cmd):
+            if cmd.strip() == "map:bins:get_bin 4, 4":
+                return f"{RemoteCommandError.ExecutionError},0,internal failure"
+            return execute(cmd)
+
+        with patch.object(self.sim, "execute", side_effect=failing):
+            with self.assertRaises(ProberException):
+                self.model.sync()
+
+        self.assertEqual(self.model.num_dirty, -1)
+        self.model.sync()
+        self.assertEqual(self.model.bin(2, 3), 4)
+
+    def test_incremental_sync(self):
+        self.model.sync()
+        self.assertEqual(self.model.num_dirty, 0)
+
+        self.prober.map.bins.set_bin(7, 4, 4)
+        self.prober.map.die.unselect(5, 5)
+        self.prober.map.get_num_cols()
+        self.assertEqual(self.model.num_dirty, 2)
+
+        count = self.sim.num_commands
+        self.assertEqual(self.model.sync(), 2)
+        self.assertEqual(self.sim.num_commands, count + 4)
+        self.assertEqual(self.model.bin(4, 4), 7)
+        self.assertEqual(self.model.die_status(5, 5), WaferMapModel.NOT_SELECTED)
+
+    def test_map_wide_commands_trigger_download(self):
+        self.model.sync()
+        self.prober.map.bins.set_all(9, BinSelection.All)
+        self.assertEqual(self.model.num_dirty, -1)
+
+        self.model.sync()
+        selected = self.model.status == WaferMapModel.SELECTED
+        self.assertTrue((self.model.bins[selected] == 9).all())
+        self.assertEqual(self.model.bin(3, 3), -1)
+
+    def test_values_are_tracked(self):
+        self.model.sync()
+        self.prober.map.bins.set_value(1.5, 4, 4)
+        self.assertEqual(self.model.values[self.model.index(4, 4)], 1.5)
+        self.assertTrue(math.isnan(self.model.values[self.model.index(4, 5)]))
+
+        self.prober.map.bins.clear_all_values()
+        self.assertTrue(numpy.isnan(self.model.values).all())
+
+        self.model.close()
+        self.prober.map.bins.set_bin(7, 4, 4)
+        self.assertEqual(self.model.num_dirty, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
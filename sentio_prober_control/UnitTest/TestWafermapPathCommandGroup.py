@@ -1,9 +1,15 @@
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 from sentio_prober_control.Sentio.ProberSentio import SentioProber
 from sentio_prober_control.Communication.CommunicatorTcpIp import CommunicatorTcpIp
 from sentio_prober_control.Sentio.Enumerations import RoutingPriority, RoutingStartPoint, TestSelection, \
-    RoutingPriority, PathSelection
+    RoutingPriority, PathSelection, DieNumber
+from sentio_prober_control.UnitTest.SimulatorTestCase import SimulatorTestCase
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 
 class TestWafermapPathCommandGroup(unittest.TestCase):
@@ -94,6 +100,37 @@ class TestWafermapPathCommandGroup(unittest.TestCase):
         self.assertEqual(result, 7)
 
 
+@unittest.skipIf(numpy is None, "requires numpy")
+class TestPathGetAll(SimulatorTestCase):
+    def test_matches_get_die(self):
+        self.prober.map.create(40)
+        self.prober.map.die.unselect(3, 3)
+        self.prober.map.path.set_routing(RoutingStartPoint.LowerRight, RoutingPriority.ColBiDir)
+
+        for chunk_size in (1, 7, 1000):
+            with self.subTest(chunk_size=chunk_size):
+                route = self.prober.map.path.get_all(chunk_size=chunk_size, depth=4)
+                self.assertEqual(route.shape, (self.prober.map.get_num_dies(DieNumber.Selected), 2))
+                self.assertEqual(route.dtype, numpy.int64)
+                self.assertEqual([tuple(d) for d in route.tolist()], [self.prober.map.path.get_die(seq) for seq in range(len(route))])
+
+    def test_empty_path(self):
+        self.assertEqual(self.prober.map.path.get_all().shape, (0, 2))
+
+    def test_path_differs_from_selection(self):
+        self.prober.map.create_rect(5, 4)
+        expected = [self.prober.map.path.get_die(seq) for seq in range(20)]
+
+        for num_selected in (0, 3, 19, 21, 40):
+            with self.subTest(num_selected=num_selected):
+                with patch.object(self.prober.map, "get_num_dies", return_value=num_selected):
+                    route = self.prober.map.path.get_all(chunk_size=6, depth=4)
+                self.assertEqual([tuple(d) for d in route.tolist()], expected)
+
+        # the communicator is still in sync
+        self.assertEqual(self.prober.map.get_num_cols(), 5)
+
+
 if __name__ == "__main__":
     unittest.main()
 
@@ -18,11 +18,32 @@ A set of example scripts for python is maintained in a separate archive at GitHu
 https://github.com/SentioProberDev/Examples-Python
 
 """
-# from .Sentio.ProberSentio import SentioProber, Module
-# from .Communication.CommunicatorTcpIp import CommunicatorTcpIp
-# from .Communication.CommunicatorGpib import CommunicatorGpib
+import importlib
+from typing import Any, List
+
+# The most frequently used classes are available from the package itself. They are imported
+# on first access, so that importing the package stays cheap. The VISA and GPIB communicators
+# load their drivers only when they are used.
+_LAZY_IMPORTS = {
+    "SentioProber": "sentio_prober_control.Sentio.ProberSentio",
+    "CommunicatorTcpIp": "sentio_prober_control.Communication.CommunicatorTcpIp",
+    "CommunicatorGpib": "sentio_prober_control.Communication.CommunicatorGpib",
+    "CommunicatorVisa": "sentio_prober_control.Communication.CommunicatorVisa",
+}
+
+
+def __getattr__(attr: str) -> Any:
+    if attr in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[attr]), attr)
+        globals()[attr] = value
+        return value
+
+    raise AttributeError(f"module {__name__!r} has no attribute {attr!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(list(globals()) + list(_LAZY_IMPORTS))
 
-print(f"Initializing package {__name__}")
 
 name = "sentio_prober_control"
 """ The name of the package. 